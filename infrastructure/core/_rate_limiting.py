@@ -8,7 +8,7 @@ import functools
 import threading
 import time
 from functools import wraps
-from typing import Any, Callable, TypedDict
+from typing import Any, Callable, Mapping, TypedDict
 
 from infrastructure.core.logging.utils import get_logger
 
@@ -78,6 +78,55 @@ class RateLimiter:
             return max(0, self.max_requests - len(self.requests[key]))
 
 
+class TokenBucketLimiter:
+    """Blocking per-key token-bucket limiter for outbound requests.
+
+    Each key (typically a hostname) refills at ``rate_per_second`` tokens per
+    second up to ``burst`` tokens. :meth:`acquire` takes one token, sleeping
+    until one is available; waiting callers reserve their token before they
+    sleep, so concurrent threads are served in arrival order without
+    over-subscribing the rate.
+
+    Thread-safe: bucket state is guarded by a Lock; sleeping happens outside it.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        *,
+        burst: float | None = None,
+        rates: Mapping[str, float] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleeper: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate_per_second <= 0 or any(rate <= 0 for rate in (rates or {}).values()):
+            raise ValueError("rates must be positive")
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.rates: dict[str, float] = dict(rates or {})
+        self._clock = clock
+        self._sleep = sleeper
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def _capacity(self, rate: float) -> float:
+        return self.burst if self.burst is not None else max(1.0, rate)
+
+    def acquire(self, key: str) -> float:
+        """Take one token for ``key``, blocking as needed; return seconds waited."""
+        rate = self.rates.get(key, self.rate_per_second)
+        capacity = self._capacity(rate)
+        with self._lock:
+            now = self._clock()
+            tokens, updated = self._buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated) * rate) - 1.0
+            self._buckets[key] = (tokens, now)
+        wait = -tokens / rate if tokens < 0 else 0.0
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+
 class SecurityEvent(TypedDict):
     """Structured security event record stored by SecurityMonitor."""
 
@@ -0,0 +1,472 @@
+"""Shared Python source index for the static auditors.
+
+Several auditors (``__all__`` re-export audit, no-mock enforcement, repository
+import verification, API-reference generation, the module line-count gate)
+read and ``ast.parse`` the same files. :class:`PythonAstIndex` gives them one
+place to do it:
+
+* :meth:`PythonAstIndex.python_files` walks each root once and filters in
+  memory;
+* :meth:`PythonAstIndex.source` reads each file once per index and
+  :meth:`PythonAstIndex.tree` keeps the most recently parsed modules (a full
+  tree costs roughly 0.3 MB, so the memo is bounded);
+* :meth:`PythonAstIndex.summaries` returns a :class:`ModuleSummary` (imports,
+  defined names, ``__all__``, line count, syntax error) per file. Summaries
+  persist in :class:`AstSummaryCache` under ``sha256(content)`` and the Python
+  version, so a sweep over an unchanged tree is a hash plus a SQLite lookup;
+  misses are parsed across worker processes (``AST_INDEX_WORKERS``).
+
+Only summaries are persisted. Unpickling a full ``ast.Module`` costs more
+than parsing the source again, so trees stay in memory. The cache lives at
+``$XDG_CACHE_HOME/template/ast-summaries.sqlite``; ``TEMPLATE_AST_CACHE=<path>``
+moves it and ``=off`` disables it. The store keeps its most recently used
+summaries (``DEFAULT_AST_CACHE_MAX_ENTRIES``). An unwritable location only
+costs the speed-up.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+import platform
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from infrastructure.core.logging.utils import get_logger
+from infrastructure.core.user_cache import CacheStats, connect_cache_db, evict_oldest, user_cache_path
+from infrastructure.core.worker_policy import ENV_AST_INDEX_WORKERS, resolve_bounded_workers
+
+logger = get_logger(__name__)
+
+__all__ = [
+    "DEFAULT_AST_CACHE_MAX_ENTRIES",
+    "DEFAULT_MAX_TREES",
+    "ENV_AST_CACHE",
+    "AstSummaryCache",
+    "ImportRecord",
+    "ModuleSummary",
+    "PythonAstIndex",
+    "default_ast_summary_cache",
+    "runtime_top_level_statements",
+    "summarize_source",
+]
+
+ENV_AST_CACHE = "TEMPLATE_AST_CACHE"
+
+# Bump whenever ModuleSummary's fields or their extraction change.
+_SUMMARY_SCHEMA_VERSION = 1
+
+# Below this many cache misses, worker start-up costs more than it saves.
+_PARALLEL_MIN_FILES = 128
+_DEFAULT_MAX_WORKERS = 8
+DEFAULT_MAX_TREES = 256
+# Several checkouts' worth of modules across a few Python versions.
+DEFAULT_AST_CACHE_MAX_ENTRIES = 20_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS summaries (
+    cache_key TEXT PRIMARY KEY,
+    summary   TEXT NOT NULL,
+    used_at   REAL NOT NULL
+);
+"""
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    """One ``import`` / ``from … import`` statement.
+
+    ``names`` is ``None`` for ``import module`` and the imported names for
+    ``from module import …``. ``runtime_top_level`` marks statements reached
+    by :func:`runtime_top_level_statements`.
+    """
+
+    module: str
+    names: tuple[str, ...] | None
+    level: int
+    lineno: int
+    end_lineno: int
+    runtime_top_level: bool
+
+
+@dataclass(frozen=True)
+class ModuleSummary:
+    """Path-independent facts about one Python source, as stored in the cache.
+
+    ``imports`` is in ``ast.walk`` order. ``defined_names`` holds every
+    function and class name defined anywhere in the module. ``dunder_all`` is
+    the literal ``__all__`` list (``None`` without one) and ``has_dunder_all``
+    is true for any top-level ``__all__`` assignment. ``syntax_error`` is
+    ``(msg, lineno, offset)`` when the source does not parse, in which case the
+    other fields are empty.
+    """
+
+    line_count: int
+    imports: tuple[ImportRecord, ...] = ()
+    defined_names: frozenset[str] = frozenset()
+    dunder_all: tuple[str, ...] | None = None
+    has_dunder_all: bool = False
+    syntax_error: tuple[str, int, int] | None = None
+
+    def syntax_error_for(self, path: Path) -> SyntaxError | None:
+        """Rebuild the :class:`SyntaxError` ``ast.parse`` raised for this source at *path*."""
+        if self.syntax_error is None:
+            return None
+        msg, lineno, offset = self.syntax_error
+        return SyntaxError(msg, (str(path), lineno or None, offset or None, None))
+
+    def to_json(self) -> str:
+        data = asdict(self)
+        data["defined_names"] = sorted(self.defined_names)
+        return json.dumps(data, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, payload: str) -> ModuleSummary:
+        data = json.loads(payload)
+        return cls(
+            line_count=data["line_count"],
+            imports=tuple(
+                ImportRecord(**{**record, "names": None if record["names"] is None else tuple(record["names"])})
+                for record in data["imports"]
+            ),
+            defined_names=frozenset(data["defined_names"]),
+            dunder_all=None if data["dunder_all"] is None else tuple(data["dunder_all"]),
+            has_dunder_all=data["has_dunder_all"],
+            syntax_error=None if data["syntax_error"] is None else tuple(data["syntax_error"]),
+        )
+
+
+def _is_type_checking_block(node: ast.stmt) -> bool:
+    if not isinstance(node, ast.If):
+        return False
+    test = node.test
+    return (isinstance(test, ast.Name) and test.id == "TYPE_CHECKING") or (
+        isinstance(test, ast.Attribute) and test.attr == "TYPE_CHECKING"
+    )
+
+
+def runtime_top_level_statements(tree: ast.Module) -> Iterator[ast.stmt]:
+    """Yield top-level statements, one level into ``try`` and ``if`` blocks, skipping ``if TYPE_CHECKING:``.
+
+    Re-export shims commonly wrap imports in ``try: … except ImportError:``;
+    those still execute at import time, so their bodies count as top level.
+    """
+    for stmt in tree.body:
+        if _is_type_checking_block(stmt):
+            continue
+        if isinstance(stmt, ast.Try):
+            yield from stmt.body
+            for handler in stmt.handlers:
+                yield from handler.body
+            yield from stmt.orelse
+            yield from stmt.finalbody
+            continue
+        if isinstance(stmt, ast.If):
+            yield from stmt.body
+            yield from stmt.orelse
+            continue
+        yield stmt
+
+
+def _literal_strings(node: ast.expr | None) -> tuple[str, ...] | None:
+    if not isinstance(node, (ast.List, ast.Tuple)):
+        return None
+    return tuple(elt.value for elt in node.elts if isinstance(elt, ast.Constant) and isinstance(elt.value, str))
+
+
+def _import_record(
+    node: ast.stmt, module: str, names: tuple[str, ...] | None, level: int, runtime: set[int]
+) -> ImportRecord:
+    return ImportRecord(
+        module=module,
+        names=names,
+        level=level,
+        lineno=node.lineno,
+        end_lineno=node.end_lineno or node.lineno,
+        runtime_top_level=id(node) in runtime,
+    )
+
+
+def summarize_source(source: str, filename: str = "<unknown>") -> ModuleSummary:
+    """Parse *source* and extract its :class:`ModuleSummary`."""
+    line_count = len(source.splitlines())
+    try:
+        tree = ast.parse(source, filename=filename)
+    except SyntaxError as exc:
+        return ModuleSummary(line_count=line_count, syntax_error=(exc.msg, exc.lineno or 0, exc.offset or 0))
+
+    runtime = {id(stmt) for stmt in runtime_top_level_statements(tree)}
+    imports: list[ImportRecord] = []
+    defined: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+            defined.add(node.name)
+        elif isinstance(node, ast.ImportFrom):
+            names = tuple(alias.name for alias in node.names)
+            imports.append(_import_record(node, node.module or "", names, node.level, runtime))
+        elif isinstance(node, ast.Import):
+            imports.extend(_import_record(node, alias.name, None, 0, runtime) for alias in node.names)
+
+    dunder_all: tuple[str, ...] | None = None
+    has_dunder_all = False
+    for stmt in tree.body:
+        targets: list[ast.expr] = []
+        if isinstance(stmt, ast.Assign):
+            targets = list(stmt.targets)
+        elif isinstance(stmt, (ast.AnnAssign, ast.AugAssign)):
+            targets = [stmt.target]
+        if any(isinstance(target, ast.Name) and target.id == "__all__" for target in targets):
+            has_dunder_all = True
+            if isinstance(stmt, ast.Assign):
+                dunder_all = _literal_strings(stmt.value)
+    return ModuleSummary(
+        line_count=line_count,
+        imports=tuple(imports),
+        defined_names=frozenset(defined),
+        dunder_all=dunder_all,
+        has_dunder_all=has_dunder_all,
+    )
+
+
+def _summarize_worker(item: tuple[str, str]) -> str:
+    path, source = item
+    return summarize_source(source, path).to_json()
+
+
+def _summary_cache_key(content_sha256: str) -> str:
+    payload = f"{_SUMMARY_SCHEMA_VERSION}\0{platform.python_version()}\0{content_sha256}"
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class AstSummaryCache:
+    """SQLite store of :class:`ModuleSummary` rows keyed by content hash and Python version.
+
+    Process-safe: each operation opens its own connection. ``stats`` counts
+    this instance's traffic; a read refreshes the rows it returns and a write
+    evicts all but the ``max_entries`` most recently used rows.
+    """
+
+    def __init__(self, db_path: Path | str, *, max_entries: int = DEFAULT_AST_CACHE_MAX_ENTRIES) -> None:
+        """Open (lazily) the cache at ``db_path``."""
+        self.db_path = Path(db_path)
+        self.max_entries = max(1, max_entries)
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        return connect_cache_db(self.db_path, _SCHEMA)
+
+    def get_many(self, content_digests: Sequence[str]) -> dict[str, ModuleSummary]:
+        """Return the stored summaries for *content_digests* (SHA-256 hex of the source bytes)."""
+        keys = {_summary_cache_key(digest): digest for digest in content_digests}
+        found: dict[str, ModuleSummary] = {}
+        ordered = list(keys)
+        now = time.time()
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    for start in range(0, len(ordered), 500):
+                        chunk = ordered[start : start + 500]
+                        placeholders = ",".join("?" * len(chunk))
+                        query = f"SELECT cache_key, summary FROM summaries WHERE cache_key IN ({placeholders})"  # noqa: S608 — placeholders only.
+                        hit_keys = []
+                        for key, payload in conn.execute(query, chunk):
+                            found[keys[key]] = ModuleSummary.from_json(payload)
+                            hit_keys.append(key)
+                        conn.executemany(
+                            "UPDATE summaries SET used_at = ? WHERE cache_key = ?",
+                            [(now, key) for key in hit_keys],
+                        )
+            finally:
+                conn.close()
+        except (OSError, sqlite3.Error, ValueError, KeyError, TypeError) as exc:
+            logger.debug("AST summary cache unavailable at %s: %s", self.db_path, exc)
+            return {}
+        with self._lock:
+            self.stats.hits += len(found)
+            self.stats.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, summaries: dict[str, ModuleSummary]) -> None:
+        """Store summaries keyed by content digest, then evict beyond ``max_entries``.
+
+        Storage errors are ignored; the cache is an optimisation only.
+        """
+        if not summaries:
+            return
+        now = time.time()
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO summaries (cache_key, summary, used_at) VALUES (?, ?, ?)",
+                        [(_summary_cache_key(digest), summary.to_json(), now) for digest, summary in summaries.items()],
+                    )
+                    evicted = evict_oldest(conn, "summaries", order_by="used_at", keep=self.max_entries)
+            finally:
+                conn.close()
+        except (OSError, sqlite3.Error) as exc:
+            logger.debug("AST summary cache not writable at %s: %s", self.db_path, exc)
+            return
+        with self._lock:
+            self.stats.stores += len(summaries)
+            self.stats.evictions += evicted
+
+    def clear(self) -> int:
+        """Delete every stored summary. Returns the number of rows removed."""
+        if not self.db_path.exists():
+            return 0
+        conn = self._connect()
+        try:
+            with conn:
+                return conn.execute("DELETE FROM summaries").rowcount
+        finally:
+            conn.close()
+
+
+def default_ast_summary_cache() -> AstSummaryCache | None:
+    """Return a cache at the location selected by ``TEMPLATE_AST_CACHE``, or ``None`` when disabled."""
+    path = user_cache_path(ENV_AST_CACHE, "ast-summaries.sqlite")
+    return AstSummaryCache(path) if path is not None else None
+
+
+class PythonAstIndex:
+    """Read, parse and summarise each Python file at most once.
+
+    ``cache`` persists summaries across processes (:meth:`default` uses
+    :func:`default_ast_summary_cache`); without one, summaries live only as
+    long as the index. ``workers`` overrides ``AST_INDEX_WORKERS`` for
+    :meth:`summaries`; ``max_trees`` bounds the parsed-module memo.
+    ``parsed`` counts ``ast.parse`` calls made by this index.
+    """
+
+    def __init__(
+        self,
+        cache: AstSummaryCache | None = None,
+        *,
+        workers: int | None = None,
+        max_trees: int = DEFAULT_MAX_TREES,
+    ) -> None:
+        """Create an empty index."""
+        self.cache = cache
+        self.workers = workers
+        self.max_trees = max_trees
+        self.parsed = 0
+        self._sources: dict[Path, str] = {}
+        self._trees: OrderedDict[Path, ast.Module | SyntaxError] = OrderedDict()
+        self._summaries: dict[Path, ModuleSummary] = {}
+        self._walks: dict[Path, tuple[Path, ...]] = {}
+
+    @classmethod
+    def default(cls) -> PythonAstIndex:
+        """Return an index backed by the persistent cache selected by ``TEMPLATE_AST_CACHE``."""
+        return cls(default_ast_summary_cache())
+
+    def python_files(self, root: Path, *, skip_dirs: Iterable[str] = ()) -> list[Path]:
+        """Return ``*.py`` files under *root* in sorted order, skipping any path containing a *skip_dirs* part.
+
+        The walk of each root happens once per index.
+        """
+        if root not in self._walks:
+            self._walks[root] = tuple(sorted(root.rglob("*.py"))) if root.is_dir() else ()
+        skip = set(skip_dirs)
+        return [path for path in self._walks[root] if not skip.intersection(path.parts)]
+
+    def source(self, path: Path) -> str:
+        """Return the UTF-8 text of *path*; raises ``OSError`` / ``UnicodeDecodeError`` like ``read_text``."""
+        text = self._sources.get(path)
+        if text is None:
+            text = path.read_text(encoding="utf-8")
+            self._sources[path] = text
+        return text
+
+    def tree(self, path: Path) -> ast.Module:
+        """Return the parsed module for *path*; raises ``SyntaxError`` like ``ast.parse``.
+
+        The ``max_trees`` most recently used modules are kept, so repeated
+        lookups of the same module (re-export chains, several exported names)
+        parse it once.
+        """
+        cached = self._trees.get(path)
+        if cached is None:
+            try:
+                cached = ast.parse(self.source(path), filename=str(path))
+            except SyntaxError as exc:
+                cached = exc
+            self.parsed += 1
+            self._trees[path] = cached
+            while len(self._trees) > self.max_trees:
+                self._trees.popitem(last=False)
+        else:
+            self._trees.move_to_end(path)
+        if isinstance(cached, SyntaxError):
+            raise cached
+        return cached
+
+    def summary(self, path: Path) -> ModuleSummary:
+        """Return the :class:`ModuleSummary` of *path*; raises ``OSError`` / ``UnicodeDecodeError`` if unreadable."""
+        found = self.summaries([path])
+        if path not in found:
+            self.source(path)  # re-raise the read error for this single path
+        return found[path]
+
+    def summaries(self, paths: Iterable[Path]) -> dict[Path, ModuleSummary]:
+        """Return summaries for every readable path; unreadable files are omitted.
+
+        Known summaries come from memory, then from the persistent cache by
+        content hash; the rest are parsed (in parallel when there are many)
+        and stored.
+        """
+        result: dict[Path, ModuleSummary] = {}
+        digests: dict[Path, str] = {}
+        for path in paths:
+            if path in self._summaries:
+                result[path] = self._summaries[path]
+                continue
+            try:
+                digests[path] = hashlib.sha256(self.source(path).encode("utf-8")).hexdigest()
+            except (OSError, UnicodeDecodeError):
+                continue
+        if not digests:
+            return result
+
+        stored = self.cache.get_many(list(set(digests.values()))) if self.cache is not None else {}
+        misses = [path for path, digest in digests.items() if digest not in stored]
+        fresh = dict(zip(misses, self._summarize(misses)))
+        self.parsed += len(fresh)
+        if self.cache is not None:
+            self.cache.put_many({digests[path]: summary for path, summary in fresh.items()})
+
+        for path, digest in digests.items():
+            summary = fresh.get(path) or stored[digest]
+            self._summaries[path] = summary
+            result[path] = summary
+        return result
+
+    def _summarize(self, paths: Sequence[Path]) -> list[ModuleSummary]:
+        items = [(str(path), self.source(path)) for path in paths]
+        workers = 1
+        if len(items) >= _PARALLEL_MIN_FILES:
+            workers = (
+                self.workers
+                if self.workers is not None
+                else resolve_bounded_workers(
+                    env_name=ENV_AST_INDEX_WORKERS,
+                    item_count=len(items),
+                    default_cap=_DEFAULT_MAX_WORKERS,
+                    invalid="fallback",
+                )
+            )
+        if workers <= 1:
+            return [summarize_source(source, name) for name, source in items]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return [ModuleSummary.from_json(payload) for payload in pool.map(_summarize_worker, items, chunksize=32)]
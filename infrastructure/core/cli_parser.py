@@ -10,6 +10,17 @@ import argparse
 from pathlib import Path
 
 
+def positive_int_arg(value: str) -> int:
+    """Parse an argparse value that must be strictly positive."""
+    try:
+        parsed = int(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError("must be an integer") from exc
+    if parsed <= 0:
+        raise argparse.ArgumentTypeError("must be a positive integer")
+    return parsed
+
+
 def create_parser() -> argparse.ArgumentParser:
     """Create the main argument parser for core CLI commands."""
     parser = argparse.ArgumentParser(
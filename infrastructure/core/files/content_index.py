@@ -0,0 +1,194 @@
+"""Stat-cached content hashing with per-directory Merkle roots.
+
+Hashing every byte of every declared input on every run makes incremental
+skip decisions cost as much as the work they try to avoid. A
+:class:`ContentHashIndex` remembers ``(size, mtime_ns, inode) -> sha256`` for
+each file it has hashed, so a later lookup only re-reads files whose stat
+signature changed. Directories are hashed as Merkle trees: each directory's
+digest covers the sorted ``(kind, name, digest)`` records of its children, so
+adding, removing, renaming or editing any file below it changes the root.
+
+The index is a cache, never a source of truth:
+
+* an entry is reused only when size, ``mtime_ns`` and inode all match;
+* files modified within :data:`RACY_WINDOW_NS` of hashing are not cached, so a
+  same-timestamp rewrite can never be mistaken for an unchanged file;
+* a missing, unreadable or malformed index file loads as an empty index.
+
+Directory walks skip hidden entries and ``__pycache__`` (the same convention
+the artifact inventory uses), and record symlinks by their target text
+instead of following them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+from infrastructure.core.logging.utils import get_logger
+
+logger = get_logger(__name__)
+
+#: Files whose mtime is this close to "now" are hashed but not cached.
+RACY_WINDOW_NS = 2_000_000_000
+
+_INDEX_VERSION = 1
+_SKIPPED_DIR_NAMES = frozenset({"__pycache__"})
+_CHUNK_SIZE = 1024 * 1024
+
+__all__ = [
+    "RACY_WINDOW_NS",
+    "ContentHashIndex",
+    "load_content_index",
+    "save_content_index",
+]
+
+
+def _stream_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _is_walk_excluded(name: str) -> bool:
+    return name.startswith(".") or name in _SKIPPED_DIR_NAMES
+
+
+class ContentHashIndex:
+    """Persistent ``path -> (size, mtime_ns, inode, sha256)`` cache.
+
+    ``hits`` and ``misses`` count file digests served from the cache versus
+    re-read from disk during the lifetime of this instance.
+    """
+
+    def __init__(self, entries: dict[str, tuple[int, int, int, str]] | None = None) -> None:
+        self._entries: dict[str, tuple[int, int, int, str]] = dict(entries or {})
+        self._touched: set[str] = set()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # -- Files ----------------------------------------------------------------
+
+    def file_digest(self, path: Path, stat: os.stat_result | None = None) -> str:
+        """Return the SHA-256 of ``path``, re-reading it only when its stat changed."""
+        st = stat if stat is not None else path.stat()
+        key = path.as_posix()
+        signature = (st.st_size, st.st_mtime_ns, st.st_ino)
+        self._touched.add(key)
+        cached = self._entries.get(key)
+        if cached is not None and cached[:3] == signature:
+            self.hits += 1
+            return cached[3]
+        self.misses += 1
+        digest = _stream_sha256(path)
+        if time.time_ns() - st.st_mtime_ns > RACY_WINDOW_NS:
+            self._entries[key] = (*signature, digest)
+        else:
+            self._entries.pop(key, None)
+        return digest
+
+    # -- Trees ----------------------------------------------------------------
+
+    def tree_digest(self, root: Path, *, exclude: Iterable[Path] = ()) -> str:
+        """Return the Merkle root of the directory tree at ``root``.
+
+        Args:
+            root: Directory to hash.
+            exclude: Paths (files or directories) omitted from the walk, e.g.
+                a stage's own outputs nested inside one of its inputs.
+        """
+        excluded = frozenset(path.as_posix() for path in exclude)
+        return self._tree_digest(root, excluded)
+
+    def _tree_digest(self, directory: Path, excluded: frozenset[str]) -> str:
+        records: list[str] = []
+        try:
+            entries = sorted(os.scandir(directory), key=lambda entry: entry.name)
+        except OSError as exc:
+            logger.debug("Cannot list %s for hashing: %s", directory, exc)
+            entries = []
+        for entry in entries:
+            if _is_walk_excluded(entry.name):
+                continue
+            child = directory / entry.name
+            if child.as_posix() in excluded:
+                continue
+            if entry.is_symlink():
+                records.append(f"l\x00{entry.name}\x00{os.readlink(child)}")
+            elif entry.is_dir(follow_symlinks=False):
+                records.append(f"d\x00{entry.name}\x00{self._tree_digest(child, excluded)}")
+            elif entry.is_file(follow_symlinks=False):
+                records.append(f"f\x00{entry.name}\x00{self.file_digest(child, entry.stat(follow_symlinks=False))}")
+        digest = hashlib.sha256()
+        for record in records:
+            digest.update(record.encode("utf-8", errors="surrogateescape"))
+            digest.update(b"\x1e")
+        return digest.hexdigest()
+
+    def path_digest(self, path: Path, *, exclude: Iterable[Path] = ()) -> str | None:
+        """Digest a file, or the Merkle root of a directory; ``None`` when absent."""
+        if path.is_file():
+            return self.file_digest(path)
+        if path.is_dir():
+            return self.tree_digest(path, exclude=exclude)
+        return None
+
+    # -- Persistence ----------------------------------------------------------
+
+    def to_dict(self) -> dict[str, object]:
+        """Serialize live entries; entries never touched whose file vanished are dropped."""
+        files: dict[str, list[object]] = {}
+        for key, (size, mtime_ns, inode, digest) in sorted(self._entries.items()):
+            if key not in self._touched and not os.path.exists(key):
+                continue
+            files[key] = [size, mtime_ns, inode, digest]
+        return {"version": _INDEX_VERSION, "files": files}
+
+    @classmethod
+    def from_dict(cls, payload: object) -> "ContentHashIndex":
+        """Rebuild an index from :meth:`to_dict` output, ignoring malformed rows."""
+        if not isinstance(payload, dict) or payload.get("version") != _INDEX_VERSION:
+            return cls()
+        files = payload.get("files")
+        if not isinstance(files, dict):
+            return cls()
+        entries: dict[str, tuple[int, int, int, str]] = {}
+        for key, row in files.items():
+            if (
+                isinstance(key, str)
+                and isinstance(row, list)
+                and len(row) == 4
+                and all(isinstance(value, int) for value in row[:3])
+                and isinstance(row[3], str)
+            ):
+                entries[key] = (row[0], row[1], row[2], row[3])
+        return cls(entries)
+
+
+def load_content_index(path: Path) -> ContentHashIndex:
+    """Load an index from ``path``; any read or parse failure yields an empty index."""
+    if not path.is_file():
+        return ContentHashIndex()
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:
+        logger.warning("Ignoring unreadable content-hash index %s: %s", path, exc)
+        return ContentHashIndex()
+    return ContentHashIndex.from_dict(payload)
+
+
+def save_content_index(path: Path, index: ContentHashIndex) -> None:
+    """Persist ``index`` to ``path`` atomically (write to a sibling, then replace)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(index.to_dict(), separators=(",", ":"), sort_keys=True) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
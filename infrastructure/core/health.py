@@ -15,6 +15,7 @@ CLI:
     uv run python -m infrastructure.core.health --gates=ruff,mypy
     uv run python -m infrastructure.core.health --quiet
     uv run python -m infrastructure.core.health --repo-root=/path/to/repo
+    uv run python -m infrastructure.core.health --warm --cache
 
 Programmatic:
 
@@ -40,6 +41,8 @@ from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Sequence
 
+from infrastructure.core.health_cache import GateResultCache, RepositorySnapshot, default_health_cache_path
+from infrastructure.core.health_host import WARM_GATE_NAMES, WarmGateHost
 from infrastructure.project.public_scope import PUBLIC_PROJECT_NAMES, public_ci_lint_paths, public_ci_source_paths
 
 __all__ = [
@@ -68,12 +71,15 @@ class GateResult:
         elapsed_ms: Wall-clock duration in milliseconds.
         output: Short tail of combined stdout/stderr captured for
             diagnostics. Never used to decide pass/fail.
+        cached: ``True`` when replayed from a ``GateResultCache`` because
+            the gate's argv and declared inputs are unchanged.
     """
 
     name: str
     passed: bool
     elapsed_ms: float
     output: str
+    cached: bool = False
 
 
 @dataclass(frozen=True)
@@ -454,25 +460,29 @@ def _run_single_gate(
     repo_root: Path,
     *,
     timeout_seconds: float = _GATE_TIMEOUT_SECONDS,
+    host: WarmGateHost | None = None,
 ) -> GateResult:
-    """Execute one gate and capture its outcome."""
+    """Execute one gate (in ``host`` when given) and capture its outcome."""
 
     start = time.perf_counter()
     try:
-        proc = subprocess.run(  # noqa: S603 — argv list, no shell.
-            list(argv),
-            cwd=str(repo_root),
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=timeout_seconds,
-        )
-        combined = (proc.stdout or "") + (proc.stderr or "")
+        if host is not None:
+            returncode, combined = host.run(argv, timeout_seconds=timeout_seconds)
+        else:
+            proc = subprocess.run(  # noqa: S603 — argv list, no shell.
+                list(argv),
+                cwd=str(repo_root),
+                capture_output=True,
+                text=True,
+                check=False,
+                timeout=timeout_seconds,
+            )
+            returncode, combined = proc.returncode, (proc.stdout or "") + (proc.stderr or "")
         predicate = _CUSTOM_PASS_PREDICATES.get(name)
         if predicate is not None:
-            passed = predicate(proc.returncode, combined)
+            passed = predicate(returncode, combined)
         else:
-            passed = proc.returncode == 0
+            passed = returncode == 0
         tail = combined[-_OUTPUT_TAIL_BYTES:].rstrip()
     except FileNotFoundError as exc:
         passed = False
@@ -500,6 +510,8 @@ def run_health_checks(
     gates: Sequence[str] | None = None,
     json_output: bool = False,
     workers: int | None = None,
+    warm: bool = False,
+    cache: GateResultCache | None = None,
 ) -> HealthReport:
     """Run every configured gate (or a subset) and aggregate results.
 
@@ -514,6 +526,10 @@ def run_health_checks(
             uses four workers for the full local sweep, or one worker for a
             single-gate subset. Passing ``1`` retains the serial diagnostic
             mode. Values below one raise ``ValueError``.
+        warm: Run :data:`WARM_GATE_NAMES` gates serially in one warm worker
+            interpreter (:mod:`infrastructure.core.health_host`).
+        cache: Replay passing results whose spec and declared inputs are
+            unchanged, and store new passes (:mod:`infrastructure.core.health_cache`).
 
     Returns:
         :class:`HealthReport` aggregating per-gate results.
@@ -543,23 +559,38 @@ def run_health_checks(
     spec_digest = gate_spec_sha256(specs)
     commit_before, clean_before = _repository_state(repo_root)
     start = time.perf_counter()
-    if selected_workers == 1 or len(specs) == 1:
-        results = [
-            _run_single_gate(name, argv, repo_root, timeout_seconds=_gate_timeout_seconds(name)) for name, argv in specs
-        ]
-    else:
-        # Gates are subprocess boundaries and do not share mutable Python
-        # state. A bounded thread pool overlaps their I/O while preserving
-        # the canonical registry order through ``executor.map``.
-        with ThreadPoolExecutor(max_workers=min(selected_workers, len(specs))) as executor:
-            results = list(
-                executor.map(
-                    lambda spec: _run_single_gate(
-                        spec[0], spec[1], repo_root, timeout_seconds=_gate_timeout_seconds(spec[0])
-                    ),
-                    specs,
-                )
-            )
+    snapshot = RepositorySnapshot.capture(repo_root) if cache is not None else None
+    host = WarmGateHost(repo_root) if warm else None
+    hosted = [spec for spec in specs if host is not None and spec[0] in WARM_GATE_NAMES]
+
+    def run_gate(spec: tuple[str, list[str]]) -> GateResult:
+        name, argv = spec
+        lookup_start = time.perf_counter()
+        key, hit = cache.lookup(snapshot, name, argv, gate_spec_sha256([spec])) if cache else (None, None)
+        if hit is not None:
+            lookup_ms = (time.perf_counter() - lookup_start) * 1000.0
+            return GateResult(name=name, passed=True, elapsed_ms=lookup_ms, output=hit, cached=True)
+        gate_host = host if spec in hosted else None
+        result = _run_single_gate(name, argv, repo_root, timeout_seconds=_gate_timeout_seconds(name), host=gate_host)
+        if cache is not None and key is not None and result.passed:
+            cache.put(key, name, result.elapsed_ms, result.output)
+        return result
+
+    try:
+        if selected_workers == 1 or len(specs) == 1:
+            by_name = {spec[0]: run_gate(spec) for spec in specs}
+        else:
+            # Subprocess gates do not share mutable Python state, so a bounded
+            # thread pool overlaps them; the warm host serialises its own gates
+            # on one pool slot. Results are reassembled in registry order.
+            with ThreadPoolExecutor(max_workers=min(selected_workers, len(specs))) as executor:
+                hosted_batch = executor.submit(lambda: [run_gate(spec) for spec in hosted])
+                pooled = [executor.submit(run_gate, spec) for spec in specs if spec not in hosted]
+                by_name = {r.name: r for r in [*hosted_batch.result(), *(f.result() for f in pooled)]}
+    finally:
+        if host is not None:
+            host.close()
+    results = [by_name[name] for name, _ in specs]
 
     total_ms = sum(r.elapsed_ms for r in results)
     wall_ms = (time.perf_counter() - start) * 1000.0
@@ -629,7 +660,7 @@ def format_report_table(report: HealthReport, *, color: bool = True) -> str:
     for result in report.results:
         status = "PASS" if result.passed else "FAIL"
         status_colored = colorize(status, _ANSI_GREEN if result.passed else _ANSI_RED)
-        elapsed = f"{result.elapsed_ms / 1000.0:6.2f}s"
+        elapsed = f"{result.elapsed_ms / 1000.0:6.2f}s" + (" (cached)" if result.cached else "")
         rows.append((result.name, status_colored, elapsed))
 
     header_name = colorize("Gate".ljust(name_width), _ANSI_BOLD)
@@ -716,6 +747,16 @@ def _build_parser() -> argparse.ArgumentParser:
         default=None,
         help=("Maximum concurrent gate subprocesses (default: 4 for a full sweep; use 1 for serial diagnostics)."),
     )
+    parser.add_argument(
+        "--warm",
+        action="store_true",
+        help="Run pure-Python gates inside one warm worker interpreter instead of a subprocess each.",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Replay passing results of gates whose inputs are unchanged (store: $TEMPLATE_HEALTH_CACHE, or 'off').",
+    )
     return parser
 
 
@@ -731,7 +772,9 @@ def main(argv: Sequence[str] | None = None) -> int:
         gates = [g.strip() for g in args.gates.split(",") if g.strip()]
 
     try:
-        report = run_health_checks(repo_root, gates=gates, workers=args.workers)
+        cache_path = default_health_cache_path() if args.cache else None
+        cache = GateResultCache(cache_path) if cache_path is not None else None
+        report = run_health_checks(repo_root, gates=gates, workers=args.workers, warm=args.warm, cache=cache)
     except ValueError as exc:
         print(f"error: {exc}", file=sys.stderr)
         return 2
@@ -0,0 +1,280 @@
+"""Persistent, input-keyed cache of passing health gate results.
+
+A gate's verdict is a function of its exact argv contract, the interpreter and
+the content of the files it reads. :func:`gate_input_paths` declares those
+files per gate (argv targets for the linters, the scanned roots for the
+policy gates, Markdown plus Python plus the tree listing for ``docs-lint``),
+so an edit outside a gate's inputs keeps its cached verdict.
+:class:`RepositorySnapshot` digests them from Git's object ids
+(worktree edits and untracked files are hashed with ``git hash-object``), and
+:class:`GateResultCache` stores passing :class:`~infrastructure.core.health.GateResult`
+rows under ``sha256(gate_spec_sha256, input digest, python version)``. An
+unchanged gate on a no-op commit is therefore answered from SQLite instead of
+re-running.
+
+Only passing results are stored: failures, timeouts and missing executables
+always re-run, so a flaky environment can never be cached into a false
+verdict. Outside a Git checkout nothing is cached. The store keeps the
+``max_entries`` most recently used results; ``TEMPLATE_HEALTH_CACHE=off``
+disables it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from fnmatch import fnmatchcase
+import platform
+import sqlite3
+import subprocess
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Sequence
+
+from infrastructure.core.user_cache import CacheStats, connect_cache_db, evict_oldest, user_cache_path
+
+__all__ = [
+    "DEFAULT_HEALTH_CACHE_MAX_ENTRIES",
+    "ENV_HEALTH_CACHE",
+    "GateResultCache",
+    "RepositorySnapshot",
+    "default_health_cache_path",
+    "gate_cache_key",
+    "gate_input_paths",
+]
+
+ENV_HEALTH_CACHE = "TEMPLATE_HEALTH_CACHE"
+# About 30 gates per sweep: room for the results of a few dozen input states.
+DEFAULT_HEALTH_CACHE_MAX_ENTRIES = 1024
+
+# Verdicts that depend on more than file content (status-freshness compares
+# the ledger date against today) are never cached.
+_UNCACHEABLE_GATES = frozenset({"status-freshness"})
+
+# Files that change every gate's toolchain.
+_TOOLING_INPUTS = ("pyproject.toml", "uv.lock")
+
+# Path marker in a gate's inputs: the digest covers every file's *name*
+# (not content), so adding, removing or renaming any file changes it.
+_TREE_LISTING = ":tree"
+
+# Gates whose argv names their complete input surface, mapped to the index of
+# the first argv entry that may be a path (flags and ruff subcommands skipped).
+_ARGV_SCOPED_GATES = {"ruff": 4, "ruff-format": 4, "mypy": 3, "bandit": 5}
+
+# Fixed input roots of gates that scan the repository themselves, mirroring
+# the directories their implementations walk. Entries with glob characters
+# match anywhere in the tree. Gates absent here declare the whole tree.
+_DECLARED_GATE_INPUTS: dict[str, tuple[str, ...]] = {
+    "no-mocks": ("infrastructure", "projects", "scripts/audit", "tests"),
+    "semantic-standins": ("infrastructure", "projects", "scripts/audit", "tests"),
+    "codeowners": (".github", "infrastructure"),
+    "xml-parser-policy": ("infrastructure",),
+    "module-line-count": ("infrastructure", "projects", "scripts", "tests"),
+    "docs-lint": ("*.md", "*.py", ".gitmodules", _TREE_LISTING),
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS gate_results (
+    cache_key  TEXT PRIMARY KEY,
+    name       TEXT NOT NULL,
+    elapsed_ms REAL NOT NULL,
+    output     TEXT NOT NULL,
+    used_at    REAL NOT NULL
+);
+"""
+
+
+def default_health_cache_path() -> Path | None:
+    """Return ``$TEMPLATE_HEALTH_CACHE`` or ``$XDG_CACHE_HOME/template/health-gates.sqlite``; ``None`` when disabled."""
+    return user_cache_path(ENV_HEALTH_CACHE, "health-gates.sqlite")
+
+
+def gate_input_paths(name: str, argv: Sequence[str]) -> tuple[str, ...] | None:
+    """Return the repo-relative paths gate ``name`` reads, or ``None`` if it must never be cached.
+
+    ``"."`` stands for the whole tree. Every cacheable gate also depends on
+    the tooling files (``pyproject.toml`` carries the mypy and ruff settings).
+    """
+    if name in _UNCACHEABLE_GATES:
+        return None
+    if name in _ARGV_SCOPED_GATES:
+        inputs = {arg.rstrip("/") for arg in argv[_ARGV_SCOPED_GATES[name] :] if not arg.startswith("-")}
+    elif name in _DECLARED_GATE_INPUTS:
+        inputs = set(_DECLARED_GATE_INPUTS[name])
+    else:
+        return (".",)
+    return tuple(sorted(inputs | set(_TOOLING_INPUTS)))
+
+
+@dataclass(frozen=True)
+class RepositorySnapshot:
+    """Content identity of every tracked and untracked (non-ignored) file.
+
+    ``files`` maps a repo-relative POSIX path to ``"t:<oid>"`` (tracked) or
+    ``"u:<oid>"`` (untracked); the oid reflects the working-tree content.
+    """
+
+    files: dict[str, str]
+
+    @classmethod
+    def capture(cls, repo_root: Path) -> RepositorySnapshot | None:
+        """Snapshot ``repo_root`` with four Git calls, or return ``None`` outside a Git checkout."""
+
+        def git(*args: str, stdin: str | None = None) -> str | None:
+            proc = subprocess.run(  # noqa: S603 - fixed git executable and argv.
+                ["git", *args],
+                cwd=repo_root,
+                input=stdin,
+                capture_output=True,
+                text=True,
+                check=False,
+                timeout=60,
+            )
+            return proc.stdout if proc.returncode == 0 else None
+
+        try:
+            staged = git("ls-files", "-s", "-z")
+            modified = git("ls-files", "-m", "-z")
+            untracked = git("ls-files", "-o", "--exclude-standard", "-z")
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+        if staged is None or modified is None or untracked is None:
+            return None
+
+        files: dict[str, str] = {}
+        for record in filter(None, staged.split("\0")):
+            meta, path = record.split("\t", 1)
+            files[path] = "t:" + meta.split()[1]
+        rehash = {path: "t" for path in filter(None, modified.split("\0"))}
+        rehash.update({path: "u" for path in filter(None, untracked.split("\0"))})
+        for path in [path for path in rehash if not (repo_root / path).is_file()]:
+            files.pop(path, None)
+            del rehash[path]
+        if rehash:
+            paths = list(rehash)
+            oids = git("hash-object", "--no-filters", "--stdin-paths", stdin="\n".join(paths) + "\n")
+            if oids is None:
+                return None
+            for path, oid in zip(paths, oids.split()):
+                files[path] = f"{rehash[path]}:{oid}"
+        return cls(files)
+
+    def digest(self, paths: Sequence[str]) -> str:
+        """Return a SHA-256 over the identities of every file under ``paths``.
+
+        An entry containing ``*``, ``?`` or ``[`` is a glob matched against
+        the whole repo-relative path; ``":tree"`` adds the names of all other
+        files to the digest.
+        """
+        patterns = tuple(p for p in paths if any(ch in p for ch in "*?["))
+        prefixes = tuple(p.rstrip("/") for p in paths if p != _TREE_LISTING and p not in patterns)
+        listing = _TREE_LISTING in paths
+        digest = hashlib.sha256()
+        for path in sorted(self.files):
+            if (
+                "." in prefixes
+                or any(path == p or path.startswith(p + "/") for p in prefixes)
+                or any(fnmatchcase(path, pattern) for pattern in patterns)
+            ):
+                digest.update(f"{path}\0{self.files[path]}\n".encode())
+            elif listing:
+                digest.update(f"{path}\n".encode())
+        return digest.hexdigest()
+
+
+def gate_cache_key(spec_sha256: str, input_digest: str) -> str:
+    """Combine a single-gate ``gate_spec_sha256`` with its input digest and interpreter version."""
+    payload = json.dumps([spec_sha256, input_digest, platform.python_version()], separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class GateResultCache:
+    """SQLite store of passing gate results keyed by :func:`gate_cache_key`.
+
+    Process-safe: each operation opens its own connection. ``stats`` counts
+    this instance's traffic; rows beyond ``max_entries`` are evicted least
+    recently used first.
+    """
+
+    def __init__(self, db_path: Path | str, *, max_entries: int = DEFAULT_HEALTH_CACHE_MAX_ENTRIES) -> None:
+        """Open (lazily) the cache at ``db_path``."""
+        self.db_path = Path(db_path)
+        self.max_entries = max(1, max_entries)
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        return connect_cache_db(self.db_path, _SCHEMA)
+
+    def lookup(
+        self, snapshot: RepositorySnapshot | None, name: str, argv: Sequence[str], spec_sha256: str
+    ) -> tuple[str | None, str | None]:
+        """Return ``(cache key, cached output)`` for one gate.
+
+        The key is ``None`` when the gate cannot be cached (no snapshot, or
+        :func:`gate_input_paths` declines it); the output is ``None`` on a miss.
+        """
+        inputs = gate_input_paths(name, argv)
+        if snapshot is None or inputs is None:
+            return None, None
+        key = gate_cache_key(spec_sha256, snapshot.digest(inputs))
+        hit = self.get(key)
+        return key, None if hit is None else hit[1]
+
+    def get(self, key: str) -> tuple[float, str] | None:
+        """Return the stored ``(elapsed_ms, output)`` of a passing run, or ``None``."""
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    row = conn.execute(
+                        "SELECT elapsed_ms, output FROM gate_results WHERE cache_key = ?", (key,)
+                    ).fetchone()
+                    if row is not None:
+                        conn.execute("UPDATE gate_results SET used_at = ? WHERE cache_key = ?", (time.time(), key))
+            finally:
+                conn.close()
+        except (OSError, sqlite3.Error):
+            row = None
+        with self._lock:
+            if row is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+        return None if row is None else (float(row[0]), str(row[1]))
+
+    def put(self, key: str, name: str, elapsed_ms: float, output: str) -> None:
+        """Record a passing run, evicting beyond ``max_entries``.
+
+        Storage errors are ignored; the cache is an optimisation only.
+        """
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO gate_results VALUES (?, ?, ?, ?, ?)",
+                        (key, name, elapsed_ms, output, time.time()),
+                    )
+                    evicted = evict_oldest(conn, "gate_results", order_by="used_at", keep=self.max_entries)
+            finally:
+                conn.close()
+        except (OSError, sqlite3.Error):
+            return
+        with self._lock:
+            self.stats.stores += 1
+            self.stats.evictions += evicted
+
+    def clear(self) -> int:
+        """Delete every stored result. Returns the number of rows removed."""
+        if not self.db_path.exists():
+            return 0
+        conn = self._connect()
+        try:
+            with conn:
+                return conn.execute("DELETE FROM gate_results").rowcount
+        finally:
+            conn.close()
@@ -0,0 +1,253 @@
+"""Warm in-process host for pure-Python health gates.
+
+Most health gates are ``uv run python scripts/...`` invocations whose runtime
+is dominated by interpreter start-up, ``uv`` environment resolution and the
+``infrastructure`` import graph rather than by the check itself. A
+:class:`WarmGateHost` starts one long-lived worker interpreter
+(``python -m infrastructure.core.health_host``) and runs each eligible gate
+inside it with ``runpy``, so those costs are paid once per sweep.
+
+Each gate still behaves like a subprocess from the orchestrator's point of
+view: ``sys.argv``, ``sys.path`` and the working directory are reset between
+gates, file descriptors 1 and 2 are redirected to a capture file (so output
+from the gate's own child processes is captured too), and ``SystemExit``
+codes become return codes. The worker interpreter is the one running the
+health command, so ``run_health_checks`` should itself be launched through
+``uv run``. A gate that exceeds its timeout kills the worker; the next gate
+starts a fresh one.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import queue
+import runpy
+import subprocess
+import sys
+import tempfile
+import threading
+import traceback
+from pathlib import Path
+from typing import IO, Sequence
+
+__all__ = [
+    "WARM_GATE_NAMES",
+    "WarmGateHost",
+    "host_request",
+]
+
+# Gates that only run Python code from this repository and are safe to share
+# one interpreter. Tool front-ends with heavy global state (mypy, ruff,
+# bandit) and gates that mostly drive external processes (per-project pytest
+# collection, headless-Chrome Mermaid rendering) keep their own subprocess.
+WARM_GATE_NAMES: frozenset[str] = frozenset(
+    {
+        "all-exports",
+        "api-reference",
+        "architecture-overview",
+        "codeowners",
+        "confidentiality",
+        "exemplar-roster",
+        "generated-artifacts",
+        "methods-plan",
+        "module-line-count",
+        "no-mocks",
+        "operations-manifest",
+        "public-capabilities",
+        "publication-records",
+        "semantic-standins",
+        "skill-reachability",
+        "skills-manifest",
+        "stage-table",
+        "status-freshness",
+        "template-drift",
+        "xml-parser-policy",
+    }
+)
+
+
+def host_request(argv: Sequence[str]) -> dict[str, object] | None:
+    """Translate a gate ``argv`` into a warm-host request, or ``None`` if it is not a Python invocation.
+
+    Accepted shapes are ``[uv run] python|<sys.executable>`` followed by
+    ``-m module args...``, ``-c code args...`` or ``script.py args...``.
+    """
+    args = list(argv)
+    if args[:2] == ["uv", "run"]:
+        args = args[2:]
+    if not args or args[0] not in ("python", sys.executable):
+        return None
+    args = args[1:]
+    if len(args) >= 2 and args[0] in ("-m", "-c"):
+        return {"kind": "module" if args[0] == "-m" else "code", "target": args[1], "args": args[2:]}
+    if args and args[0].endswith(".py"):
+        return {"kind": "script", "target": args[0], "args": args[1:]}
+    return None
+
+
+class WarmGateHost:
+    """Client for one warm worker interpreter rooted at ``repo_root``.
+
+    Thread-safe: gates submitted from several threads are serialised through
+    the single worker.
+    """
+
+    def __init__(self, repo_root: Path) -> None:
+        """Prepare (but do not yet start) a worker for ``repo_root``."""
+        self.repo_root = repo_root
+        self._lock = threading.Lock()
+        self._proc: subprocess.Popen[str] | None = None
+        self._responses: queue.Queue[str | None] = queue.Queue()
+
+    def __enter__(self) -> WarmGateHost:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def _start(self) -> subprocess.Popen[str]:
+        proc = subprocess.Popen(  # noqa: S603 — argv list, no shell.
+            [sys.executable, "-m", "infrastructure.core.health_host"],
+            cwd=str(self.repo_root),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+        responses: queue.Queue[str | None] = queue.Queue()
+        assert proc.stdout is not None
+
+        def pump(stream: IO[str]) -> None:
+            for line in stream:
+                responses.put(line)
+            responses.put(None)
+
+        threading.Thread(target=pump, args=(proc.stdout,), daemon=True).start()
+        self._proc, self._responses = proc, responses
+        return proc
+
+    def run(self, argv: Sequence[str], *, timeout_seconds: float) -> tuple[int, str]:
+        """Run one gate in the worker and return ``(returncode, combined output)``.
+
+        Raises:
+            ValueError: ``argv`` is not a Python invocation (see :func:`host_request`).
+            subprocess.TimeoutExpired: The gate did not finish in time; the
+                worker has been killed.
+        """
+        request = host_request(argv)
+        if request is None:
+            raise ValueError(f"not a Python gate invocation: {list(argv)!r}")
+        with self._lock:
+            proc = self._proc if self._proc is not None and self._proc.poll() is None else self._start()
+            assert proc.stdin is not None
+            try:
+                proc.stdin.write(json.dumps(request) + "\n")
+                proc.stdin.flush()
+                line = self._responses.get(timeout=timeout_seconds)
+            except queue.Empty:
+                self._kill()
+                raise subprocess.TimeoutExpired(list(argv), timeout_seconds) from None
+            except OSError as exc:
+                self._kill()
+                return 1, f"warm gate host unavailable: {exc}"
+            if line is None:
+                self._kill()
+                return 1, "warm gate host exited before reporting a result"
+            response = json.loads(line)
+            return int(response["returncode"]), str(response["output"])
+
+    def _kill(self) -> None:
+        if self._proc is not None:
+            self._proc.kill()
+            self._proc.wait()
+            self._proc = None
+
+    def close(self) -> None:
+        """Stop the worker (idempotent)."""
+        with self._lock:
+            proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        assert proc.stdin is not None
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=10)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+            proc.wait()
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+
+
+def _exit_code(code: object) -> int:
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def _execute(kind: str, target: str, args: list[str]) -> int:
+    try:
+        if kind == "script":
+            sys.argv = [target, *args]
+            sys.path.insert(0, str(Path(target).resolve().parent))
+            runpy.run_path(target, run_name="__main__")
+        elif kind == "module":
+            sys.argv = [target, *args]
+            runpy.run_module(target, run_name="__main__", alter_sys=True)
+        else:
+            sys.argv = ["-c", *args]
+            exec(compile(target, "<string>", "exec"), {"__name__": "__main__"})  # noqa: S102 — registry-owned code.
+    except SystemExit as exc:
+        return _exit_code(exc.code)
+    except Exception:  # noqa: BLE001 — reported like an uncaught exception in a subprocess.
+        traceback.print_exc()
+        return 1
+    return 0
+
+
+def _run_request(request: dict[str, object]) -> dict[str, object]:
+    """Run one request with fds 1/2 captured and interpreter state restored afterwards."""
+    saved_argv, saved_path, saved_cwd = sys.argv[:], sys.path[:], os.getcwd()
+    with tempfile.TemporaryFile() as capture:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        saved_fds = os.dup(1), os.dup(2)
+        os.dup2(capture.fileno(), 1)
+        os.dup2(capture.fileno(), 2)
+        try:
+            raw_args = request.get("args")
+            args = [str(arg) for arg in raw_args] if isinstance(raw_args, list) else []
+            returncode = _execute(str(request["kind"]), str(request["target"]), args)
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            for fd, saved in zip((1, 2), saved_fds):
+                os.dup2(saved, fd)
+                os.close(saved)
+            sys.argv, sys.path[:] = saved_argv, saved_path
+            os.chdir(saved_cwd)
+        capture.seek(0)
+        output = capture.read().decode("utf-8", errors="replace")
+    return {"returncode": returncode, "output": output}
+
+
+def serve() -> int:
+    """Worker loop: one JSON request per stdin line, one JSON response per line on the original stdout."""
+    channel = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    sys.path.insert(0, os.getcwd())
+    for line in sys.stdin:
+        if line.strip():
+            channel.write(json.dumps(_run_request(json.loads(line))) + "\n")
+            channel.flush()
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover — exercised via WarmGateHost in tests.
+    raise SystemExit(serve())
@@ -0,0 +1,152 @@
+"""Run-scoped digest ledger that lets per-stage artifact manifests skip unchanged files.
+
+Split from :mod:`infrastructure.core.pipeline.artifacts`, whose manifest
+writers accept an optional :class:`ArtifactDigestLedger`.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from infrastructure.core.pipeline.artifacts import (
+    _git_ignore_matches,
+    _git_worktree_marker,
+    _GitIgnoreEvaluation,
+    _read_stage_manifest,
+    _StageManifestRead,
+    compute_sha256,
+)
+
+__all__ = ["ArtifactDigestLedger", "ArtifactLedgerStats"]
+
+_StatSignature = tuple[int, int, int, int, int]
+
+
+def _stat_signature(metadata: os.stat_result) -> _StatSignature:
+    """Identity of one file version: same inode, size, mtime and ctime means same bytes."""
+    return (metadata.st_dev, metadata.st_ino, metadata.st_size, metadata.st_mtime_ns, metadata.st_ctime_ns)
+
+
+@dataclass
+class ArtifactLedgerStats:
+    """Work done versus work reused by one :class:`ArtifactDigestLedger`."""
+
+    hashed: int = 0
+    reused: int = 0
+    ignore_queried: int = 0
+    ignore_reused: int = 0
+    manifests_parsed: int = 0
+    manifests_reused: int = 0
+
+
+class ArtifactDigestLedger:
+    """Run-scoped memo that lets per-stage manifests skip unchanged artifacts.
+
+    Without it every stage re-hashes the whole output tree, re-asks Git about
+    every file and re-parses every earlier stage manifest, so a 15-stage run
+    hashes the tree 15 times. The ledger carries three things forward between
+    stages of one :class:`~infrastructure.core.pipeline.executor.PipelineExecutor`
+    run:
+
+    * ``(dev, inode, size, mtime_ns, ctime_ns) -> sha256`` per artifact. Only new
+      or modified files are hashed; ``ctime`` cannot be set from user space, so a
+      rewrite that restores the old mtime is still detected.
+    * Git-ignore verdicts per candidate path. Only paths not seen before are sent
+      to ``git check-ignore``, in one batch. Verdicts are dropped whenever any
+      ``.gitignore`` / ``info/exclude`` file that could affect them changes.
+    * Parsed stage manifests keyed by their stat signature, so the aggregate
+      re-reads only the manifest the current stage wrote.
+
+    Failed Git evaluations are never cached, so fail-closed behavior is
+    unchanged. A ledger is not thread-safe and must not outlive its run.
+    """
+
+    def __init__(self) -> None:
+        self.stats = ArtifactLedgerStats()
+        self._digests: dict[Path, tuple[_StatSignature, str]] = {}
+        self._ignore_verdicts: dict[Path, tuple[bytes, bytes, bytes] | None] = {}
+        self._ignore_rules: tuple[tuple[str, _StatSignature | None], ...] | None = None
+        self._manifests: dict[Path, tuple[_StatSignature, _StageManifestRead]] = {}
+
+    def sha256(self, path: Path) -> str:
+        """Return ``compute_sha256(path)``, reusing the digest of an unchanged file."""
+        signature = _stat_signature(path.lstat())
+        cached = self._digests.get(path)
+        if cached is not None and cached[0] == signature:
+            self.stats.reused += 1
+            return cached[1]
+        digest = compute_sha256(path)
+        self._digests[path] = (signature, digest)
+        self.stats.hashed += 1
+        return digest
+
+    def cached_sha256(self, path: Path, metadata: os.stat_result) -> str | None:
+        """Return a digest already computed for this exact file version, without hashing."""
+        cached = self._digests.get(path)
+        if cached is not None and cached[0] == _stat_signature(metadata):
+            return cached[1]
+        return None
+
+    def git_ignore_matches(
+        self,
+        paths: Sequence[Path],
+        project_dir: Path,
+        *,
+        rule_files: Sequence[Path] = (),
+    ) -> _GitIgnoreEvaluation:
+        """Evaluate ``paths`` like :func:`_git_ignore_matches`, querying Git only for unseen paths."""
+        rules = _ignore_rules_signature(project_dir, rule_files)
+        if rules != self._ignore_rules:
+            self._ignore_verdicts.clear()
+            self._ignore_rules = rules
+        unseen = tuple(path for path in dict.fromkeys(paths) if path not in self._ignore_verdicts)
+        if unseen:
+            evaluation = _git_ignore_matches(unseen, project_dir)
+            if not evaluation.ok:
+                return evaluation
+            for path in unseen:
+                self._ignore_verdicts[path] = evaluation.matches.get(path)
+        self.stats.ignore_queried += len(unseen)
+        self.stats.ignore_reused += len(paths) - len(unseen)
+        matches = {path: rule for path in paths if (rule := self._ignore_verdicts[path]) is not None}
+        return _GitIgnoreEvaluation(matches=matches)
+
+    def read_stage_manifest(self, manifest_path: Path) -> _StageManifestRead:
+        """Return :func:`_read_stage_manifest` for ``manifest_path``, parsing it only when it changed."""
+        try:
+            signature = _stat_signature(manifest_path.lstat())
+        except OSError:
+            return _read_stage_manifest(manifest_path)
+        cached = self._manifests.get(manifest_path)
+        if cached is not None and cached[0] == signature:
+            self.stats.manifests_reused += 1
+            return cached[1]
+        result = _read_stage_manifest(manifest_path)
+        self._manifests[manifest_path] = (signature, result)
+        self.stats.manifests_parsed += 1
+        return result
+
+
+def _ignore_rules_signature(
+    project_dir: Path, rule_files: Sequence[Path]
+) -> tuple[tuple[str, _StatSignature | None], ...]:
+    """Stat every ignore-rule file that can affect paths below ``project_dir``."""
+    candidates: list[Path] = list(rule_files)
+    marker = _git_worktree_marker(project_dir)
+    current = project_dir.absolute()
+    for directory in (current, *current.parents):
+        candidates.append(directory / ".gitignore")
+        if marker is not None and directory == marker.parent:
+            break
+    if marker is not None and marker.is_dir():
+        candidates.append(marker / "info" / "exclude")
+    signature: list[tuple[str, _StatSignature | None]] = []
+    for candidate in candidates:
+        try:
+            signature.append((str(candidate), _stat_signature(candidate.stat())))
+        except OSError:
+            signature.append((str(candidate), None))
+    return tuple(signature)
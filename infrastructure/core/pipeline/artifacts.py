@@ -12,11 +12,14 @@ from datetime import datetime, timezone
 import subprocess
 from collections.abc import Mapping, Sequence
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 from infrastructure.core.files.portability import sanitize_machine_local_paths
 from infrastructure.core.pipeline.types import StageContract
 
+if TYPE_CHECKING:
+    from infrastructure.core.pipeline.artifact_ledger import ArtifactDigestLedger
+
 _IGNORED_OUTPUT_PARTS = frozenset(
     {
         ".checkpoints",
@@ -117,6 +120,28 @@ class _GitIgnoreEvaluation:
         return self.error is None
 
 
+@dataclass(frozen=True)
+class _StageManifestRead:
+    """One parsed stage manifest file, or the reason it could not be read."""
+
+    payload: Mapping[str, object] | None = None
+    manifest: ArtifactManifest | None = None
+    error: str | None = None
+
+
+def _read_stage_manifest(manifest_path: Path) -> _StageManifestRead:
+    try:
+        payload = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:
+        return _StageManifestRead(error=str(exc))
+    if not isinstance(payload, dict):
+        return _StageManifestRead(error="expected a mapping")
+    try:
+        return _StageManifestRead(payload=payload, manifest=artifact_manifest_from_payload(payload))
+    except ValueError as exc:
+        return _StageManifestRead(error=str(exc))
+
+
 def parse_output_inventory_mode(value: object) -> OutputInventoryMode:
     """Parse a stable-output inventory mode without silently widening scope."""
     if value == STABLE_OUTPUT_INVENTORY_MODE:
@@ -248,8 +273,13 @@ def write_stage_artifact_manifest(
     stage_num: int,
     stage_name: str,
     contract: StageContract,
+    ledger: ArtifactDigestLedger | None = None,
 ) -> ArtifactManifest:
-    """Write a stage-specific artifact manifest and return it."""
+    """Write a stage-specific artifact manifest and return it.
+
+    With a run-scoped ``ledger`` only files created or modified since the
+    previous stage are hashed; the manifest content is identical either way.
+    """
     output_dir = project_dir / "output"
     declared_paths = _declared_output_paths(repo_root, project_dir, contract)
     entries: list[ArtifactManifestEntry] = []
@@ -268,11 +298,12 @@ def write_stage_artifact_manifest(
         inventory = collect_stable_output_inventory(
             output_dir,
             inventory_mode=inventory_mode,
+            ledger=ledger,
         )
         issues.extend(inventory.issues)
         for path in inventory.files:
             relative_path = path.relative_to(project_dir).as_posix()
-            digest = compute_sha256(path)
+            digest = ledger.sha256(path) if ledger is not None else compute_sha256(path)
             contract_match = not declared_paths or any(_is_relative_to(path, declared) for declared in declared_paths)
             entries.append(
                 ArtifactManifestEntry(
@@ -303,8 +334,12 @@ def aggregate_artifact_manifests(
     output_dir: Path,
     *,
     inventory_mode: OutputInventoryMode = STABLE_OUTPUT_INVENTORY_MODE,
+    ledger: ArtifactDigestLedger | None = None,
 ) -> ArtifactManifest:
-    """Aggregate all stage manifests into ``output/reports/artifact_manifest.json``."""
+    """Aggregate all stage manifests into ``output/reports/artifact_manifest.json``.
+
+    With a run-scoped ``ledger`` unchanged stage manifests are not re-parsed.
+    """
     inventory_mode = parse_output_inventory_mode(inventory_mode)
     if output_dir.is_symlink():
         raise ValueError(f"refusing to aggregate through symlink output directory: {output_dir}")
@@ -322,19 +357,13 @@ def aggregate_artifact_manifests(
         for manifest_path in sorted(stage_dir.glob("stage-*.json")):
             if manifest_path.is_symlink():
                 continue
-            try:
-                payload = json.loads(manifest_path.read_text(encoding="utf-8"))
-            except (OSError, json.JSONDecodeError) as exc:
-                issues.append(f"cannot read stage artifact manifest: {manifest_path.name}: {exc}")
-                continue
-            if not isinstance(payload, dict):
-                issues.append(f"cannot read stage artifact manifest: {manifest_path.name}: expected a mapping")
-                continue
-            try:
-                stage_manifest = artifact_manifest_from_payload(payload)
-            except ValueError as exc:
-                issues.append(f"cannot read stage artifact manifest: {manifest_path.name}: {exc}")
+            read = (
+                ledger.read_stage_manifest(manifest_path) if ledger is not None else _read_stage_manifest(manifest_path)
+            )
+            if read.error is not None or read.payload is None or read.manifest is None:
+                issues.append(f"cannot read stage artifact manifest: {manifest_path.name}: {read.error}")
                 continue
+            payload, stage_manifest = read.payload, read.manifest
             if "inventory_mode" in payload:
                 stage_inventory_mode = stage_manifest.inventory_mode
                 if stage_inventory_mode != inventory_mode:
@@ -346,14 +375,14 @@ def aggregate_artifact_manifests(
             issues.extend(stage_manifest.issues)
 
     if not entries and output_dir.exists():
-        inventory = collect_stable_output_inventory(output_dir, inventory_mode=inventory_mode)
+        inventory = collect_stable_output_inventory(output_dir, inventory_mode=inventory_mode, ledger=ledger)
         issues.extend(inventory.issues)
         for path in inventory.files:
             entries.append(
                 ArtifactManifestEntry(
                     path=path.relative_to(project_dir).as_posix(),
                     size_bytes=path.stat().st_size,
-                    sha256=compute_sha256(path),
+                    sha256=ledger.sha256(path) if ledger is not None else compute_sha256(path),
                     stage_num=0,
                     stage_name="standalone-output-scan",
                     contract_match=True,
@@ -380,6 +409,7 @@ def collect_stable_output_inventory(
     git_ignore_output_dir: Path | None = None,
     git_ignore_path_overrides: Mapping[Path, Path] | None = None,
     inventory_mode: OutputInventoryMode = STABLE_OUTPUT_INVENTORY_MODE,
+    ledger: ArtifactDigestLedger | None = None,
 ) -> StableOutputInventory:
     """Collect stable output files using publication and local-output semantics.
 
@@ -395,7 +425,8 @@ def collect_stable_output_inventory(
     followed. ``git_ignore_output_dir`` maps copied files back to the canonical
     project output tree for Git-ignore evaluation; ``git_ignore_path_overrides``
     records promotions such as Stage 5's copied root PDF whose canonical source
-    lives under ``pdf/``.
+    lives under ``pdf/``. A run-scoped ``ledger`` limits the Git query to paths
+    it has not evaluated under the current ignore rules.
     """
     output_dir = output_dir.absolute()
     if output_dir.is_symlink():
@@ -433,7 +464,15 @@ def collect_stable_output_inventory(
             if source_relative.is_absolute() or ".." in source_relative.parts:
                 raise ValueError(f"invalid Git-ignore path override: {relative} -> {source_relative}")
             git_candidates.setdefault(ignore_output_dir / source_relative, []).append(path)
-        candidate_evaluation = _git_ignore_matches(tuple(git_candidates), project_dir)
+        rule_files = tuple(path for path in snapshot_paths if path.name == ".gitignore")
+
+        def evaluate_ignores(paths: tuple[Path, ...]) -> _GitIgnoreEvaluation:
+            # Remapped (copied) trees take their rules from elsewhere; never memoize those.
+            if ledger is None or ignore_output_dir != output_dir:
+                return _git_ignore_matches(paths, project_dir)
+            return ledger.git_ignore_matches(paths, project_dir, rule_files=rule_files)
+
+        candidate_evaluation = evaluate_ignores(tuple(git_candidates))
         if not candidate_evaluation.ok and _git_worktree_marker(project_dir) is not None:
             issues.append(f"git ignore evaluation failed: {candidate_evaluation.error}")
             return StableOutputInventory(files=(), issues=tuple(issues), mode=inventory_mode)
@@ -449,7 +488,7 @@ def collect_stable_output_inventory(
                 ignore_output_dir / "__template_output_inventory_probe__" / "artifact.sentinel-b",
                 ignore_output_dir / "__template_output_inventory_probe__" / "nested" / "leaf",
             )
-            probe_evaluation = _git_ignore_matches(probes, project_dir)
+            probe_evaluation = evaluate_ignores(probes)
             if not probe_evaluation.ok and _git_worktree_marker(project_dir) is not None:
                 issues.append(f"git ignore evaluation failed: {probe_evaluation.error}")
                 return StableOutputInventory(files=(), issues=tuple(issues), mode=inventory_mode)
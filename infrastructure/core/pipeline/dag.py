@@ -251,6 +251,7 @@ class PipelineDAG:
         from infrastructure.core.pipeline.types import StageSpec
 
         sorted_stages = self.sorted_stages()
+        present = {stage.name for stage in sorted_stages}
         specs: list[StageSpec] = []
 
         for stage in sorted_stages:
@@ -262,6 +263,7 @@ class PipelineDAG:
                     contract=stage.contract,
                     hooks=stage.hooks,
                     key=stage.key,
+                    depends_on=tuple(dep for dep in stage.depends_on if dep in present),
                 )
             )
 
@@ -23,6 +23,7 @@ from infrastructure.core.logging.utils import (
 from infrastructure.core.errors import (
     PIPELINE_STAGE_FAILED,
 )
+from infrastructure.core.pipeline.artifact_ledger import ArtifactDigestLedger
 from infrastructure.core.pipeline.resume import PipelineResumeMixin
 from infrastructure.core.pipeline.stages import PipelineStageMixin
 from infrastructure.core.pipeline.control import load_pipeline_control_config, merge_control_configs
@@ -35,6 +36,7 @@ from infrastructure.core.pipeline.types import (
 from infrastructure.core.pipeline._stage_execution import execute_stage
 from infrastructure.core.pipeline.definition import PipelinePurpose, resolve_pipeline_source
 from infrastructure.core.telemetry import TelemetryCollector, TelemetryConfig
+from infrastructure.core.worker_policy import clamp_worker_count
 
 logger = get_logger(__name__)
 
@@ -80,11 +82,17 @@ class PipelineExecutor(PipelineStageMixin, PipelineResumeMixin):
 
         # Incremental (content-hash) skip manifest. Stays ``None`` unless the
         # opt-in feature is enabled and a run loads it. DEFAULT-OFF.
+        from infrastructure.core.files.content_index import ContentHashIndex
         from infrastructure.core.pipeline.incremental import HashManifest
 
         self._incremental_manifest: HashManifest | None = None
+        self._content_index: ContentHashIndex | None = None
         self._artifact_manifest_sealed = False
         self._artifact_manifest_boundary_names: frozenset[str] = frozenset()
+        # Run-scoped digest/ignore/manifest memo so each stage's artifact
+        # manifest only hashes what that stage wrote.
+        self._artifact_ledger = ArtifactDigestLedger()
+        self.checkpoint_manager.digest_hint = self._artifact_ledger.cached_sha256
 
     def _setup_log_file_handler(self) -> None:
         """Set up or recreate the log file handler.
@@ -278,16 +286,34 @@ class PipelineExecutor(PipelineStageMixin, PipelineResumeMixin):
             pipeline_start,
             stage_spec=stage_spec,
         )
+        self._commit_stage_result(stage_num, stage_spec, result, results, pipeline_start)
+        return result
+
+    def _commit_stage_result(
+        self,
+        stage_num: int,
+        stage_spec: StageSpec,
+        result: PipelineStageResult,
+        results: list[PipelineStageResult],
+        pipeline_start: float,
+        *,
+        record: bool = True,
+    ) -> None:
+        """Append a finished stage result and persist its bookkeeping.
+
+        ``record=False`` appends the result for reporting only; the parallel
+        scheduler uses it for stages that finished after the run was halted so
+        the checkpoint never claims work beyond the first failure or pause.
+        """
         results.append(result)
         if not result.success:
             logger.error(PIPELINE_STAGE_FAILED.format(stage_num=stage_num, stage_name=stage_spec.name))
-        elif result.stage_completed:
+        elif result.stage_completed and record:
             self._record_incremental_hash(stage_spec)
             if not self._artifact_manifest_sealed:
                 self._write_artifact_manifest(stage_num, stage_spec)
             self._write_snapshot(stage_num, stage_spec)
             self._save_checkpoint(pipeline_start, stage_num, results)
-        return result
 
     # -- Incremental (content-hash) stage skipping (DEFAULT-OFF) -------------
 
@@ -310,6 +336,7 @@ class PipelineExecutor(PipelineStageMixin, PipelineResumeMixin):
             project_dir=self.config.project_dir,
             stage_name=stage_spec.name,
             contract=stage_spec.contract,
+            index=self._content_index,
         )
         if not decision.skip:
             return None
@@ -326,7 +353,11 @@ class PipelineExecutor(PipelineStageMixin, PipelineResumeMixin):
         """Record the stage's input/output hashes (no-op when feature disabled)."""
         if not self._incremental_enabled() or self._incremental_manifest is None:
             return
-        from infrastructure.core.pipeline.incremental import record_stage_hash, save_hash_manifest
+        from infrastructure.core.pipeline.incremental import (
+            record_stage_hash,
+            save_hash_manifest,
+            save_stage_content_index,
+        )
 
         try:
             # Pass empty upstream hashes: transitive invalidation flows through
@@ -339,36 +370,114 @@ class PipelineExecutor(PipelineStageMixin, PipelineResumeMixin):
                 stage_name=stage_spec.name,
                 contract=stage_spec.contract,
                 upstream_output_hashes={},
+                index=self._content_index,
             )
             save_hash_manifest(self.config.project_dir / "output", self._incremental_manifest)
+            if self._content_index is not None:
+                save_stage_content_index(self.config.project_dir / "output", self._content_index)
         except OSError as exc:
             logger.warning(f"Failed to record incremental hash: {exc}")
 
     def _load_incremental_manifest(self) -> None:
-        """Load the hash manifest for this run (no-op when feature disabled)."""
+        """Load the hash manifest and content-hash index (no-op when feature disabled)."""
         self._incremental_manifest = None
+        self._content_index = None
         if not self._incremental_enabled():
             return
-        from infrastructure.core.pipeline.incremental import load_hash_manifest
+        from infrastructure.core.pipeline.incremental import load_hash_manifest, load_stage_content_index
 
         self._incremental_manifest = load_hash_manifest(self.config.project_dir / "output")
+        self._content_index = load_stage_content_index(self.config.project_dir / "output")
 
     def _execute_pipeline(self, stages: list[StageSpec]) -> list[PipelineStageResult]:
         """Execute pipeline stages."""
         self._current_stage_count = len(stages)
         self._artifact_manifest_sealed = False
+        self._artifact_ledger = ArtifactDigestLedger()
+        self.checkpoint_manager.digest_hint = self._artifact_ledger.cached_sha256
         results: list[PipelineStageResult] = []
         pipeline_start = time.time()
         self._load_incremental_manifest()
 
-        for stage_num, stage_spec in enumerate(stages, 1):
-            result = self._run_stage_and_checkpoint(stage_num, stage_spec, results, pipeline_start)
-            if not result.success or result.hitl_pause:
-                break
+        self._run_stages(list(enumerate(stages, 1)), results, pipeline_start)
 
         self._finalize_pipeline_run(pipeline_start, results)
         return results
 
+    def _run_stages(
+        self,
+        numbered_stages: list[tuple[int, StageSpec]],
+        results: list[PipelineStageResult],
+        pipeline_start: float,
+    ) -> None:
+        """Run numbered stages serially, or through the ready-queue scheduler.
+
+        ``config.stage_parallelism`` of 1 (the default) keeps the original
+        one-stage-at-a-time loop; larger values hand the plan to
+        :func:`infrastructure.core.pipeline.scheduler.run_ready_queue`.
+        """
+        workers = clamp_worker_count(max(1, self.config.stage_parallelism), len(numbered_stages))
+        if workers <= 1:
+            for stage_num, stage_spec in numbered_stages:
+                result = self._run_stage_and_checkpoint(stage_num, stage_spec, results, pipeline_start)
+                if not result.success or result.hitl_pause:
+                    break
+            return
+        self._run_stages_parallel(numbered_stages, results, pipeline_start, workers)
+
+    def _run_stages_parallel(
+        self,
+        numbered_stages: list[tuple[int, StageSpec]],
+        results: list[PipelineStageResult],
+        pipeline_start: float,
+        workers: int,
+    ) -> None:
+        """Dispatch independent stages concurrently onto ``workers`` threads."""
+        from infrastructure.core.pipeline.hitl import HitlController
+        from infrastructure.core.pipeline.scheduler import ScheduledStage, run_ready_queue
+
+        hitl = HitlController(project_output_dir=self.config.project_dir / "output", control=self.control_config)
+        smart_pause = self.control_config.smart_pause_action == "pause"
+        plan = [
+            ScheduledStage(
+                stage_num=stage_num,
+                spec=spec,
+                exclusive=(
+                    smart_pause
+                    or spec.name in self._artifact_manifest_boundary_names
+                    or spec.key == "clean"
+                    or hitl.should_pause_before(stage_num, spec)
+                    or hitl.should_pause_after(stage_num, spec)
+                ),
+            )
+            for stage_num, spec in numbered_stages
+        ]
+        logger.info(f"Running {len(plan)} stage(s) with stage parallelism {workers}")
+
+        def pre_dispatch(stage: ScheduledStage) -> PipelineStageResult | None:
+            self._prepare_artifact_manifest_for_stage(stage.spec, results)
+            return self._maybe_skip_stage_incremental(stage.stage_num, stage.spec)
+
+        def run_stage(stage: ScheduledStage) -> PipelineStageResult:
+            return self._execute_stage(
+                stage.stage_num,
+                stage.spec.name,
+                stage.spec.func,
+                pipeline_start,
+                stage_spec=stage.spec,
+            )
+
+        def commit_stage(stage: ScheduledStage, result: PipelineStageResult, record: bool) -> None:
+            self._commit_stage_result(stage.stage_num, stage.spec, result, results, pipeline_start, record=record)
+
+        run_ready_queue(
+            plan,
+            max_workers=workers,
+            run_stage=run_stage,
+            commit_stage=commit_stage,
+            pre_dispatch=pre_dispatch,
+        )
+
     def _finalize_pipeline_run(self, pipeline_start: float, results: list[PipelineStageResult]) -> None:
         """Shared post-run finalization for fresh and resumed pipeline paths."""
         if self._telemetry is not None:
@@ -416,6 +525,7 @@ class PipelineExecutor(PipelineStageMixin, PipelineResumeMixin):
                 stage_num=stage_num,
                 stage_name=stage_spec.name,
                 contract=stage_spec.contract,
+                ledger=self._artifact_ledger,
             )
             aggregate_artifact_manifests(
                 self.config.project_dir / "output",
@@ -423,6 +533,12 @@ class PipelineExecutor(PipelineStageMixin, PipelineResumeMixin):
                     self.config.repo_root,
                     self.config.project_dir,
                 ),
+                ledger=self._artifact_ledger,
+            )
+            stats = self._artifact_ledger.stats
+            logger.debug(
+                f"Artifact ledger: {stats.hashed} hashed, {stats.reused} reused, "
+                f"{stats.ignore_queried} Git-ignore queries, {stats.manifests_reused} manifests reused"
             )
         except (OSError, ValueError) as exc:
             logger.warning(f"Failed to write artifact manifest: {exc}")
@@ -470,6 +586,7 @@ class PipelineExecutor(PipelineStageMixin, PipelineResumeMixin):
                     self.config.repo_root,
                     self.config.project_dir,
                 ),
+                ledger=self._artifact_ledger,
             )
         except (OSError, ValueError) as exc:
             logger.warning(f"Failed to finalize artifact manifest before validation: {exc}")
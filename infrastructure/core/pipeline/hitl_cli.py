@@ -20,6 +20,7 @@ class PipelineArgs:
     resume: bool = False
     core_only: bool = False
     incremental: bool = False
+    stage_parallelism: int = 1
     pipeline_path: str | None = None
     stage: str | None = None
     hitl_mode: str = "full-auto"
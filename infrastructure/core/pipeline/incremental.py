@@ -36,6 +36,23 @@ hashes, mutating an upstream input changes the upstream output, which changes
 the recorded upstream output hash, which changes the downstream input hash —
 so the downstream stage re-runs as well.
 
+Directories and the content-hash index
+--------------------------------------
+Declared *input* directories (``infrastructure/``, ``projects/{project}/src/``)
+are hashed as Merkle trees via
+:class:`~infrastructure.core.files.content_index.ContentHashIndex`, so editing,
+adding or removing any file below them invalidates the stage. The stage's own
+declared outputs are excluded from those walks (``projects/{project}/`` as an
+input must not be invalidated by ``projects/{project}/output/``). Declared
+*output* directories are existence-checked only: they are usually shared with
+downstream stages, whose writes would otherwise invalidate every upstream
+stage on every run.
+
+The index persists ``(size, mtime_ns, inode) -> sha256`` under
+``output/.pipeline/content_index.json`` so repeated skip checks stat files
+instead of re-reading them; only files whose stat signature changed are
+re-hashed.
+
 Determinism
 -----------
 Hashes are SHA-256 over a canonical, sorted serialization of declared paths and
@@ -51,6 +68,7 @@ import json
 from dataclasses import dataclass
 from pathlib import Path
 
+from infrastructure.core.files.content_index import ContentHashIndex, load_content_index, save_content_index
 from infrastructure.core.logging.utils import get_logger
 from infrastructure.core.pipeline.artifacts import _declared_output_paths
 from infrastructure.core.pipeline.types import StageContract
@@ -60,10 +78,16 @@ logger = get_logger(__name__)
 #: Manifest location, relative to ``output/``.
 INCREMENTAL_MANIFEST_RELPATH = Path(".pipeline") / "incremental.json"
 
+#: Stat-keyed content-hash index location, relative to ``output/``.
+CONTENT_INDEX_RELPATH = Path(".pipeline") / "content_index.json"
+
 #: Sentinel mixed into the hash for declared-but-missing input files. Keeps the
 #: hash deterministic (and distinct from an empty/zero-byte file) without raising.
 _MISSING_INPUT_SENTINEL = b"\x00<missing>\x00"
 
+#: Marker for declared output directories, which are existence-checked only.
+_DIRECTORY_OUTPUT_SENTINEL = b"\x00<directory>\x00"
+
 
 @dataclass(frozen=True)
 class IncrementalConfig:
@@ -175,6 +199,16 @@ def save_hash_manifest(output_dir: Path, manifest: HashManifest) -> None:
     path.write_text(json.dumps(manifest.to_dict(), indent=2, sort_keys=True) + "\n", encoding="utf-8")
 
 
+def load_stage_content_index(output_dir: Path) -> ContentHashIndex:
+    """Load the persistent content-hash index for a project ``output/`` directory."""
+    return load_content_index(output_dir / CONTENT_INDEX_RELPATH)
+
+
+def save_stage_content_index(output_dir: Path, index: ContentHashIndex) -> None:
+    """Persist the content-hash index next to the incremental manifest."""
+    save_content_index(output_dir / CONTENT_INDEX_RELPATH, index)
+
+
 # -- Path resolution ---------------------------------------------------------
 
 
@@ -188,23 +222,33 @@ def _resolve_input_paths(repo_root: Path, project_dir: Path, contract: StageCont
     return _declared_output_paths(repo_root, project_dir, proxy)
 
 
-def _hash_paths(paths: tuple[Path, ...]) -> str:
-    """Hash a set of files by their relative-order-independent content digest.
-
-    Each path contributes ``<resolved-path>\\0<sha256-of-bytes-or-sentinel>``.
-    Missing files contribute a fixed sentinel so the hash stays deterministic.
-    Entries are sorted so ordering of the declared tuple does not matter.
+def _hash_paths(
+    paths: tuple[Path, ...],
+    *,
+    index: ContentHashIndex | None = None,
+    hash_directories: bool = True,
+    exclude: tuple[Path, ...] = (),
+) -> str:
+    """Hash a set of declared paths by their relative-order-independent content digest.
+
+    Each path contributes ``<resolved-path>\\0<digest-or-sentinel>``. Files
+    contribute their SHA-256 (served from ``index`` when their stat is
+    unchanged); directories contribute their Merkle root, minus ``exclude``,
+    or a fixed directory marker when ``hash_directories`` is False. Missing
+    paths contribute a fixed sentinel so the hash stays deterministic. Entries
+    are sorted so ordering of the declared tuple does not matter.
     """
+    index = index if index is not None else ContentHashIndex()
     digest = hashlib.sha256()
     parts: list[str] = []
     for path in paths:
         key = path.as_posix()
         if path.is_file():
-            file_digest = hashlib.sha256()
-            with path.open("rb") as fh:
-                for chunk in iter(lambda: fh.read(1024 * 1024), b""):
-                    file_digest.update(chunk)
-            parts.append(f"{key}\x00{file_digest.hexdigest()}")
+            parts.append(f"{key}\x00{index.file_digest(path)}")
+        elif path.is_dir() and hash_directories:
+            parts.append(f"{key}\x00{index.tree_digest(path, exclude=exclude)}")
+        elif path.is_dir():
+            parts.append(f"{key}\x00{hashlib.sha256(_DIRECTORY_OUTPUT_SENTINEL).hexdigest()}")
         else:
             parts.append(f"{key}\x00{hashlib.sha256(_MISSING_INPUT_SENTINEL).hexdigest()}")
     for part in sorted(parts):
@@ -223,19 +267,27 @@ def compute_stage_input_hash(
     stage_name: str,
     contract: StageContract,
     upstream_output_hashes: dict[str, str],
+    index: ContentHashIndex | None = None,
 ) -> str:
     """Compute a deterministic input hash for a stage.
 
     The hash folds in: the stage name, the content hash of declared input
-    artifacts, and the recorded output hashes of dependency stages
+    artifacts (directories as Merkle roots that exclude the stage's own
+    declared outputs), and the recorded output hashes of dependency stages
     (``upstream_output_hashes``). Any change to those flips the hash.
     """
+    own_outputs = _declared_output_paths(repo_root, project_dir, contract)
+    inputs_digest = _hash_paths(
+        _resolve_input_paths(repo_root, project_dir, contract),
+        index=index,
+        exclude=own_outputs,
+    )
     digest = hashlib.sha256()
     digest.update(b"stage\x00")
     digest.update(stage_name.encode("utf-8"))
     digest.update(b"\x1e")
     digest.update(b"inputs\x00")
-    digest.update(_hash_paths(_resolve_input_paths(repo_root, project_dir, contract)).encode("ascii"))
+    digest.update(inputs_digest.encode("ascii"))
     digest.update(b"\x1e")
     digest.update(b"upstream\x00")
     # A stage never folds its OWN recorded output hash into its input hash, only
@@ -256,9 +308,18 @@ def compute_stage_output_hash(
     repo_root: Path,
     project_dir: Path,
     contract: StageContract,
+    index: ContentHashIndex | None = None,
 ) -> str:
-    """Compute a deterministic content hash over a stage's declared outputs."""
-    return _hash_paths(_declared_output_paths(repo_root, project_dir, contract))
+    """Compute a deterministic content hash over a stage's declared outputs.
+
+    Declared output files are content-hashed; declared output directories are
+    existence-checked only (see the module docstring).
+    """
+    return _hash_paths(
+        _declared_output_paths(repo_root, project_dir, contract),
+        index=index,
+        hash_directories=False,
+    )
 
 
 def declared_outputs_present(
@@ -286,6 +347,7 @@ def should_skip_stage(
     project_dir: Path,
     stage_name: str,
     contract: StageContract,
+    index: ContentHashIndex | None = None,
 ) -> SkipDecision:
     """Decide whether a stage may be skipped under incremental mode.
 
@@ -293,6 +355,9 @@ def should_skip_stage(
     disabled (the default), guaranteeing the legacy behavior. When enabled, the
     stage is skippable only when the recorded input hash matches, all declared
     outputs are present, AND the current output hash matches the recorded one.
+
+    Pass a persistent ``index`` to make repeated decisions stat-only for
+    unchanged files.
     """
     if not config.enabled:
         return SkipDecision(skip=False)
@@ -309,6 +374,7 @@ def should_skip_stage(
         stage_name=stage_name,
         contract=contract,
         upstream_output_hashes={},
+        index=index,
     )
     record = manifest.get(stage_name)
     if record is None or record.input_hash != input_hash:
@@ -320,6 +386,7 @@ def should_skip_stage(
         repo_root=repo_root,
         project_dir=project_dir,
         contract=contract,
+        index=index,
     )
     if record.output_hash != current_output:
         # Recorded input matched but the declared outputs were rewritten or swapped.
@@ -336,6 +403,7 @@ def record_stage_hash(
     contract: StageContract,
     upstream_output_hashes: dict[str, str],
     input_hash: str | None = None,
+    index: ContentHashIndex | None = None,
 ) -> None:
     """Record a stage's input and output hashes into the manifest.
 
@@ -349,12 +417,16 @@ def record_stage_hash(
             stage_name=stage_name,
             contract=contract,
             upstream_output_hashes=upstream_output_hashes,
+            index=index,
         )
-    output_hash = compute_stage_output_hash(repo_root=repo_root, project_dir=project_dir, contract=contract)
+    output_hash = compute_stage_output_hash(
+        repo_root=repo_root, project_dir=project_dir, contract=contract, index=index
+    )
     manifest.record(stage_name, input_hash=input_hash, output_hash=output_hash)
 
 
 __all__ = [
+    "CONTENT_INDEX_RELPATH",
     "INCREMENTAL_MANIFEST_RELPATH",
     "HashManifest",
     "IncrementalConfig",
@@ -364,7 +436,9 @@ __all__ = [
     "compute_stage_output_hash",
     "declared_outputs_present",
     "load_hash_manifest",
+    "load_stage_content_index",
     "record_stage_hash",
     "save_hash_manifest",
+    "save_stage_content_index",
     "should_skip_stage",
 ]
@@ -65,6 +65,15 @@ class PipelineResumeMixin(ABC):
     ) -> PipelineStageResult:
         """Run one stage and save checkpoint (implemented by host class)."""
 
+    @abstractmethod
+    def _run_stages(
+        self,
+        numbered_stages: list[tuple[int, StageSpec]],
+        results: list[PipelineStageResult],
+        pipeline_start: float,
+    ) -> None:
+        """Run numbered stages until one fails or pauses (implemented by host class)."""
+
     def _start_fresh(self) -> list[PipelineStageResult]:
         """Run the pipeline from scratch, bypassing any checkpoint."""
         skip_clean = not self.config.clean
@@ -130,12 +139,8 @@ class PipelineResumeMixin(ABC):
 
         # Execute remaining stages, continuing checkpoint numbering from prior completed count
         pipeline_start = checkpoint.pipeline_start_time
-        executed_stage_num = len(resumed_results)
-        for stage_spec in remaining:
-            executed_stage_num += 1
-            result = self._run_stage_and_checkpoint(executed_stage_num, stage_spec, resumed_results, pipeline_start)
-            if not result.success or result.hitl_pause:
-                break
+        first_stage_num = len(resumed_results) + 1
+        self._run_stages(list(enumerate(remaining, first_stage_num)), resumed_results, pipeline_start)
 
         finalize = getattr(self, "_finalize_pipeline_run", None)
         if callable(finalize):
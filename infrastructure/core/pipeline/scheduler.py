@@ -0,0 +1,200 @@
+"""Ready-queue scheduler for running independent pipeline stages concurrently.
+
+The serial executor walks the Kahn-sorted stage list one stage at a time. The
+declared ``depends_on`` edges usually leave room for overlap (validation,
+metadata, ebook and reporting stages only need the rendered manuscript), so
+with ``--stage-parallelism N`` the executor hands the same sorted list to
+:func:`run_ready_queue`, which dispatches every stage whose dependencies have
+succeeded onto a bounded thread pool. Stages are subprocess scripts, so
+threads are enough to keep N of them running.
+
+Correctness rules, in order of precedence:
+
+* **Dependencies.** A stage is ready only when every surviving ``depends_on``
+  stage has completed successfully.
+* **Artifact conflicts.** Two stages whose :class:`StageContract` artifacts
+  overlap (one writes a path the other reads or writes) never run at the same
+  time, and a later stage never overtakes an earlier conflicting one, so the
+  serial write order is preserved. A stage that declares no output artifacts
+  may write anywhere and therefore conflicts with every other stage.
+* **Exclusive stages.** Stages that may pause for HITL, and the stage that
+  seals the artifact manifest, run alone: everything before them finishes
+  first and nothing after them starts until they are committed.
+* **Commit order.** Results are committed (appended, checkpointed, recorded
+  in the incremental and artifact manifests) strictly in stage-number order,
+  so the checkpoint is always a prefix of the sorted plan and
+  ``--resume`` keeps working unchanged.
+
+The first failed or paused result stops further dispatch; stages already
+running are drained and reported but are not checkpointed past the stop.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+
+from infrastructure.core.logging.utils import get_logger
+from infrastructure.core.pipeline.types import PipelineStageResult, StageContract, StageSpec
+
+logger = get_logger(__name__)
+
+__all__ = [
+    "ScheduledStage",
+    "artifact_paths_overlap",
+    "contracts_conflict",
+    "run_ready_queue",
+]
+
+
+@dataclass(frozen=True)
+class ScheduledStage:
+    """One stage of a plan together with its 1-based position and barrier flag."""
+
+    stage_num: int
+    spec: StageSpec
+    exclusive: bool = False
+
+
+def _normalize_artifact(path: str) -> str:
+    normalized = path.replace("\\", "/").strip()
+    while normalized.startswith("./"):
+        normalized = normalized[2:]
+    return normalized.rstrip("/")
+
+
+def artifact_paths_overlap(left: str, right: str) -> bool:
+    """Return True when two declared artifact paths can refer to the same file.
+
+    Paths overlap when they are equal or one is a directory prefix of the
+    other. ``{project}`` placeholders are compared verbatim: every stage of a
+    plan is formatted with the same project name.
+    """
+    a = _normalize_artifact(left)
+    b = _normalize_artifact(right)
+    if not a or not b:
+        return True
+    if a == b:
+        return True
+    return a.startswith(b + "/") or b.startswith(a + "/")
+
+
+def contracts_conflict(first: StageContract, second: StageContract) -> bool:
+    """Return True when the two stages must not run at the same time."""
+    if not first.output_artifacts or not second.output_artifacts:
+        return True
+    for written in first.output_artifacts:
+        for touched in (*second.input_artifacts, *second.output_artifacts):
+            if artifact_paths_overlap(written, touched):
+                return True
+    for written in second.output_artifacts:
+        for read in first.input_artifacts:
+            if artifact_paths_overlap(written, read):
+                return True
+    return False
+
+
+def _halts(result: PipelineStageResult) -> bool:
+    return not result.success or result.hitl_pause
+
+
+def run_ready_queue(
+    stages: Sequence[ScheduledStage],
+    *,
+    max_workers: int,
+    run_stage: Callable[[ScheduledStage], PipelineStageResult],
+    commit_stage: Callable[[ScheduledStage, PipelineStageResult, bool], None],
+    pre_dispatch: Callable[[ScheduledStage], PipelineStageResult | None] | None = None,
+) -> None:
+    """Run ``stages`` concurrently while preserving serial-equivalent semantics.
+
+    Args:
+        stages: Topologically sorted plan; ``stage_num`` must be increasing.
+        max_workers: Upper bound on concurrently running stages.
+        run_stage: Executes one stage on a worker thread and returns its result.
+        commit_stage: Called on the scheduling thread, in stage order, with
+            ``(stage, result, record)``. ``record`` is False for results that
+            must not be checkpointed: incremental skips (mirroring the serial
+            path) and stages that finished after the run was halted.
+        pre_dispatch: Optional hook called on the scheduling thread just before
+            a stage is dispatched. Returning a result short-circuits the stage
+            (used for incremental skips) without occupying a worker.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be positive")
+
+    order = list(stages)
+    names = {stage.spec.name for stage in order}
+    pending: list[ScheduledStage] = list(order)
+    running: dict[Future[PipelineStageResult], ScheduledStage] = {}
+    finished: dict[int, tuple[PipelineStageResult, bool]] = {}
+    succeeded: set[str] = set()
+    commit_index = 0
+    halted = False
+    commit_halted = False
+
+    def can_dispatch(stage: ScheduledStage) -> bool:
+        if any(dep in names and dep not in succeeded for dep in stage.spec.depends_on):
+            return False
+        if any(active.exclusive for active in running.values()):
+            return False
+        earlier = [other for other in order if other.stage_num < stage.stage_num and other.stage_num not in finished]
+        if stage.exclusive:
+            return not running and not earlier
+        for other in earlier:
+            if other.exclusive or contracts_conflict(stage.spec.contract, other.spec.contract):
+                return False
+        return True
+
+    def record(stage: ScheduledStage, result: PipelineStageResult, recordable: bool) -> None:
+        nonlocal halted
+        finished[stage.stage_num] = (result, recordable)
+        if result.success and result.stage_completed:
+            succeeded.add(stage.spec.name)
+        if _halts(result) and not halted:
+            halted = True
+            logger.info(f"Stage {stage.stage_num} halted the parallel run; draining {len(running)} running stage(s)")
+
+    def commit_ready() -> None:
+        nonlocal commit_index, commit_halted
+        while not commit_halted and commit_index < len(order) and order[commit_index].stage_num in finished:
+            stage = order[commit_index]
+            result, recordable = finished[stage.stage_num]
+            commit_stage(stage, result, recordable)
+            commit_index += 1
+            commit_halted = _halts(result)
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pipeline-stage") as pool:
+        while True:
+            dispatched = True
+            while dispatched and not halted:
+                dispatched = False
+                for stage in pending:
+                    if len(running) >= max_workers:
+                        break
+                    if not can_dispatch(stage):
+                        continue
+                    pending.remove(stage)
+                    dispatched = True
+                    immediate = pre_dispatch(stage) if pre_dispatch is not None else None
+                    if immediate is not None:
+                        record(stage, immediate, False)
+                        commit_ready()
+                    else:
+                        running[pool.submit(run_stage, stage)] = stage
+                    break
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=lambda f: running[f].stage_num):
+                stage = running.pop(future)
+                record(stage, future.result(), True)
+            commit_ready()
+
+    # Anything still uncommitted finished behind a halt (or after a gap left by
+    # stages that were never dispatched): report it, but never checkpoint it.
+    for stage in order[commit_index:]:
+        if stage.stage_num in finished:
+            result, _ = finished[stage.stage_num]
+            commit_stage(stage, result, False)
@@ -100,6 +100,10 @@ class PipelineConfig:
         resume: Whether to resume from the last checkpoint.
         hitl_mode: Lightweight human-in-the-loop policy. Defaults to
             ``full-auto`` so existing pipelines keep running without pauses.
+        stage_parallelism: Maximum number of independent stages dispatched
+            concurrently. ``1`` (the default) keeps the strictly serial order;
+            larger values enable the ready-queue scheduler in
+            :mod:`infrastructure.core.pipeline.scheduler`.
         total_stages: Total number of pipeline stages (for ETA display).
     """
 
@@ -114,6 +118,7 @@ class PipelineConfig:
     control: PipelineControlConfig = field(default_factory=PipelineControlConfig)
     incremental: "IncrementalConfig" = field(default_factory=lambda: _default_incremental_config())
     pipeline_path: Path | None = None
+    stage_parallelism: int = 1
     total_stages: int = 10
 
     @property
@@ -162,7 +167,10 @@ class StageSpec(NamedTuple):
     NamedTuple is intentional: the specification is logically immutable once
     defined. ``key`` carries the stable machine-facing identity from
     ``pipeline.yaml`` so orchestration does not have to infer lifecycle
-    boundaries from a user-facing stage name.
+    boundaries from a user-facing stage name. ``depends_on`` lists the
+    ``depends_on`` edges that survived tag filtering; the serial executor
+    ignores it (the list is already topologically sorted) while the parallel
+    scheduler uses it to decide which stages are ready.
     """
 
     name: str
@@ -170,3 +178,4 @@ class StageSpec(NamedTuple):
     contract: StageContract = StageContract()
     hooks: StageHooks = StageHooks()
     key: str | None = None
+    depends_on: tuple[str, ...] = ()
@@ -10,15 +10,63 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
 import time
+from collections.abc import Callable, Mapping
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any
 
+from infrastructure.core.files.content_index import RACY_WINDOW_NS
 from infrastructure.core.logging.utils import get_logger
 
 logger = get_logger(__name__)
 
+_DIGEST_IGNORED_PARTS = frozenset({".checkpoints", ".pipeline", "logs", "__pycache__"})
+_CHUNK_SIZE = 1024 * 1024
+
+#: ``relpath -> (size, mtime_ns, sha256)``; ``mtime_ns == -1`` forces a re-hash.
+OutputFingerprint = dict[str, tuple[int, int, str]]
+#: Optional source of already-computed digests, e.g. the artifact-manifest ledger.
+DigestHint = Callable[[Path, os.stat_result], "str | None"]
+
+
+def _stream_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _fingerprint_digest(fingerprint: Mapping[str, tuple[int, int, str]]) -> str:
+    """Tree digest over ``(relpath, sha256)`` pairs in path order."""
+    digest = hashlib.sha256()
+    for rel in sorted(fingerprint):
+        digest.update(rel.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(fingerprint[rel][2].encode("ascii"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def _fingerprint_from_payload(raw: object) -> OutputFingerprint | None:
+    if not isinstance(raw, dict):
+        return None
+    fingerprint: OutputFingerprint = {}
+    for rel, row in raw.items():
+        if not (
+            isinstance(rel, str)
+            and isinstance(row, list)
+            and len(row) == 3
+            and type(row[0]) is int
+            and type(row[1]) is int
+            and isinstance(row[2], str)
+        ):
+            return None
+        fingerprint[rel] = (row[0], row[1], row[2])
+    return fingerprint
+
 
 @dataclass
 class StageResult:
@@ -43,10 +91,13 @@ class PipelineCheckpoint:
     total_stages: int
     checkpoint_time: float
     output_digest: str = ""
+    # Stat fingerprint behind ``output_digest``; ``None`` for legacy checkpoints
+    # whose digest covers raw file bytes instead of per-file SHA-256 values.
+    output_files: OutputFingerprint | None = None
 
     def to_dict(self) -> dict[str, Any]:
         """Convert checkpoint to dictionary for serialization."""
-        return {
+        data: dict[str, Any] = {
             "pipeline_start_time": self.pipeline_start_time,
             "last_stage_completed": self.last_stage_completed,
             "stage_results": [asdict(sr) for sr in self.stage_results],
@@ -54,6 +105,9 @@ class PipelineCheckpoint:
             "checkpoint_time": self.checkpoint_time,
             "output_digest": self.output_digest,
         }
+        if self.output_files is not None:
+            data["output_files"] = {rel: list(row) for rel, row in sorted(self.output_files.items())}
+        return data
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "PipelineCheckpoint":
@@ -66,11 +120,22 @@ class PipelineCheckpoint:
             total_stages=data["total_stages"],
             checkpoint_time=data["checkpoint_time"],
             output_digest=str(data.get("output_digest", "") or ""),
+            output_files=_fingerprint_from_payload(data.get("output_files")),
         )
 
 
 class CheckpointManager:
-    """Manages pipeline checkpoints for resume capability."""
+    """Manages pipeline checkpoints for resume capability.
+
+    The output tree is fingerprinted in two tiers so that saving and validating
+    a checkpoint costs O(files) rather than O(bytes): each file's
+    ``(size, mtime_ns)`` is compared with the last known fingerprint and only
+    files whose stat changed are streamed through SHA-256. ``digest_hint`` may
+    supply digests another component already computed (the executor wires in
+    its artifact-manifest ledger). Files modified within
+    :data:`~infrastructure.core.files.content_index.RACY_WINDOW_NS` of a save
+    are recorded with an invalid mtime so they are always re-hashed.
+    """
 
     def __init__(
         self,
@@ -99,6 +164,8 @@ class CheckpointManager:
 
         self.checkpoint_dir = Path(checkpoint_dir)
         self.checkpoint_file = self.checkpoint_dir / "pipeline_checkpoint.json"
+        self.digest_hint: DigestHint | None = None
+        self._fingerprint: OutputFingerprint = {}
 
     def _ensure_checkpoint_dir(self) -> None:
         """Ensure checkpoint directory exists."""
@@ -124,13 +191,15 @@ class CheckpointManager:
             Callers should log a warning and continue — pipeline execution
             proceeds regardless, but resume will not be available.
         """
+        fingerprint = self._output_fingerprint()
         checkpoint = PipelineCheckpoint(
             pipeline_start_time=pipeline_start_time,
             last_stage_completed=last_stage_completed,
             stage_results=stage_results,
             total_stages=total_stages,
             checkpoint_time=time.time(),
-            output_digest=self._output_tree_digest(),
+            output_digest=_fingerprint_digest(fingerprint),
+            output_files=fingerprint,
         )
 
         try:
@@ -191,29 +260,64 @@ class CheckpointManager:
             logger.debug(f"checkpoint_exists check failed (treating as no checkpoint): {type(e).__name__}: {e}")
             return False
 
-    def _output_tree_digest(self) -> str:
-        """SHA-256 of the output tree excluding checkpoints, logs, and internal metadata."""
+    def _output_files(self) -> list[tuple[str, Path]]:
+        """Return ``(relpath, path)`` for every digested output file, sorted by relpath."""
         output_root = self.checkpoint_dir.parent
         if not output_root.is_dir():
-            return ""
-        digest = hashlib.sha256()
-        files: list[Path] = []
-        ignored_parts = {".checkpoints", ".pipeline", "logs", "__pycache__"}
+            return []
+        files: list[tuple[str, Path]] = []
         for path in output_root.rglob("*"):
             if not path.is_file():
                 continue
             try:
-                rel_parts = set(path.relative_to(output_root).parts)
-                if rel_parts & ignored_parts:
-                    continue
+                relative = path.relative_to(output_root)
             except ValueError:
                 continue
-            files.append(path)
-        for path in sorted(files, key=lambda item: item.as_posix()):
-            rel = path.relative_to(output_root).as_posix()
+            if _DIGEST_IGNORED_PARTS.intersection(relative.parts):
+                continue
+            files.append((relative.as_posix(), path))
+        return sorted(files)
+
+    def _output_fingerprint(self, known: Mapping[str, tuple[int, int, str]] | None = None) -> OutputFingerprint:
+        """Fingerprint the output tree, hashing only files whose stat changed.
+
+        Args:
+            known: Fingerprint to reuse digests from (e.g. the one stored in the
+                checkpoint being validated). The manager's own last fingerprint
+                is always consulted as well.
+        """
+        now_ns = time.time_ns()
+        fingerprint: OutputFingerprint = {}
+        for rel, path in self._output_files():
+            st = path.stat()
+            digest = None
+            for source in (known, self._fingerprint):
+                prior = source.get(rel) if source else None
+                if prior is not None and prior[0] == st.st_size and prior[1] == st.st_mtime_ns:
+                    digest = prior[2]
+                    break
+            if digest is None and self.digest_hint is not None:
+                digest = self.digest_hint(path.absolute(), st)
+            if digest is None:
+                digest = _stream_sha256(path)
+            racy = now_ns - st.st_mtime_ns <= RACY_WINDOW_NS
+            fingerprint[rel] = (st.st_size, -1 if racy else st.st_mtime_ns, digest)
+        self._fingerprint = fingerprint
+        return fingerprint
+
+    def _output_tree_digest(self) -> str:
+        """SHA-256 of the output tree excluding checkpoints, logs, and internal metadata."""
+        return _fingerprint_digest(self._output_fingerprint())
+
+    def _legacy_output_tree_digest(self) -> str:
+        """Whole-byte digest used by checkpoints written before stat fingerprints."""
+        digest = hashlib.sha256()
+        for rel, path in self._output_files():
             digest.update(rel.encode("utf-8"))
             digest.update(b"\0")
-            digest.update(path.read_bytes())
+            with path.open("rb") as fh:
+                for chunk in iter(lambda: fh.read(_CHUNK_SIZE), b""):
+                    digest.update(chunk)
             digest.update(b"\n")
         return digest.hexdigest()
 
@@ -271,7 +375,10 @@ class CheckpointManager:
                     )
 
             if checkpoint.last_stage_completed > 0 and checkpoint.output_digest:
-                current = self._output_tree_digest()
+                if checkpoint.output_files is not None:
+                    current = _fingerprint_digest(self._output_fingerprint(checkpoint.output_files))
+                else:
+                    current = self._legacy_output_tree_digest()
                 if current != checkpoint.output_digest:
                     return (
                         False,
@@ -9,7 +9,7 @@ API style note:
   for stateless one-off checks.
 Implementation split:
 - _validation.py   — SecurityValidator (input/path/filename/content validation)
-- _rate_limiting.py — RateLimiter, SecurityMonitor, rate_limit decorator
+- _rate_limiting.py — RateLimiter, TokenBucketLimiter, SecurityMonitor, rate_limit decorator
 - security.py       — HTTP headers, singletons, backwards-compat re-exports
 """
 
@@ -20,6 +20,7 @@ from infrastructure.core.exceptions import SecurityViolation  # noqa: F401
 from infrastructure.core._rate_limiting import (  # noqa: F401
     RateLimiter,
     SecurityMonitor,
+    TokenBucketLimiter,
     get_security_monitor,
     rate_limit,
 )
@@ -15,11 +15,21 @@ Usage in ``PipelineExecutor``::
         collector.end_stage(stage.name, stage_num, result)
 
     collector.finalize()
+
+Stages run as subprocesses, so the orchestrator's own ``psutil`` numbers say
+little about them. With ``track_children`` each stage additionally records
+``getrusage(RUSAGE_CHILDREN)`` deltas (CPU time, block I/O and — when a child
+sets a new high-water mark — peak RSS) and the peak RSS of the whole child
+tree observed by a background sampler. Both are process-wide: stages that
+overlap under the parallel scheduler share the children active while they ran.
 """
 
 import json
 import os
+import sys
+import threading
 import time
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
@@ -38,8 +48,75 @@ from infrastructure.core.telemetry.models import (
 )
 from infrastructure.core.telemetry.retention import rotate as rotate_telemetry
 
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
 logger = get_logger(__name__)
 
+# ``ru_maxrss`` is reported in kilobytes on Linux and in bytes on macOS.
+_MAXRSS_BYTES = 1 if sys.platform == "darwin" else 1024
+# ``ru_inblock`` / ``ru_oublock`` count 512-byte blocks.
+_BLOCK_BYTES = 512
+
+
+@dataclass(frozen=True)
+class _ChildUsage:
+    """Cumulative resource usage of all reaped child processes."""
+
+    user_s: float
+    system_s: float
+    maxrss_mb: float
+    read_bytes: int
+    write_bytes: int
+
+
+def _child_usage() -> _ChildUsage | None:
+    """Return ``getrusage(RUSAGE_CHILDREN)``, or ``None`` where unsupported."""
+    if resource is None:
+        return None
+    try:
+        usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    except (OSError, ValueError):
+        return None
+    return _ChildUsage(
+        user_s=usage.ru_utime,
+        system_s=usage.ru_stime,
+        maxrss_mb=usage.ru_maxrss * _MAXRSS_BYTES / 1024 / 1024,
+        read_bytes=usage.ru_inblock * _BLOCK_BYTES,
+        write_bytes=usage.ru_oublock * _BLOCK_BYTES,
+    )
+
+
+def _child_tree_rss_mb() -> float:
+    """Return the summed RSS of every live descendant of this process (MB)."""
+    if psutil is None:
+        return 0.0
+    try:
+        children = psutil.Process(os.getpid()).children(recursive=True)
+    except (psutil.Error, OSError):
+        return 0.0
+    total = 0
+    for child in children:
+        try:
+            total += child.memory_info().rss
+        except (psutil.Error, OSError):
+            continue  # exited between listing and sampling
+    return total / 1024 / 1024
+
+
+@dataclass
+class _StageStart:
+    """Resource baseline captured by ``start_stage`` for one in-flight stage."""
+
+    start_time: float
+    start_memory: float = 0.0
+    start_io: Any | None = None
+    start_children: _ChildUsage | None = None
+    child_peak_rss_mb: float = 0.0
+    diagnostic_snapshot: int = 0
+
 
 class TelemetryCollector:
     """Unified telemetry collector for pipeline execution.
@@ -79,12 +156,15 @@ class TelemetryCollector:
             config_used=config.to_dict(),
         )
 
-        # Per-stage tracking state
-        self._current_stage: str | None = None
-        self._stage_start_time: float = 0.0
-        self._stage_start_memory: float = 0.0
-        self._stage_start_io: Any | None = None
-        self._stage_diagnostic_snapshot: int = 0
+        # Per-stage tracking state, keyed by stage name so stages dispatched
+        # concurrently by the parallel scheduler keep independent baselines.
+        self._active_stages: dict[str, _StageStart] = {}
+        self._lock = threading.Lock()
+        self._sampler: threading.Thread | None = None
+        self._sampler_stop = threading.Event()
+        # Child CPU time is summed over every core; divide by this before
+        # comparing it with the single-core ``high_cpu_percent`` threshold.
+        self._cpu_count = os.cpu_count() or 1
 
     # ------------------------------------------------------------------
     # System info
@@ -137,22 +217,27 @@ class TelemetryCollector:
         if not self.config.enabled:
             return
 
-        self._current_stage = stage_name
-        self._stage_start_time = time.time()
-        self._stage_start_memory = 0.0
-        self._stage_start_io = None
+        start = _StageStart(start_time=time.time())
 
         if self.config.track_resources and psutil is not None:
             try:
                 proc = psutil.Process(os.getpid())
-                self._stage_start_memory = proc.memory_info().rss / 1024 / 1024
-                self._stage_start_io = proc.io_counters()
+                start.start_memory = proc.memory_info().rss / 1024 / 1024
+                start.start_io = proc.io_counters()
             except (AttributeError, OSError) as e:
                 logger.debug(f"Resource tracking unavailable: {e}")
 
+        if self._tracks_children():
+            start.start_children = _child_usage()
+
         # Snapshot diagnostic event count so we can compute delta
         if self.config.track_diagnostics and self.diagnostic_reporter:
-            self._stage_diagnostic_snapshot = len(self.diagnostic_reporter.events)
+            start.diagnostic_snapshot = len(self.diagnostic_reporter.events)
+
+        with self._lock:
+            self._active_stages[stage_name] = start
+        if self._tracks_children():
+            self._ensure_sampler()
 
         logger.debug(f"Telemetry: started stage '{stage_name}' (#{stage_num})")
 
@@ -176,7 +261,12 @@ class TelemetryCollector:
         Returns:
             The ``StageTelemetry`` record for this stage.
         """
-        duration = time.time() - self._stage_start_time if self._stage_start_time else 0.0
+        with self._lock:
+            start = self._active_stages.pop(stage_name, None)
+            idle = not self._active_stages
+        if idle:
+            self._stop_sampler()
+        duration = time.time() - start.start_time if start is not None else 0.0
 
         stage = StageTelemetry(
             stage_name=stage_name,
@@ -197,24 +287,86 @@ class TelemetryCollector:
                 stage.memory_mb = proc.memory_info().rss / 1024 / 1024
                 stage.cpu_percent = proc.cpu_percent(interval=0.1)
 
-                if self._stage_start_io is not None:
+                if start is not None and start.start_io is not None:
                     current_io = proc.io_counters()
-                    stage.io_read_mb = (current_io.read_bytes - self._stage_start_io.read_bytes) / 1024 / 1024
-                    stage.io_write_mb = (current_io.write_bytes - self._stage_start_io.write_bytes) / 1024 / 1024
+                    stage.io_read_mb = (current_io.read_bytes - start.start_io.read_bytes) / 1024 / 1024
+                    stage.io_write_mb = (current_io.write_bytes - start.start_io.write_bytes) / 1024 / 1024
             except (AttributeError, OSError) as e:
                 logger.debug(f"Resource metrics unavailable for '{stage_name}': {e}")
 
+        if start is not None and self._tracks_children():
+            self._record_child_usage(stage, start)
+
         # Diagnostic event delta
         if self.config.track_diagnostics and self.diagnostic_reporter:
-            new_events = self.diagnostic_reporter.events[self._stage_diagnostic_snapshot :]
+            snapshot = start.diagnostic_snapshot if start is not None else 0
+            new_events = self.diagnostic_reporter.events[snapshot:]
             stage.diagnostic_errors = sum(1 for e in new_events if e.severity == DiagnosticSeverity.ERROR)
             stage.diagnostic_warnings = sum(1 for e in new_events if e.severity == DiagnosticSeverity.WARNING)
 
-        self._report.stages.append(stage)
-        self._current_stage = None
+        with self._lock:
+            self._report.stages.append(stage)
         logger.debug(f"Telemetry: ended stage '{stage_name}' (duration={duration:.2f}s, success={success})")
         return stage
 
+    # ------------------------------------------------------------------
+    # Child-process accounting
+    # ------------------------------------------------------------------
+
+    def _tracks_children(self) -> bool:
+        return self.config.enabled and self.config.track_resources and self.config.track_children
+
+    @staticmethod
+    def _record_child_usage(stage: StageTelemetry, start: _StageStart) -> None:
+        """Fill the ``child_*`` fields from rusage deltas and the sampled peak."""
+        peak = start.child_peak_rss_mb
+        before = start.start_children
+        after = _child_usage()
+        if before is not None and after is not None:
+            stage.child_cpu_user_s = max(0.0, after.user_s - before.user_s)
+            stage.child_cpu_system_s = max(0.0, after.system_s - before.system_s)
+            stage.child_io_read_mb = max(0, after.read_bytes - before.read_bytes) / 1024 / 1024
+            stage.child_io_write_mb = max(0, after.write_bytes - before.write_bytes) / 1024 / 1024
+            # ru_maxrss is a high-water mark over all reaped children; it only
+            # attributes to this stage when one of its children raised it.
+            if after.maxrss_mb > before.maxrss_mb:
+                peak = max(peak, after.maxrss_mb)
+        stage.child_peak_rss_mb = peak
+
+    def _ensure_sampler(self) -> None:
+        """Start the child-tree RSS sampler if it is not already running."""
+        if psutil is None:
+            return
+        with self._lock:
+            if self._sampler is not None and self._sampler.is_alive():
+                return
+            self._sampler_stop = threading.Event()
+            self._sampler = threading.Thread(
+                target=self._sample_children,
+                args=(self._sampler_stop,),
+                name="telemetry-child-sampler",
+                daemon=True,
+            )
+            self._sampler.start()
+
+    def _stop_sampler(self) -> None:
+        with self._lock:
+            sampler, self._sampler = self._sampler, None
+            self._sampler_stop.set()
+        if sampler is not None:
+            sampler.join(timeout=max(1.0, self.config.child_sample_interval * 2))
+
+    def _sample_children(self, stop: threading.Event) -> None:
+        """Record the child tree's summed RSS into every active stage until stopped."""
+        interval = max(0.05, self.config.child_sample_interval)
+        while True:
+            rss_mb = _child_tree_rss_mb()
+            with self._lock:
+                for start in self._active_stages.values():
+                    start.child_peak_rss_mb = max(start.child_peak_rss_mb, rss_mb)
+            if stop.wait(interval):
+                return
+
     # ------------------------------------------------------------------
     # Finalization
     # ------------------------------------------------------------------
@@ -282,34 +434,42 @@ class TelemetryCollector:
                     )
                 )
 
-            # High memory
-            if stage.memory_mb > self.config.high_memory_mb:
+            # High memory (orchestrator or, usually, the stage's subprocess tree)
+            peak_memory = stage.peak_memory_mb
+            if peak_memory > self.config.high_memory_mb:
+                source = "child-process peak" if stage.child_peak_rss_mb > stage.memory_mb else "orchestrator"
                 warnings.append(
                     PerformanceWarning(
                         warning_type="high_memory",
                         stage_name=stage.stage_name,
                         message=(
-                            f"Stage '{stage.stage_name}' used {stage.memory_mb:.0f} MB RSS "
+                            f"Stage '{stage.stage_name}' used {peak_memory:.0f} MB RSS ({source}) "
                             f"(threshold: {self.config.high_memory_mb:.0f} MB)"
                         ),
                         suggestion="Consider memory optimization or streaming",
-                        value=stage.memory_mb,
+                        value=peak_memory,
                         threshold=self.config.high_memory_mb,
                     )
                 )
 
-            # High CPU
-            if stage.cpu_percent > self.config.high_cpu_percent:
+            # High CPU (orchestrator, or the child tree's share of all cores)
+            child_cpu_percent = stage.child_cpu_percent / self._cpu_count
+            cpu_percent = max(stage.cpu_percent, child_cpu_percent)
+            if cpu_percent > self.config.high_cpu_percent:
+                if child_cpu_percent > stage.cpu_percent:
+                    source = f"child processes across {self._cpu_count} core(s)"
+                else:
+                    source = "orchestrator"
                 warnings.append(
                     PerformanceWarning(
                         warning_type="high_cpu",
                         stage_name=stage.stage_name,
                         message=(
-                            f"Stage '{stage.stage_name}' used {stage.cpu_percent:.1f}% CPU "
+                            f"Stage '{stage.stage_name}' used {cpu_percent:.1f}% CPU ({source}) "
                             f"(threshold: {self.config.high_cpu_percent:.0f}%)"
                         ),
                         suggestion="Consider parallelization or CPU optimization",
-                        value=stage.cpu_percent,
+                        value=cpu_percent,
                         threshold=self.config.high_cpu_percent,
                     )
                 )
@@ -379,19 +539,21 @@ class TelemetryCollector:
         lines.append("")
 
         # Stage table
-        lines.append(f"{'Stage':<35} {'Time':>8} {'Mem MB':>8} {'CPU%':>6} {'Status':>8}")
-        lines.append("-" * 72)
+        lines.append(f"{'Stage':<35} {'Time':>8} {'Mem MB':>8} {'CPU%':>6} {'Child s':>8} {'Status':>8}")
+        lines.append("-" * 81)
         for s in r.stages:
             status = "✓ OK" if s.success else "✗ FAIL"
+            child_cpu = s.child_cpu_user_s + s.child_cpu_system_s
             lines.append(
-                f"{s.stage_name:<35} {s.duration:>7.1f}s {s.memory_mb:>7.0f} {s.cpu_percent:>5.1f} {status:>8}"
+                f"{s.stage_name:<35} {s.duration:>7.1f}s {s.peak_memory_mb:>7.0f} "
+                f"{s.cpu_percent:>5.1f} {child_cpu:>7.1f}s {status:>8}"
             )
 
         # Warnings
         if r.warnings:
             lines.append("")
             lines.append(f"Performance Warnings ({len(r.warnings)}):")
-            lines.append("-" * 72)
+            lines.append("-" * 81)
             for w in r.warnings:
                 lines.append(f"  ⚠ [{w.warning_type}] {w.message}")
                 if w.suggestion:
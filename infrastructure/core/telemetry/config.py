@@ -19,6 +19,9 @@ class TelemetryConfig:
         enabled: Master switch — when False the collector becomes a no-op.
         track_resources: Collect CPU, memory, and I/O via psutil.
         track_diagnostics: Aggregate DiagnosticReporter events.
+        track_children: Account for stage subprocesses (``getrusage`` deltas
+            plus a background peak-RSS sampler of the child tree).
+        child_sample_interval: Seconds between child-tree RSS samples.
         output_formats: Formats for the persisted report (json, text).
         persist_report: Write telemetry.json at end of pipeline.
         slow_stage_multiplier: Warn when a stage exceeds N× the average.
@@ -29,6 +32,8 @@ class TelemetryConfig:
     enabled: bool = True
     track_resources: bool = True
     track_diagnostics: bool = True
+    track_children: bool = True
+    child_sample_interval: float = 0.5
     output_formats: list[str] = field(default_factory=lambda: ["json", "text"])
     persist_report: bool = True
     slow_stage_multiplier: float = 2.0
@@ -52,6 +57,8 @@ class TelemetryConfig:
             "enabled": self.enabled,
             "track_resources": self.track_resources,
             "track_diagnostics": self.track_diagnostics,
+            "track_children": self.track_children,
+            "child_sample_interval": self.child_sample_interval,
             "output_formats": list(self.output_formats),
             "persist_report": self.persist_report,
             "slow_stage_multiplier": self.slow_stage_multiplier,
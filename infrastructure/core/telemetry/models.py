@@ -22,6 +22,12 @@ class StageTelemetry:
         cpu_percent: CPU usage during the stage, 0 if unavailable.
         io_read_mb: Bytes read during stage (MB), 0 if unavailable.
         io_write_mb: Bytes written during stage (MB), 0 if unavailable.
+        child_peak_rss_mb: Peak RSS of the stage's child-process tree (MB),
+            from the background sampler and ``getrusage(RUSAGE_CHILDREN)``.
+        child_cpu_user_s: User CPU seconds of children reaped during the stage.
+        child_cpu_system_s: System CPU seconds of children reaped during the stage.
+        child_io_read_mb: Block-device reads by reaped children (MB).
+        child_io_write_mb: Block-device writes by reaped children (MB).
         diagnostic_errors: Count of ERROR-level diagnostic events.
         diagnostic_warnings: Count of WARNING-level diagnostic events.
         error_message: Error description if the stage failed.
@@ -36,10 +42,27 @@ class StageTelemetry:
     cpu_percent: float = 0.0
     io_read_mb: float = 0.0
     io_write_mb: float = 0.0
+    child_peak_rss_mb: float = 0.0
+    child_cpu_user_s: float = 0.0
+    child_cpu_system_s: float = 0.0
+    child_io_read_mb: float = 0.0
+    child_io_write_mb: float = 0.0
     diagnostic_errors: int = 0
     diagnostic_warnings: int = 0
     error_message: str = ""
 
+    @property
+    def peak_memory_mb(self) -> float:
+        """Larger of the orchestrator RSS and the child-tree peak RSS."""
+        return max(self.memory_mb, self.child_peak_rss_mb)
+
+    @property
+    def child_cpu_percent(self) -> float:
+        """Child CPU time as a percentage of wall time (can exceed 100 on multiple cores)."""
+        if self.duration <= 0:
+            return 0.0
+        return (self.child_cpu_user_s + self.child_cpu_system_s) / self.duration * 100
+
     def to_dict(self) -> dict[str, Any]:
         """Serialize to a plain dictionary."""
         return {
@@ -52,6 +75,11 @@ class StageTelemetry:
             "cpu_percent": round(self.cpu_percent, 1),
             "io_read_mb": round(self.io_read_mb, 2),
             "io_write_mb": round(self.io_write_mb, 2),
+            "child_peak_rss_mb": round(self.child_peak_rss_mb, 1),
+            "child_cpu_user_s": round(self.child_cpu_user_s, 3),
+            "child_cpu_system_s": round(self.child_cpu_system_s, 3),
+            "child_io_read_mb": round(self.child_io_read_mb, 2),
+            "child_io_write_mb": round(self.child_io_write_mb, 2),
             "diagnostic_errors": self.diagnostic_errors,
             "diagnostic_warnings": self.diagnostic_warnings,
             "error_message": self.error_message,
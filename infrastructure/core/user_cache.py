@@ -0,0 +1,107 @@
+"""Shared plumbing for the per-user SQLite caches under ``~/.cache/template``.
+
+Several subsystems keep derived data (extracted PDF text, health-gate
+verdicts, Mermaid lint verdicts, AST summaries, connector responses, coverage
+history) in small SQLite files under one user cache root. Each file can be
+moved or disabled with its own environment variable. This module holds what
+they share:
+
+* :func:`user_cache_root` — ``$XDG_CACHE_HOME/template`` (``~/.cache`` when unset).
+* :func:`user_cache_path` — the env-var switch: ``<path>`` moves a cache,
+  ``off`` / ``0`` / ``false`` / ``no`` / ``none`` disables it.
+* :func:`connect_cache_db` — one connection per operation, with the schema
+  applied once per ``schema_version``. A file written under another version
+  is reset rather than migrated, because everything in it can be recomputed.
+* :func:`evict_oldest` — the size bound: keep the newest ``keep`` rows.
+* :class:`CacheStats` — per-instance hit/miss/store/eviction counters.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+__all__ = [
+    "CACHE_DISABLED_VALUES",
+    "CacheStats",
+    "connect_cache_db",
+    "evict_oldest",
+    "user_cache_path",
+    "user_cache_root",
+]
+
+CACHE_DISABLED_VALUES = frozenset({"0", "off", "false", "no", "none"})
+
+
+@dataclass
+class CacheStats:
+    """Counters for one cache instance's traffic."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+def user_cache_root() -> Path:
+    """Return ``$XDG_CACHE_HOME/template``, falling back to ``~/.cache/template``."""
+    return Path(os.environ.get("XDG_CACHE_HOME") or (Path.home() / ".cache")) / "template"
+
+
+def user_cache_path(env_name: str, filename: str) -> Path | None:
+    """Return the cache file selected by *env_name*, or ``None`` when that variable disables it.
+
+    Args:
+        env_name: Variable holding an explicit path or an off value.
+        filename: File name under :func:`user_cache_root` when the variable is unset.
+    """
+    configured = os.environ.get(env_name, "").strip()
+    if configured.lower() in CACHE_DISABLED_VALUES:
+        return None
+    if configured:
+        return Path(configured).expanduser()
+    return user_cache_root() / filename
+
+
+def connect_cache_db(db_path: Path, schema: str, *, schema_version: int = 1) -> sqlite3.Connection:
+    """Open *db_path* (creating its directory) with *schema* in place.
+
+    The schema script runs only when the file's ``PRAGMA user_version``
+    differs from *schema_version*. In that case every existing table is
+    dropped first, so bumping the version is how a cache changes its layout.
+    """
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(db_path), timeout=30.0)
+    try:
+        if conn.execute("PRAGMA user_version").fetchone()[0] != schema_version:
+            tables = [
+                name
+                for (name,) in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+                )
+            ]
+            for table in tables:
+                conn.execute(f'DROP TABLE IF EXISTS "{table}"')
+            conn.executescript(f"{schema}\nPRAGMA user_version = {int(schema_version)};")
+    except sqlite3.Error:
+        conn.close()
+        raise
+    return conn
+
+
+def evict_oldest(conn: sqlite3.Connection, table: str, *, order_by: str, keep: int) -> int:
+    """Delete all but the *keep* newest rows of *table* by column *order_by*; return the count removed.
+
+    Ties are broken by insertion order. *table* and *order_by* are trusted
+    identifiers from the caller's schema.
+    """
+    return conn.execute(
+        f"DELETE FROM {table} WHERE rowid IN ("  # noqa: S608 — caller-owned identifiers.
+        f"SELECT rowid FROM {table} ORDER BY {order_by} DESC, rowid DESC LIMIT -1 OFFSET ?)",
+        (max(0, keep),),
+    ).rowcount
@@ -9,11 +9,29 @@ from typing import Literal
 ENV_MULTI_PROJECT_WORKERS = "MULTI_PROJECT_MAX_WORKERS"
 ENV_PROJECT_MATRIX_WORKERS = "TEMPLATE_PROJECT_WORKERS"
 ENV_XDIST_WORKERS = "PYTEST_XDIST_WORKERS"
+ENV_RENDER_SECTION_WORKERS = "RENDER_SECTION_WORKERS"
+ENV_MERMAID_RENDER_WORKERS = "MERMAID_RENDER_WORKERS"
+ENV_LLM_REVIEW_WORKERS = "LLM_REVIEW_WORKERS"
+ENV_PDF_TEXT_WORKERS = "PDF_TEXT_WORKERS"
+ENV_DOCS_CORPUS_WORKERS = "DOCS_CORPUS_WORKERS"
+ENV_AST_INDEX_WORKERS = "AST_INDEX_WORKERS"
+ENV_CONNECTOR_SEARCH_WORKERS = "CONNECTOR_SEARCH_WORKERS"
 DEFAULT_PROJECT_MATRIX_MAX_WORKERS = 4
 
 InvalidPolicy = Literal["raise", "fallback"]
 
 
+def parse_positive_int(raw: str | None) -> int | None:
+    """Return *raw* as a positive integer, or ``None`` when unset, blank or invalid."""
+    if raw is None or not raw.strip():
+        return None
+    try:
+        value = int(raw.strip())
+    except ValueError:
+        return None
+    return value if value >= 1 else None
+
+
 def clamp_worker_count(requested: int, item_count: int | None = None) -> int:
     """Validate a positive worker request and cap it to available items."""
     if requested < 1:
@@ -61,9 +79,17 @@ def resolve_bounded_workers(
 
 __all__ = [
     "DEFAULT_PROJECT_MATRIX_MAX_WORKERS",
+    "ENV_AST_INDEX_WORKERS",
+    "ENV_CONNECTOR_SEARCH_WORKERS",
+    "ENV_DOCS_CORPUS_WORKERS",
+    "ENV_LLM_REVIEW_WORKERS",
+    "ENV_MERMAID_RENDER_WORKERS",
     "ENV_MULTI_PROJECT_WORKERS",
+    "ENV_PDF_TEXT_WORKERS",
     "ENV_PROJECT_MATRIX_WORKERS",
+    "ENV_RENDER_SECTION_WORKERS",
     "ENV_XDIST_WORKERS",
     "clamp_worker_count",
+    "parse_positive_int",
     "resolve_bounded_workers",
 ]
@@ -53,6 +53,7 @@ import ast
 from dataclasses import dataclass
 from pathlib import Path
 
+from infrastructure.core.ast_index import PythonAstIndex
 from infrastructure.core.logging.utils import get_logger
 from infrastructure.documentation.glossary_gen import inject_between_markers
 
@@ -90,14 +91,13 @@ class ModuleAPI:
 # ---------------------------------------------------------------------------
 
 
-def _parse_init(init_path: Path) -> tuple[list[str], dict[str, str]]:
+def _parse_init(init_path: Path, index: PythonAstIndex | None = None) -> tuple[list[str], dict[str, str]]:
     """Return ``(__all__ list, symbol_name -> dotted_module)`` from an init file.
 
     Raises ``ValueError`` if the file cannot be parsed or has no
     literal ``__all__`` assignment.
     """
-    source = init_path.read_text(encoding="utf-8")
-    tree = ast.parse(source, filename=str(init_path))
+    tree = (index if index is not None else PythonAstIndex()).tree(init_path)
 
     all_list: list[str] | None = None
     symbol_to_module: dict[str, str] = {}
@@ -155,7 +155,14 @@ def _module_to_path(module: str, package_root: Path) -> Path | None:
     return _module_dotted_to_path(module, repo_root)
 
 
-def _find_definition(module_path: Path, name: str, repo_root: Path, *, _depth: int = 0) -> tuple[str, str, str, str]:
+def _find_definition(
+    module_path: Path,
+    name: str,
+    repo_root: Path,
+    *,
+    index: PythonAstIndex | None = None,
+    _depth: int = 0,
+) -> tuple[str, str, str, str]:
     """Return ``(kind, signature, summary, defining_module)`` for ``name``.
 
     ``kind`` is one of ``"function"``, ``"class"``, ``"unknown"``.
@@ -164,12 +171,14 @@ def _find_definition(module_path: Path, name: str, repo_root: Path, *, _depth: i
     re-exported through one or more intermediate modules).
 
     Follows re-export chains up to 5 hops to handle cases like
-    ``utils.py`` re-exporting from ``setup.py``. Pure AST — never imports.
+    ``utils.py`` re-exporting from ``setup.py``. Pure AST — never imports;
+    modules are parsed once per ``index``.
     """
     if _depth > 5:
         return ("unknown", "", "", _path_to_dotted(module_path, repo_root))
+    index = index if index is not None else PythonAstIndex()
     try:
-        tree = ast.parse(module_path.read_text(encoding="utf-8"), filename=str(module_path))
+        tree = index.tree(module_path)
     except (SyntaxError, OSError, UnicodeDecodeError) as e:
         logger.debug(f"Skipping {module_path} (parse error): {e}")
         return ("unknown", "", "", _path_to_dotted(module_path, repo_root))
@@ -247,7 +256,7 @@ def _find_definition(module_path: Path, name: str, repo_root: Path, *, _depth: i
             if target_path is None:
                 continue
             real_name = alias.name  # Original name in the source module.
-            return _find_definition(target_path, real_name, repo_root, _depth=_depth + 1)
+            return _find_definition(target_path, real_name, repo_root, index=index, _depth=_depth + 1)
 
     return ("unknown", "", "", _path_to_dotted(module_path, repo_root))
 
@@ -357,12 +366,14 @@ def discover_infrastructure_packages(infra_dir: Path) -> list[Path]:
     )
 
 
-def walk_public_api(package_root: Path) -> list[ModuleAPI]:
+def walk_public_api(package_root: Path, *, index: PythonAstIndex | None = None) -> list[ModuleAPI]:
     """Walk one package's ``__init__.py`` and return :class:`ModuleAPI` records.
 
     Args:
         package_root: A directory whose ``__init__.py`` declares ``__all__``,
             e.g. ``infrastructure/llm``.
+        index: Parse cache shared across packages; each module is parsed
+            once however many exported names it defines or re-exports.
 
     Returns:
         A list of :class:`ModuleAPI` records, one per name in ``__all__``,
@@ -378,7 +389,8 @@ def walk_public_api(package_root: Path) -> list[ModuleAPI]:
     if not init_path.is_file():
         raise FileNotFoundError(f"Package __init__.py not found: {init_path}")
 
-    all_list, sym_to_module = _parse_init(init_path)
+    index = index if index is not None else PythonAstIndex()
+    all_list, sym_to_module = _parse_init(init_path, index)
     package_dotted = (
         f"{package_root.parent.name}.{package_root.name}" if package_root.parent.name else package_root.name
     )
@@ -401,7 +413,7 @@ def walk_public_api(package_root: Path) -> list[ModuleAPI]:
             )
             continue
         repo_root = package_root.parent.parent
-        kind, signature, summary, defining_module = _find_definition(module_path, name, repo_root)
+        kind, signature, summary, defining_module = _find_definition(module_path, name, repo_root, index=index)
         records.append(
             ModuleAPI(
                 package=package_dotted,
@@ -451,8 +463,9 @@ def build_api_reference_markdown(packages: list[Path]) -> str:
     lines: list[str] = [caption, ""]
 
     documented_packages = 0
+    index = PythonAstIndex()
     for pkg_root in packages:
-        records = walk_public_api(pkg_root)
+        records = walk_public_api(pkg_root, index=index)
         if not records:
             logger.debug(f"Skipping {pkg_root} (empty __all__)")
             continue
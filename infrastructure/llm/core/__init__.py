@@ -4,6 +4,7 @@ from infrastructure.llm.core._text_utils import strip_thinking_tags
 from infrastructure.llm.core.client import LLMClient, ResponseMode
 from infrastructure.llm.core.config import GenerationOptions, OllamaClientConfig
 from infrastructure.llm.core.context import ConversationContext, ContextState, Message, MessageDict
+from infrastructure.llm.core.response_cache import LLMResponseCache, ResponseCacheStats
 from infrastructure.llm.core.response_saver import save_response, save_streaming_response
 
 __all__ = [
@@ -16,6 +17,8 @@ __all__ = [
     "ContextState",
     "Message",
     "MessageDict",
+    "LLMResponseCache",
+    "ResponseCacheStats",
     "save_response",
     "save_streaming_response",
 ]
@@ -2,6 +2,11 @@
 
 Extracted from client.py to keep each module under 300 LOC.
 These are mixed into LLMClient via _ConnectionMixin.
+
+Every request goes through one pooled :class:`requests.Session` per client, so
+consecutive generations reuse the keep-alive connection to Ollama. When the
+host has a :class:`LLMResponseCache`, deterministic requests are looked up by
+content address before they are sent and stored after they succeed.
 """
 
 from __future__ import annotations
@@ -25,21 +30,83 @@ from infrastructure.core.exceptions import LLMConnectionError
 from infrastructure.core.logging.utils import get_logger
 from infrastructure.llm.core._text_utils import strip_thinking_tags
 from infrastructure.llm.core.config import GenerationOptions
+from infrastructure.llm.core.response_cache import LLMResponseCache, is_deterministic_request, response_cache_key
 
 if TYPE_CHECKING:
     from infrastructure.llm.core.config import OllamaClientConfig
 
 logger = get_logger("infrastructure.llm.core.client")
 
+# Keep-alive connections held per client; enough for concurrent review workers.
+_SESSION_POOL_SIZE = 8
+
+
+def _new_session() -> requests.Session:
+    """Return a session with a keep-alive connection pool for the Ollama host."""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=_SESSION_POOL_SIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
 
 class _ConnectionMixin:
     """Mixin providing connection checks, model listing, and low-level HTTP generation.
 
     Expects the host class to provide:
     - self.config: OllamaClientConfig
+    - optionally self.response_cache: LLMResponseCache (defaults to None)
     """
 
     config: OllamaClientConfig
+    response_cache: LLMResponseCache | None = None
+    _session: requests.Session | None = None
+    _model_digests: dict[str, str] | None = None
+
+    @property
+    def session(self) -> requests.Session:
+        """The pooled HTTP session every request from this client is sent on."""
+        if self._session is None:
+            self._session = _new_session()
+        return self._session
+
+    def _model_digest(self, model: str) -> str | None:
+        """Return the installed digest of ``model`` (memoized), or None if unknown."""
+        if self._model_digests is None:
+            self._model_digests = {}
+        if model in self._model_digests:
+            return self._model_digests[model]
+        try:
+            response = self.session.get(f"{self.config.base_url}/api/tags", timeout=self.config.timeout)
+            response.raise_for_status()
+            installed = response.json().get("models", [])
+        except (requests.exceptions.RequestException, ValueError, AttributeError) as e:
+            logger.debug(f"Could not read model digests; response cache bypassed: {e}")
+            return None
+        names = {model, f"{model}:latest"}
+        for entry in installed:
+            if isinstance(entry, dict) and entry.get("name") in names and entry.get("digest"):
+                self._model_digests[model] = str(entry["digest"])
+                return self._model_digests[model]
+        return None
+
+    def _response_cache_key(self, payload: dict[str, Any]) -> str | None:
+        """Return the response-cache key for a chat ``payload``; None when it must not be cached.
+
+        Only deterministic requests (seeded or temperature 0) against a model
+        whose digest is known are cacheable.
+        """
+        if self.response_cache is None or not is_deterministic_request(payload["options"]):
+            return None
+        digest = self._model_digest(payload["model"])
+        if digest is None:
+            return None
+        return response_cache_key(
+            model_digest=digest,
+            messages=payload["messages"],
+            ollama_options=payload["options"],
+            response_format=payload.get("format"),
+        )
 
     def _generate_response_direct(
         self,
@@ -79,6 +146,13 @@ class _ConnectionMixin:
         if opts.format_json:
             payload["format"] = "json"
 
+        cache_key = self._response_cache_key(payload)
+        if cache_key is not None and self.response_cache is not None:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Reusing cached response ({model}, {len(cached)} chars)")
+                return cached
+
         last_error: str = ""  # accumulates last failure reason across retry attempts
 
         logger.debug(
@@ -99,7 +173,7 @@ class _ConnectionMixin:
                     )
                     time_module.sleep(wait_time)
 
-                response = requests.post(url, json=payload, timeout=self.config.timeout)
+                response = self.session.post(url, json=payload, timeout=self.config.timeout)
                 response.raise_for_status()
 
                 data = response.json()
@@ -132,6 +206,8 @@ class _ConnectionMixin:
                 if attempt > 0:
                     logger.info(f"Request succeeded on retry {attempt + 1}")
 
+                if cache_key is not None and self.response_cache is not None:
+                    self.response_cache.put(cache_key, content, model=model)
                 return content
 
             except requests.exceptions.Timeout as e:
@@ -244,7 +320,7 @@ class _ConnectionMixin:
         """
         url = f"{self.config.base_url}/api/tags"
         try:
-            response = requests.get(url, timeout=self.config.timeout)
+            response = self.session.get(url, timeout=self.config.timeout)
             response.raise_for_status()
             data = response.json()
             models = [m["name"].split(":")[0] for m in data.get("models", [])]
@@ -264,7 +340,7 @@ class _ConnectionMixin:
     def check_connection_with_reason(self, timeout: float = 2.0) -> tuple[bool, str | None]:
         """Return (is_available, error_message) for the Ollama server."""
         try:
-            response = requests.get(f"{self.config.base_url}/api/tags", timeout=timeout)
+            response = self.session.get(f"{self.config.base_url}/api/tags", timeout=timeout)
             if response.status_code == 200:
                 logger.debug(f"Ollama connection check successful at {self.config.base_url}")
                 return (True, None)
@@ -27,6 +27,7 @@ from infrastructure.llm.core._stream_helpers import (
 from infrastructure.llm.core._text_utils import strip_thinking_tags
 from infrastructure.llm.core.config import GenerationOptions, OllamaClientConfig
 from infrastructure.llm.core.context import ConversationContext
+from infrastructure.llm.core.response_cache import LLMResponseCache
 
 logger = get_logger(__name__)
 
@@ -42,6 +43,9 @@ def stream_query_impl(
     save_path: Path | None = None,
     log_progress: bool = True,
     retries: int = 1,
+    session: requests.Session | None = None,
+    response_cache: LLMResponseCache | None = None,
+    cache_key_fn: Callable[[dict[str, Any]], str | None] | None = None,
 ) -> Iterator[str]:
     """Stream response from LLM with comprehensive logging and error recovery.
 
@@ -58,6 +62,9 @@ def stream_query_impl(
         save_path: Path to save response (auto-generated if None and save_response=True)
         log_progress: Whether to log streaming progress (DEBUG level)
         retries: Number of retry attempts on transient failures
+        session: Pooled HTTP session to send on (a one-off request when None)
+        response_cache: Cache consulted before and filled after the request
+        cache_key_fn: Maps the request payload to its cache key (None = uncacheable)
 
     Yields:
         Response text chunks
@@ -92,6 +99,16 @@ def stream_query_impl(
     if opts.format_json:
         payload["format"] = "json"
 
+    cache_key = cache_key_fn(payload) if response_cache is not None and cache_key_fn is not None else None
+    if cache_key is not None and response_cache is not None:
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Reusing cached streaming response model=%s chars=%d", model_name, len(cached))
+            context.add_message("assistant", cached)
+            yield cached
+            return
+
+    post = session.post if session is not None else requests.post
     full_response: list[str] = []
     chunk_count = 0
     first_chunk_time: float | None = None
@@ -115,7 +132,7 @@ def stream_query_impl(
                 )
                 time_module.sleep(wait_time)
 
-            with requests.post(url, json=payload, stream=True, timeout=config.timeout) as r:
+            with post(url, json=payload, stream=True, timeout=config.timeout) as r:
                 r.raise_for_status()
 
                 for line in r.iter_lines():
@@ -268,6 +285,8 @@ def stream_query_impl(
 
     # Add full response to context
     context.add_message("assistant", full_response_text)
+    if cache_key is not None and response_cache is not None and error_count == 0 and full_response_text:
+        response_cache.put(cache_key, full_response_text, model=model_name)
 
     # Save response if requested
     if save_response and not partial_saved:
@@ -18,8 +18,11 @@ from infrastructure.llm.core.sanitization import sanitize_llm_input
 from infrastructure.llm.core.context import MessageDict
 
 if TYPE_CHECKING:
+    import requests
+
     from infrastructure.llm.core.config import OllamaClientConfig
     from infrastructure.llm.core.context import ConversationContext
+    from infrastructure.llm.core.response_cache import LLMResponseCache
 
 logger = get_logger("infrastructure.llm.core.client")
 
@@ -43,6 +46,8 @@ class _StructuredQueryMixin:
     # Host-class contract: type-checker-visible declarations for duck-typed dependencies.
     config: "OllamaClientConfig"
     context: "ConversationContext"
+    response_cache: "LLMResponseCache | None"
+    session: "requests.Session"
 
     def query(
         self,
@@ -77,6 +82,9 @@ class _StructuredQueryMixin:
     ) -> bool:
         raise NotImplementedError  # pragma: no cover
 
+    def _response_cache_key(self, payload: dict[str, Any]) -> str | None:
+        raise NotImplementedError  # pragma: no cover
+
     @staticmethod
     def _time_call(fn: Any) -> tuple[Any, float]:
         raise NotImplementedError  # pragma: no cover
@@ -337,4 +345,7 @@ class _StructuredQueryMixin:
             save_path=save_path,
             log_progress=log_progress,
             retries=retries,
+            session=self.session,
+            response_cache=self.response_cache,
+            cache_key_fn=self._response_cache_key,
         )
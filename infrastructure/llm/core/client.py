@@ -19,6 +19,7 @@ from infrastructure.llm.core._structured_queries import _StructuredQueryMixin
 from infrastructure.llm.core.bypass import require_raw_query_bypass, require_sanitization_bypass
 from infrastructure.llm.core.config import GenerationOptions, OllamaClientConfig, ResponseMode
 from infrastructure.llm.core.context import ConversationContext, MessageDict
+from infrastructure.llm.core.response_cache import LLMResponseCache
 from infrastructure.llm.core.sanitization import sanitize_llm_input
 from infrastructure.llm.templates import get_template
 
@@ -79,6 +80,11 @@ class LLMClient(_ConnectionMixin, _StructuredQueryMixin):
         """
         self.config = config or OllamaClientConfig.from_env()
         self.context = ConversationContext(max_tokens=self.config.context_window)
+        self.response_cache = (
+            LLMResponseCache(self.config.response_cache_path, max_entries=self.config.response_cache_max_entries)
+            if self.config.response_cache_path
+            else None
+        )
         self._system_prompt_injected = False
 
         # Store the default system prompt to detect if user explicitly set it
@@ -360,6 +366,9 @@ class LLMClient(_ConnectionMixin, _StructuredQueryMixin):
             save_path=save_path,
             log_progress=log_progress,
             retries=retries,
+            session=self.session,
+            response_cache=self.response_cache,
+            cache_key_fn=self._response_cache_key,
         )
 
     def reset(self) -> None:
@@ -138,6 +138,10 @@ class OllamaClientConfig:
     review_timeout: float = 300.0  # Timeout for review operations (LLM_REVIEW_TIMEOUT)
     max_input_length: int = 500000  # Max input character length (LLM_MAX_INPUT_LENGTH)
 
+    # Opt-in persistent cache of deterministic (seeded or temperature-0) responses
+    response_cache_path: str | None = None  # SQLite file (LLM_RESPONSE_CACHE)
+    response_cache_max_entries: int = 512  # LRU bound (LLM_RESPONSE_CACHE_MAX_ENTRIES)
+
     def __init__(self, **kwargs: Any):
         """Initialize config, supporting num_ctx as alias for context_window.
 
@@ -187,6 +191,8 @@ class OllamaClientConfig:
         "LLM_EARLY_WARNING_THRESHOLD": ("early_warning_threshold", float),
         "LLM_REVIEW_TIMEOUT": ("review_timeout", float),
         "LLM_MAX_INPUT_LENGTH": ("max_input_length", int),
+        "LLM_RESPONSE_CACHE": ("response_cache_path", str),
+        "LLM_RESPONSE_CACHE_MAX_ENTRIES": ("response_cache_max_entries", int),
     }
 
     @classmethod
@@ -0,0 +1,177 @@
+"""Persistent, content-addressed cache of deterministic LLM responses.
+
+Regenerating a manuscript review costs minutes of model time, yet a re-run
+after an unrelated edit asks the model the exact same question. When a request
+is deterministic — a fixed sampler ``seed`` or ``temperature`` 0 — the answer
+depends only on the model weights, the messages and the generation options,
+so it can be replayed from disk.
+
+Entries are keyed by :func:`response_cache_key`, a SHA-256 over the canonical
+JSON of the model *digest* (not its name, so re-pulling a tag invalidates it),
+the messages and the Ollama options. The cache is opt-in
+(``LLM_RESPONSE_CACHE=<path>``), bounded to ``max_entries`` rows with
+least-recently-used eviction, and counts hits, misses, stores and evictions in
+:class:`ResponseCacheStats`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Mapping, Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from infrastructure.core.logging.utils import get_logger
+
+logger = get_logger(__name__)
+
+__all__ = [
+    "DEFAULT_RESPONSE_CACHE_MAX_ENTRIES",
+    "LLMResponseCache",
+    "ResponseCacheStats",
+    "is_deterministic_request",
+    "response_cache_key",
+]
+
+DEFAULT_RESPONSE_CACHE_MAX_ENTRIES = 512
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key        TEXT PRIMARY KEY,
+    model      TEXT NOT NULL,
+    response   TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    used_at    REAL NOT NULL
+)
+"""
+
+
+def is_deterministic_request(ollama_options: Mapping[str, Any]) -> bool:
+    """Return whether ``ollama_options`` pin the sampler (a seed, or temperature 0)."""
+    return ollama_options.get("seed") is not None or ollama_options.get("temperature") == 0
+
+
+def response_cache_key(
+    *,
+    model_digest: str,
+    messages: Sequence[Mapping[str, Any]],
+    ollama_options: Mapping[str, Any],
+    response_format: str | None = None,
+) -> str:
+    """Return the content address of one chat request."""
+    canonical = json.dumps(
+        {
+            "model_digest": model_digest,
+            "messages": list(messages),
+            "options": dict(ollama_options),
+            "format": response_format,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class ResponseCacheStats:
+    """Hit/miss counters for one :class:`LLMResponseCache` instance."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict[str, float]:
+        return {**asdict(self), "hit_rate": self.hit_rate}
+
+
+class LLMResponseCache:
+    """SQLite-backed response store keyed by :func:`response_cache_key`.
+
+    Thread-safe: each operation opens its own connection and the counters are
+    guarded by a Lock, so one cache can serve concurrent clients.
+    """
+
+    def __init__(self, db_path: Path | str, *, max_entries: int = DEFAULT_RESPONSE_CACHE_MAX_ENTRIES) -> None:
+        self.db_path = Path(db_path)
+        self.max_entries = max(1, max_entries)
+        self.stats = ResponseCacheStats()
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=30.0)
+        conn.execute(_SCHEMA)
+        return conn
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response for ``key`` (refreshing its recency), or ``None``."""
+        conn = self._connect()
+        try:
+            with conn:
+                row = conn.execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    conn.execute("UPDATE responses SET used_at = ? WHERE key = ?", (time.time(), key))
+        finally:
+            conn.close()
+        with self._lock:
+            if row is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+        return None if row is None else str(row[0])
+
+    def put(self, key: str, response: str, *, model: str) -> None:
+        """Store ``response`` under ``key``, evicting least-recently-used rows beyond ``max_entries``."""
+        now = time.time()
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, model, response, created_at, used_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, model, response, now, now),
+                )
+                evicted = conn.execute(
+                    "DELETE FROM responses WHERE key IN "
+                    "(SELECT key FROM responses ORDER BY used_at DESC, rowid DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                ).rowcount
+        finally:
+            conn.close()
+        with self._lock:
+            self.stats.stores += 1
+            self.stats.evictions += max(0, evicted)
+        if evicted:
+            logger.debug("Evicted %d LLM response cache entr%s", evicted, "y" if evicted == 1 else "ies")
+
+    def __len__(self) -> int:
+        if not self.db_path.exists():
+            return 0
+        conn = self._connect()
+        try:
+            return int(conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0])
+        finally:
+            conn.close()
+
+    def clear(self) -> int:
+        """Delete every cached response. Returns the number of rows removed."""
+        if not self.db_path.exists():
+            return 0
+        conn = self._connect()
+        try:
+            with conn:
+                return conn.execute("DELETE FROM responses").rowcount
+        finally:
+            conn.close()
@@ -222,7 +222,7 @@ def _build_review_metadata(
     compliance_rate = (compliant_reviews / total_reviews * 100) if total_reviews > 0 else 100
 
     llm_config = OllamaClientConfig.from_env()
-    return {
+    metadata: dict[str, Any] = {
         "model": model_name,
         "timestamp": timestamp,
         "source_pdf": str(pdf_path),
@@ -254,3 +254,6 @@ def _build_review_metadata(
             "system_prompt": "manuscript_review",
         },
     }
+    if session_metrics.response_cache is not None:
+        metadata["response_cache"] = session_metrics.response_cache
+    return metadata
@@ -33,6 +33,7 @@ from infrastructure.llm.templates.manuscript import (
 
 from infrastructure.llm.review.metrics import ReviewMetrics, ManuscriptInputMetrics, estimate_tokens
 from infrastructure.llm.review.quality import validate_review_quality, _is_small_model, ReviewType
+from infrastructure.llm.review.scheduling import review_cancelled
 
 # Cross-subsystem import: llm/review depends on validation/pdf_validator for text extraction.
 # This is an intentional seam — PDF text extraction lives in validation because it is also
@@ -161,6 +162,9 @@ def _stream_with_heartbeat(
                 bypass_caller="infrastructure.llm.review.generation",
                 bypass_reason="review prompt contains trusted technical notation that trips generic sanitization",
             ):
+                if review_cancelled():
+                    logger.info(f"{review_name} was abandoned by the review scheduler; stopping the stream")
+                    break
                 response_chunks.append(chunk)
                 tokens_generated += len(chunk.split())
                 progress.set(tokens_generated)
@@ -250,6 +254,9 @@ def generate_review_with_metrics(
         try:
             current_prompt = prompt
             if attempt > 0:
+                if review_cancelled():
+                    metrics.generation_time_seconds = time.time() - start_time
+                    return None, metrics
                 client.reset()
                 adjusted_temp = min(temperature + 0.15 * attempt, 0.8)
                 options = GenerationOptions(temperature=adjusted_temp, max_tokens=max_tokens)
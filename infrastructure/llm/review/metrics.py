@@ -43,6 +43,7 @@ class SessionMetrics:
     model_name: str = ""
     max_input_length: int = 0
     warmup_tokens_per_sec: float = 0.0  # Performance from warmup step
+    response_cache: dict[str, float] | None = None  # LLMResponseCache stats when LLM_RESPONSE_CACHE is set
 
 
 @dataclass
@@ -1,6 +1,7 @@
 """LLM Review Pipeline runner for orchestration."""
 
 import time
+from collections.abc import Callable
 from pathlib import Path
 
 from infrastructure.core.exceptions import PDFValidationError
@@ -17,7 +18,8 @@ from infrastructure.llm.review.io import (
     save_single_review,
     generate_review_summary,
 )
-from infrastructure.llm.review.metrics import SessionMetrics
+from infrastructure.llm.review.metrics import ReviewMetrics, SessionMetrics
+from infrastructure.llm.core.client import LLMClient
 from infrastructure.llm.core.config import get_max_input_length
 from infrastructure.llm.review.generator import (
     select_and_start_ollama_model,
@@ -30,6 +32,7 @@ from infrastructure.llm.review.generator import (
     generate_translation,
     warmup_model,
 )
+from infrastructure.llm.review.scheduling import ReviewJob, ReviewOutcome, resolve_review_workers, run_review_jobs
 
 logger = get_logger(__name__)
 
@@ -40,6 +43,10 @@ REVIEW_GENERATORS = {
     "improvement_suggestions": generate_improvement_suggestions,
 }
 
+# Per-review deadline in concurrent mode, in units of LLM_REVIEW_TIMEOUT: the
+# generators make one validation retry, so a review may legitimately issue two requests.
+_REVIEW_DEADLINE_ATTEMPTS = 2
+
 
 class ReviewMode:
     """Mode for LLM review execution."""
@@ -49,6 +56,25 @@ class ReviewMode:
     TRANSLATIONS_ONLY = "translations_only"  # Run only translations
 
 
+def _review_job(
+    review_type: str,
+    generator: Callable[[LLMClient, str, str], tuple[str | None, ReviewMetrics]],
+    text: str,
+    model_name: str,
+) -> ReviewJob[LLMClient]:
+    def run(client: LLMClient) -> tuple[str | None, ReviewMetrics]:
+        return generator(client, text, model_name)
+
+    return ReviewJob(review_type, f"Review: {review_type.replace('_', ' ').title()}", run)
+
+
+def _translation_job(lang_code: str, text: str, model_name: str) -> ReviewJob[LLMClient]:
+    def run(client: LLMClient) -> tuple[str | None, ReviewMetrics]:
+        return generate_translation(client, text, lang_code, model_name)
+
+    return ReviewJob(f"translation_{lang_code}", f"Translation: {TRANSLATION_LANGUAGES.get(lang_code, lang_code)}", run)
+
+
 def run_llm_review_pipeline(
     mode: str = ReviewMode.ALL,
     project_name: str = "project",
@@ -125,63 +151,73 @@ def run_llm_review_pipeline(
             return 1
         session_metrics.warmup_tokens_per_sec = tokens_per_sec
 
-        # Step 4: Generate reviews
-        reviews = {}
-        total_start = time.time()
+        # Step 4: Build one independent job per review type and translation
+        jobs: list[ReviewJob[LLMClient]] = []
 
-        # English reviews
         if mode != ReviewMode.TRANSLATIONS_ONLY:
-            logger.info("\n  Generating English scientific reviews...")
-            review_types = get_review_types(repo_root, project_name) or ["executive_summary"]
-
-            for i, review_type in enumerate(review_types, 1):
-                log_progress(i, len(review_types), f"Review: {review_type.replace('_', ' ').title()}", logger)
-
+            for review_type in get_review_types(repo_root, project_name) or ["executive_summary"]:
                 generator = REVIEW_GENERATORS.get(review_type)
                 if generator is None:
                     logger.warning(f"  Skipping unknown review type: {review_type}")
                     continue
-                response, metrics = generator(client, text, model_name)
-                session_metrics.reviews[review_type] = metrics
-
-                if response is None:
-                    logger.warning(f"  ⚠️  {review_type} returned no content — skipping save")
-                    continue
-
-                reviews[review_type] = response
-                save_single_review(review_type, response, output_dir, model_name, metrics)
+                jobs.append(_review_job(review_type, generator, text, model_name))
 
-        # Translations
         if mode != ReviewMode.REVIEWS_ONLY:
             translation_languages = get_translation_languages(repo_root, project_name)
-            if translation_languages:
-                logger.info(f"\n  Generating translations for {len(translation_languages)} language(s)...")
-
-                for i, lang_code in enumerate(translation_languages, 1):
-                    lang_name = TRANSLATION_LANGUAGES.get(lang_code, lang_code)
-                    log_progress(i, len(translation_languages), f"Translation: {lang_name}", logger)
-                    translation_response, metrics = generate_translation(client, text, lang_code, model_name)
-                    review_name = f"translation_{lang_code}"
-                    session_metrics.reviews[review_name] = metrics
-                    if translation_response is not None:
-                        reviews[review_name] = translation_response
-                        save_single_review(review_name, translation_response, output_dir, model_name, metrics)
-            elif mode == ReviewMode.TRANSLATIONS_ONLY:
+            if not translation_languages and mode == ReviewMode.TRANSLATIONS_ONLY:
                 logger.warning("\n⚠️  No translation languages configured")
                 return 2
+            for lang_code in translation_languages:
+                jobs.append(_translation_job(lang_code, text, model_name))
+
+        # Step 5: Generate (bounded-concurrent when LLM_REVIEW_WORKERS > 1), saving in job order
+        reviews = {}
+        workers = resolve_review_workers(len(jobs))
+        if workers > 1:
+            logger.info(f"\n  Generating {len(jobs)} review(s) with {workers} concurrent worker(s)...")
+        else:
+            logger.info(f"\n  Generating {len(jobs)} review(s)...")
+
+        def create_worker_client() -> LLMClient:
+            worker_client = create_review_client(model_name)
+            worker_client.response_cache = client.response_cache  # one cache, one set of stats
+            return worker_client
+
+        def record(outcome: ReviewOutcome) -> None:
+            session_metrics.reviews[outcome.name] = outcome.metrics
+            if outcome.response is None:
+                logger.warning(f"  ⚠️  {outcome.name} returned no content — skipping save")
+                return
+            reviews[outcome.name] = outcome.response
+            save_single_review(outcome.name, outcome.response, output_dir, model_name, outcome.metrics)
+
+        total_start = time.time()
+        run_review_jobs(
+            jobs,
+            client=client,
+            client_factory=create_worker_client,
+            workers=workers,
+            deadline=client.config.review_timeout * _REVIEW_DEADLINE_ATTEMPTS,
+            on_start=lambda index, job: log_progress(index + 1, len(jobs), job.label, logger),
+            on_result=record,
+        )
 
         if not reviews:
             logger.warning("\n⚠️  No reviews or translations were generated")
             return 2
 
         session_metrics.total_generation_time = time.time() - total_start
+        if client.response_cache is not None:
+            stats = client.response_cache.stats
+            session_metrics.response_cache = stats.to_dict()
+            logger.info(f"  Response cache: {stats.hits} hit(s), {stats.misses} miss(es), {stats.evictions} evicted")
 
-        # Step 5: Save outputs
+        # Step 6: Save outputs
         if not save_review_outputs(reviews, output_dir, model_name, pdf_path, session_metrics):
             logger.error("Failed to save some review outputs")
             return 1
 
-        # Step 6: Generate summary
+        # Step 7: Generate summary
         generate_review_summary(reviews, output_dir, session_metrics)
         return 0
 
@@ -0,0 +1,225 @@
+"""Bounded-concurrency scheduling of independent review generations.
+
+Every review type and translation is an independent request against the same
+extracted manuscript, so they can be in flight together when Ollama serves
+several sequences at once (``OLLAMA_NUM_PARALLEL``). :func:`run_review_jobs`
+runs a list of :class:`ReviewJob` on a bounded thread pool:
+
+* **Serial by default.** One worker runs the jobs inline on the caller's
+  client, exactly as the sequential loop did. ``LLM_REVIEW_WORKERS=N`` (or
+  ``auto`` → ``OLLAMA_NUM_PARALLEL``) opts into parallel generation.
+* **One client per worker thread.** :class:`~infrastructure.llm.core.client.LLMClient`
+  keeps a conversation context, so workers never share one; each gets its own
+  from ``client_factory``.
+* **Shared prompt prefix.** Review templates place the manuscript block first
+  and every worker client carries the same system prompt, so the prompts share
+  one long prefix that Ollama's per-slot prompt cache reuses across requests.
+* **Per-review deadline.** A job still running ``deadline`` seconds after it
+  started is abandoned and reported as timed out; the pipeline moves on.
+  Abandoned work is not killed: its thread keeps running until the job
+  notices :func:`review_cancelled` (the review generator checks it between
+  streamed chunks and before a retry) or its request times out, and its
+  result is discarded. Jobs still queued when the run returns never start.
+* **Deterministic output order.** ``on_result`` is invoked in job order — a
+  finished job waits for its predecessors — so files and metrics are written
+  in the configured order regardless of completion order.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+from infrastructure.core.logging.utils import get_logger
+from infrastructure.core.worker_policy import ENV_LLM_REVIEW_WORKERS, clamp_worker_count, parse_positive_int
+from infrastructure.llm.review.metrics import ReviewMetrics
+
+logger = get_logger(__name__)
+
+__all__ = [
+    "ENV_OLLAMA_NUM_PARALLEL",
+    "ReviewJob",
+    "ReviewOutcome",
+    "resolve_review_workers",
+    "review_cancelled",
+    "run_review_jobs",
+]
+
+ENV_OLLAMA_NUM_PARALLEL = "OLLAMA_NUM_PARALLEL"
+
+ClientT = TypeVar("ClientT")
+
+_POLL_INTERVAL = 0.25
+
+# Cancellation flag of the job running on the current worker thread.
+_current_job = threading.local()
+
+
+@dataclass(frozen=True)
+class ReviewJob(Generic[ClientT]):
+    """One independent generation: ``run(client) -> (response, metrics)``."""
+
+    name: str
+    label: str
+    run: Callable[[ClientT], tuple[str | None, ReviewMetrics]]
+
+
+@dataclass
+class ReviewOutcome:
+    """Result of one :class:`ReviewJob`; ``response`` is ``None`` on failure or timeout."""
+
+    name: str
+    response: str | None
+    metrics: ReviewMetrics
+    timed_out: bool = False
+    error: str | None = None
+
+
+def resolve_review_workers(job_count: int, env: Mapping[str, str] | None = None) -> int:
+    """Return how many reviews to generate concurrently.
+
+    ``LLM_REVIEW_WORKERS`` accepts a positive integer, ``auto`` (use
+    ``OLLAMA_NUM_PARALLEL``, else serial) or ``serial``. Unset or invalid
+    values mean serial generation. The result is capped to ``job_count``.
+    """
+    source = os.environ if env is None else env
+    raw = (source.get(ENV_LLM_REVIEW_WORKERS) or "").strip().lower()
+    if raw in ("", "serial"):
+        requested = 1
+    elif raw == "auto":
+        requested = parse_positive_int(source.get(ENV_OLLAMA_NUM_PARALLEL)) or 1
+    else:
+        parsed = parse_positive_int(raw)
+        if parsed is None:
+            logger.warning(f"Ignoring invalid {ENV_LLM_REVIEW_WORKERS}={raw!r}; generating reviews serially")
+        requested = parsed or 1
+    return clamp_worker_count(requested, job_count)
+
+
+def review_cancelled() -> bool:
+    """Return True when the scheduler has abandoned the job running on this thread.
+
+    Long-running jobs poll this to stop early once their result can no longer
+    be used; it is always False outside :func:`run_review_jobs` workers.
+    """
+    flag: threading.Event | None = getattr(_current_job, "cancelled", None)
+    return flag is not None and flag.is_set()
+
+
+def _run_one(job: ReviewJob[ClientT], client: ClientT) -> ReviewOutcome:
+    response, metrics = job.run(client)
+    return ReviewOutcome(job.name, response, metrics)
+
+
+def _failed(job: ReviewJob[Any], *, timed_out: bool = False, error: str | None = None) -> ReviewOutcome:
+    return ReviewOutcome(job.name, None, ReviewMetrics(), timed_out=timed_out, error=error)
+
+
+def run_review_jobs(
+    jobs: Sequence[ReviewJob[ClientT]],
+    *,
+    client: ClientT,
+    client_factory: Callable[[], ClientT],
+    workers: int = 1,
+    deadline: float | None = None,
+    on_start: Callable[[int, ReviewJob[ClientT]], None] | None = None,
+    on_result: Callable[[ReviewOutcome], None] | None = None,
+) -> list[ReviewOutcome]:
+    """Run ``jobs`` with at most ``workers`` in flight and return outcomes in job order.
+
+    Args:
+        jobs: Independent generations, in the order their outputs are written.
+        client: Client used for serial runs (``workers == 1``).
+        client_factory: Builds one client per worker thread for parallel runs.
+        workers: Maximum concurrent generations.
+        deadline: Per-job wall-clock limit in seconds (parallel runs only;
+            serial runs are bounded by the client's request timeout).
+        on_start: Called with ``(index, job)`` as each job starts.
+        on_result: Called with each outcome, strictly in job order.
+
+    Timed-out jobs are abandoned rather than interrupted: their cancellation
+    flag is set (see :func:`review_cancelled`) and whatever they eventually
+    return is discarded. The same happens to every job still running when
+    this function returns.
+    """
+    outcomes: list[ReviewOutcome | None] = [None] * len(jobs)
+    emitted = 0
+
+    def emit_ready() -> None:
+        nonlocal emitted
+        while emitted < len(jobs) and outcomes[emitted] is not None:
+            if on_result is not None:
+                on_result(outcomes[emitted])  # type: ignore[arg-type]
+            emitted += 1
+
+    if workers <= 1 or len(jobs) <= 1:
+        for index, job in enumerate(jobs):
+            if on_start is not None:
+                on_start(index, job)
+            outcomes[index] = _run_one(job, client)
+            emit_ready()
+        return [outcome for outcome in outcomes if outcome is not None]
+
+    local = threading.local()
+    started: dict[int, float] = {}
+    started_lock = threading.Lock()
+    cancelled = [threading.Event() for _ in jobs]
+
+    def worker(index: int, job: ReviewJob[ClientT]) -> ReviewOutcome:
+        if cancelled[index].is_set():
+            return _failed(job, timed_out=True)
+        with started_lock:
+            started[index] = time.monotonic()
+        if on_start is not None:
+            on_start(index, job)
+        if not hasattr(local, "client"):
+            local.client = client_factory()
+        _current_job.cancelled = cancelled[index]
+        try:
+            return _run_one(job, local.client)
+        finally:
+            _current_job.cancelled = None
+
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="llm-review")
+    try:
+        pending: dict[Future[ReviewOutcome], int] = {
+            executor.submit(worker, index, job): index for index, job in enumerate(jobs)
+        }
+        while pending:
+            done, _ = wait(
+                pending, timeout=_POLL_INTERVAL if deadline is not None else None, return_when=FIRST_COMPLETED
+            )
+            for future in done:
+                index = pending.pop(future)
+                try:
+                    outcomes[index] = future.result()
+                except Exception as exc:  # noqa: BLE001 - one failed review must not sink the others
+                    logger.warning(f"  ⚠️  {jobs[index].name} failed: {exc}")
+                    outcomes[index] = _failed(jobs[index], error=str(exc))
+            if deadline is not None:
+                now = time.monotonic()
+                with started_lock:
+                    overdue = [
+                        (future, index)
+                        for future, index in pending.items()
+                        if index in started and now - started[index] > deadline
+                    ]
+                for future, index in overdue:
+                    del pending[future]
+                    cancelled[index].set()
+                    future.cancel()
+                    logger.warning(f"  ⚠️  {jobs[index].name} exceeded its {deadline:.0f}s deadline — abandoning")
+                    outcomes[index] = _failed(jobs[index], timed_out=True)
+            emit_ready()
+    finally:
+        # Abandoned requests are asked to stop and finish in the background;
+        # never block on them, and never start the jobs still queued.
+        for flag in cancelled:
+            flag.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+    return [outcome for outcome in outcomes if outcome is not None]
@@ -102,6 +102,7 @@ def cmd_pipeline(ns: argparse.Namespace, *, runner_factory: Any = PipelineRunner
                 resume=ns.resume,
                 core_only=ns.core_only,
                 incremental=ns.incremental,
+                stage_parallelism=ns.stage_parallelism,
             )
         )
     )
@@ -5,6 +5,8 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
+from infrastructure.core.cli_parser import positive_int_arg
+
 
 def build_parser() -> argparse.ArgumentParser:
     """Build the compatible top-level orchestration parser."""
@@ -32,6 +34,13 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Enable incremental stage skipping when inputs/outputs are unchanged (opt-in; default off).",
     )
+    pipe.add_argument(
+        "--stage-parallelism",
+        type=positive_int_arg,
+        default=1,
+        metavar="N",
+        help="Run up to N independent stages concurrently (default 1: strictly serial).",
+    )
 
     multi = sub.add_parser("multi", help="Run all-projects orchestration.")
     multi.add_argument("--core-only", action="store_true")
@@ -42,6 +42,7 @@ class PipelineInvocation:
     resume: bool = False
     core_only: bool = False
     incremental: bool = False
+    stage_parallelism: int = 1
     log_layout: str = "per_project"
 
 
@@ -98,6 +99,7 @@ class PipelineRunner:
             skip_llm=invocation.skip_llm or invocation.core_only,
             resume=invocation.resume,
             incremental=IncrementalConfig(enabled=invocation.incremental),
+            stage_parallelism=invocation.stage_parallelism,
         )
         executor = self.executor_factory(config)
         preview = getattr(executor, "preview_stage_names", None)
@@ -1,13 +1,8 @@
-"""Prose analysis subpackage — metrics, structure, quality."""
+"""Prose analysis subpackage — tokens, metrics, structure, quality."""
 
 from .metrics import (
     ProseMetrics,
     compute_metrics,
-    count_syllables,
-    is_complex_word,
-    split_paragraphs,
-    split_sentences,
-    tokenize_words,
 )
 from .quality import (
     QualityReport,
@@ -25,6 +20,18 @@ from .structure import (
     parse_headings,
     render_outline,
 )
+from .tokens import (
+    ProseDocument,
+    clear_token_caches,
+    count_syllables,
+    is_complex_word,
+    split_paragraphs,
+    split_sentences,
+    tokenize_document,
+    tokenize_paragraph,
+    tokenize_words,
+    word_profile,
+)
 
 __all__ = [
     # metrics
@@ -35,6 +42,12 @@ __all__ = [
     "split_paragraphs",
     "split_sentences",
     "tokenize_words",
+    # tokens
+    "ProseDocument",
+    "clear_token_caches",
+    "tokenize_document",
+    "tokenize_paragraph",
+    "word_profile",
     # structure
     "Heading",
     "Section",
@@ -3,46 +3,16 @@
 Lightweight stylistic analysers intended to give a writer fast,
 deterministic feedback. None of these is a replacement for human
 review; all are heuristics tuned for academic prose.
+
+The word-level detectors read the shared
+:func:`~infrastructure.prose.analysis.tokens.tokenize_document` stream, whose
+lexicon holds the "to be" forms, past-participle pattern and hedge words.
 """
 
 import re
 from dataclasses import dataclass, field
 
-from infrastructure.prose.analysis.metrics import (
-    split_sentences,
-    tokenize_words,
-)
-
-# Common "to be" forms used to flag potential passive constructions.
-_BE_FORMS = {"is", "are", "was", "were", "be", "been", "being", "am"}
-
-# Common past-participle endings (heuristic, not exhaustive). Coupled with
-# a preceding "to be" form, this gives a rough passive-voice signal.
-_PP_RE = re.compile(r"\b\w+(ed|en)\b", re.IGNORECASE)
-
-# Hedge words / weasel words common in academic writing.
-_HEDGE_WORDS = {
-    "may",
-    "might",
-    "could",
-    "perhaps",
-    "probably",
-    "likely",
-    "possibly",
-    "somewhat",
-    "roughly",
-    "approximately",
-    "essentially",
-    "basically",
-    "arguably",
-    "generally",
-    "largely",
-    "nearly",
-    "almost",
-    "seems",
-    "appears",
-    "suggests",
-}
+from infrastructure.prose.analysis.tokens import tokenize_document
 
 # Pandoc / pandoc-citeproc citation key patterns.
 _CITE_RE = re.compile(r"(?<!\w)@[A-Za-z][A-Za-z0-9_:.-]*")
@@ -106,22 +76,12 @@ class QualityReport:
 
 def detect_passive_sentences(text: str) -> list[str]:
     """Return sentences with at least one "be + past participle" pair."""
-    out: list[str] = []
-    for sentence in split_sentences(text):
-        words = tokenize_words(sentence)
-        lower_words = [w.lower() for w in words]
-        for i, w in enumerate(lower_words[:-1]):
-            if w in _BE_FORMS:
-                next_word = words[i + 1]
-                if _PP_RE.match(next_word):
-                    out.append(sentence)
-                    break
-    return out
+    return [s.text for s in tokenize_document(text).sentences if s.passive]
 
 
 def detect_hedge_words(text: str) -> list[str]:
     """Return list of hedge words present in *text* (with duplicates)."""
-    return [w for w in (t.lower() for t in tokenize_words(text)) if w in _HEDGE_WORDS]
+    return tokenize_document(text).hedge_words
 
 
 def extract_citation_keys(text: str) -> list[str]:
@@ -148,7 +108,7 @@ def extract_citation_keys(text: str) -> list[str]:
 
 def detect_long_sentences(text: str, *, threshold: int = 35) -> list[str]:
     """Return sentences with > *threshold* words."""
-    return [s for s in split_sentences(text) if len(tokenize_words(s)) > threshold]
+    return [s.text for s in tokenize_document(text).sentences if s.word_count > threshold]
 
 
 def analyze_quality(text: str, *, long_sentence_threshold: int = 35) -> QualityReport:
@@ -156,12 +116,12 @@ def analyze_quality(text: str, *, long_sentence_threshold: int = 35) -> QualityR
     if not text or not text.strip():
         return QualityReport()
 
-    words = tokenize_words(text)
-    n = len(words)
-    passive = detect_passive_sentences(text)
-    hedges = detect_hedge_words(text)
+    doc = tokenize_document(text)
+    n = doc.word_count
+    passive = [s.text for s in doc.sentences if s.passive]
+    hedges = doc.hedge_words
     cites = extract_citation_keys(text)
-    long_sents = detect_long_sentences(text, threshold=long_sentence_threshold)
+    long_sents = [s.text for s in doc.sentences if s.word_count > long_sentence_threshold]
 
     def density(count: int) -> float:
         """Return the citation density metric."""
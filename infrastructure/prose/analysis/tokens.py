@@ -0,0 +1,370 @@
+"""Single-pass token stream and word lexicon shared by the prose analysers.
+
+:func:`tokenize_document` splits plain prose into paragraphs, sentences and
+words once, keeping character offsets for every span, and both
+:func:`~infrastructure.prose.analysis.metrics.compute_metrics` and
+:func:`~infrastructure.prose.analysis.quality.analyze_quality` read the same
+:class:`ProseDocument` instead of re-splitting and re-tokenizing the text.
+
+Work is cached at three levels, all in-process and bounded:
+
+* :func:`word_profile` memoizes per-word facts (syllables, Gunning Fog
+  complexity, hedge and passive-voice markers), so each distinct word is
+  scored once however often it occurs.
+* :func:`tokenize_paragraph` memoizes each paragraph by its text, so
+  re-analysing a long manuscript after a one-paragraph edit only re-tokenizes
+  the edited paragraph.
+* :func:`tokenize_document` memoizes the last few documents, so the metrics
+  and quality passes over one section share a single stream.
+
+The splitting heuristics are the package's historical ones: paragraphs break
+on blank lines, sentences on ``. ! ?`` followed by whitespace and a capital,
+and words are ASCII letter runs.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass
+from functools import lru_cache
+
+# Sentence splitting pattern. Conservative: only break on . ! ? followed
+# by whitespace + capital. Won't perfectly handle abbreviations but is
+# stable.
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+(?=[A-Z\"\(\[])")
+_WORD_RE = re.compile(r"[A-Za-z][A-Za-z\-']*")
+_VOWEL_GROUP_RE = re.compile(r"[aeiouyAEIOUY]+")
+_PARAGRAPH_BREAK_RE = re.compile(r"\n\s*\n")
+
+# The two halves of _SENTENCE_RE, used to decide whether a sentence
+# continues across a paragraph break.
+_SENTENCE_END_CHARS = (".", "!", "?")
+_SENTENCE_START_RE = re.compile(r"[A-Z\"\(\[]")
+
+# Common "to be" forms used to flag potential passive constructions.
+_BE_FORMS = {"is", "are", "was", "were", "be", "been", "being", "am"}
+
+# Common past-participle endings (heuristic, not exhaustive). Coupled with
+# a preceding "to be" form, this gives a rough passive-voice signal.
+_PP_RE = re.compile(r"\b\w+(ed|en)\b", re.IGNORECASE)
+
+# Hedge words / weasel words common in academic writing.
+_HEDGE_WORDS = {
+    "may",
+    "might",
+    "could",
+    "perhaps",
+    "probably",
+    "likely",
+    "possibly",
+    "somewhat",
+    "roughly",
+    "approximately",
+    "essentially",
+    "basically",
+    "arguably",
+    "generally",
+    "largely",
+    "nearly",
+    "almost",
+    "seems",
+    "appears",
+    "suggests",
+}
+
+# Cache bounds: distinct words, distinct paragraphs, whole documents.
+_LEXICON_SIZE = 1 << 16
+_PARAGRAPH_CACHE_SIZE = 1 << 14
+_DOCUMENT_CACHE_SIZE = 8
+
+_Span = tuple[int, int]
+
+
+def _stripped_spans(text: str, separator: re.Pattern[str]) -> Iterator[_Span]:
+    """Yield the whitespace-stripped, non-empty pieces of ``separator.split(text)`` as spans."""
+    pos = 0
+    for match in separator.finditer(text):
+        yield from _strip_span(text, pos, match.start())
+        pos = match.end()
+    yield from _strip_span(text, pos, len(text))
+
+
+def _strip_span(text: str, start: int, end: int) -> Iterator[_Span]:
+    piece = text[start:end]
+    stripped = piece.strip()
+    if stripped:
+        lead = len(piece) - len(piece.lstrip())
+        yield start + lead, start + lead + len(stripped)
+
+
+def split_paragraphs(text: str) -> list[str]:
+    """Split *text* on blank lines into non-empty paragraphs."""
+    if not text:
+        return []
+    return [text[start:end] for start, end in _stripped_spans(text, _PARAGRAPH_BREAK_RE)]
+
+
+def split_sentences(text: str) -> list[str]:
+    """Split *text* into sentences using a conservative heuristic."""
+    if not text:
+        return []
+    # The final "sentence" may not end with terminal punctuation; keep it.
+    text = text.strip()
+    return [text[start:end] for start, end in _stripped_spans(text, _SENTENCE_RE)]
+
+
+def tokenize_words(text: str) -> list[str]:
+    """Return the list of word tokens in *text*."""
+    return _WORD_RE.findall(text)
+
+
+def count_syllables(word: str) -> int:
+    """Estimate syllables in *word* using vowel-group heuristic.
+
+    Special rules:
+
+    * Silent terminal "e" subtracts one (unless the word would have zero).
+    * Always at least one syllable for any non-empty word.
+    """
+    if not word:
+        return 0
+    word = word.lower()
+    groups = _VOWEL_GROUP_RE.findall(word)
+    count = len(groups)
+    if word.endswith("e") and count > 1 and not word.endswith("le"):
+        count -= 1
+    return max(1, count)
+
+
+def is_complex_word(word: str) -> bool:
+    """A "complex word" for Gunning Fog: ≥3 syllables, not proper noun,
+    not a -es / -ed / -ing form."""
+    if not word or word[0].isupper():
+        return False
+    if len(word) < 4:
+        return False
+    lower = word.lower()
+    if lower.endswith(("es", "ed", "ing")):
+        return False
+    return count_syllables(word) >= 3
+
+
+@dataclass(frozen=True)
+class WordProfile:
+    """Everything the analysers need to know about one word form."""
+
+    syllables: int
+    complex: bool
+    hedge: bool
+    be_form: bool
+    participle: bool
+
+
+@lru_cache(maxsize=_LEXICON_SIZE)
+def word_profile(word: str) -> WordProfile:
+    """Return the memoized :class:`WordProfile` for *word* (case-sensitive)."""
+    lower = word.lower()
+    return WordProfile(
+        syllables=count_syllables(word),
+        complex=is_complex_word(word),
+        hedge=lower in _HEDGE_WORDS,
+        be_form=lower in _BE_FORMS,
+        participle=_PP_RE.match(word) is not None,
+    )
+
+
+@dataclass(frozen=True)
+class SentenceSpan:
+    """A sentence inside one paragraph.
+
+    ``start``/``end`` are offsets into the paragraph text and
+    ``word_start``/``word_end`` index the paragraph's words.
+    """
+
+    start: int
+    end: int
+    word_start: int
+    word_end: int
+    passive: bool
+
+
+@dataclass(frozen=True)
+class ParagraphTokens:
+    """Position-independent tokens for one paragraph; cached by paragraph text."""
+
+    text: str
+    sentences: tuple[SentenceSpan, ...]
+    words: tuple[str, ...]
+    word_spans: tuple[_Span, ...]
+    syllable_count: int
+    complex_word_count: int
+    hedge_words: tuple[str, ...]
+
+
+@lru_cache(maxsize=_PARAGRAPH_CACHE_SIZE)
+def tokenize_paragraph(text: str) -> ParagraphTokens:
+    """Tokenize one stripped paragraph into sentences and words."""
+    sentences: list[SentenceSpan] = []
+    words: list[str] = []
+    word_spans: list[_Span] = []
+    syllables = complex_words = 0
+    hedges: list[str] = []
+    for start, end in _stripped_spans(text, _SENTENCE_RE):
+        first = len(words)
+        passive = False
+        previous_be = False
+        for match in _WORD_RE.finditer(text, start, end):
+            word = match.group()
+            profile = word_profile(word)
+            words.append(word)
+            word_spans.append(match.span())
+            syllables += profile.syllables
+            complex_words += profile.complex
+            if profile.hedge:
+                hedges.append(word.lower())
+            passive = passive or (previous_be and profile.participle)
+            previous_be = profile.be_form
+        sentences.append(SentenceSpan(start, end, first, len(words), passive))
+    return ParagraphTokens(
+        text=text,
+        sentences=tuple(sentences),
+        words=tuple(words),
+        word_spans=tuple(word_spans),
+        syllable_count=syllables,
+        complex_word_count=complex_words,
+        hedge_words=tuple(hedges),
+    )
+
+
+@dataclass(frozen=True)
+class Paragraph:
+    """A paragraph and its offsets in the document text."""
+
+    start: int
+    end: int
+    tokens: ParagraphTokens
+
+
+@dataclass(frozen=True)
+class Sentence:
+    """A document-level sentence, as :func:`split_sentences` would return it."""
+
+    start: int
+    end: int
+    text: str
+    word_count: int
+    passive: bool
+
+
+@dataclass(frozen=True)
+class ProseDocument:
+    """Paragraph, sentence and word spans for one plain-text document.
+
+    ``paragraphs`` carry the per-paragraph sentences used for readability
+    counts. ``sentences`` is the document-level segmentation used by the
+    quality detectors. Like :func:`split_sentences` over the whole text, a
+    sentence there continues across a blank line unless the earlier paragraph
+    ends in ``. ! ?`` and the next starts with a capital.
+    """
+
+    text: str
+    paragraphs: tuple[Paragraph, ...]
+    sentences: tuple[Sentence, ...]
+
+    @property
+    def word_count(self) -> int:
+        return sum(len(p.tokens.words) for p in self.paragraphs)
+
+    @property
+    def paragraph_sentence_count(self) -> int:
+        """Number of sentences when every paragraph break also ends a sentence."""
+        return sum(len(p.tokens.sentences) for p in self.paragraphs)
+
+    @property
+    def syllable_count(self) -> int:
+        return sum(p.tokens.syllable_count for p in self.paragraphs)
+
+    @property
+    def complex_word_count(self) -> int:
+        return sum(p.tokens.complex_word_count for p in self.paragraphs)
+
+    @property
+    def hedge_words(self) -> list[str]:
+        """Lower-cased hedge words in document order, with duplicates."""
+        return [word for p in self.paragraphs for word in p.tokens.hedge_words]
+
+    def words(self) -> Iterator[tuple[str, int, int]]:
+        """Yield ``(word, start, end)`` with offsets into :attr:`text`."""
+        for paragraph in self.paragraphs:
+            for word, (start, end) in zip(paragraph.tokens.words, paragraph.tokens.word_spans):
+                yield word, paragraph.start + start, paragraph.start + end
+
+
+@lru_cache(maxsize=_DOCUMENT_CACHE_SIZE)
+def tokenize_document(text: str) -> ProseDocument:
+    """Return the :class:`ProseDocument` for plain-text *text*."""
+    paragraphs = tuple(
+        Paragraph(start, end, tokenize_paragraph(text[start:end]))
+        for start, end in _stripped_spans(text, _PARAGRAPH_BREAK_RE)
+    )
+    return ProseDocument(text=text, paragraphs=paragraphs, sentences=_document_sentences(text, paragraphs))
+
+
+def _document_sentences(text: str, paragraphs: tuple[Paragraph, ...]) -> tuple[Sentence, ...]:
+    """Join paragraph sentences that the document-level split would not separate."""
+    sentences: list[Sentence] = []
+    # Sentence being built: start, end, word count, passive, whether its last word is a "to be" form.
+    start = end = words = 0
+    passive = last_be = False
+    open_sentence = False
+    previous_text = ""
+    for paragraph in paragraphs:
+        tokens = paragraph.tokens
+        continues = open_sentence and not (
+            previous_text.endswith(_SENTENCE_END_CHARS) and _SENTENCE_START_RE.match(tokens.text)
+        )
+        for index, span in enumerate(tokens.sentences):
+            span_words = tokens.words[span.word_start : span.word_end]
+            if index == 0 and continues:
+                crosses = last_be and bool(span_words) and word_profile(span_words[0]).participle
+                passive = passive or span.passive or crosses
+                words += len(span_words)
+            else:
+                if open_sentence:
+                    sentences.append(Sentence(start, end, text[start:end], words, passive))
+                start, words, passive, last_be = paragraph.start + span.start, len(span_words), span.passive, False
+                open_sentence = True
+            end = paragraph.start + span.end
+            if span_words:
+                last_be = word_profile(span_words[-1]).be_form
+        previous_text = tokens.text
+    if open_sentence:
+        sentences.append(Sentence(start, end, text[start:end], words, passive))
+    return tuple(sentences)
+
+
+def clear_token_caches() -> None:
+    """Drop every memoized word, paragraph and document."""
+    word_profile.cache_clear()
+    tokenize_paragraph.cache_clear()
+    tokenize_document.cache_clear()
+
+
+__all__ = [
+    "Paragraph",
+    "ParagraphTokens",
+    "ProseDocument",
+    "Sentence",
+    "SentenceSpan",
+    "WordProfile",
+    "clear_token_caches",
+    "count_syllables",
+    "is_complex_word",
+    "split_paragraphs",
+    "split_sentences",
+    "tokenize_document",
+    "tokenize_paragraph",
+    "tokenize_words",
+    "word_profile",
+]
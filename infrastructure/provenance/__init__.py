@@ -18,6 +18,10 @@ Quick start::
     prov.link(run.node_id, art.node_id, EdgeRelation.produced_by)
 
     print(len(prov), "nodes")
+
+Large DAGs should be recorded inside ``with prov.batch():``; a ``.sqlite``
+path passed to :func:`open_provenance_store` selects the indexed
+:class:`SqliteProvenance` backend.
 """
 
 from __future__ import annotations
@@ -41,7 +45,13 @@ from infrastructure.provenance.review import (
     Severity,
     review_provenance_store,
 )
-from infrastructure.provenance.store import Provenance, ProvenanceStoreError
+from infrastructure.provenance.sqlite_store import SqliteProvenance
+from infrastructure.provenance.store import (
+    Provenance,
+    ProvenanceStore,
+    ProvenanceStoreError,
+    open_provenance_store,
+)
 from infrastructure.provenance.validation import (
     ProvenanceValidationFinding,
     ProvenanceValidationReport,
@@ -61,7 +71,10 @@ __all__ = [
     "node_from_dict",
     # Store
     "Provenance",
+    "ProvenanceStore",
     "ProvenanceStoreError",
+    "SqliteProvenance",
+    "open_provenance_store",
     # Review
     "Finding",
     "Review",
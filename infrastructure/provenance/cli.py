@@ -1,10 +1,14 @@
-"""CLI for the provenance DAG — ``record-artifact``, ``list``, and ``review`` subcommands.
+"""CLI for the provenance DAG — ``record-artifact``, ``list``, ``review`` and ``export`` subcommands.
+
+``--dag-path`` accepts a ``dag.json`` or a ``.sqlite`` database (see
+:func:`~infrastructure.provenance.store.open_provenance_store`).
 
 Usage::
 
     python -m infrastructure.provenance record-artifact fig1 --path output/figures/fig1.pdf
     python -m infrastructure.provenance list
     python -m infrastructure.provenance review
+    python -m infrastructure.provenance --dag-path output/provenance/dag.sqlite export output/provenance/dag.json
 """
 
 from __future__ import annotations
@@ -19,13 +23,13 @@ from infrastructure.provenance.models import (
     NodeKind,
 )
 from infrastructure.provenance.review import review_provenance_store
-from infrastructure.provenance.store import Provenance, ProvenanceStoreError
+from infrastructure.provenance.store import ProvenanceStore, ProvenanceStoreError, open_provenance_store
 from infrastructure.provenance.validation import validate_provenance_dag
 
 
-def _get_store(args: argparse.Namespace) -> Provenance:
+def _get_store(args: argparse.Namespace) -> ProvenanceStore:
     dag_path = Path(args.dag_path) if args.dag_path else Path("output/provenance/dag.json")
-    return Provenance(dag_path)
+    return open_provenance_store(dag_path)
 
 
 def _cmd_list(args: argparse.Namespace) -> int:
@@ -77,13 +81,20 @@ def _cmd_validate(args: argparse.Namespace) -> int:
     return 0 if report.is_valid else 1
 
 
+def _cmd_export(args: argparse.Namespace) -> int:
+    store = _get_store(args)
+    destination = store.export_json(Path(args.destination))
+    print(f"exported {len(store)} nodes to {destination}")
+    return 0
+
+
 def build_parser() -> argparse.ArgumentParser:
     """Build and return the argparse parser."""
     parser = argparse.ArgumentParser(
         prog="provenance",
         description="Provenance DAG CLI",
     )
-    parser.add_argument("--dag-path", default="", help="Path to dag.json")
+    parser.add_argument("--dag-path", default="", help="Path to dag.json or a .sqlite store")
     sub = parser.add_subparsers(dest="command")
 
     # list
@@ -108,6 +119,11 @@ def build_parser() -> argparse.ArgumentParser:
     p_val.add_argument("--json", action="store_true")
     p_val.set_defaults(func=_cmd_validate)
 
+    # export
+    p_export = sub.add_parser("export", help="Write the DAG as a publishable dag.json document")
+    p_export.add_argument("destination")
+    p_export.set_defaults(func=_cmd_export)
+
     return parser
 
 
@@ -3,6 +3,13 @@
 The store persists nodes and edges as a single JSON file under
 ``output/provenance/dag.json`` relative to the project directory.
 All writes are atomic (write-then-rename) to avoid partial-state corruption.
+
+Every mutation rewrites the file, so bulk recording should happen inside
+:meth:`Provenance.batch`, which writes once when the outermost batch exits and
+restores the previous state if it raises. Large projects can switch to the
+SQLite backend (:class:`~infrastructure.provenance.sqlite_store.SqliteProvenance`)
+by giving the store a ``.sqlite`` path; :func:`open_provenance_store` picks the
+backend from the suffix and both export the same JSON document.
 """
 
 from __future__ import annotations
@@ -11,9 +18,10 @@ import datetime
 import json
 import tempfile
 import typing
-from contextlib import suppress
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager, suppress
 from pathlib import Path
-from typing import Any, Iterator
+from typing import IO, Any, Protocol
 
 from infrastructure.provenance.models import (
     Edge,
@@ -25,11 +33,53 @@ from infrastructure.provenance.models import (
 
 _DEFAULT_FILENAME = "dag.json"
 
+#: File suffixes that select the SQLite backend in :func:`open_provenance_store`.
+SQLITE_SUFFIXES = frozenset({".sqlite", ".sqlite3", ".db"})
+
+_EdgeKey = tuple[str, str, str]
+
 
 class ProvenanceStoreError(ValueError):
     """Raised when a provenance store is malformed or cannot be read."""
 
 
+class ProvenanceStore(Protocol):
+    """Operations shared by the JSON and SQLite provenance backends."""
+
+    @property
+    def path(self) -> Path: ...
+
+    def record(self, node: ProvenanceNode) -> ProvenanceNode: ...
+
+    def link(
+        self,
+        from_id: str,
+        to_id: str,
+        relation: EdgeRelation,
+        metadata: dict[str, Any] | None = None,
+    ) -> Edge: ...
+
+    def batch(self) -> AbstractContextManager[None]: ...
+
+    def clear(self) -> tuple[int, int]: ...
+
+    def get(self, node_id: str) -> ProvenanceNode | None: ...
+
+    def list(self, kind: NodeKind | None = None) -> typing.List[ProvenanceNode]: ...  # noqa: A003
+
+    def query(
+        self,
+        *,
+        from_id: str | None = None,
+        to_id: str | None = None,
+        relation: EdgeRelation | None = None,
+    ) -> typing.List[Edge]: ...
+
+    def export_json(self, destination: Path) -> Path: ...
+
+    def __len__(self) -> int: ...
+
+
 class Provenance:
     """Persistent provenance DAG store.
 
@@ -49,6 +99,11 @@ class Provenance:
         self._path = path
         self._nodes: dict[str, dict[str, Any]] = {}
         self._edges: list[dict[str, Any]] = []
+        self._edge_keys: set[_EdgeKey] = set()
+        self._edges_from: dict[str, list[dict[str, Any]]] = {}
+        self._edges_to: dict[str, list[dict[str, Any]]] = {}
+        self._batch_depth = 0
+        self._dirty = False
         if path.exists():
             self._load()
 
@@ -88,7 +143,7 @@ class Provenance:
         if node.node_id not in self._nodes:
             node.created_at = datetime.datetime.now(datetime.timezone.utc).isoformat()
             self._nodes[node.node_id] = node.to_dict()
-            self._save()
+            self._changed()
         return node
 
     def link(
@@ -118,14 +173,41 @@ class Provenance:
             raise KeyError(f"Node '{to_id}' not found in provenance store")
 
         edge = Edge(from_id=from_id, to_id=to_id, relation=relation, metadata=metadata or {})
-        key = (from_id, to_id, relation.value)
         # Idempotent: only add if not already present
-        existing_keys = {(e["from_id"], e["to_id"], e["relation"]) for e in self._edges}
-        if key not in existing_keys:
-            self._edges.append(edge.to_dict())
-            self._save()
+        if (from_id, to_id, relation.value) not in self._edge_keys:
+            self._add_edge(edge.to_dict())
+            self._changed()
         return edge
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group mutations into one write.
+
+        The DAG is saved once when the outermost batch exits. If the block
+        raises, the store returns to its state when the batch began and
+        nothing is written. Batches nest.
+        """
+        if self._batch_depth:
+            self._batch_depth += 1
+            try:
+                yield
+            finally:
+                self._batch_depth -= 1
+            return
+        snapshot = (dict(self._nodes), list(self._edges), self._dirty)
+        self._batch_depth = 1
+        try:
+            yield
+        except BaseException:
+            self._batch_depth = 0
+            nodes, edges, self._dirty = snapshot
+            self._nodes = nodes
+            self._index_edges(edges)
+            raise
+        self._batch_depth = 0
+        if self._dirty:
+            self._save()
+
     def clear(self) -> tuple[int, int]:
         """Remove all nodes and edges.
 
@@ -134,10 +216,16 @@ class Provenance:
         """
         n_nodes, n_edges = len(self._nodes), len(self._edges)
         self._nodes.clear()
-        self._edges.clear()
-        self._save()
+        self._index_edges([])
+        self._changed()
         return n_nodes, n_edges
 
+    def export_json(self, destination: Path) -> Path:
+        """Write the DAG as the publication JSON document at *destination* and return it."""
+        payload = self._payload()
+        _atomic_write(destination, lambda fh: json.dump(payload, fh, indent=2, ensure_ascii=False))
+        return destination
+
     # ------------------------------------------------------------------
     # Queries
     # ------------------------------------------------------------------
@@ -170,15 +258,23 @@ class Provenance:
     ) -> typing.List[Edge]:
         """Return edges matching the supplied criteria.
 
-        All supplied criteria are combined with AND.
+        All supplied criteria are combined with AND. Lookups by *from_id* or
+        *to_id* read an adjacency index instead of scanning every edge.
 
         Args:
             from_id: Filter by source node id.
             to_id: Filter by target node id.
             relation: Filter by edge relation type.
         """
+        candidates: typing.Sequence[dict[str, Any]] = self._edges
+        if from_id is not None:
+            candidates = self._edges_from.get(from_id, [])
+        if to_id is not None:
+            by_target = self._edges_to.get(to_id, [])
+            if len(by_target) < len(candidates):
+                candidates = by_target
         results: list[Edge] = []
-        for e in self._edges:
+        for e in candidates:
             if from_id is not None and e["from_id"] != from_id:
                 continue
             if to_id is not None and e["to_id"] != to_id:
@@ -269,34 +365,84 @@ class Provenance:
             edges.append(raw_edge)
 
         self._nodes = nodes
-        self._edges = edges
+        self._index_edges(edges)
+
+    def _add_edge(self, edge: dict[str, Any]) -> None:
+        self._edges.append(edge)
+        self._edge_keys.add((edge["from_id"], edge["to_id"], edge["relation"]))
+        self._edges_from.setdefault(edge["from_id"], []).append(edge)
+        self._edges_to.setdefault(edge["to_id"], []).append(edge)
+
+    def _index_edges(self, edges: typing.Iterable[dict[str, Any]]) -> None:
+        """Replace the edge list and rebuild the key set and adjacency indexes."""
+        self._edges = []
+        self._edge_keys = set()
+        self._edges_from = {}
+        self._edges_to = {}
+        for edge in edges:
+            self._add_edge(edge)
+
+    def _changed(self) -> None:
+        """Persist now, or mark the DAG dirty for the enclosing batch."""
+        if self._batch_depth:
+            self._dirty = True
+        else:
+            self._save()
 
-    def _save(self) -> None:
-        """Atomically persist the current DAG to disk."""
-        self._path.parent.mkdir(parents=True, exist_ok=True)
-        payload = {
+    def _payload(self) -> dict[str, Any]:
+        return {
             "nodes": list(self._nodes.values()),
             "edges": self._edges,
         }
-        # Atomic write: write to tmp then rename
-        tmp_dir = self._path.parent
-        tmp_path: Path | None = None
-        try:
-            with tempfile.NamedTemporaryFile(
-                mode="w",
-                encoding="utf-8",
-                dir=tmp_dir,
-                delete=False,
-                suffix=".tmp",
-            ) as fh:
-                json.dump(payload, fh, indent=2, ensure_ascii=False)
-                tmp_path = Path(fh.name)
-            tmp_path.replace(self._path)
-        except OSError:
-            if tmp_path is not None:
-                with suppress(OSError):
-                    tmp_path.unlink(missing_ok=True)
-            raise
+
+    def _save(self) -> None:
+        """Atomically persist the current DAG to disk."""
+        payload = self._payload()
+        _atomic_write(self._path, lambda fh: json.dump(payload, fh, indent=2, ensure_ascii=False))
+        self._dirty = False
+
+
+def _atomic_write(path: Path, write: Callable[[IO[str]], None]) -> None:
+    """Call *write* on a temporary file beside *path*, then rename it into place."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path: Path | None = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            mode="w",
+            encoding="utf-8",
+            dir=path.parent,
+            delete=False,
+            suffix=".tmp",
+        ) as fh:
+            tmp_path = Path(fh.name)
+            write(fh)
+        tmp_path.replace(path)
+    except BaseException:
+        if tmp_path is not None:
+            with suppress(OSError):
+                tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def open_provenance_store(path: Path | str) -> ProvenanceStore:
+    """Open the provenance store at *path*, choosing the backend from its suffix.
+
+    ``.sqlite``, ``.sqlite3`` and ``.db`` paths open a
+    :class:`~infrastructure.provenance.sqlite_store.SqliteProvenance`; anything
+    else opens the JSON :class:`Provenance`.
+    """
+    path = Path(path)
+    if path.suffix.lower() in SQLITE_SUFFIXES:
+        from infrastructure.provenance.sqlite_store import SqliteProvenance
+
+        return SqliteProvenance(path)
+    return Provenance(path)
 
 
-__all__ = ["Provenance", "ProvenanceStoreError"]
+__all__ = [
+    "SQLITE_SUFFIXES",
+    "Provenance",
+    "ProvenanceStore",
+    "ProvenanceStoreError",
+    "open_provenance_store",
+]
@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 from infrastructure.provenance.models import Edge, NodeKind, ProvenanceNode
-from infrastructure.provenance.store import Provenance
+from infrastructure.provenance.store import ProvenanceStore
 
 
 @dataclass(frozen=True)
@@ -64,8 +64,8 @@ class ProvenanceValidationReport:
         }
 
 
-def validate_provenance_dag(store: Provenance) -> ProvenanceValidationReport:
-    """Validate graph structure, references, and acyclicity of a Provenance store."""
+def validate_provenance_dag(store: ProvenanceStore) -> ProvenanceValidationReport:
+    """Validate graph structure, references, and acyclicity of a JSON or SQLite provenance store."""
     findings: list[ProvenanceValidationFinding] = []
 
     nodes: list[ProvenanceNode] = store.list()
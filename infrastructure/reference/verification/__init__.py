@@ -8,7 +8,8 @@ rather than silently passing.
 
 Public API:
 
-* :class:`ReferenceResolver` — resolve a DOI / arXiv id / title to a record.
+* :class:`ReferenceResolver` — resolve a DOI / arXiv id / title to a record
+  (or a whole batch of :class:`ResolutionRequest` via ``resolve_many``).
 * :class:`ResolutionCache` — persistent SQLite cache of resolutions.
 * :func:`verify_bibfile` / :func:`verify_database` / :func:`verify_entry` —
   classify cited references into :class:`VerificationStatus` outcomes.
@@ -28,6 +29,7 @@ from infrastructure.reference.verification.models import (
 from infrastructure.reference.verification.resolver import (
     ReferenceResolver,
     Resolution,
+    ResolutionRequest,
     normalize_doi,
     title_similarity,
 )
@@ -46,6 +48,7 @@ __all__ = [
     "ReferenceVerdict",
     "Resolution",
     "ResolutionCache",
+    "ResolutionRequest",
     "VerificationReport",
     "VerificationStatus",
     "extract_arxiv_id",
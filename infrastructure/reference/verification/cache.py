@@ -22,6 +22,7 @@ from __future__ import annotations
 import json
 import sqlite3
 import time
+from collections.abc import Iterable
 from pathlib import Path
 
 from infrastructure.search.literature.models import Paper
@@ -31,6 +32,9 @@ __all__ = ["CACHE_MISS", "CacheMiss", "DEFAULT_TTL_SECONDS", "ResolutionCache"]
 # 90 days — a published reference's metadata is stable, so a long TTL is safe.
 DEFAULT_TTL_SECONDS = 90 * 24 * 60 * 60
 
+# Stay well under SQLite's default host-parameter limit in ``get_many``.
+_QUERY_CHUNK = 500
+
 _SCHEMA = """
 CREATE TABLE IF NOT EXISTS resolutions (
     key         TEXT PRIMARY KEY,
@@ -81,14 +85,48 @@ class ResolutionCache:
             conn.close()
         if row is None:
             return CACHE_MISS
-        found, paper_json, resolved_via, cached_at = row
+        return self._decode_row(*row)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Paper | None]:
+        """Return every cached (non-expired) value among ``keys`` in one connection.
+
+        Keys that miss are simply absent from the result, so callers partition a
+        batch into hits and misses without one round-trip per key.
+        """
+        wanted = list(dict.fromkeys(keys))
+        if not wanted:
+            return {}
+        found_values: dict[str, Paper | None] = {}
+        conn = self._connect()
+        try:
+            for start in range(0, len(wanted), _QUERY_CHUNK):
+                chunk = wanted[start : start + _QUERY_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    "SELECT key, found, paper_json, resolved_via, cached_at FROM resolutions "
+                    f"WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for key, *row in rows:
+                    value = self._decode_row(*row)
+                    if not isinstance(value, CacheMiss):
+                        found_values[key] = value
+        finally:
+            conn.close()
+        return found_values
+
+    def _decode_row(
+        self, found: int, paper_json: str | None, resolved_via: str | None, cached_at: float
+    ) -> Paper | None | CacheMiss:
         if self.ttl_seconds is not None and (time.time() - float(cached_at)) > self.ttl_seconds:
             return CACHE_MISS
         if not found:
             return None
+        if paper_json is None:
+            return CACHE_MISS
         try:
             data = json.loads(paper_json)
-        except (TypeError, json.JSONDecodeError):
+        except json.JSONDecodeError:
             return CACHE_MISS
         paper = Paper.from_dict(data)
         if resolved_via and not paper.source:
@@ -97,20 +135,31 @@ class ResolutionCache:
 
     def put(self, key: str, paper: Paper | None, *, resolved_via: str | None = None) -> None:
         """Store a positive (``paper``) or negative (``None``) resolution."""
+        self.put_many([(key, paper, resolved_via)])
+
+    def put_many(self, rows: Iterable[tuple[str, Paper | None, str | None]]) -> None:
+        """Store ``(key, paper, resolved_via)`` resolutions in a single transaction."""
+        now = time.time()
+        values = [
+            (
+                key,
+                1 if paper is not None else 0,
+                json.dumps(paper.to_dict(), ensure_ascii=False) if paper is not None else None,
+                resolved_via or (paper.source if paper is not None else None),
+                now,
+            )
+            for key, paper, resolved_via in rows
+        ]
+        if not values:
+            return
         conn = self._connect()
         try:
-            conn.execute(
-                "INSERT OR REPLACE INTO resolutions (key, found, paper_json, resolved_via, cached_at) "
-                "VALUES (?, ?, ?, ?, ?)",
-                (
-                    key,
-                    1 if paper is not None else 0,
-                    json.dumps(paper.to_dict(), ensure_ascii=False) if paper is not None else None,
-                    resolved_via or (paper.source if paper is not None else None),
-                    time.time(),
-                ),
-            )
-            conn.commit()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO resolutions (key, found, paper_json, resolved_via, cached_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    values,
+                )
         finally:
             conn.close()
 
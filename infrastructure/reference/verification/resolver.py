@@ -13,6 +13,13 @@ agreement across independent indices raises confidence that a record is real.
 Implementation is original and Apache-2.0; the Crossref/arXiv field mapping is
 reused from :mod:`infrastructure.search.literature` so the two paths cannot
 drift.
+
+:meth:`ReferenceResolver.resolve_many` verifies a whole bibliography at once:
+it partitions the requests into cache hits and misses with one cache read,
+looks up missed DOIs with multi-DOI Crossref / OpenAlex filter queries, and
+resolves whatever is left concurrently. Every request the resolver sends goes
+through a per-host token bucket, so concurrency never exceeds an index's
+published rate limit (arXiv in particular asks for one request per 3 seconds).
 """
 
 from __future__ import annotations
@@ -21,17 +28,44 @@ import hashlib
 import json
 import re
 import urllib.parse
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Final
 
+from infrastructure.core._rate_limiting import TokenBucketLimiter
 from infrastructure.reference.verification.cache import CacheMiss, ResolutionCache
 from infrastructure.search.literature.arxiv_backend import ArxivBackend
 from infrastructure.search.literature.base import BackendError
 from infrastructure.search.literature.crossref_backend import CrossrefBackend, crossref_item_to_paper
-from infrastructure.search.literature.http_client import HttpClient, UrllibHttpClient
+from infrastructure.search.literature.http_client import HttpClient, HttpResponse, UrllibHttpClient
 from infrastructure.search.literature.models import Paper, SearchQuery
 
-__all__ = ["Resolution", "ReferenceResolver", "normalize_doi"]
+__all__ = [
+    "DEFAULT_HOST_RATES",
+    "DEFAULT_RESOLVE_WORKERS",
+    "Resolution",
+    "ResolutionRequest",
+    "ReferenceResolver",
+    "normalize_doi",
+]
+
+#: Concurrent lookups used by :meth:`ReferenceResolver.resolve_many`.
+DEFAULT_RESOLVE_WORKERS: Final[int] = 8
+
+#: Requests per second allowed per index host. Unlisted hosts get
+#: ``_DEFAULT_HOST_RATE``.
+DEFAULT_HOST_RATES: Final[Mapping[str, float]] = {
+    "api.crossref.org": 10.0,
+    "api.openalex.org": 10.0,
+    "export.arxiv.org": 1 / 3,
+}
+_DEFAULT_HOST_RATE: Final[float] = 10.0
+
+# DOIs per multi-DOI filter query. Crossref rejects long filter lists; OpenAlex
+# accepts up to 50 OR-ed values per filter.
+_CROSSREF_DOI_BATCH: Final[int] = 20
+_OPENALEX_DOI_BATCH: Final[int] = 50
 
 
 _DOI_PREFIX_RE = re.compile(r"^(https?://(dx\.)?doi\.org/|doi:\s*)", re.IGNORECASE)
@@ -67,6 +101,43 @@ class Resolution:
     from_cache: bool
 
 
+@dataclass(frozen=True)
+class ResolutionRequest:
+    """The identifiers of one reference, as accepted by :meth:`ReferenceResolver.resolve`."""
+
+    doi: str | None = None
+    arxiv_id: str | None = None
+    title: str | None = None
+
+
+_UNCHECKED = Resolution(paper=None, via=None, checked=False, from_cache=False)
+
+_Outcome = tuple[Paper | None, str | None, bool]
+
+
+class _RateLimitedHttpClient:
+    """:class:`HttpClient` wrapper that takes a token for the URL's host before each request."""
+
+    def __init__(self, inner: HttpClient, limiter: TokenBucketLimiter) -> None:
+        self.inner = inner
+        self.limiter = limiter
+
+    def _acquire(self, url: str) -> None:
+        self.limiter.acquire(urllib.parse.urlsplit(url).netloc.lower())
+
+    def get(self, url: str, **kwargs: Any) -> HttpResponse:
+        self._acquire(url)
+        return self.inner.get(url, **kwargs)
+
+    def get_bytes(self, url: str, **kwargs: Any) -> bytes:
+        self._acquire(url)
+        return self.inner.get_bytes(url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> HttpResponse:
+        self._acquire(url)
+        return self.inner.post(url, **kwargs)
+
+
 class ReferenceResolver:
     """Resolve DOIs / arXiv ids / titles against Crossref, OpenAlex, and arXiv."""
 
@@ -82,8 +153,11 @@ class ReferenceResolver:
         mailto: str | None = None,
         timeout: float = 15.0,
         title_match_floor: float = 0.82,
+        max_workers: int = DEFAULT_RESOLVE_WORKERS,
+        rate_limiter: TokenBucketLimiter | None = None,
     ) -> None:
-        self.http = http_client or UrllibHttpClient()
+        self.rate_limiter = rate_limiter or TokenBucketLimiter(_DEFAULT_HOST_RATE, rates=DEFAULT_HOST_RATES)
+        self.http = _RateLimitedHttpClient(http_client or UrllibHttpClient(), self.rate_limiter)
         self.cache = cache
         self.allow_network = allow_network
         self.crossref_base_url = crossref_base_url.rstrip("/")
@@ -92,6 +166,7 @@ class ReferenceResolver:
         self.mailto = mailto
         self.timeout = timeout
         self.title_match_floor = title_match_floor
+        self.max_workers = max(1, max_workers)
 
     # -- public API ---------------------------------------------------------
 
@@ -131,6 +206,143 @@ class ReferenceResolver:
             self.cache.put(key, paper, resolved_via=via)
         return Resolution(paper=paper, via=via, checked=True, from_cache=False)
 
+    def resolve_many(self, requests: Sequence[ResolutionRequest]) -> list[Resolution]:
+        """Resolve ``requests`` as one batch; results are in request order.
+
+        Equivalent to calling :meth:`resolve` for each request, but the cache is
+        read and written once, each identifier is looked up once however often
+        it is cited, missed DOIs are fetched with multi-DOI filter queries, and
+        the remaining lookups run on up to ``max_workers`` threads under the
+        per-host rate limits.
+        """
+        keys = [self._cache_key(doi=r.doi, arxiv_id=r.arxiv_id, title=r.title) for r in requests]
+        cached: dict[str, Paper | None] = {}
+        if self.cache is not None:
+            cached = self.cache.get_many(key for key in keys if key is not None)
+
+        misses: dict[str, ResolutionRequest] = {}
+        for key, request in zip(keys, requests):
+            if key is not None and key not in cached and self.allow_network:
+                misses.setdefault(key, request)
+            elif key in cached and not _cache_payload_consistent(key, cached[key]):
+                del cached[key]
+                if self.allow_network:
+                    misses.setdefault(key, request)
+
+        outcomes = self._resolve_misses(misses) if misses else {}
+        if self.cache is not None:
+            self.cache.put_many((key, paper, via) for key, (paper, via, definitive) in outcomes.items() if definitive)
+
+        resolutions: list[Resolution] = []
+        for key in keys:
+            if key is not None and key in cached:
+                paper = cached[key]
+                via = paper.source if isinstance(paper, Paper) and paper.source else "cache"
+                resolutions.append(Resolution(paper=paper, via=via, checked=True, from_cache=True))
+            elif key is not None and key in outcomes and outcomes[key][2]:
+                fetched, fetched_via, _ = outcomes[key]
+                resolutions.append(Resolution(paper=fetched, via=fetched_via, checked=True, from_cache=False))
+            else:
+                resolutions.append(_UNCHECKED)
+        return resolutions
+
+    # -- batch resolution ---------------------------------------------------
+
+    def _resolve_misses(self, misses: Mapping[str, ResolutionRequest]) -> dict[str, _Outcome]:
+        """Look up every cache miss; return ``key -> (paper, via, definitive)``."""
+        workers = min(self.max_workers, len(misses))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="reference-resolve") as pool:
+            dois = [
+                key[len("doi:") :] for key in misses if key.startswith("doi:") and "," not in key and "|" not in key
+            ]
+            outcomes = self._resolve_dois_batched(dois, pool) if len(dois) > 1 else {}
+            remaining = [(key, request) for key, request in misses.items() if key not in outcomes]
+            futures = {
+                key: pool.submit(self._resolve_online, doi=request.doi, arxiv_id=request.arxiv_id, title=request.title)
+                for key, request in remaining
+            }
+            for key, future in futures.items():
+                outcomes[key] = future.result()
+        return outcomes
+
+    def _resolve_dois_batched(self, dois: list[str], pool: ThreadPoolExecutor) -> dict[str, _Outcome]:
+        """Resolve normalized DOIs with multi-DOI queries, Crossref first then OpenAlex.
+
+        A DOI absent from a successful Crossref *and* a successful OpenAlex
+        batch is a definitive "not found", exactly as in :meth:`_resolve_online`.
+        DOIs in a failed batch are omitted so the caller looks them up singly.
+        """
+        outcomes: dict[str, _Outcome] = {}
+        crossref_miss: list[str] = []
+        chunks = [dois[i : i + _CROSSREF_DOI_BATCH] for i in range(0, len(dois), _CROSSREF_DOI_BATCH)]
+        for chunk, found in zip(chunks, pool.map(self._crossref_by_dois, chunks)):
+            if found is None:
+                continue
+            for doi in chunk:
+                if doi in found:
+                    outcomes[f"doi:{doi}"] = (found[doi], "crossref", True)
+                else:
+                    crossref_miss.append(doi)
+
+        chunks = [crossref_miss[i : i + _OPENALEX_DOI_BATCH] for i in range(0, len(crossref_miss), _OPENALEX_DOI_BATCH)]
+        for chunk, found in zip(chunks, pool.map(self._openalex_by_dois, chunks)):
+            if found is None:
+                continue
+            for doi in chunk:
+                paper = found.get(doi)
+                outcomes[f"doi:{doi}"] = (paper, "openalex" if paper is not None else None, True)
+        return outcomes
+
+    def _crossref_by_dois(self, dois: list[str]) -> dict[str, Paper] | None:
+        """Return ``doi -> Paper`` for the DOIs Crossref knows, or ``None`` on failure."""
+        params: dict[str, object] = {"filter": ",".join(f"doi:{doi}" for doi in dois), "rows": len(dois)}
+        if self.mailto:
+            params["mailto"] = self.mailto
+        items = self._batch_items(
+            self.crossref_base_url, params, lambda payload: payload.get("message", {}).get("items")
+        )
+        if items is None:
+            return None
+        found: dict[str, Paper] = {}
+        for item in items:
+            paper = crossref_item_to_paper(item, source="crossref")
+            if paper.doi:
+                found.setdefault(normalize_doi(paper.doi), paper)
+        return found
+
+    def _openalex_by_dois(self, dois: list[str]) -> dict[str, Paper] | None:
+        """Return ``doi -> Paper`` for the DOIs OpenAlex knows, or ``None`` on failure."""
+        params: dict[str, object] = {"filter": "doi:" + "|".join(dois), "per-page": len(dois)}
+        if self.mailto:
+            params["mailto"] = self.mailto
+        items = self._batch_items(self.openalex_base_url, params, lambda payload: payload.get("results"))
+        if items is None:
+            return None
+        found: dict[str, Paper] = {}
+        for item in items:
+            paper = _openalex_work_to_paper(item)
+            if paper.doi:
+                found.setdefault(paper.doi, paper)
+        return found
+
+    def _batch_items(
+        self, url: str, params: dict[str, object], extract: Callable[[Any], object]
+    ) -> list[dict[str, Any]] | None:
+        """GET a list endpoint and return its records, or ``None`` on any transport/parse failure."""
+        try:
+            resp = self.http.get(url, params=params, timeout=self.timeout)
+        except BackendError:
+            return None
+        if resp.status_code != 200:
+            return None
+        try:
+            items = extract(resp.json())
+        except (json.JSONDecodeError, AttributeError):
+            return None
+        if not isinstance(items, list):
+            return None
+        return [item for item in items if isinstance(item, dict)]
+
     # -- network resolution -------------------------------------------------
 
     def _resolve_online(
@@ -29,7 +29,12 @@ from infrastructure.reference.verification.models import (
     VerificationReport,
     VerificationStatus,
 )
-from infrastructure.reference.verification.resolver import ReferenceResolver, title_similarity
+from infrastructure.reference.verification.resolver import (
+    ReferenceResolver,
+    Resolution,
+    ResolutionRequest,
+    title_similarity,
+)
 
 __all__ = [
     "extract_arxiv_id",
@@ -78,23 +83,44 @@ def _is_arxiv_only_doi(doi: str | None) -> bool:
     return bool(doi and _ARXIV_DOI_RE.search(doi))
 
 
+def _resolution_request(entry: BibEntry) -> ResolutionRequest:
+    """Return the identifiers *entry* is resolved by."""
+    doi = entry.get("doi")
+    # An arXiv-minted DOI is best resolved through the arXiv API, not Crossref.
+    return ResolutionRequest(
+        doi=None if _is_arxiv_only_doi(doi) else doi,
+        arxiv_id=extract_arxiv_id(entry),
+        title=entry.get("title"),
+    )
+
+
+def _is_future_dated(entry: BibEntry, as_of_year: int | None) -> bool:
+    bib_year = parse_bib_year(entry.get("year"))
+    return as_of_year is not None and bib_year is not None and bib_year > as_of_year
+
+
 def verify_entry(
     entry: BibEntry,
     resolver: ReferenceResolver,
     *,
     as_of_year: int | None = None,
+    resolution: Resolution | None = None,
 ) -> ReferenceVerdict:
-    """Verify a single ``.bib`` entry and return its verdict."""
+    """Verify a single ``.bib`` entry and return its verdict.
+
+    ``resolution`` is the entry's already-resolved record (as produced by
+    :meth:`ReferenceResolver.resolve_many`); when omitted the entry is resolved
+    here.
+    """
     doi = entry.get("doi")
-    arxiv_id = extract_arxiv_id(entry)
-    title = entry.get("title")
+    request = _resolution_request(entry)
+    resolve_doi = request.doi
+    arxiv_id = request.arxiv_id
+    title = request.title
     bib_year = parse_bib_year(entry.get("year"))
 
-    # An arXiv-minted DOI is best resolved through the arXiv API, not Crossref.
-    resolve_doi = None if _is_arxiv_only_doi(doi) else doi
-
     # Temporal integrity: a citation dated after the manuscript cannot be real.
-    if as_of_year is not None and bib_year is not None and bib_year > as_of_year:
+    if _is_future_dated(entry, as_of_year):
         return ReferenceVerdict(
             citation_key=entry.citation_key,
             status=VerificationStatus.ANACHRONISM,
@@ -105,7 +131,8 @@ def verify_entry(
         )
 
     has_identifier = bool(resolve_doi or arxiv_id)
-    resolution = resolver.resolve(doi=resolve_doi, arxiv_id=arxiv_id, title=title)
+    if resolution is None:
+        resolution = resolver.resolve(doi=resolve_doi, arxiv_id=arxiv_id, title=title)
 
     if not resolution.checked:
         return ReferenceVerdict(
@@ -201,8 +228,20 @@ def verify_database(
     *,
     as_of_year: int | None = None,
 ) -> VerificationReport:
-    """Verify every entry in *db* and aggregate the verdicts."""
-    verdicts = [verify_entry(entry, resolver, as_of_year=as_of_year) for entry in db]
+    """Verify every entry in *db* and aggregate the verdicts.
+
+    Entries are resolved together through :meth:`ReferenceResolver.resolve_many`
+    (one cache pass, batched and concurrent lookups for the misses); future-dated
+    entries are rejected without a lookup, as in :func:`verify_entry`.
+    """
+    entries = list(db)
+    to_resolve = [index for index, entry in enumerate(entries) if not _is_future_dated(entry, as_of_year)]
+    resolved = resolver.resolve_many([_resolution_request(entries[index]) for index in to_resolve])
+    resolutions = dict(zip(to_resolve, resolved))
+    verdicts = [
+        verify_entry(entry, resolver, as_of_year=as_of_year, resolution=resolutions.get(index))
+        for index, entry in enumerate(entries)
+    ]
     return VerificationReport(verdicts=verdicts, network_used=resolver.allow_network)
 
 
@@ -22,7 +22,8 @@ from infrastructure.rendering._pdf_combined_markdown import preprocess_combined_
 from infrastructure.rendering._pdf_combined_prevalidate import prevalidate_for_render
 from infrastructure.rendering._pdf_markdown_combine import combine_manuscript_markdown_sections
 from infrastructure.rendering._pdf_title_page_config import _load_render_config, _rendering_options
-from infrastructure.rendering._slides_crossref import COMBINED_AUX_BASENAME
+from infrastructure.rendering._section_render_cache import plan_slide_refresh_cache
+from infrastructure.rendering._slides_crossref import COMBINED_AUX_BASENAME, parse_aux_label_numbers
 from infrastructure.rendering.manuscript_composition import write_manuscript_composition
 
 logger = get_logger(__name__)
@@ -459,7 +460,9 @@ def _refresh_slides_against_combined_aux(
     combined manuscript AUX file when it is available, so this refresh is the
     producer-order bridge between the combined PDF and the slide surfaces.
     Missing transmission bookends and explicitly skipped Beamer sources are
-    excluded exactly as they are in the ordinary per-file renderer.
+    excluded exactly as they are in the ordinary per-file renderer. Decks whose
+    section inputs and the AUX label numbers are unchanged since their last
+    refresh are reused from the slide-refresh render cache.
     """
     refresh_sources: list[Path] = []
     for source_file in combined_source_files(md_files):
@@ -484,6 +487,11 @@ def _refresh_slides_against_combined_aux(
         _remove_refresh_decks(manager, refresh_sources)
         raise
 
+    refresh_cache = plan_slide_refresh_cache(
+        manager,
+        refresh_sources,
+        parse_aux_label_numbers(_combined_aux_path(manager)),
+    )
     logger.info(
         "Refreshing %d Beamer deck(s) against the combined manuscript AUX label map",
         len(refresh_sources),
@@ -491,6 +499,9 @@ def _refresh_slides_against_combined_aux(
     failures: list[str] = []
     for source_file in refresh_sources:
         output_file = _slide_pdf_path(manager, source_file)
+        if refresh_cache is not None and refresh_cache.cached_outputs(source_file):
+            logger.debug("Reusing refreshed Beamer deck for %s (inputs and labels unchanged)", source_file.name)
+            continue
         try:
             output_file.unlink(missing_ok=True)
             manager.render_slides(
@@ -498,7 +509,11 @@ def _refresh_slides_against_combined_aux(
                 output_format="beamer",
                 strict_cross_deck_refs=True,
             )
+            if refresh_cache is not None:
+                refresh_cache.record(source_file, [output_file])
         except (TemplateError, OSError, subprocess.SubprocessError, ValueError, TypeError) as exc:
+            if refresh_cache is not None:
+                refresh_cache.forget(source_file)
             try:
                 output_file.unlink(missing_ok=True)
             except OSError as cleanup_exc:
@@ -3,19 +3,27 @@
 from __future__ import annotations
 
 import os
+import pickle
 import stat
 import subprocess
+import tempfile
+from collections.abc import Collection, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from infrastructure.core.exceptions import TemplateError, ValidationError
 from infrastructure.core.logging.constants import BANNER_WIDTH
-from infrastructure.core.logging.diagnostic import DiagnosticReporter, DiagnosticSeverity
+from infrastructure.core.logging.diagnostic import DiagnosticEvent, DiagnosticReporter, DiagnosticSeverity
 from infrastructure.core.logging.utils import get_logger, log_success
 from infrastructure.core.project_paths import resolve_source_manuscript_dir
+from infrastructure.core.worker_policy import ENV_RENDER_SECTION_WORKERS, resolve_bounded_workers
 from infrastructure.core.progress import SubStageProgress
 from infrastructure.publishing.transmission_bookends import is_transmission_bookend
 from infrastructure.rendering import RenderManager
+from infrastructure.rendering._section_render_cache import SectionRenderPlan, plan_section_render_cache
 from infrastructure.rendering.latex_package_validator import validate_preamble_packages
 from infrastructure.rendering.latex_validation import ValidationReport
 
@@ -190,7 +198,7 @@ def load_project_config_yaml(manuscript_dir: Path) -> dict[str, Any] | None:
         return None
 
 
-def _clean_stale_web_artifacts(manager: RenderManager) -> None:
+def _clean_stale_web_artifacts(manager: RenderManager, preserve: Collection[Path] = ()) -> None:
     """Remove generated web artifacts before deciding whether HTML will render.
 
     Only removes files this renderer itself produces (the combined
@@ -198,6 +206,7 @@ def _clean_stale_web_artifacts(manager: RenderManager) -> None:
     ``WebRenderer._output_file_for_source``) — a blanket ``*.html`` glob would
     also delete unrelated hand-authored web artifacts (e.g. a project's own
     ``dashboard.html``) that happen to live in the same ``output/web/`` dir.
+    Resolved paths in ``preserve`` (cached section pages) are kept.
     """
     web_dir = Path(manager.config.web_dir)
     if not web_dir.exists():
@@ -206,6 +215,7 @@ def _clean_stale_web_artifacts(manager: RenderManager) -> None:
     for renderer_owned in (web_dir / "_combined_manuscript.md", web_dir / "favicon.ico"):
         if renderer_owned.exists() or renderer_owned.is_symlink():
             stale_files.append(renderer_owned)
+    stale_files = [path for path in stale_files if path.resolve() not in preserve]
     removed = 0
     for stale in stale_files:
         try:
@@ -248,6 +258,8 @@ def clean_stale_render_deliverables(
     manager: RenderManager,
     source_files: list[Path],
     project_name: str,
+    *,
+    preserve: Collection[Path] = (),
 ) -> None:
     """Remove canonical deliverables that could be mistaken for this run.
 
@@ -260,7 +272,8 @@ def clean_stale_render_deliverables(
     the format root are rejected before any cleanup. ``Path.rglob`` leaves
     deeper symlinked directories untraversed. Unrelated project artifacts are
     preserved. A standalone LaTeX PDF is treated as renderer-owned only when a
-    compiler sidecar with the same stem identifies it.
+    compiler sidecar with the same stem identifies it. Resolved paths in
+    ``preserve`` are the outputs of sections the render cache will reuse.
     """
 
     output_dir = Path(manager.config.output_dir)
@@ -268,7 +281,7 @@ def clean_stale_render_deliverables(
     epub_dir = Path(manager.config.epub_dir)
     _reject_unsafe_combined_output_root(docx_dir, output_dir)
     _reject_unsafe_combined_output_root(epub_dir, output_dir)
-    _clean_stale_web_artifacts(manager)
+    _clean_stale_web_artifacts(manager, preserve)
     project_basename = Path(project_name).name
     targets = {
         Path(manager.config.pdf_dir) / f"{project_basename}_combined.pdf",
@@ -319,53 +332,183 @@ def clean_stale_render_deliverables(
     for target in sorted(targets):
         if not target.exists() and not target.is_symlink():
             continue
+        if target.resolve() in preserve:
+            continue
         target.unlink()
         removed += 1
     if removed:
         logger.info("Removed %d stale render deliverable(s) before the current run", removed)
 
 
+@dataclass(frozen=True)
+class _SectionOutcome:
+    """Picklable result of rendering one section (in-process or in a worker)."""
+
+    outputs: tuple[Path, ...] = ()
+    error_message: str | None = None
+    error_event: DiagnosticEvent | None = None
+
+
+def _render_section(manager: RenderManager, source_file: Path) -> _SectionOutcome:
+    """Render one section, folding the per-file failure contract into a value."""
+    try:
+        return _SectionOutcome(outputs=tuple(manager.render_all(source_file)))
+    except TemplateError as render_error:
+        # RenderingError and all other template-domain failures carry the
+        # same diagnostic contract. Record a per-section failure instead
+        # of aborting before the combined-render summary is written.
+        return _SectionOutcome(
+            error_message=render_error.message,
+            error_event=render_error.to_diagnostic_event(severity=DiagnosticSeverity.ERROR),
+        )
+    except (OSError, subprocess.SubprocessError, ValueError) as e:
+        return _SectionOutcome(error_message=str(e))
+
+
+def _render_section_isolated(manager: RenderManager, source_file: Path) -> _SectionOutcome:
+    """Worker entry point: render one section with a private temp directory.
+
+    Module-level so it pickles under every start method. ``TMPDIR`` (inherited
+    by pandoc and LaTeX) and :mod:`tempfile` both point at a per-section
+    directory for the duration of the render, so concurrent sections never
+    share scratch files.
+    """
+    previous_env = os.environ.get("TMPDIR")
+    previous_tempdir = tempfile.tempdir
+    with tempfile.TemporaryDirectory(prefix=f"render-{source_file.stem}-") as scratch:
+        os.environ["TMPDIR"] = scratch
+        tempfile.tempdir = scratch
+        try:
+            return _render_section(manager, source_file)
+        finally:
+            tempfile.tempdir = previous_tempdir
+            if previous_env is None:
+                os.environ.pop("TMPDIR", None)
+            else:
+                os.environ["TMPDIR"] = previous_env
+
+
+def resolve_section_render_workers(section_count: int, env: Mapping[str, str] | None = None) -> int:
+    """Return the worker count for per-section rendering (1 means serial).
+
+    ``RENDER_SECTION_WORKERS`` is opt-in: unset, ``1`` or ``serial`` keeps the
+    serial loop; ``auto`` uses every CPU (bounded by the section count); an
+    integer is bounded by :func:`resolve_bounded_workers`. Invalid values fall
+    back to serial with a warning.
+    """
+    source_env = os.environ if env is None else env
+    configured = source_env.get(ENV_RENDER_SECTION_WORKERS, "").strip().lower()
+    if configured in ("", "1", "serial") or section_count < 2:
+        return 1
+    try:
+        if configured == "auto":
+            return resolve_bounded_workers(env_name=ENV_RENDER_SECTION_WORKERS, env={}, item_count=section_count)
+        return resolve_bounded_workers(env_name=ENV_RENDER_SECTION_WORKERS, env=source_env, item_count=section_count)
+    except ValueError as exc:
+        logger.warning("%s; rendering sections serially", exc)
+        return 1
+
+
+def _render_sections_parallel(
+    manager: RenderManager,
+    sections: list[Path],
+    workers: int,
+) -> dict[Path, _SectionOutcome] | None:
+    """Render ``sections`` in a process pool; ``None`` when the manager cannot be shipped."""
+    try:
+        pickle.dumps(manager)
+    except (pickle.PicklingError, TypeError, AttributeError) as exc:
+        logger.warning("Render manager is not picklable (%s); rendering sections serially", exc)
+        return None
+    logger.info(f"Rendering {len(sections)} section(s) with {workers} worker process(es)")
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {source_file: pool.submit(_render_section_isolated, manager, source_file) for source_file in sections}
+        outcomes: dict[Path, _SectionOutcome] = {}
+        for source_file, future in futures.items():
+            try:
+                outcomes[source_file] = future.result()
+            except (BrokenProcessPool, OSError, pickle.PicklingError) as exc:
+                outcomes[source_file] = _SectionOutcome(error_message=f"render worker failed: {exc}")
+    return outcomes
+
+
 def render_individual_files(
     manager: RenderManager,
     source_files: list[Path],
     reporter: DiagnosticReporter,
+    *,
+    section_cache: SectionRenderPlan | None = None,
 ) -> tuple[int, list[str]]:
-    """Render each source file; return (rendered_count, failed_file_names)."""
-    _clean_stale_web_artifacts(manager)
+    """Render each source file; return (rendered_count, failed_file_names).
+
+    Sections whose source and dependency hashes match ``section_cache`` (see
+    ``_section_render_cache``) reuse their recorded outputs instead of
+    re-running pandoc. When no plan is passed one is built here, before the
+    stale web-page cleanup, so reusable pages survive it.
+
+    With ``RENDER_SECTION_WORKERS`` set (see
+    :func:`resolve_section_render_workers`) the sections that need rendering
+    run concurrently in worker processes. Outcomes are then applied in
+    manuscript order, so logging, diagnostics, the render cache and the
+    returned failure list are identical to the serial run.
+    """
+    if section_cache is None:
+        section_cache = plan_section_render_cache(manager, source_files)
+    _clean_stale_web_artifacts(manager, section_cache.preserved_outputs() if section_cache else ())
+
+    to_render = [
+        source_file
+        for source_file in source_files
+        if not is_transmission_bookend(source_file)
+        and not (section_cache is not None and section_cache.cached_outputs(source_file))
+    ]
+    workers = resolve_section_render_workers(len(to_render))
+    prerendered = _render_sections_parallel(manager, to_render, workers) if workers > 1 else None
+
     rendered_count = 0
     failed_files: list[str] = []
     progress = SubStageProgress(total=len(source_files), stage_name="Rendering Files")
     for i, source_file in enumerate(source_files, 1):
         progress.start_substage(i, source_file.name)
-        try:
-            if is_transmission_bookend(source_file):
-                logger.debug(
-                    "Skipping per-file render for transmission bookend (combined PDF only): %s",
-                    source_file.name,
-                )
-                progress.complete_substage()
-                continue
-            outputs = manager.render_all(source_file)
-            if outputs:
-                for output_path in outputs:
+        if is_transmission_bookend(source_file):
+            logger.debug(
+                "Skipping per-file render for transmission bookend (combined PDF only): %s",
+                source_file.name,
+            )
+            progress.complete_substage()
+            continue
+        cached_outputs = section_cache.cached_outputs(source_file) if section_cache else None
+        if cached_outputs:
+            logger.info(f"  ♻ Reusing cached render for {source_file.name} (inputs unchanged)")
+            rendered_count += 1
+            progress.complete_substage()
+            continue
+        if prerendered is not None:
+            outcome = prerendered[source_file]
+        else:
+            outcome = _render_section(manager, source_file)
+        if outcome.error_message is None:
+            if outcome.outputs:
+                for output_path in outcome.outputs:
                     logger.debug(f"  Generated: {output_path.name}")
                 rendered_count += 1
+                if section_cache is not None:
+                    section_cache.record(source_file, list(outcome.outputs))
             else:
                 logger.warning(f"  No output generated for {source_file.name}")
-        except TemplateError as render_error:
-            # RenderingError and all other template-domain failures carry the
-            # same diagnostic contract. Record a per-section failure instead
-            # of aborting before the combined-render summary is written.
-            logger.warning(f"  ❌ Rendering error for {source_file.name}: {render_error.message}")
-            reporter.record(render_error.to_diagnostic_event(severity=DiagnosticSeverity.ERROR))
-            failed_files.append(source_file.name)
-        except (OSError, subprocess.SubprocessError, ValueError) as e:
-            logger.warning(f"  ❌ Unexpected error rendering {source_file.name}: {e}")
-            reporter.record_error(
-                category="UnexpectedError",
-                message=f"Unexpected error rendering {source_file.name}: {e}",
-                file_path=source_file.name,
-            )
+        else:
+            if outcome.error_event is not None:
+                logger.warning(f"  ❌ Rendering error for {source_file.name}: {outcome.error_message}")
+                reporter.record(outcome.error_event)
+            else:
+                logger.warning(f"  ❌ Unexpected error rendering {source_file.name}: {outcome.error_message}")
+                reporter.record_error(
+                    category="UnexpectedError",
+                    message=f"Unexpected error rendering {source_file.name}: {outcome.error_message}",
+                    file_path=source_file.name,
+                )
             failed_files.append(source_file.name)
+            if section_cache is not None:
+                section_cache.forget(source_file)
         progress.complete_substage()
     return rendered_count, failed_files
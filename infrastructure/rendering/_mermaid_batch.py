@@ -0,0 +1,270 @@
+"""Batched Mermaid-to-PNG rendering with content-addressed reuse.
+
+Every ``mmdc`` invocation boots a headless Chrome, which costs far more than
+rendering the diagram itself. Rendering one diagram per process therefore
+spends most of a diagram-heavy build starting browsers. This module renders a
+whole set of diagrams at once:
+
+* targets whose PNG already exists next to a ``.mmd`` sidecar holding the same
+  source are reused without starting ``mmdc``;
+* targets sharing one source are rendered once and copied;
+* the remaining sources are split across at most ``MERMAID_RENDER_WORKERS``
+  concurrent ``mmdc`` sessions. Each session renders its share through
+  mermaid-cli's Markdown mode, which draws every fence of one Markdown input
+  in a single browser.
+
+A session that fails, or that does not produce every expected PNG, falls back
+to rendering its diagrams one at a time so a single invalid diagram only
+fails itself. Failures are returned per target, never raised, so callers keep
+their own fallback policy.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import tempfile
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Final
+
+from infrastructure.core.exceptions import RenderingError
+from infrastructure.core.logging.utils import get_logger
+from infrastructure.core.worker_policy import ENV_MERMAID_RENDER_WORKERS, resolve_bounded_workers
+from infrastructure.rendering.security import run_isolated_subprocess
+
+logger = get_logger(__name__)
+
+#: Concurrent browser sessions used when ``MERMAID_RENDER_WORKERS`` is unset.
+DEFAULT_MERMAID_MAX_WORKERS: Final[int] = 4
+
+_BATCH_TIMEOUT_PER_DIAGRAM: Final[int] = 30
+
+
+@dataclass(frozen=True)
+class MermaidRenderOptions:
+    """``mmdc`` settings shared by every diagram in a batch."""
+
+    width: int = 1400
+    height: int = 900
+    background: str = "white"
+    timeout: int = 90
+    puppeteer_config: Path | None = None
+
+
+@dataclass
+class MermaidBatchOutcome:
+    """Per-target result of :func:`render_mermaid_batch`."""
+
+    rendered: dict[Path, Path] = field(default_factory=dict)
+    failed: dict[Path, RenderingError] = field(default_factory=dict)
+    cache_hits: int = 0
+    browser_sessions: int = 0
+
+
+def is_cached_render(png_path: Path, source: str) -> bool:
+    """Return whether ``png_path`` was rendered from ``source`` and is non-empty."""
+    mmd_path = png_path.with_suffix(".mmd")
+    return (
+        png_path.is_file()
+        and png_path.stat().st_size > 0
+        and mmd_path.is_file()
+        and mmd_path.read_text(encoding="utf-8").rstrip("\n") == source.rstrip("\n")
+    )
+
+
+def render_mermaid_batch(
+    jobs: Mapping[Path, str],
+    *,
+    mmdc: str,
+    options: MermaidRenderOptions | None = None,
+    workers: int | None = None,
+) -> MermaidBatchOutcome:
+    """Render ``jobs`` (PNG target -> Mermaid source) with as few browser boots as possible.
+
+    Args:
+        jobs: Output PNG path for each diagram source.
+        mmdc: Resolved Mermaid CLI executable.
+        options: Shared render settings.
+        workers: Concurrent ``mmdc`` sessions; ``None`` resolves
+            ``MERMAID_RENDER_WORKERS`` (default at most
+            :data:`DEFAULT_MERMAID_MAX_WORKERS`).
+
+    Returns:
+        Rendered and failed targets, plus cache-hit and session counts.
+    """
+    opts = options or MermaidRenderOptions()
+    outcome = MermaidBatchOutcome()
+    pending: dict[str, list[Path]] = {}
+    for target, source in jobs.items():
+        if is_cached_render(target, source):
+            outcome.rendered[target] = target
+            outcome.cache_hits += 1
+        else:
+            pending.setdefault(source, []).append(target)
+    if not pending:
+        return outcome
+
+    sources = list(pending)
+    session_count = (
+        workers
+        if workers is not None
+        else resolve_bounded_workers(
+            env_name=ENV_MERMAID_RENDER_WORKERS,
+            item_count=len(sources),
+            default_cap=DEFAULT_MERMAID_MAX_WORKERS,
+            invalid="fallback",
+        )
+    )
+    session_count = max(1, min(session_count, len(sources)))
+    shares = [sources[index::session_count] for index in range(session_count)]
+    primaries = [[(pending[source][0], source) for source in share] for share in shares]
+
+    if session_count == 1:
+        results = [_render_share(primaries[0], opts, mmdc)]
+    else:
+        with ThreadPoolExecutor(max_workers=session_count, thread_name_prefix="mermaid") as pool:
+            results = list(pool.map(lambda share: _render_share(share, opts, mmdc), primaries))
+
+    for sessions, share_results in results:
+        outcome.browser_sessions += sessions
+        for primary, result in share_results.items():
+            targets = pending[jobs[primary]]
+            if isinstance(result, RenderingError):
+                for target in targets:
+                    outcome.failed[target] = result
+                continue
+            outcome.rendered[primary] = result
+            for duplicate in targets[1:]:
+                duplicate.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(result, duplicate)
+                shutil.copyfile(result.with_suffix(".mmd"), duplicate.with_suffix(".mmd"))
+                outcome.rendered[duplicate] = duplicate
+    return outcome
+
+
+def _render_share(
+    share: list[tuple[Path, str]], options: MermaidRenderOptions, mmdc: str
+) -> tuple[int, dict[Path, Path | RenderingError]]:
+    """Render one session's diagrams; return sessions started and per-target results."""
+    results: dict[Path, Path | RenderingError] = {}
+    sessions = 0
+    remaining = share
+    if len(share) > 1:
+        sessions += 1
+        try:
+            results.update(_render_markdown_session(share, options, mmdc))
+        except RenderingError as exc:
+            logger.info("Batched Mermaid session failed (%s); rendering its diagrams one at a time", exc)
+        remaining = [(target, source) for target, source in share if target not in results]
+    for target, source in remaining:
+        sessions += 1
+        try:
+            results[target] = render_mermaid_file(source, target, options, mmdc)
+        except RenderingError as exc:
+            results[target] = exc
+    return sessions, results
+
+
+def _render_markdown_session(
+    share: list[tuple[Path, str]], options: MermaidRenderOptions, mmdc: str
+) -> dict[Path, Path]:
+    """Render every diagram in ``share`` through one ``mmdc`` Markdown invocation."""
+    scratch_parent = share[0][0].parent
+    scratch_parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(prefix=".mermaid_batch_", dir=scratch_parent) as scratch:
+        scratch_dir = Path(scratch)
+        batch_input = scratch_dir / "batch.md"
+        batch_input.write_text(
+            "".join(f"```mermaid\n{source}\n```\n\n" for _, source in share),
+            encoding="utf-8",
+        )
+        batch_output = scratch_dir / "rendered.md"
+        _run_mmdc(
+            mmdc,
+            batch_input,
+            batch_output,
+            options,
+            label=f"a batch of {len(share)} diagrams",
+            timeout=max(options.timeout, _BATCH_TIMEOUT_PER_DIAGRAM * len(share)),
+            extra_args=["--outputFormat", "png"],
+        )
+        rendered: dict[Path, Path] = {}
+        for index, (target, source) in enumerate(share, start=1):
+            produced = scratch_dir / f"rendered-{index}.png"
+            if not produced.is_file() or produced.stat().st_size == 0:
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.move(str(produced), target)
+            target.with_suffix(".mmd").write_text(source + "\n", encoding="utf-8")
+            rendered[target] = target
+        return rendered
+
+
+def render_mermaid_file(source: str, png_path: Path, options: MermaidRenderOptions, mmdc: str) -> Path:
+    """Render one Mermaid source string to ``png_path`` with strict failure handling."""
+    if is_cached_render(png_path, source):
+        return png_path
+    png_path.parent.mkdir(parents=True, exist_ok=True)
+    mmd_path = png_path.with_suffix(".mmd")
+    mmd_path.write_text(source + "\n", encoding="utf-8")
+    _run_mmdc(mmdc, mmd_path, png_path, options, label=png_path.stem, timeout=options.timeout)
+    if not png_path.is_file() or png_path.stat().st_size == 0:
+        raise RenderingError(f"mmdc reported success for {png_path.stem} but did not produce a PNG")
+    return png_path
+
+
+def _run_mmdc(
+    mmdc: str,
+    input_path: Path,
+    output_path: Path,
+    options: MermaidRenderOptions,
+    *,
+    label: str,
+    timeout: int,
+    extra_args: list[str] | None = None,
+) -> None:
+    cmd = [
+        mmdc,
+        "--input",
+        str(input_path),
+        "--output",
+        str(output_path),
+        *(extra_args or []),
+        "--width",
+        str(options.width),
+        "--height",
+        str(options.height),
+        "--backgroundColor",
+        options.background,
+        "--quiet",
+    ]
+    if options.puppeteer_config is not None:
+        cmd.extend(["--puppeteerConfigFile", str(options.puppeteer_config)])
+    env = os.environ.copy()
+    env["PATH"] = os.pathsep.join(part for part in (env.get("PATH", ""), os.defpath) if part)
+
+    try:
+        # Every mmdc execution failure becomes a RenderingError so callers can
+        # apply their documented fallback and keep rendering.
+        completed = run_isolated_subprocess(cmd, env=env, timeout=timeout)
+    except subprocess.TimeoutExpired as exc:
+        raise RenderingError(f"mmdc timed out while rendering {label}") from exc
+    except OSError as exc:
+        raise RenderingError(f"Could not execute mmdc while rendering {label}: {exc}") from exc
+    if completed.returncode != 0:
+        stderr = completed.stderr.strip() or completed.stdout.strip()
+        raise RenderingError(f"mmdc failed for {label}: {stderr[:800]}")
+
+
+__all__ = [
+    "DEFAULT_MERMAID_MAX_WORKERS",
+    "MermaidBatchOutcome",
+    "MermaidRenderOptions",
+    "is_cached_render",
+    "render_mermaid_batch",
+    "render_mermaid_file",
+]
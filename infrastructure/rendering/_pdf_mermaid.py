@@ -3,25 +3,29 @@
 Pandoc does not render Mermaid diagrams by itself. Combined PDF rendering
 therefore converts each fenced Mermaid block into a deterministic PNG and
 replaces the fence with a normal Markdown image reference before Pandoc runs.
+
+Rendered PNGs are content-addressed: ``inline_mermaid_<hash>.png`` is named
+after the normalised diagram source only, so reordering, inserting or
+repeating diagrams reuses earlier renders. All diagrams that still need a PNG
+are rendered together by :mod:`infrastructure.rendering._mermaid_batch`,
+which boots one browser per batch instead of one per diagram.
 """
 
 from __future__ import annotations
 
 import hashlib
 import json
-import os
 import re
 import shutil
-import subprocess
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Final
 
 from infrastructure.core.exceptions import RenderingError
 from infrastructure.core.logging.utils import get_logger
+from infrastructure.rendering._mermaid_batch import MermaidBatchOutcome, MermaidRenderOptions, render_mermaid_batch
 from infrastructure.rendering.chrome import resolve_chrome_executable as _resolve_chrome_executable
 from infrastructure.rendering._pdf_title_page_latex import _latex_graphic_alt_text
-from infrastructure.rendering.security import run_isolated_subprocess
 
 logger = get_logger(__name__)
 
@@ -39,6 +43,9 @@ _BRACE_LABEL_RE: Final[re.Pattern[str]] = re.compile(
     r"(?P<prefix>\b[A-Za-z][\w.-]*)\{(?P<label>(?![\"`])[^}\n]*<br/>[^}\n]*)\}"
 )
 _STATE_DESCRIPTION_RE: Final[re.Pattern[str]] = re.compile(r"^\s*[A-Za-z_][\w.-]*\s*:")
+_LEGACY_ARTIFACT_RE: Final[re.Pattern[str]] = re.compile(
+    r"inline_mermaid_\d{4}_(?P<hash>[0-9a-f]{12})(?P<suffix>\.png|\.mmd)"
+)
 _PUPPETEER_RUNTIME_CONFIG_NAME: Final[str] = "inline_mermaid.puppeteer.json"
 _VERBATIM_END_MARKER: Final[str] = r"\end{verbatim}"
 
@@ -88,40 +95,47 @@ def replace_inline_mermaid(
     expected_artifacts = _expected_inline_artifacts(content)
     _prune_inline_mermaid_dir(output_dir, expected_artifacts)
 
-    block_index = 0
+    try:
+        renders = _render_inline_diagrams(
+            content,
+            output_dir=output_dir,
+            mmdc=mmdc,
+            render_enabled=render_disabled_reason is None,
+            puppeteer_config=puppeteer_config,
+        )
+    finally:
+        if puppeteer_config is not None and runtime_chrome_executable is not None:
+            # mmdc must read the real executable path during its synchronous
+            # subprocess.  Once that subprocess has finished (successfully or
+            # otherwise), the tracked sidecar is publication evidence rather
+            # than an executable runtime config and must not retain a local
+            # home-directory prefix.
+            _persist_portable_puppeteer_runtime_config(
+                puppeteer_config,
+                runtime_chrome_executable,
+                home=home,
+            )
+
     diagrams_rendered = 0
 
     def _replace(match: re.Match[str]) -> str:
-        nonlocal block_index, diagrams_rendered
-        block_index += 1
+        nonlocal diagrams_rendered
         raw_source = match.group("source").strip()
         source = _normalise_mermaid_source(raw_source) if raw_source else ""
         caption_text = _caption_text(match)
         alt = _first_alt(match.group("alts")) or caption_text or "Mermaid diagram"
         caption = _caption_for_markdown(caption_text or alt)
         fallback_source = source or raw_source
-        stem = f"inline_mermaid_{block_index:04d}_{_source_hash(source)}"
+        stem = _inline_stem(source)
         if not source:
             logger.warning("Inline Mermaid block %s is empty; falling back to verbatim figure", stem)
             return _mermaid_fallback_figure(fallback_source, caption)
         if render_disabled_reason is not None:
             logger.warning("Inline Mermaid block %s falling back: %s", stem, render_disabled_reason)
             return _mermaid_fallback_figure(fallback_source, caption)
-        if mmdc is None:
-            raise RenderingError(
-                "Mermaid CLI 'mmdc' is required to render inline Mermaid diagrams for PDF output. "
-                "From the repository root, run `npm ci` and add `node_modules/.bin` to PATH, then rerun the PDF render."
-            )
-        try:
-            png_path = _render_mermaid(
-                mmdc=mmdc,
-                output_dir=output_dir,
-                stem=stem,
-                source=source,
-                puppeteer_config=puppeteer_config,
-            )
-        except RenderingError as exc:
-            logger.warning("%s", exc)
+        png_path = renders.rendered.get(output_dir / f"{stem}.png")
+        if png_path is None:
+            logger.warning("%s", renders.failed[output_dir / f"{stem}.png"])
             return _mermaid_fallback_figure(fallback_source, caption)
         diagrams_rendered += 1
         rel_path = f"../figures/mermaid_inline/{png_path.name}"
@@ -136,20 +150,7 @@ def replace_inline_mermaid(
             "\\end{figure}\n"
         )
 
-    try:
-        rewritten = _MERMAID_BLOCK_RE.sub(_replace, content)
-    finally:
-        if puppeteer_config is not None and runtime_chrome_executable is not None:
-            # mmdc must read the real executable path during its synchronous
-            # subprocess.  Once that subprocess has finished (successfully or
-            # otherwise), the tracked sidecar is publication evidence rather
-            # than an executable runtime config and must not retain a local
-            # home-directory prefix.
-            _persist_portable_puppeteer_runtime_config(
-                puppeteer_config,
-                runtime_chrome_executable,
-                home=home,
-            )
+    rewritten = _MERMAID_BLOCK_RE.sub(_replace, content)
     logger.info("Rendered %d inline Mermaid diagram(s) for PDF output", diagrams_rendered)
     return MermaidReplacementResult(rewritten, diagrams_rendered)
 
@@ -163,19 +164,69 @@ def _inline_mermaid_dir(manuscript_dir: Path) -> Path:
     return manuscript_dir / "output" / "figures" / "mermaid_inline"
 
 
+def _inline_stem(source: str) -> str:
+    """Return the content-addressed artifact stem for a normalised source."""
+    return f"inline_mermaid_{_source_hash(source)}"
+
+
 def _expected_inline_artifacts(content: str) -> set[str]:
     """Return the exact inline Mermaid artifact filenames for this build."""
     expected: set[str] = set()
-    for index, match in enumerate(_MERMAID_BLOCK_RE.finditer(content), start=1):
-        source = _normalise_mermaid_source(match.group("source").strip())
-        stem = f"inline_mermaid_{index:04d}_{_source_hash(source)}"
+    for match in _MERMAID_BLOCK_RE.finditer(content):
+        stem = _inline_stem(_normalise_mermaid_source(match.group("source").strip()))
         expected.add(f"{stem}.mmd")
         expected.add(f"{stem}.png")
     return expected
 
 
+def _render_inline_diagrams(
+    content: str,
+    *,
+    output_dir: Path,
+    mmdc: str | None,
+    render_enabled: bool,
+    puppeteer_config: Path | None,
+) -> MermaidBatchOutcome:
+    """Render every distinct non-empty Mermaid fence in ``content`` in one batch."""
+    if not render_enabled:
+        return MermaidBatchOutcome()
+    jobs: dict[Path, str] = {}
+    for match in _MERMAID_BLOCK_RE.finditer(content):
+        raw_source = match.group("source").strip()
+        if raw_source:
+            source = _normalise_mermaid_source(raw_source)
+            jobs[output_dir / f"{_inline_stem(source)}.png"] = source
+    if not jobs:
+        return MermaidBatchOutcome()
+    if mmdc is None:
+        raise RenderingError(
+            "Mermaid CLI 'mmdc' is required to render inline Mermaid diagrams for PDF output. "
+            "From the repository root, run `npm ci` and add `node_modules/.bin` to PATH, then rerun the PDF render."
+        )
+    outcome = render_mermaid_batch(jobs, mmdc=mmdc, options=MermaidRenderOptions(puppeteer_config=puppeteer_config))
+    logger.debug(
+        "Inline Mermaid: %d distinct diagram(s), %d reused, %d mmdc session(s)",
+        len(jobs),
+        outcome.cache_hits,
+        outcome.browser_sessions,
+    )
+    return outcome
+
+
 def _prune_inline_mermaid_dir(output_dir: Path, expected_artifacts: set[str]) -> None:
-    """Remove stale inline Mermaid render artifacts without discarding cache hits."""
+    """Remove stale inline Mermaid render artifacts without discarding cache hits.
+
+    Artifacts from the older index-prefixed layout
+    (``inline_mermaid_0003_<hash>.png``) are adopted under their
+    content-addressed name first, so upgrading does not re-render them.
+    """
+    for artifact in sorted(output_dir.glob("inline_mermaid_*")):
+        legacy = _LEGACY_ARTIFACT_RE.fullmatch(artifact.name)
+        if legacy is None:
+            continue
+        adopted = output_dir / f"inline_mermaid_{legacy.group('hash')}{legacy.group('suffix')}"
+        if adopted.name in expected_artifacts and not adopted.exists():
+            artifact.rename(adopted)
     for pattern in ("inline_mermaid_*.png", "inline_mermaid_*.mmd"):
         for artifact in output_dir.glob(pattern):
             if artifact.name not in expected_artifacts:
@@ -458,56 +509,4 @@ def _markdown_alt(text: str) -> str:
     return cleaned or "Mermaid diagram"
 
 
-def _render_mermaid(
-    *,
-    mmdc: str,
-    output_dir: Path,
-    stem: str,
-    source: str,
-    puppeteer_config: Path | None,
-) -> Path:
-    """Render one Mermaid source string to PNG with strict failure handling."""
-    mmd_path = output_dir / f"{stem}.mmd"
-    png_path = output_dir / f"{stem}.png"
-    if png_path.is_file() and png_path.stat().st_size > 0 and mmd_path.is_file():
-        if mmd_path.read_text(encoding="utf-8").rstrip("\n") == source:
-            return png_path
-
-    mmd_path.write_text(source + "\n", encoding="utf-8")
-    cmd = [
-        mmdc,
-        "--input",
-        str(mmd_path),
-        "--output",
-        str(png_path),
-        "--width",
-        "1400",
-        "--height",
-        "900",
-        "--backgroundColor",
-        "white",
-        "--quiet",
-    ]
-    if puppeteer_config is not None:
-        cmd.extend(["--puppeteerConfigFile", str(puppeteer_config)])
-    env = os.environ.copy()
-    env["PATH"] = os.pathsep.join(part for part in (env.get("PATH", ""), os.defpath) if part)
-
-    try:
-        # Intentionally convert every mmdc execution failure into a documented
-        # caller-side fallback so combined PDF rendering can continue.
-        completed = run_isolated_subprocess(cmd, env=env, timeout=90)
-    except subprocess.TimeoutExpired as exc:
-        raise RenderingError(f"mmdc timed out while rendering {stem}") from exc
-    except OSError as exc:
-        raise RenderingError(f"Could not execute mmdc while rendering {stem}: {exc}") from exc
-
-    if completed.returncode != 0:
-        stderr = completed.stderr.strip() or completed.stdout.strip()
-        raise RenderingError(f"mmdc failed for {stem}: {stderr[:800]}")
-    if not png_path.is_file() or png_path.stat().st_size == 0:
-        raise RenderingError(f"mmdc reported success for {stem} but did not produce a PNG")
-    return png_path
-
-
 __all__ = ["MermaidReplacementResult", "_resolve_chrome_executable", "replace_inline_mermaid"]
@@ -0,0 +1,318 @@
+"""Dependency-aware reuse of per-section renders (slides and HTML pages).
+
+``render_individual_files`` re-runs pandoc/xelatex for every manuscript
+section on every pipeline run. A section's per-file outputs are a function of
+more than its own markdown, so the cache key here folds in everything else the
+slides and web renderers read:
+
+* the section's figures — every ``![...](path)`` / ``\\includegraphics{path}``
+  target, resolved the way the renderers resolve them (next to the section,
+  under the manuscript directory, and by name under ``figures_dir``), plus the
+  ``_mobile`` companions the web pages link to and ``figure_registry.json``;
+* the manuscript-level inputs: ``config.yaml``, ``preamble.md`` and every
+  ``*.bib`` file in the manuscript directory, and the ordered section list;
+* the renderer version: the rendering package's own code, filters and
+  stylesheet, the ``pandoc --version`` banner, and the format-relevant fields
+  of :class:`~infrastructure.rendering.config.RenderingConfig`.
+
+Any change to one of those produces a different dependency hash, so the
+section renders again. The first pass caches in ``output/.render_cache.json``;
+the post-combined Beamer refresh caches in ``output/.render_cache_slides.json``
+with the combined manuscript's label map as an extra dependency. Caching is
+active only when ``RenderingConfig.section_cache`` is set, which the render
+pipeline does unless ``RENDER_SECTION_CACHE=0``.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+import re
+import subprocess
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from infrastructure.core.logging.utils import get_logger
+from infrastructure.rendering.render_cache import ManuscriptRenderCache, RenderCacheError
+
+logger = get_logger(__name__)
+
+#: Cache file name, relative to the rendering output directory.
+RENDER_CACHE_FILENAME = ".render_cache.json"
+
+#: Cache file for decks refreshed against the combined AUX label map.
+SLIDE_REFRESH_CACHE_FILENAME = ".render_cache_slides.json"
+
+#: Set to ``0``/``false`` to make the render pipeline re-render every section.
+SECTION_CACHE_ENV = "RENDER_SECTION_CACHE"
+
+_RENDERING_PACKAGE_DIR = Path(__file__).resolve().parent
+_RENDERER_CODE_SUFFIXES = frozenset({".py", ".lua", ".css"})
+_MISSING = "missing"
+
+# ``![alt](target "title"){attrs}`` and ``\includegraphics[opts]{target}``.
+_MARKDOWN_IMAGE_RE = re.compile(r"!\[[^\]]*\]\(\s*<?([^)\s>]+)")
+_INCLUDEGRAPHICS_RE = re.compile(r"\\includegraphics(?:\[[^\]]*\])?\{([^}]+)\}")
+_REMOTE_PREFIXES = ("http://", "https://", "data:")
+
+# Per-run scratch locations and the cache toggle itself do not change what a
+# section renders to; every other config field does.
+_CONFIG_FINGERPRINT_EXCLUDED = frozenset({"section_cache", "untrusted_temp_root"})
+
+
+def section_cache_enabled(env: dict[str, str] | None = None) -> bool:
+    """Return False when ``RENDER_SECTION_CACHE`` opts the render pipeline out of section reuse."""
+    value = (env if env is not None else os.environ).get(SECTION_CACHE_ENV, "1")
+    return value.strip().lower() not in ("0", "false", "no", "off")
+
+
+def _sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    try:
+        with path.open("rb") as fh:
+            for chunk in iter(lambda: fh.read(1024 * 1024), b""):
+                digest.update(chunk)
+    except OSError:
+        return _MISSING
+    return digest.hexdigest()
+
+
+def _fold(digest: Any, label: str, value: str) -> None:
+    digest.update(label.encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(value.encode("utf-8", errors="surrogateescape"))
+    digest.update(b"\x1e")
+
+
+@lru_cache(maxsize=1)
+def _renderer_code_digest() -> str:
+    """Digest of the rendering package's code, Lua filters and stylesheets."""
+    digest = hashlib.sha256()
+    for path in sorted(_RENDERING_PACKAGE_DIR.iterdir()):
+        if path.is_file() and path.suffix in _RENDERER_CODE_SUFFIXES:
+            _fold(digest, path.name, _sha256_file(path))
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=8)
+def _tool_version(executable: str) -> str:
+    """First line of ``<executable> --version`` (``unavailable`` when it cannot run)."""
+    try:
+        result = subprocess.run(  # nosec B603 — fixed argv, no shell
+            [executable, "--version"],
+            capture_output=True,
+            text=True,
+            check=False,
+            timeout=30,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return "unavailable"
+    first_line = (result.stdout or "").splitlines()[:1]
+    return first_line[0].strip() if first_line else f"exit {result.returncode}"
+
+
+def referenced_figures(source_text: str) -> list[str]:
+    """Return the local image targets a section references, in first-seen order."""
+    targets: list[str] = []
+    for match in (*_MARKDOWN_IMAGE_RE.finditer(source_text), *_INCLUDEGRAPHICS_RE.finditer(source_text)):
+        target = match.group(1).strip()
+        if target and not target.startswith(_REMOTE_PREFIXES) and target not in targets:
+            targets.append(target)
+    return targets
+
+
+def _figure_candidates(target: str, source_file: Path, manuscript_dir: Path, figures_dir: Path) -> list[Path]:
+    relative = Path(target)
+    candidates = [source_file.parent / relative, manuscript_dir / relative, figures_dir / relative.name]
+    if relative.suffix:
+        mobile_name = f"{relative.stem}_mobile{relative.suffix}"
+        candidates.append(figures_dir / mobile_name)
+    return candidates
+
+
+@dataclass
+class SectionRenderPlan:
+    """Per-run view of the section cache: dependency hashes and reusable sections.
+
+    Built once before stale-output cleanup so the outputs of reusable sections
+    can be preserved, then consulted (and updated) while rendering.
+    """
+
+    cache: ManuscriptRenderCache
+    dependency_hashes: dict[Path, str] = field(default_factory=dict)
+    reusable: dict[Path, list[Path]] = field(default_factory=dict)
+
+    def preserved_outputs(self) -> frozenset[Path]:
+        """Resolved output paths that stale-output cleanup must leave in place."""
+        return frozenset(output.resolve() for outputs in self.reusable.values() for output in outputs)
+
+    def cached_outputs(self, source_file: Path) -> list[Path] | None:
+        """Outputs to reuse for ``source_file``, or ``None`` when it must render."""
+        return self.reusable.get(source_file)
+
+    def record(self, source_file: Path, outputs: list[Path]) -> None:
+        """Record a fresh render; cache write failures only cost the next run a re-render."""
+        dependency_hash = self.dependency_hashes.get(source_file)
+        if dependency_hash is None:
+            return
+        try:
+            self.cache.record_rendered(source_file, outputs, dependency_hash=dependency_hash)
+        except RenderCacheError as exc:
+            logger.warning("Could not record render cache entry for %s: %s", source_file.name, exc)
+
+    def forget(self, source_file: Path) -> None:
+        """Invalidate ``source_file`` after a failed render."""
+        self.cache.forget(source_file)
+        try:
+            self.cache.save()
+        except RenderCacheError as exc:
+            logger.warning("Could not update render cache after %s failed: %s", source_file.name, exc)
+
+
+def _shared_dependency_hash(config: Any, manuscript_dir: Path, figures_dir: Path, source_files: list[Path]) -> str:
+    digest = hashlib.sha256()
+    _fold(digest, "renderer-code", _renderer_code_digest())
+    pandoc_path = str(getattr(config, "pandoc_path", "pandoc"))
+    _fold(digest, "pandoc", _tool_version(pandoc_path))
+    if dataclasses.is_dataclass(config) and not isinstance(config, type):
+        fields = {
+            name: value
+            for name, value in sorted(dataclasses.asdict(config).items())
+            if name not in _CONFIG_FINGERPRINT_EXCLUDED
+        }
+        _fold(digest, "config", json.dumps(fields, sort_keys=True, default=str))
+    for name in ("config.yaml", "preamble.md"):
+        _fold(digest, name, _sha256_file(manuscript_dir / name))
+    for bib in sorted(manuscript_dir.glob("*.bib")):
+        _fold(digest, f"bib:{bib.name}", _sha256_file(bib))
+    _fold(digest, "figure-registry", _sha256_file(figures_dir / "figure_registry.json"))
+    _fold(digest, "sections", "\x1f".join(path.name for path in source_files))
+    return digest.hexdigest()
+
+
+def section_dependency_hash(
+    source_file: Path,
+    *,
+    shared_hash: str,
+    manuscript_dir: Path,
+    figures_dir: Path,
+) -> str:
+    """Combine the shared render inputs with this section's own figures."""
+    digest = hashlib.sha256()
+    _fold(digest, "shared", shared_hash)
+    try:
+        source_text = source_file.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        source_text = ""
+    for target in referenced_figures(source_text):
+        for candidate in _figure_candidates(target, source_file, manuscript_dir, figures_dir):
+            _fold(digest, f"figure:{candidate.as_posix()}", _sha256_file(candidate))
+    return digest.hexdigest()
+
+
+def _open_cache(cache_file: Path) -> ManuscriptRenderCache | None:
+    """Open ``cache_file``, discarding it when it cannot be trusted."""
+    try:
+        return ManuscriptRenderCache(cache_file)
+    except RenderCacheError as exc:
+        logger.warning("Discarding untrusted render cache: %s", exc)
+    try:
+        cache_file.unlink(missing_ok=True)
+        return ManuscriptRenderCache(cache_file)
+    except (OSError, RenderCacheError) as exc:
+        logger.warning("Render cache disabled for this run: %s", exc)
+        return None
+
+
+def _build_plan(
+    manager: Any,
+    source_files: list[Path],
+    *,
+    cache_filename: str,
+    extra_dependency: str = "",
+    require_unmodified: bool = False,
+) -> SectionRenderPlan | None:
+    config = manager.config
+    if not getattr(config, "section_cache", False):
+        return None
+    cache = _open_cache(Path(config.output_dir) / cache_filename)
+    if cache is None:
+        return None
+    manuscript_dir = Path(getattr(manager, "manuscript_dir", None) or config.manuscript_dir)
+    figures_dir = Path(getattr(manager, "figures_dir", None) or config.figures_dir)
+    shared_hash = _shared_dependency_hash(config, manuscript_dir, figures_dir, source_files)
+    if extra_dependency:
+        shared_hash = hashlib.sha256(f"{shared_hash}\x00{extra_dependency}".encode()).hexdigest()
+    plan = SectionRenderPlan(cache=cache)
+    for source_file in source_files:
+        dependency_hash = section_dependency_hash(
+            source_file,
+            shared_hash=shared_hash,
+            manuscript_dir=manuscript_dir,
+            figures_dir=figures_dir,
+        )
+        plan.dependency_hashes[source_file] = dependency_hash
+        outputs = cache.cached_outputs(
+            source_file,
+            dependency_hash=dependency_hash,
+            require_unmodified=require_unmodified,
+        )
+        if outputs is not None:
+            plan.reusable[source_file] = outputs
+    return plan
+
+
+def plan_section_render_cache(
+    manager: Any,
+    source_files: Iterable[Path],
+) -> SectionRenderPlan | None:
+    """Build the per-file render reuse plan (``None`` when the cache is off)."""
+    files = list(source_files)
+    plan = _build_plan(manager, files, cache_filename=RENDER_CACHE_FILENAME)
+    if plan is not None and plan.reusable:
+        logger.info("Render cache: %d of %d section(s) unchanged", len(plan.reusable), len(files))
+    return plan
+
+
+def plan_slide_refresh_cache(
+    manager: Any,
+    source_files: Iterable[Path],
+    label_numbers: dict[str, str],
+) -> SectionRenderPlan | None:
+    """Build the reuse plan for the post-combined Beamer refresh.
+
+    The refreshed decks additionally depend on the combined manuscript's
+    ``label -> number`` map; page numbers and other AUX noise are ignored, so
+    only a change to cross-section numbering re-runs every deck. A deck the
+    first pass re-rendered since its last refresh is never reused.
+    """
+    files = list(source_files)
+    labels = json.dumps(label_numbers, sort_keys=True)
+    plan = _build_plan(
+        manager,
+        files,
+        cache_filename=SLIDE_REFRESH_CACHE_FILENAME,
+        extra_dependency=f"labels\x00{labels}",
+        require_unmodified=True,
+    )
+    if plan is not None and plan.reusable:
+        logger.info("Render cache: %d of %d refreshed deck(s) unchanged", len(plan.reusable), len(files))
+    return plan
+
+
+__all__ = [
+    "RENDER_CACHE_FILENAME",
+    "SECTION_CACHE_ENV",
+    "SLIDE_REFRESH_CACHE_FILENAME",
+    "SectionRenderPlan",
+    "plan_section_render_cache",
+    "plan_slide_refresh_cache",
+    "referenced_figures",
+    "section_cache_enabled",
+    "section_dependency_hash",
+]
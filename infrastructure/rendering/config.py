@@ -71,6 +71,11 @@ class RenderingConfig:
     enable_docx: bool = False
     enable_epub: bool = False
 
+    # Reuse per-section slides/HTML whose sources and dependencies are
+    # unchanged (see ``_section_render_cache``). Off for ad-hoc managers; the
+    # render pipeline turns it on unless ``RENDER_SECTION_CACHE=0``.
+    section_cache: bool = False
+
     @classmethod
     def from_env(cls, env: dict[str, str] | None = None) -> RenderingConfig:
         """Create configuration from environment variables.
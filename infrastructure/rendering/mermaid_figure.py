@@ -7,6 +7,11 @@ when a caller already has one Mermaid diagram source string and wants a PNG
 at a specific path — e.g. a slide deck embedding an architecture diagram as
 a :class:`infrastructure.rendering.slide_deck.Slide` figure.
 
+Use :func:`render_mermaid_pngs` for several diagrams: it reuses unchanged
+PNGs and renders the rest in batched ``mmdc`` sessions instead of booting a
+browser per diagram. :func:`render_required_mermaid_pngs` wraps it for
+figure producers that must report every failed diagram and fail closed.
+
 Requires ``mmdc`` (mermaid-cli) on ``PATH``; raises
 :class:`~infrastructure.core.exceptions.RenderingError` with a clear message
 if it is absent, rather than a bare ``FileNotFoundError``.
@@ -15,16 +20,16 @@ if it is absent, rather than a bare ``FileNotFoundError``.
 from __future__ import annotations
 
 import json
-import os
+import logging
 import shutil
-import subprocess
-from collections.abc import Callable
+import tempfile
+from collections.abc import Callable, Mapping
 from pathlib import Path
 
 from infrastructure.core.exceptions import RenderingError
 from infrastructure.core.logging.utils import get_logger
+from infrastructure.rendering._mermaid_batch import MermaidBatchOutcome, MermaidRenderOptions, render_mermaid_batch
 from infrastructure.rendering.chrome import resolve_chrome_executable
-from infrastructure.rendering.security import run_isolated_subprocess
 
 logger = get_logger(__name__)
 
@@ -46,6 +51,40 @@ def render_mermaid_png(
     content recorded alongside it (mirrors the caching behavior of the
     inline-fence renderer).
     """
+    outcome = render_mermaid_pngs(
+        {output_path: source},
+        width=width,
+        height=height,
+        background=background,
+        timeout=timeout,
+        executable_resolver=executable_resolver,
+    )
+    if output_path in outcome.failed:
+        raise outcome.failed[output_path]
+    return output_path
+
+
+def render_mermaid_pngs(
+    diagrams: Mapping[Path, str],
+    *,
+    width: int = 1400,
+    height: int = 900,
+    background: str = "white",
+    timeout: int = 90,
+    workers: int | None = None,
+    executable_resolver: Callable[[str], str | None] = shutil.which,
+) -> MermaidBatchOutcome:
+    """Render several diagrams (PNG path -> Mermaid source) in as few browser boots as possible.
+
+    Unchanged targets are reused, identical sources render once, and the rest
+    are rendered in batched ``mmdc`` sessions (at most ``workers`` at a time;
+    ``MERMAID_RENDER_WORKERS`` when ``None``). Per-diagram failures are
+    reported in the returned outcome instead of raised, so one broken diagram
+    does not hide the others.
+
+    Raises:
+        RenderingError: If ``mmdc`` is not on ``PATH``.
+    """
     mmdc = executable_resolver("mmdc")
     if mmdc is None:
         raise RenderingError(
@@ -53,60 +92,68 @@ def render_mermaid_png(
             '`npm ci` and `export PATH="$PWD/node_modules/.bin:$PATH"` to render Mermaid diagrams to PNG.'
         )
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    mmd_sidecar = output_path.with_suffix(".mmd")
-    if (
-        output_path.is_file()
-        and output_path.stat().st_size > 0
-        and mmd_sidecar.is_file()
-        and mmd_sidecar.read_text(encoding="utf-8").rstrip("\n") == source.rstrip("\n")
-    ):
-        return output_path
-
-    mmd_sidecar.write_text(source + "\n", encoding="utf-8")
-
-    cmd = [
-        mmdc,
-        "--input",
-        str(mmd_sidecar),
-        "--output",
-        str(output_path),
-        "--width",
-        str(width),
-        "--height",
-        str(height),
-        "--backgroundColor",
-        background,
-        "--quiet",
-    ]
-
-    chrome_executable = resolve_chrome_executable(include_macos_app=True)
-    puppeteer_config: Path | None = None
-    if chrome_executable is not None:
-        puppeteer_config = output_path.parent / f"{output_path.stem}.puppeteer.json"
-        puppeteer_config.write_text(
-            json.dumps({"executablePath": str(chrome_executable)}) + "\n",
-            encoding="utf-8",
+    with tempfile.TemporaryDirectory(prefix="mermaid_figure_") as scratch:
+        chrome_executable = resolve_chrome_executable(include_macos_app=True)
+        puppeteer_config: Path | None = None
+        if chrome_executable is not None:
+            puppeteer_config = Path(scratch) / "puppeteer.json"
+            puppeteer_config.write_text(
+                json.dumps({"executablePath": str(chrome_executable)}) + "\n",
+                encoding="utf-8",
+            )
+        options = MermaidRenderOptions(
+            width=width,
+            height=height,
+            background=background,
+            timeout=timeout,
+            puppeteer_config=puppeteer_config,
         )
-        cmd.extend(["--puppeteerConfigFile", str(puppeteer_config)])
-
-    env = os.environ.copy()
-    env["PATH"] = os.pathsep.join(part for part in (env.get("PATH", ""), os.defpath) if part)
+        outcome = render_mermaid_batch(
+            {path: source.rstrip("\n") for path, source in diagrams.items()},
+            mmdc=mmdc,
+            options=options,
+            workers=workers,
+        )
+    logger.debug(
+        "Rendered %d Mermaid diagram(s): %d reused, %d failed, %d mmdc session(s)",
+        len(diagrams),
+        outcome.cache_hits,
+        len(outcome.failed),
+        outcome.browser_sessions,
+    )
+    return outcome
+
+
+def render_required_mermaid_pngs(
+    diagrams: Mapping[Path, str],
+    *,
+    log: logging.Logger | None = None,
+    executable_resolver: Callable[[str], str | None] = shutil.which,
+) -> list[Path]:
+    """Render every diagram with :func:`render_mermaid_pngs` and return the paths that failed.
 
+    Each written or failed diagram is logged on *log* (this module's logger
+    when ``None``). A missing ``mmdc`` or browser fails every diagram instead
+    of raising, so producers can report all of them before exiting non-zero.
+    """
+    log = log or logger
     try:
-        completed = run_isolated_subprocess(cmd, env=env, timeout=timeout)
-    except subprocess.TimeoutExpired as exc:
-        raise RenderingError(f"mmdc timed out while rendering {output_path.name}") from exc
-    except OSError as exc:
-        raise RenderingError(f"Could not execute mmdc while rendering {output_path.name}: {exc}") from exc
-
-    if completed.returncode != 0:
-        stderr = completed.stderr.strip() or completed.stdout.strip()
-        raise RenderingError(f"mmdc failed for {output_path.name}: {stderr[:800]}")
-    if not output_path.is_file() or output_path.stat().st_size == 0:
-        raise RenderingError(f"mmdc reported success for {output_path.name} but did not produce a PNG")
-
-    return output_path
-
-
-__all__ = ["render_mermaid_png"]
+        outcome = render_mermaid_pngs(diagrams, executable_resolver=executable_resolver)
+    except Exception as exc:  # noqa: BLE001 - a missing renderer fails every required diagram
+        log.error("Could not render required diagrams (mmdc/Chrome unavailable): %s", exc)
+        return list(diagrams)
+    failures: list[Path] = []
+    for output_path in diagrams:
+        if output_path in outcome.failed:
+            failures.append(output_path)
+            log.error(
+                "Could not render required diagram %s (mmdc/Chrome failed): %s",
+                output_path.name,
+                outcome.failed[output_path],
+            )
+        else:
+            log.info("Wrote diagram: %s", output_path)
+    return failures
+
+
+__all__ = ["render_mermaid_png", "render_mermaid_pngs", "render_required_mermaid_pngs"]
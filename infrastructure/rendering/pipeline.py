@@ -41,6 +41,7 @@ from infrastructure.rendering._pipeline_summary import (
     verify_pdf_outputs,
     verify_render_outputs,
 )
+from infrastructure.rendering._section_render_cache import plan_section_render_cache, section_cache_enabled
 from infrastructure.rendering.config import RenderingConfig
 from infrastructure.rendering.manuscript_discovery import discover_manuscript_files, verify_figures_exist
 from infrastructure.rendering import RenderManager
@@ -155,6 +156,7 @@ def _render_pipeline_impl(
             enable_slides=env_config.enable_slides,
             enable_docx=env_config.enable_docx,
             enable_epub=env_config.enable_epub,
+            section_cache=section_cache_enabled(),
         )
         manager = deps.manager_factory(
             config,
@@ -171,12 +173,25 @@ def _render_pipeline_impl(
         return 1
 
     md_files = [f for f in source_files if f.suffix == ".md"]
+    # Outputs of sections the render cache will reuse must survive the stale
+    # deliverable sweep; the same plan then drives ``render_individual_files``.
+    section_cache = plan_section_render_cache(manager, source_files)
     try:
-        _clean_stale_render_deliverables(manager, source_files, project_name)
+        _clean_stale_render_deliverables(
+            manager,
+            source_files,
+            project_name,
+            preserve=section_cache.preserved_outputs() if section_cache else (),
+        )
     except OSError as exc:
         logger.error("Could not remove stale render deliverable: %s", exc)
         return 1
-    rendered_count, failed_files = deps.render_individual(manager, source_files, reporter)
+    rendered_count, failed_files = deps.render_individual(
+        manager,
+        source_files,
+        reporter,
+        section_cache=section_cache,
+    )
 
     if md_files:
         deps.render_combined(manager, md_files, manuscript_dir, project_name, reporter, rendered_count)
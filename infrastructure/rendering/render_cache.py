@@ -1,4 +1,11 @@
-"""Modular manuscript rendering cache for fast incremental compilation."""
+"""Modular manuscript rendering cache for fast incremental compilation.
+
+Each entry records a section's source hash, an optional ``dependency_hash``
+covering everything else that shaped the render (figures, bibliography,
+preamble/config, renderer version; see ``_section_render_cache``), and the
+outputs the render produced. A section is reusable only when both hashes
+match and every recorded output is still a regular file.
+"""
 
 from __future__ import annotations
 
@@ -10,7 +17,7 @@ import tempfile
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeGuard
 
 
 _SCHEMA_VERSION = 1
@@ -28,17 +35,23 @@ class SectionCacheEntry:
     content_hash: str
     rendered_outputs: list[str] = field(default_factory=list)
     timestamp: float = 0.0
+    dependency_hash: str = ""
 
     def to_dict(self) -> dict[str, Any]:
         """Convert entry to JSON-safe dictionary."""
         return {
             "file_name": self.file_name,
             "content_hash": self.content_hash,
+            "dependency_hash": self.dependency_hash,
             "rendered_outputs": list(self.rendered_outputs),
             "timestamp": self.timestamp,
         }
 
 
+def _is_sha256_hex(value: object) -> TypeGuard[str]:
+    return isinstance(value, str) and len(value) == 64 and all(character in "0123456789abcdef" for character in value)
+
+
 class ManuscriptRenderCache:
     """File-backed incremental rendering cache."""
 
@@ -73,17 +86,15 @@ class ManuscriptRenderCache:
                 raise RenderCacheError(f"Render cache entry {index} is not an object: {self.cache_file}")
             file_name = item.get("file_name")
             content_hash = item.get("content_hash")
+            dependency_hash = item.get("dependency_hash", "")
             rendered_outputs = item.get("rendered_outputs")
             timestamp = item.get("timestamp")
             if not isinstance(file_name, str) or not file_name:
                 raise RenderCacheError(f"Render cache entry {index} has no valid file key: {self.cache_file}")
-            if (
-                not isinstance(content_hash, str)
-                or len(content_hash) != 64
-                or content_hash != content_hash.lower()
-                or any(character not in "0123456789abcdef" for character in content_hash)
-            ):
+            if not _is_sha256_hex(content_hash):
                 raise RenderCacheError(f"Render cache entry {index} has an invalid content hash: {self.cache_file}")
+            if dependency_hash != "" and not _is_sha256_hex(dependency_hash):
+                raise RenderCacheError(f"Render cache entry {index} has an invalid dependency hash: {self.cache_file}")
             if not isinstance(rendered_outputs, list) or not all(isinstance(path, str) for path in rendered_outputs):
                 raise RenderCacheError(f"Render cache entry {index} has invalid rendered outputs: {self.cache_file}")
             if (
@@ -100,6 +111,7 @@ class ManuscriptRenderCache:
                 content_hash=content_hash,
                 rendered_outputs=list(rendered_outputs),
                 timestamp=float(timestamp),
+                dependency_hash=dependency_hash,
             )
         self._entries = entries
 
@@ -143,35 +155,67 @@ class ManuscriptRenderCache:
         except OSError:
             return ""
 
-    def is_up_to_date(self, source_file: Path, expected_outputs: list[Path]) -> bool:
-        """Check hash, exact output set, and file outputs for a cached section."""
-        entry = self._entries.get(self._path_key(source_file))
-        if not entry:
-            return False
-        current_hash = self.compute_hash(source_file)
-        if not current_hash or current_hash != entry.content_hash:
+    def is_up_to_date(self, source_file: Path, expected_outputs: list[Path], *, dependency_hash: str = "") -> bool:
+        """Check hashes, exact output set, and file outputs for a cached section."""
+        entry = self._matching_entry(source_file, dependency_hash)
+        if entry is None:
             return False
         expected_keys = [self._path_key(output) for output in expected_outputs]
         if expected_keys != entry.rendered_outputs:
             return False
         return all(output.is_file() for output in expected_outputs)
 
-    def record_rendered(self, source_file: Path, outputs: list[Path]) -> None:
+    def cached_outputs(
+        self,
+        source_file: Path,
+        *,
+        dependency_hash: str = "",
+        require_unmodified: bool = False,
+    ) -> list[Path] | None:
+        """Return the recorded outputs of an up-to-date section, else ``None``.
+
+        Unlike :meth:`is_up_to_date` the caller does not need to predict the
+        output set: the recorded one is returned when the source and
+        dependency hashes match and every recorded output is still a file.
+        With ``require_unmodified`` an output rewritten after it was recorded
+        (by another render pass) also invalidates the entry.
+        """
+        entry = self._matching_entry(source_file, dependency_hash)
+        if entry is None or not entry.rendered_outputs:
+            return None
+        outputs = [self._path_from_key(key) for key in entry.rendered_outputs]
+        try:
+            if not all(output.is_file() for output in outputs):
+                return None
+            if require_unmodified and any(output.stat().st_mtime > entry.timestamp for output in outputs):
+                return None
+        except OSError:
+            return None
+        return outputs
+
+    def record_rendered(self, source_file: Path, outputs: list[Path], *, dependency_hash: str = "") -> None:
         """Record successful render of a section."""
         content_hash = self.compute_hash(source_file)
         if not content_hash:
             raise RenderCacheError(f"Cannot cache missing or unreadable source file: {source_file}")
         if not all(output.is_file() for output in outputs):
             raise RenderCacheError("Cannot cache a render with missing or non-file outputs")
+        if dependency_hash and not _is_sha256_hex(dependency_hash):
+            raise RenderCacheError(f"Invalid dependency hash for {source_file}: {dependency_hash!r}")
         key = self._path_key(source_file)
         self._entries[key] = SectionCacheEntry(
             file_name=key,
             content_hash=content_hash,
             rendered_outputs=[self._path_key(output) for output in outputs],
             timestamp=time.time(),
+            dependency_hash=dependency_hash,
         )
         self.save()
 
+    def forget(self, source_file: Path) -> None:
+        """Drop the entry for ``source_file`` (in memory; persisted on next save)."""
+        self._entries.pop(self._path_key(source_file), None)
+
     def clear(self) -> None:
         """Clear the cache."""
         self._entries.clear()
@@ -181,6 +225,20 @@ class ManuscriptRenderCache:
             except OSError as exc:
                 raise RenderCacheError(f"Could not clear render cache {self.cache_file}: {exc}") from exc
 
+    def _matching_entry(self, source_file: Path, dependency_hash: str) -> SectionCacheEntry | None:
+        entry = self._entries.get(self._path_key(source_file))
+        if entry is None or entry.dependency_hash != dependency_hash:
+            return None
+        current_hash = self.compute_hash(source_file)
+        if not current_hash or current_hash != entry.content_hash:
+            return None
+        return entry
+
+    def _path_from_key(self, key: str) -> Path:
+        if key.startswith("external:"):
+            return Path(key[len("external:") :])
+        return self._cache_root / key
+
     def _path_key(self, path: Path) -> str:
         """Return a collision-resistant cache key for a source or output path."""
         resolved = Path(path).resolve()
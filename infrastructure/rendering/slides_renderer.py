@@ -25,6 +25,7 @@ single section in isolation and have a different acceptable-citation
 set than the full manuscript.
 """
 
+import os
 import re
 import shutil
 import subprocess
@@ -662,7 +663,13 @@ class SlidesRenderer:
         # unconditional appends) -- a header is always written here.
         output_dir.mkdir(parents=True, exist_ok=True)
         header_path = output_dir / "_slides_math_header.tex"
-        header_path.write_text("\n".join(snippet_parts), encoding="utf-8")
+        header_text = "\n".join(snippet_parts)
+        # Shared by every deck: sections rendered in parallel must never read
+        # a half-written header, so replace it atomically and only on change.
+        if not header_path.is_file() or header_path.read_text(encoding="utf-8") != header_text:
+            staging = header_path.with_name(f".{header_path.name}.{os.getpid()}.tmp")
+            staging.write_text(header_text, encoding="utf-8")
+            os.replace(staging, header_path)
         logger.debug(f"Wrote slides math header: {header_path}")
         return header_path
 
@@ -12,6 +12,14 @@ The module exposes three pure functions and one I/O-driven collector:
 - :func:`collect_history_via_gh` — real ``gh run list`` + ``gh run download``
   invocations (no mocks; raises ``RuntimeError`` if the CLI is missing).
 
+Parsing streams the XML with ``iterparse``. The suite totals come from the
+root element's attributes, so the parser stops after the first start tag and
+never builds a tree for multi-megabyte reports. Per-package or per-file rates
+are streamed only when ``detail`` asks for them. Both collectors accept a
+:class:`~infrastructure.reporting.coverage_history_store.CoverageHistoryStore`.
+The store ingests each XML (or each ``gh`` run) once and serves later
+builds from SQLite.
+
 Two driver modes are supported by the orchestrator script
 ``scripts/docgen/coverage_history.py``:
 
@@ -32,15 +40,19 @@ import re
 import shutil
 import subprocess
 import tempfile
-from dataclasses import dataclass
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import Sequence
+from typing import TYPE_CHECKING, Any, Literal, Sequence
 
 import defusedxml.ElementTree as ET
 
 from infrastructure.core.logging.utils import get_logger
 
+if TYPE_CHECKING:
+    from infrastructure.reporting.coverage_history_store import CoverageHistoryStore
+
 logger = get_logger(__name__)
 
 
@@ -49,6 +61,18 @@ logger = get_logger(__name__)
 # ---------------------------------------------------------------------------
 
 
+#: Granularity of the optional per-module rates: Cobertura ``<package>`` or ``<class>`` (one per file).
+CoverageDetail = Literal["package", "file"]
+
+
+@dataclass(frozen=True)
+class ModuleCoverage:
+    """Line coverage of one Cobertura package (by name) or file (by filename)."""
+
+    name: str
+    percentage: float
+
+
 @dataclass(frozen=True)
 class CoveragePoint:
     """A single coverage measurement for one suite at a specific timestamp.
@@ -60,6 +84,9 @@ class CoveragePoint:
         percentage: Coverage in ``[0.0, 100.0]`` (Cobertura ``line-rate`` × 100).
         lines_covered: Total covered lines reported by Cobertura.
         lines_total: Total considered lines reported by Cobertura.
+        modules: Per-package or per-file rates, when parsed with ``detail``.
+        source: Store key of the report the point was read from (``""`` when
+            parsed without a store). Not part of equality.
     """
 
     date: datetime
@@ -67,6 +94,8 @@ class CoveragePoint:
     percentage: float
     lines_covered: int
     lines_total: int
+    modules: tuple[ModuleCoverage, ...] = ()
+    source: str = field(default="", compare=False)
 
 
 # ---------------------------------------------------------------------------
@@ -112,11 +141,21 @@ def _parse_timestamp(raw: str | None) -> datetime:
             return datetime.now(timezone.utc)
 
 
-def parse_coverage_xml(path: Path) -> "CoveragePoint":
+# Element tag and name attribute streamed for each detail level.
+_DETAIL_ELEMENTS: dict[str, tuple[str, str]] = {
+    "package": ("package", "name"),
+    "file": ("class", "filename"),
+}
+
+
+def parse_coverage_xml(path: Path, *, detail: CoverageDetail | None = None) -> "CoveragePoint":
     """Parse a Cobertura-style ``coverage-*.xml`` file into a :class:`CoveragePoint`.
 
     Args:
         path: Path to a Cobertura XML file produced by ``pytest --cov-report=xml``.
+        detail: Also stream per-``"package"`` or per-``"file"`` line rates into
+            :attr:`CoveragePoint.modules`. ``None`` (default) reads only the
+            root element and stops.
 
     Returns:
         A frozen :class:`CoveragePoint`.
@@ -128,27 +167,43 @@ def parse_coverage_xml(path: Path) -> "CoveragePoint":
     if not path.exists():
         raise FileNotFoundError(f"Coverage XML not found: {path}")
 
-    tree = ET.parse(str(path))
-    root = tree.getroot()
-    if root.tag != "coverage":
-        raise ValueError(f"Expected <coverage> root, got <{root.tag}> in {path}")
+    with path.open("rb") as fh:
+        events = ET.iterparse(fh, events=("start", "end"))
+        _, root = next(events)
+        if root.tag != "coverage":
+            raise ValueError(f"Expected <coverage> root, got <{root.tag}> in {path}")
+        attrib = dict(root.attrib)
+        modules = _stream_modules(events, detail) if detail else ()
 
-    line_rate = float(root.attrib.get("line-rate", "0") or "0")
-    lines_covered = int(root.attrib.get("lines-covered", "0") or "0")
-    lines_total = int(root.attrib.get("lines-valid", "0") or "0")
+    line_rate = float(attrib.get("line-rate", "0") or "0")
+    lines_covered = int(attrib.get("lines-covered", "0") or "0")
+    lines_total = int(attrib.get("lines-valid", "0") or "0")
 
-    suite_attr = root.attrib.get("suite")
+    suite_attr = attrib.get("suite")
     suite = suite_attr if suite_attr else _suite_from_filename(path)
 
     return CoveragePoint(
-        date=_parse_timestamp(root.attrib.get("timestamp")),
+        date=_parse_timestamp(attrib.get("timestamp")),
         suite=suite,
         percentage=line_rate * 100.0,
         lines_covered=lines_covered,
         lines_total=lines_total,
+        modules=modules,
     )
 
 
+def _stream_modules(events: Iterator[tuple[str, Any]], detail: CoverageDetail) -> tuple[ModuleCoverage, ...]:
+    """Collect ``detail``-level rates from the rest of an ``iterparse`` stream, freeing each element."""
+    tag, name_attr = _DETAIL_ELEMENTS[detail]
+    modules: list[ModuleCoverage] = []
+    for event, elem in events:
+        if event == "end" and elem.tag == tag:
+            rate = float(elem.get("line-rate", "0") or "0")
+            modules.append(ModuleCoverage(name=elem.get(name_attr) or elem.get("name", ""), percentage=rate * 100.0))
+            elem.clear()
+    return tuple(modules)
+
+
 # ---------------------------------------------------------------------------
 # Markdown rendering
 # ---------------------------------------------------------------------------
@@ -200,6 +255,7 @@ def build_history_markdown(
     *,
     days: int = 30,
     today: date | None = None,
+    module_trends: Mapping[str, Sequence[float]] | None = None,
 ) -> str:
     """Render a deterministic Markdown coverage-history report.
 
@@ -209,6 +265,8 @@ def build_history_markdown(
         days: Width of the rolling window in days (default 30).
         today: Override the "today" anchor — used by tests to pin output.
             Defaults to the current timezone.utc date.
+        module_trends: Optional ``{module: chronological percentages}``; when
+            given, a "Module trends" section lists a sparkline per module.
 
     Returns:
         A Markdown document string. The function is pure and idempotent:
@@ -255,6 +313,16 @@ def build_history_markdown(
     if not suites:
         spark_lines.append("- _No coverage data points within the rolling window._")
 
+    module_lines: list[str] = []
+    if module_trends is not None:
+        module_lines = ["## Module trends", ""]
+        for name, trend in module_trends.items():
+            latest = _format_pct(trend[-1] if trend else None)
+            module_lines.append(f"- `{name}`  {_sparkline(trend)}  {latest}")
+        if not module_trends:
+            module_lines.append("- _No per-module coverage recorded._")
+        module_lines.append("")
+
     document = [
         "# Coverage history",
         "",
@@ -273,6 +341,7 @@ def build_history_markdown(
         "",
         *spark_lines,
         "",
+        *module_lines,
         "## Regenerate",
         "",
         "```bash",
@@ -327,6 +396,7 @@ def collect_history_via_gh(
     *,
     days: int = 30,
     repo_root: Path | None = None,
+    store: "CoverageHistoryStore | None" = None,
 ) -> list[CoveragePoint]:
     """Collect coverage points from the last ``days`` of CI artefacts via ``gh``.
 
@@ -347,6 +417,9 @@ def collect_history_via_gh(
         days: Rolling window in days (default 30).
         repo_root: Optional working directory; ``gh`` will resolve the
             repo from the cwd's git remote.
+        store: Optional history store. Runs it has already ingested are not
+            downloaded again; their points are read from the store and merged
+            with the points of the runs downloaded now.
 
     Returns:
         Coverage points sorted by ``(date, suite)``.
@@ -378,6 +451,7 @@ def collect_history_via_gh(
         raise RuntimeError(f"Could not parse `gh run list` JSON output: {exc}") from exc
 
     points: list[CoveragePoint] = []
+    stored_runs: list[str] = []
     with tempfile.TemporaryDirectory(prefix="coverage-history-") as tmp:
         tmp_path = Path(tmp)
         for run in runs:
@@ -394,6 +468,9 @@ def collect_history_via_gh(
             run_id = str(run.get("databaseId") or "")
             if not run_id:
                 continue
+            if store is not None and store.has_run(run_id):
+                stored_runs.append(run_id)
+                continue
 
             run_dir = tmp_path / run_id
             run_dir.mkdir(parents=True, exist_ok=True)
@@ -417,10 +494,18 @@ def collect_history_via_gh(
 
             for xml_path in sorted(run_dir.rglob("coverage-*.xml")):
                 try:
-                    points.append(parse_coverage_xml(xml_path))
+                    if store is not None:
+                        source = f"gh:{run_id}/{xml_path.relative_to(run_dir).as_posix()}"
+                        points.append(store.ingest(xml_path, source=source))
+                    else:
+                        points.append(parse_coverage_xml(xml_path))
                 except (ValueError, FileNotFoundError, ET.ParseError) as exc:
                     logger.warning("Skipping malformed coverage XML %s: %s", xml_path, exc)
+            if store is not None:
+                store.mark_run(run_id)
 
+    if stored_runs and store is not None:
+        points.extend(store.points(source_prefixes=[f"gh:{run_id}/" for run_id in stored_runs]))
     points.sort(key=lambda p: (p.date, p.suite))
     return points
 
@@ -430,20 +515,27 @@ def collect_history_via_gh(
 # ---------------------------------------------------------------------------
 
 
-def collect_history_from_dir(directory: Path) -> list[CoveragePoint]:
+def collect_history_from_dir(
+    directory: Path,
+    *,
+    store: "CoverageHistoryStore | None" = None,
+) -> list[CoveragePoint]:
     """Recursively parse every ``coverage-*.xml`` under ``directory``.
 
-    Sorted by ``(date, suite)`` for deterministic downstream output.
+    Sorted by ``(date, suite)`` for deterministic downstream output. With a
+    *store*, files already ingested (same path, size and mtime) are read from
+    it instead of being parsed again.
     """
     if not directory.exists():
         raise FileNotFoundError(f"Coverage directory not found: {directory}")
     if not directory.is_dir():
         raise NotADirectoryError(f"Not a directory: {directory}")
 
+    parse = store.ingest if store is not None else parse_coverage_xml
     points: list[CoveragePoint] = []
     for xml_path in sorted(directory.rglob("coverage-*.xml")):
         try:
-            points.append(parse_coverage_xml(xml_path))
+            points.append(parse(xml_path))
         except (ValueError, FileNotFoundError, ET.ParseError) as exc:
             logger.warning("Skipping malformed coverage XML %s: %s", xml_path, exc)
     points.sort(key=lambda p: (p.date, p.suite))
@@ -451,7 +543,9 @@ def collect_history_from_dir(directory: Path) -> list[CoveragePoint]:
 
 
 __all__ = [
+    "CoverageDetail",
     "CoveragePoint",
+    "ModuleCoverage",
     "build_history_markdown",
     "collect_history_from_dir",
     "collect_history_via_gh",
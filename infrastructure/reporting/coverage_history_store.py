@@ -0,0 +1,327 @@
+"""Persistent coverage-history store: ingest each Cobertura XML once.
+
+:class:`CoverageHistoryStore` keeps one row per ingested ``coverage-*.xml``
+(suite totals and timestamp) plus its per-package or per-file rates in a
+single SQLite file. A file whose path, size and mtime are unchanged is served
+from the store, and a ``gh`` run that was ingested before is not downloaded
+again. The coverage dashboard therefore only pays to parse reports it has
+never seen. Window and per-module trend queries run against indexed columns,
+so they do not touch the XML archive.
+
+The store lives at ``$XDG_CACHE_HOME/template/coverage-history.sqlite``.
+``TEMPLATE_COVERAGE_HISTORY_CACHE=<path>`` moves it and ``=off`` disables it.
+It holds only data derived from the XML files, so deleting it just costs one
+full re-ingest. It keeps the ``max_points`` most recent reports (by report
+timestamp); older rows, their module rates and the ``gh`` runs they came from
+are dropped on the next ingest.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from collections.abc import Sequence
+from contextlib import closing
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from infrastructure.core.logging.utils import get_logger
+from infrastructure.core.user_cache import connect_cache_db, evict_oldest, user_cache_path
+from infrastructure.reporting.coverage_history import (
+    CoverageDetail,
+    CoveragePoint,
+    ModuleCoverage,
+    parse_coverage_xml,
+)
+
+logger = get_logger(__name__)
+
+__all__ = [
+    "DEFAULT_COVERAGE_HISTORY_MAX_POINTS",
+    "ENV_COVERAGE_HISTORY_CACHE",
+    "CoverageHistoryStats",
+    "CoverageHistoryStore",
+    "default_coverage_history_store",
+]
+
+ENV_COVERAGE_HISTORY_CACHE = "TEMPLATE_COVERAGE_HISTORY_CACHE"
+
+# Roughly two years of daily CI runs across a dozen suites.
+DEFAULT_COVERAGE_HISTORY_MAX_POINTS = 10_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS points (
+    source        TEXT PRIMARY KEY,
+    size          INTEGER NOT NULL,
+    mtime_ns      INTEGER NOT NULL,
+    detail        TEXT NOT NULL,
+    taken_at      REAL NOT NULL,
+    suite         TEXT NOT NULL,
+    percentage    REAL NOT NULL,
+    lines_covered INTEGER NOT NULL,
+    lines_total   INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS points_taken_at ON points (taken_at);
+CREATE TABLE IF NOT EXISTS modules (
+    source     TEXT NOT NULL,
+    name       TEXT NOT NULL,
+    percentage REAL NOT NULL,
+    PRIMARY KEY (source, name)
+);
+CREATE INDEX IF NOT EXISTS modules_name ON modules (name);
+CREATE TABLE IF NOT EXISTS runs (
+    run_id      TEXT PRIMARY KEY,
+    ingested_at REAL NOT NULL
+);
+"""
+
+_POINT_COLUMNS = "taken_at, suite, percentage, lines_covered, lines_total, source"
+
+# Restricts ``modules`` rows (alias given by the caller) to a JSON array of
+# sources; a NULL parameter disables the restriction.
+_SOURCES_CLAUSE = "(? IS NULL OR {alias}.source IN (SELECT value FROM json_each(?)))"
+
+
+@dataclass
+class CoverageHistoryStats:
+    """Counters for one store instance: XML files ``parsed`` versus ``reused`` from SQLite, and points evicted."""
+
+    parsed: int = 0
+    reused: int = 0
+    evictions: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+def _point_from_row(row: tuple[Any, ...]) -> CoveragePoint:
+    taken_at, suite, percentage, lines_covered, lines_total, source = row
+    return CoveragePoint(
+        date=datetime.fromtimestamp(taken_at, tz=timezone.utc),
+        suite=suite,
+        percentage=percentage,
+        lines_covered=lines_covered,
+        lines_total=lines_total,
+        source=source,
+    )
+
+
+def _sources_param(sources: Sequence[str] | None) -> str | None:
+    return None if sources is None else json.dumps(list(sources))
+
+
+class CoverageHistoryStore:
+    """SQLite store of coverage points and per-module rates, keyed by source file.
+
+    Args:
+        db_path: Database file; the parent directory is created on first use.
+        detail: Module granularity recorded at ingest (``"package"``,
+            ``"file"`` or ``None`` for suite totals only). Changing it
+            re-ingests files recorded at another granularity.
+        max_points: Reports kept; each ingest drops the oldest beyond it.
+    """
+
+    def __init__(
+        self,
+        db_path: Path | str,
+        *,
+        detail: CoverageDetail | None = "package",
+        max_points: int = DEFAULT_COVERAGE_HISTORY_MAX_POINTS,
+    ) -> None:
+        self.db_path = Path(db_path)
+        self.detail = detail
+        self.max_points = max(1, max_points)
+        self.stats = CoverageHistoryStats()
+
+    def _connect(self) -> sqlite3.Connection:
+        return connect_cache_db(self.db_path, _SCHEMA)
+
+    # ------------------------------------------------------------------
+    # Ingestion
+    # ------------------------------------------------------------------
+
+    def ingest(self, path: Path, *, source: str | None = None) -> CoveragePoint:
+        """Return the point for *path*, parsing it only if the stored copy is missing or stale.
+
+        Args:
+            path: Cobertura XML file.
+            source: Stable identifier for the row (default: the resolved path).
+                ``gh`` downloads use ``gh:<run-id>/<relative path>``.
+
+        Raises:
+            FileNotFoundError, ValueError, defusedxml ParseError: As
+            :func:`~infrastructure.reporting.coverage_history.parse_coverage_xml`.
+        """
+        if not path.exists():
+            raise FileNotFoundError(f"Coverage XML not found: {path}")
+        stat = path.stat()
+        key = source or str(path.resolve())
+        detail = self.detail or ""
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    f"SELECT {_POINT_COLUMNS} FROM points"  # noqa: S608 — constant column list.
+                    " WHERE source = ? AND size = ? AND mtime_ns = ? AND detail = ?",
+                    (key, stat.st_size, stat.st_mtime_ns, detail),
+                ).fetchone()
+        except (OSError, sqlite3.Error) as exc:
+            logger.debug("coverage history store unavailable at %s: %s", self.db_path, exc)
+            row = None
+        if row is not None:
+            self.stats.reused += 1
+            return _point_from_row(row)
+
+        point = replace(parse_coverage_xml(path, detail=self.detail), source=key)
+        self.stats.parsed += 1
+        self._store(key, stat.st_size, stat.st_mtime_ns, detail, point)
+        return point
+
+    def _store(self, key: str, size: int, mtime_ns: int, detail: str, point: CoveragePoint) -> None:
+        row = (
+            key,
+            size,
+            mtime_ns,
+            detail,
+            point.date.timestamp(),
+            point.suite,
+            point.percentage,
+            point.lines_covered,
+            point.lines_total,
+        )
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute("DELETE FROM modules WHERE source = ?", (key,))
+                conn.execute("INSERT OR REPLACE INTO points VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", row)
+                conn.executemany(
+                    "INSERT OR REPLACE INTO modules (source, name, percentage) VALUES (?, ?, ?)",
+                    [(key, module.name, module.percentage) for module in point.modules],
+                )
+                evicted = evict_oldest(conn, "points", order_by="taken_at", keep=self.max_points)
+                if evicted:
+                    conn.execute("DELETE FROM modules WHERE source NOT IN (SELECT source FROM points)")
+                    # A run whose reports are gone must be downloaded again.
+                    conn.execute(
+                        "DELETE FROM runs WHERE NOT EXISTS (SELECT 1 FROM points"
+                        " WHERE substr(source, 1, length(runs.run_id) + 4) = 'gh:' || runs.run_id || '/')"
+                    )
+        except (OSError, sqlite3.Error) as exc:
+            logger.debug("coverage history store not writable at %s: %s", self.db_path, exc)
+            return
+        self.stats.evictions += evicted
+
+    def has_run(self, run_id: str) -> bool:
+        """Return whether ``gh`` run *run_id* was already ingested."""
+        if not self.db_path.exists():
+            return False
+        try:
+            with closing(self._connect()) as conn:
+                return conn.execute("SELECT 1 FROM runs WHERE run_id = ?", (run_id,)).fetchone() is not None
+        except (OSError, sqlite3.Error) as exc:
+            logger.debug("coverage history store unavailable at %s: %s", self.db_path, exc)
+            return False
+
+    def mark_run(self, run_id: str) -> None:
+        """Record that every coverage XML of ``gh`` run *run_id* has been ingested."""
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute("INSERT OR REPLACE INTO runs VALUES (?, ?)", (run_id, time.time()))
+        except (OSError, sqlite3.Error) as exc:
+            logger.debug("coverage history store not writable at %s: %s", self.db_path, exc)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def points(
+        self,
+        *,
+        since: datetime | None = None,
+        source_prefixes: Sequence[str] | None = None,
+    ) -> list[CoveragePoint]:
+        """Return stored points sorted by ``(date, suite)``; ``[]`` if the store cannot be read.
+
+        Args:
+            since: Only points taken at or after this instant.
+            source_prefixes: Only rows whose source starts with one of these.
+        """
+        clauses: list[str] = []
+        params: list[object] = []
+        if since is not None:
+            clauses.append("taken_at >= ?")
+            params.append(since.timestamp())
+        if source_prefixes is not None:
+            if not source_prefixes:
+                return []
+            clauses.append("(" + " OR ".join("substr(source, 1, ?) = ?" for _ in source_prefixes) + ")")
+            for prefix in source_prefixes:
+                params.extend((len(prefix), prefix))
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        try:
+            with closing(self._connect()) as conn:
+                rows = conn.execute(
+                    f"SELECT {_POINT_COLUMNS} FROM points{where} ORDER BY taken_at, suite",  # noqa: S608 — fixed clauses.
+                    params,
+                ).fetchall()
+        except (OSError, sqlite3.Error) as exc:
+            logger.debug("coverage history store unavailable at %s: %s", self.db_path, exc)
+            return []
+        return [_point_from_row(row) for row in rows]
+
+    def module_trend(
+        self,
+        name: str,
+        *,
+        suite: str | None = None,
+        since: datetime | None = None,
+        sources: Sequence[str] | None = None,
+    ) -> list[tuple[datetime, float]]:
+        """Return ``(date, percentage)`` for module *name*, oldest first; ``[]`` if the store cannot be read.
+
+        *sources* limits the trend to reports with those store keys
+        (:attr:`CoveragePoint.source`).
+        """
+        sql = (
+            "SELECT p.taken_at, m.percentage FROM modules m JOIN points p ON p.source = m.source"
+            " WHERE m.name = ? AND (? IS NULL OR p.suite = ?) AND p.taken_at >= ?"
+            f" AND {_SOURCES_CLAUSE.format(alias='m')} ORDER BY p.taken_at"
+        )
+        cutoff = since.timestamp() if since is not None else float("-inf")
+        scope = _sources_param(sources)
+        try:
+            with closing(self._connect()) as conn:
+                rows = conn.execute(sql, (name, suite, suite, cutoff, scope, scope)).fetchall()
+        except (OSError, sqlite3.Error) as exc:
+            logger.debug("coverage history store unavailable at %s: %s", self.db_path, exc)
+            return []
+        return [(datetime.fromtimestamp(taken_at, tz=timezone.utc), percentage) for taken_at, percentage in rows]
+
+    def latest_modules(self, *, suite: str | None = None, sources: Sequence[str] | None = None) -> list[ModuleCoverage]:
+        """Return every module's rate from its most recent point, lowest coverage first.
+
+        *sources* limits the answer to reports with those store keys; ``[]``
+        if the store cannot be read.
+        """
+        sql = (
+            "SELECT m.name, m.percentage FROM modules m JOIN points p ON p.source = m.source"
+            f" WHERE (? IS NULL OR p.suite = ?) AND {_SOURCES_CLAUSE.format(alias='m')} AND p.taken_at = ("
+            "  SELECT MAX(p2.taken_at) FROM modules m2 JOIN points p2 ON p2.source = m2.source"
+            f"  WHERE m2.name = m.name AND (? IS NULL OR p2.suite = ?) AND {_SOURCES_CLAUSE.format(alias='m2')})"
+            " ORDER BY m.percentage, m.name"
+        )
+        scope = _sources_param(sources)
+        try:
+            with closing(self._connect()) as conn:
+                rows = conn.execute(sql, (suite, suite, scope, scope, suite, suite, scope, scope)).fetchall()
+        except (OSError, sqlite3.Error) as exc:
+            logger.debug("coverage history store unavailable at %s: %s", self.db_path, exc)
+            return []
+        return [ModuleCoverage(name=row[0], percentage=row[1]) for row in rows]
+
+
+def default_coverage_history_store() -> CoverageHistoryStore | None:
+    """Return a store at the location selected by ``TEMPLATE_COVERAGE_HISTORY_CACHE``, or ``None`` when disabled."""
+    path = user_cache_path(ENV_COVERAGE_HISTORY_CACHE, "coverage-history.sqlite")
+    return CoverageHistoryStore(path) if path is not None else None
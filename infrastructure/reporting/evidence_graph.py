@@ -28,22 +28,43 @@ Edge relations
 ``validates`` — validator stage → artifact it checks.
 ``supports``  — artifact → claim it backs (only when a claim ledger exists).
 
+Evidence flows along ``produces`` and ``supports`` edges and *against*
+``consumes`` edges (the artifact feeds the stage). ``validates`` edges check
+an artifact without deriving anything from it, so they are not part of the
+flow. :meth:`EvidenceGraph.upstream` and :meth:`EvidenceGraph.downstream`
+walk that flow transitively: the upstream provenance of a figure, or every
+claim affected by a change to an artifact.
+
+Indexing
+--------
+:class:`EvidenceGraph` keeps ``nodes``/``edges`` as plain append-only lists
+(the serialized form) and maintains an id → node map, per-type id lists and
+forward/reverse adjacency beside them, so insertion validation and every
+query are O(1) per touched node or edge instead of a scan of the whole graph.
+
 Determinism
 -----------
 :func:`graph_to_json` emits nodes and edges in sorted order with
 ``sort_keys=True`` so that the same inputs yield byte-identical output. No
 wall-clock time or randomness is baked into any generated artifact.
+:func:`graph_to_sqlite` writes the same content to an indexed SQLite file for
+graphs too large to load as one JSON document; :func:`graph_from_sqlite`
+restores a graph whose ``to_dict`` equals the original's.
 
 CLI
 ---
-``python -m infrastructure.reporting.evidence_graph build <project> [--json out]``
+``python -m infrastructure.reporting.evidence_graph build <project> [--json out] [--sqlite out]``
 """
 
 from __future__ import annotations
 
 import argparse
 import json
+import os
+import sqlite3
 import sys
+from collections import deque
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -62,7 +83,9 @@ __all__ = [
     "EvidenceEdge",
     "EvidenceGraph",
     "build_evidence_graph",
+    "graph_from_sqlite",
     "graph_to_json",
+    "graph_to_sqlite",
     "main",
 ]
 
@@ -147,6 +170,14 @@ class EvidenceEdge:
         )
 
 
+# Evidence-flow direction per relation: +1 follows the edge, -1 reverses it.
+_FLOW_DIRECTION: dict[RelationType, int] = {
+    RelationType.PRODUCES: 1,
+    RelationType.SUPPORTS: 1,
+    RelationType.CONSUMES: -1,
+}
+
+
 @dataclass
 class EvidenceGraph:
     """A queryable evidence graph for a single project.
@@ -155,6 +186,9 @@ class EvidenceGraph:
     every edge endpoint must reference an existing node. ``notes`` records any
     gaps (e.g. an absent claim ledger) so callers never confuse "no data" with
     "fabricated data".
+
+    ``nodes`` and ``edges`` are append-only; entries appended to them directly
+    (as :meth:`from_dict` does) are indexed on the next query.
     """
 
     project: str
@@ -162,53 +196,129 @@ class EvidenceGraph:
     edges: list[EvidenceEdge] = field(default_factory=list)
     notes: list[str] = field(default_factory=list)
 
+    _by_id: dict[str, EvidenceNode] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _by_type: dict[NodeType, list[str]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _adjacent: dict[str, set[str]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _downstream: dict[str, set[str]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _upstream: dict[str, set[str]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _indexed: tuple[int, int] = field(default=(0, 0), init=False, repr=False, compare=False)
+
+    # -- indexing ---------------------------------------------------------- #
+    def _sync(self) -> None:
+        """Index nodes/edges appended since the last call (rebuild if lists shrank)."""
+        node_count, edge_count = self._indexed
+        if node_count > len(self.nodes) or edge_count > len(self.edges):
+            for index in (self._by_id, self._by_type, self._adjacent, self._downstream, self._upstream):
+                index.clear()
+            node_count = edge_count = 0
+        for node in self.nodes[node_count:]:
+            self._index_node(node)
+        for edge in self.edges[edge_count:]:
+            self._index_edge(edge)
+        self._indexed = (len(self.nodes), len(self.edges))
+
+    def _index_node(self, node: EvidenceNode) -> None:
+        self._by_id[node.id] = node
+        self._by_type.setdefault(node.type, []).append(node.id)
+
+    def _index_edge(self, edge: EvidenceEdge) -> None:
+        self._adjacent.setdefault(edge.source, set()).add(edge.target)
+        self._adjacent.setdefault(edge.target, set()).add(edge.source)
+        direction = _FLOW_DIRECTION.get(edge.relation)
+        if direction is not None:
+            origin, derived = (edge.source, edge.target) if direction > 0 else (edge.target, edge.source)
+            self._downstream.setdefault(origin, set()).add(derived)
+            self._upstream.setdefault(derived, set()).add(origin)
+
+    def _sorted_nodes(self, ids: Iterable[str]) -> list[EvidenceNode]:
+        return [self._by_id[i] for i in sorted(ids)]
+
     # -- mutation (validated) --------------------------------------------- #
     def add_node(self, node: EvidenceNode) -> None:
         """Append *node*, raising on a duplicate id."""
-        if any(existing.id == node.id for existing in self.nodes):
+        self._sync()
+        if node.id in self._by_id:
             raise ValueError(f"duplicate node id: {node.id!r}")
         self.nodes.append(node)
+        self._index_node(node)
+        self._indexed = (len(self.nodes), self._indexed[1])
 
     def add_edge(self, edge: EvidenceEdge) -> None:
         """Append *edge*, raising if either endpoint is unknown."""
-        ids = {n.id for n in self.nodes}
-        if edge.source not in ids:
+        self._sync()
+        if edge.source not in self._by_id:
             raise ValueError(f"edge references unknown source node: {edge.source!r}")
-        if edge.target not in ids:
+        if edge.target not in self._by_id:
             raise ValueError(f"edge references unknown target node: {edge.target!r}")
         self.edges.append(edge)
+        self._index_edge(edge)
+        self._indexed = (self._indexed[0], len(self.edges))
 
     # -- query API --------------------------------------------------------- #
+    def get(self, node_id: str) -> EvidenceNode | None:
+        """Return the node with *node_id*, or ``None``."""
+        self._sync()
+        return self._by_id.get(node_id)
+
+    def __contains__(self, node_id: object) -> bool:
+        self._sync()
+        return node_id in self._by_id
+
     def nodes_by_type(self, node_type: NodeType) -> list[EvidenceNode]:
         """Return all nodes of *node_type* (sorted by id for determinism)."""
-        return sorted((n for n in self.nodes if n.type is node_type), key=lambda n: n.id)
+        self._sync()
+        return self._sorted_nodes(self._by_type.get(node_type, ()))
 
     def neighbors(self, node_id: str) -> list[EvidenceNode]:
         """Return nodes directly connected to *node_id* (in or out).
 
         Raises ``KeyError`` if *node_id* is not in the graph.
         """
-        by_id = {n.id: n for n in self.nodes}
-        if node_id not in by_id:
+        self._sync()
+        if node_id not in self._by_id:
+            raise KeyError(node_id)
+        return self._sorted_nodes(self._adjacent.get(node_id, set()) - {node_id})
+
+    def upstream(self, node_id: str) -> list[EvidenceNode]:
+        """Return every node *node_id* transitively derives from (its provenance).
+
+        For a figure artifact: the stage that produced it, the artifacts that
+        stage consumed, their producers, and so on. Sorted by id; raises
+        ``KeyError`` if *node_id* is not in the graph.
+        """
+        return self._reachable(node_id, self._upstream)
+
+    def downstream(self, node_id: str) -> list[EvidenceNode]:
+        """Return every node transitively derived from *node_id*.
+
+        For an artifact: the stages consuming it, what they produce, and the
+        claims those artifacts support. Sorted by id; raises ``KeyError`` if
+        *node_id* is not in the graph.
+        """
+        return self._reachable(node_id, self._downstream)
+
+    def claims_affected_by(self, node_id: str) -> list[EvidenceNode]:
+        """Return the claims downstream of *node_id* (sorted by id)."""
+        return [n for n in self.downstream(node_id) if n.type is NodeType.CLAIM]
+
+    def _reachable(self, node_id: str, adjacency: dict[str, set[str]]) -> list[EvidenceNode]:
+        self._sync()
+        if node_id not in self._by_id:
             raise KeyError(node_id)
-        connected: set[str] = set()
-        for edge in self.edges:
-            if edge.source == node_id:
-                connected.add(edge.target)
-            elif edge.target == node_id:
-                connected.add(edge.source)
-        return sorted((by_id[i] for i in connected), key=lambda n: n.id)
+        seen = {node_id}
+        queue = deque([node_id])
+        while queue:
+            for nxt in adjacency.get(queue.popleft(), ()):
+                if nxt not in seen:
+                    seen.add(nxt)
+                    queue.append(nxt)
+        seen.discard(node_id)
+        return self._sorted_nodes(seen)
 
     def artifacts_missing_metadata(self) -> list[EvidenceNode]:
         """Return artifact nodes lacking any producer/consumer/validator edge."""
-        connected: set[str] = set()
-        for edge in self.edges:
-            connected.add(edge.source)
-            connected.add(edge.target)
-        return sorted(
-            (n for n in self.nodes if n.type is NodeType.ARTIFACT and n.id not in connected),
-            key=lambda n: n.id,
-        )
+        self._sync()
+        return self._sorted_nodes(i for i in self._by_type.get(NodeType.ARTIFACT, ()) if i not in self._adjacent)
 
     # -- serialization ----------------------------------------------------- #
     def to_dict(self) -> dict[str, Any]:
@@ -471,6 +581,107 @@ def graph_to_json(graph: EvidenceGraph) -> str:
     return json.dumps(graph.to_dict(), indent=2, sort_keys=True, ensure_ascii=False)
 
 
+_SQLITE_SCHEMA = """
+CREATE TABLE meta  (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE nodes (
+    id              TEXT PRIMARY KEY,
+    type            TEXT NOT NULL,
+    source_of_truth TEXT NOT NULL,
+    label           TEXT NOT NULL,
+    attributes      TEXT NOT NULL
+);
+CREATE TABLE edges (source TEXT NOT NULL, target TEXT NOT NULL, relation TEXT NOT NULL);
+CREATE TABLE notes (position INTEGER PRIMARY KEY, note TEXT NOT NULL);
+CREATE INDEX nodes_by_type ON nodes (type, id);
+CREATE INDEX edges_by_source ON edges (source, relation);
+CREATE INDEX edges_by_target ON edges (target, relation);
+"""
+
+_SQLITE_FORMAT = "evidence-graph/1"
+
+
+def graph_to_sqlite(graph: EvidenceGraph, path: Path | str) -> Path:
+    """Write *graph* to an indexed SQLite file at *path* and return the path.
+
+    Rows are inserted in the same sorted order as :meth:`EvidenceGraph.to_dict`
+    (node attributes as canonical JSON), and the file is written to a sibling
+    temp path and renamed into place, so readers never see a partial graph.
+    The ``edges_by_source``/``edges_by_target`` indexes let other tools walk
+    adjacency with SQL without loading the whole graph.
+    """
+    out_path = Path(path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = out_path.with_name(f".{out_path.name}.tmp")
+    tmp_path.unlink(missing_ok=True)
+    payload = graph.to_dict()
+    conn = sqlite3.connect(str(tmp_path))
+    try:
+        with conn:
+            conn.executescript(_SQLITE_SCHEMA)
+            conn.executemany(
+                "INSERT INTO meta (key, value) VALUES (?, ?)",
+                [("format", _SQLITE_FORMAT), ("project", payload["project"])],
+            )
+            conn.executemany(
+                "INSERT INTO nodes (id, type, source_of_truth, label, attributes) VALUES (?, ?, ?, ?, ?)",
+                (
+                    (
+                        n["id"],
+                        n["type"],
+                        n["source_of_truth"],
+                        n["label"],
+                        json.dumps(n["attributes"], sort_keys=True, separators=(",", ":"), ensure_ascii=False),
+                    )
+                    for n in payload["nodes"]
+                ),
+            )
+            conn.executemany(
+                "INSERT INTO edges (source, target, relation) VALUES (?, ?, ?)",
+                ((e["source"], e["target"], e["relation"]) for e in payload["edges"]),
+            )
+            conn.executemany("INSERT INTO notes (position, note) VALUES (?, ?)", enumerate(payload["notes"]))
+    finally:
+        conn.close()
+    os.replace(tmp_path, out_path)
+    return out_path
+
+
+def graph_from_sqlite(path: Path | str) -> EvidenceGraph:
+    """Load a graph written by :func:`graph_to_sqlite`.
+
+    Raises ``ValueError`` if *path* is not an evidence-graph database.
+    """
+    conn = sqlite3.connect(f"file:{Path(path)}?mode=ro", uri=True)
+    try:
+        try:
+            meta = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+        except sqlite3.DatabaseError as exc:
+            raise ValueError(f"{path} is not an evidence-graph database: {exc}") from exc
+        if meta.get("format") != _SQLITE_FORMAT:
+            raise ValueError(f"{path} has unsupported evidence-graph format {meta.get('format')!r}")
+        graph = EvidenceGraph(
+            project=meta["project"],
+            notes=[row[0] for row in conn.execute("SELECT note FROM notes ORDER BY position")],
+        )
+        for node_id, node_type, source_of_truth, label, attributes in conn.execute(
+            "SELECT id, type, source_of_truth, label, attributes FROM nodes ORDER BY rowid"
+        ):
+            graph.nodes.append(
+                EvidenceNode(
+                    id=node_id,
+                    type=NodeType(node_type),
+                    source_of_truth=source_of_truth,
+                    label=label,
+                    attributes=json.loads(attributes),
+                )
+            )
+        for source, target, relation in conn.execute("SELECT source, target, relation FROM edges ORDER BY rowid"):
+            graph.edges.append(EvidenceEdge(source=source, target=target, relation=RelationType(relation)))
+    finally:
+        conn.close()
+    return graph
+
+
 # --------------------------------------------------------------------------- #
 # CLI
 # --------------------------------------------------------------------------- #
@@ -488,6 +699,12 @@ def _build_parser() -> argparse.ArgumentParser:
         metavar="PATH",
         help="Write JSON to PATH instead of stdout.",
     )
+    build.add_argument(
+        "--sqlite",
+        dest="sqlite_out",
+        metavar="PATH",
+        help="Also write an indexed SQLite copy of the graph to PATH.",
+    )
     build.add_argument(
         "--repo-root",
         default=".",
@@ -502,6 +719,8 @@ def main(argv: list[str] | None = None) -> int:
     if args.command == "build":
         graph = build_evidence_graph(args.repo_root, args.project)
         payload = graph_to_json(graph)
+        if args.sqlite_out:
+            logger.info("Wrote evidence graph database to %s", graph_to_sqlite(graph, args.sqlite_out))
         if args.json_out:
             out_path = Path(args.json_out)
             out_path.parent.mkdir(parents=True, exist_ok=True)
@@ -1,11 +1,19 @@
 """Minimal HTTP client for connector implementations.
 
-Wraps :mod:`urllib.request` with:
+Wraps :mod:`http.client` with:
 
 * Configurable ``User-Agent`` header.
 * Per-request timeout.
-* Exponential-backoff retry on transient failures (429, 503, 500).
-* In-memory TTL cache keyed on the full request URL.
+* Keep-alive connections reused per host through the shared
+  :class:`~infrastructure.search.connectors.transport.HostConnectionPool`
+  (requests routed through an environment proxy fall back to :mod:`urllib`).
+* Exponential-backoff retry on transient failures (429, 503, 500), honouring
+  a numeric ``Retry-After``.
+* Optional per-connector concurrency and spacing limits.
+* A small in-memory LRU of decoded responses in front of the shared on-disk
+  :class:`~infrastructure.search.connectors.http_cache.ConnectorHttpCache`,
+  which revalidates stale entries with ``ETag`` / ``Last-Modified`` and can
+  replay a whole stage offline.
 
 All connector implementations should use this client so that retry logic
 and caching live in one place.
@@ -13,15 +21,34 @@ and caching live in one place.
 
 from __future__ import annotations
 
-import hashlib
+import http.client
 import json
+import threading
 import time
 import urllib.error
 import urllib.parse
 import urllib.request
+from collections import OrderedDict
+from contextlib import nullcontext
 from dataclasses import dataclass
+from email.message import Message
 from typing import Any
 
+from infrastructure.search.connectors.http_cache import (
+    DEFAULT_CONNECTOR_TTL,
+    ConnectorHttpCache,
+    connector_ttl,
+    default_connector_http_cache,
+    offline_replay_enabled,
+    response_cache_key,
+)
+from infrastructure.search.connectors.transport import (
+    ConnectorRateLimiter,
+    HostConnectionPool,
+    rate_limiter_for,
+    shared_pool,
+)
+
 
 _DEFAULT_USER_AGENT = (
     "infrastructure-connectors/1.0 (+https://github.com/template/infrastructure; mailto:team@example.org)"
@@ -30,6 +57,20 @@ _DEFAULT_USER_AGENT = (
 #: HTTP status codes that warrant an automatic retry.
 _RETRYABLE_STATUSES: frozenset[int] = frozenset({429, 500, 502, 503, 504})
 
+_REDIRECT_STATUSES: frozenset[int] = frozenset({301, 302, 303, 307, 308})
+_MAX_REDIRECTS = 5
+
+#: Longest ``Retry-After`` (seconds) honoured before falling back to back-off.
+_MAX_RETRY_AFTER = 60.0
+
+#: Errors meaning the server closed an idle keep-alive connection.
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+#: Decoded responses kept in memory per client before the oldest is dropped.
+_DEFAULT_MEMORY_ENTRIES = 128
+
+_USE_DEFAULT_CACHE: Any = object()
+
 
 @dataclass
 class _CacheEntry:
@@ -37,6 +78,20 @@ class _CacheEntry:
     expires_at: float  # monotonic time
 
 
+@dataclass
+class _Response:
+    body: bytes | None  # ``None`` for 304 Not Modified
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+class _StatusError(Exception):
+    def __init__(self, code: int, retry_after: str | None = None) -> None:
+        super().__init__(f"HTTP {code}")
+        self.code = code
+        self.retry_after = retry_after
+
+
 class ConnectorHttpClient:
     """Stdlib-only HTTP client used by all connector implementations.
 
@@ -46,6 +101,15 @@ class ConnectorHttpClient:
         max_retries: Maximum number of retry attempts on transient errors.
         backoff_base: Base interval (seconds) for exponential back-off.
         ttl: Cache TTL in seconds.  Pass ``0`` to disable caching.
+        cache: On-disk response cache; defaults to
+            :func:`~infrastructure.search.connectors.http_cache.default_connector_http_cache`.
+            Pass ``None`` to keep responses in memory only.
+        namespace: Connector id recorded with stored responses, so
+            :meth:`clear_cache` only drops this connector's rows.
+        max_memory_entries: Bound on the in-memory layer.
+        rate_limiter: Shared concurrency/spacing limiter held around every
+            network attempt (cache hits never wait on it).
+        keep_alive: Reuse pooled connections; ``False`` opens one per request.
     """
 
     def __init__(
@@ -54,14 +118,35 @@ class ConnectorHttpClient:
         timeout: float = 20.0,
         max_retries: int = 3,
         backoff_base: float = 1.0,
-        ttl: float = 300.0,
+        ttl: float = DEFAULT_CONNECTOR_TTL,
+        *,
+        cache: ConnectorHttpCache | None = _USE_DEFAULT_CACHE,
+        namespace: str = "default",
+        max_memory_entries: int = _DEFAULT_MEMORY_ENTRIES,
+        rate_limiter: ConnectorRateLimiter | None = None,
+        keep_alive: bool = True,
     ) -> None:
         self.user_agent = user_agent
         self.timeout = timeout
         self.max_retries = max_retries
         self.backoff_base = backoff_base
         self.ttl = ttl
-        self._cache: dict[str, _CacheEntry] = {}
+        self.cache = default_connector_http_cache() if cache is _USE_DEFAULT_CACHE else cache
+        self.namespace = namespace
+        self.max_memory_entries = max_memory_entries
+        self.rate_limiter = rate_limiter
+        self.pool: HostConnectionPool | None = shared_pool() if keep_alive else None
+        self._cache: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._memory_lock = threading.Lock()
+
+    @classmethod
+    def for_connector(cls, connector_id: str) -> ConnectorHttpClient:
+        """Return a client using *connector_id*'s TTL and rate limits from the shared policy tables."""
+        return cls(
+            ttl=connector_ttl(connector_id),
+            namespace=connector_id,
+            rate_limiter=rate_limiter_for(connector_id),
+        )
 
     # ------------------------------------------------------------------
     # Public API
@@ -89,12 +174,17 @@ class ConnectorHttpClient:
             ConnectorHttpError: On JSON decoding failures.
         """
         full_url = self._build_url(url, params)
-        cached = self._cache_get(full_url)
+        key = "json:" + response_cache_key(full_url, self._headers(headers or {}))
+        cached = self._cache_get(key)
         if cached is not None:
             return cached
 
-        response_data = self._get_with_retry(full_url, headers or {})
-        self._cache_set(full_url, response_data)
+        raw = self._fetch(full_url, headers or {})
+        try:
+            response_data = json.loads(raw)
+        except json.JSONDecodeError as exc:
+            raise ConnectorHttpError(f"Invalid JSON from {full_url}") from exc
+        self._cache_set(key, response_data)
         return response_data
 
     def get_text(
@@ -117,19 +207,22 @@ class ConnectorHttpClient:
             ConnectorHttpError: On HTTP-level errors.
         """
         full_url = self._build_url(url, params)
-        cached = self._cache_get(full_url)
+        key = "text:" + response_cache_key(full_url, self._headers(headers or {}))
+        cached = self._cache_get(key)
         if cached is not None:
             return str(cached)
 
-        resp = self._request_with_retry(full_url, headers or {})
-        text = resp.decode("utf-8", errors="replace")
-        self._cache_set(full_url, text)
+        text = self._fetch(full_url, headers or {}).decode("utf-8", errors="replace")
+        self._cache_set(key, text)
         return text
 
     def clear_cache(self) -> int:
-        """Evict all cached entries and return the number removed."""
-        count = len(self._cache)
-        self._cache.clear()
+        """Evict this client's in-memory and on-disk entries and return the number removed."""
+        with self._memory_lock:
+            count = len(self._cache)
+            self._cache.clear()
+        if self.cache is not None:
+            count += self.cache.clear(self.namespace)
         return count
 
     # ------------------------------------------------------------------
@@ -144,24 +237,36 @@ class ConnectorHttpClient:
         sep = "&" if "?" in url else "?"
         return f"{url}{sep}{encoded}"
 
-    def _build_request(self, url: str, extra_headers: dict[str, str]) -> urllib.request.Request:
+    def _headers(self, extra_headers: dict[str, str]) -> dict[str, str]:
         headers = {"User-Agent": self.user_agent, "Accept": "application/json"}
         headers.update(extra_headers)
-        return urllib.request.Request(url, headers=headers)
+        return headers
 
     def _request_with_retry(self, url: str, headers: dict[str, str]) -> bytes:
-        req = self._build_request(url, headers)
+        body = self._exchange(url, headers).body
+        if body is None:
+            raise ConnectorHttpError(f"HTTP 304 from {url} without a cached response")
+        return body
+
+    def _exchange(self, url: str, headers: dict[str, str]) -> _Response:
+        """Send one GET with retries; a ``304`` is returned with ``body=None``.
+
+        The rate-limit slot is held only while a request is on the wire, so
+        a back-off sleep never stalls other searches against the connector.
+        """
         last_exc: Exception | None = None
         for attempt in range(self.max_retries + 1):
             try:
-                with urllib.request.urlopen(req, timeout=self.timeout) as resp:  # nosec B310 — URLs are hard-coded to known public science APIs (OpenAlex, arXiv, etc.)
-                    return bytes(resp.read())
-            except urllib.error.HTTPError as exc:
+                with self._request_slot():
+                    return self._send(url, headers)
+            except _StatusError as exc:
                 if exc.code in _RETRYABLE_STATUSES and attempt < self.max_retries:
-                    time.sleep(self.backoff_base * (2**attempt))
+                    time.sleep(self._backoff(attempt, exc.retry_after))
                     last_exc = exc
                     continue
                 raise ConnectorHttpError(f"HTTP {exc.code} from {url}") from exc
+            except ConnectorHttpError:
+                raise
             except Exception as exc:
                 if attempt < self.max_retries:
                     time.sleep(self.backoff_base * (2**attempt))
@@ -170,38 +275,148 @@ class ConnectorHttpClient:
                 raise ConnectorHttpError(f"Request failed: {url}") from exc
         raise ConnectorHttpError(f"Exhausted retries for {url}") from last_exc
 
-    def _get_with_retry(self, url: str, headers: dict[str, str]) -> Any:
-        raw = self._request_with_retry(url, headers)
+    def _request_slot(self) -> Any:
+        return self.rate_limiter.slot() if self.rate_limiter is not None else nullcontext()
+
+    def _backoff(self, attempt: int, retry_after: str | None) -> float:
+        if retry_after is not None and retry_after.strip().isdigit():
+            return min(float(retry_after.strip()), _MAX_RETRY_AFTER)
+        return float(self.backoff_base * 2**attempt)
+
+    def _send(self, url: str, headers: dict[str, str]) -> _Response:
+        """Perform one GET (following redirects) over a pooled keep-alive connection."""
+        request_headers = self._headers(headers)
+        target = url
+        for _ in range(_MAX_REDIRECTS + 1):
+            parts = urllib.parse.urlsplit(target)
+            if self.pool is None or _uses_proxy(parts):
+                return self._send_urllib(target, request_headers)
+            if parts.scheme not in ("http", "https") or not parts.hostname:
+                raise ConnectorHttpError(f"Unsupported URL: {target}")
+            key = (parts.scheme, parts.hostname, parts.port or (443 if parts.scheme == "https" else 80))
+            path = urllib.parse.urlunsplit(("", "", parts.path or "/", parts.query, ""))
+            status, response_headers, body = self._round_trip(self.pool, key, path, request_headers)
+            location = response_headers.get("Location")
+            if status in _REDIRECT_STATUSES and location:
+                target = urllib.parse.urljoin(target, location)
+                continue
+            return _response_for(status, response_headers, body)
+        raise ConnectorHttpError(f"Too many redirects from {url}")
+
+    def _round_trip(
+        self,
+        pool: HostConnectionPool,
+        key: tuple[str, str, int],
+        path: str,
+        headers: dict[str, str],
+    ) -> tuple[int, http.client.HTTPMessage, bytes]:
+        while True:
+            conn, reused = pool.acquire(key, self.timeout)
+            try:
+                conn.request("GET", path, headers=headers)
+                response = conn.getresponse()
+                body = response.read()
+            except _STALE_CONNECTION_ERRORS:
+                conn.close()
+                if reused:
+                    continue  # the server dropped an idle connection; try another
+                raise
+            except BaseException:
+                conn.close()
+                raise
+            if response.will_close:
+                conn.close()
+            else:
+                pool.release(key, conn)
+            return response.status, response.headers, body
+
+    def _send_urllib(self, url: str, headers: dict[str, str]) -> _Response:
+        req = urllib.request.Request(url, headers=headers)
         try:
-            return json.loads(raw)
-        except json.JSONDecodeError as exc:
-            raise ConnectorHttpError(f"Invalid JSON from {url}") from exc
+            with urllib.request.urlopen(req, timeout=self.timeout) as resp:  # nosec B310 — URLs are hard-coded to known public science APIs (OpenAlex, arXiv, etc.)
+                return _response_for(resp.status, resp.headers, bytes(resp.read()))
+        except urllib.error.HTTPError as exc:
+            return _response_for(exc.code, exc.headers, b"")
+
+    def _fetch(self, url: str, headers: dict[str, str]) -> bytes:
+        """Return the body for *url*, going through the on-disk cache when enabled.
+
+        Fresh entries are served without a request and stale ones are
+        revalidated, so an unchanged resource costs one ``304``. In offline
+        replay every stored entry counts as fresh and a miss raises.
+        """
+        disk = self.cache if self.ttl > 0 else None
+        if disk is None:
+            return self._request_with_retry(url, headers)
+
+        key = response_cache_key(url, self._headers(headers))
+        offline = offline_replay_enabled()
+        stored = disk.get(key)
+        if stored is not None and (stored.fresh or offline):
+            disk.record("hits")
+            return stored.body
+        if offline:
+            raise ConnectorHttpError(f"Offline replay has no cached response for {url}")
+
+        conditional = stored.conditional_headers() if stored is not None else {}
+        response = self._exchange(url, {**headers, **conditional})
+        if response.body is None:
+            if stored is None:
+                raise ConnectorHttpError(f"HTTP 304 from {url} without a cached response")
+            disk.refresh(key, self.ttl)
+            disk.record("revalidated")
+            return stored.body
+        disk.record("misses")
+        disk.put(
+            key,
+            namespace=self.namespace,
+            url=url,
+            body=response.body,
+            ttl=self.ttl,
+            etag=response.etag,
+            last_modified=response.last_modified,
+        )
+        return response.body
 
     # ------------------------------------------------------------------
     # Cache helpers
     # ------------------------------------------------------------------
 
-    @staticmethod
-    def _cache_key(url: str) -> str:
-        return hashlib.sha256(url.encode()).hexdigest()[:16]
-
-    def _cache_get(self, url: str) -> Any | None:
+    def _cache_get(self, key: str) -> Any | None:
         if self.ttl <= 0:
             return None
-        key = self._cache_key(url)
-        entry = self._cache.get(key)
-        if entry is None:
-            return None
-        if time.monotonic() > entry.expires_at:
-            del self._cache[key]
-            return None
-        return entry.data
-
-    def _cache_set(self, url: str, data: Any) -> None:
-        if self.ttl <= 0:
+        with self._memory_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() > entry.expires_at:
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return entry.data
+
+    def _cache_set(self, key: str, data: Any) -> None:
+        if self.ttl <= 0 or self.max_memory_entries <= 0:
             return
-        key = self._cache_key(url)
-        self._cache[key] = _CacheEntry(data=data, expires_at=time.monotonic() + self.ttl)
+        with self._memory_lock:
+            self._cache[key] = _CacheEntry(data=data, expires_at=time.monotonic() + self.ttl)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_memory_entries:
+                self._cache.popitem(last=False)
+
+
+def _uses_proxy(parts: urllib.parse.SplitResult) -> bool:
+    """Return whether the environment routes *parts* through a proxy (handled by :mod:`urllib`)."""
+    proxies = urllib.request.getproxies()
+    return bool(proxies.get(parts.scheme)) and not urllib.request.proxy_bypass(parts.hostname or "")
+
+
+def _response_for(status: int, headers: Message, body: bytes) -> _Response:
+    if status == 304:
+        return _Response(body=None)
+    if 200 <= status < 300:
+        return _Response(body=body, etag=headers.get("ETag"), last_modified=headers.get("Last-Modified"))
+    raise _StatusError(status, headers.get("Retry-After"))
 
 
 class ConnectorHttpError(Exception):
@@ -0,0 +1,294 @@
+"""Persistent, revalidating response cache shared by every connector.
+
+:class:`ConnectorHttpCache` stores GET response bodies in one SQLite file,
+zlib-compressed and keyed by ``sha256(url, request headers)``. Each row keeps
+the ``ETag`` and ``Last-Modified`` validators the server sent, so when an entry
+outlives its TTL :class:`~infrastructure.search.connectors.http.ConnectorHttpClient`
+revalidates it with ``If-None-Match`` / ``If-Modified-Since`` and a ``304`` only
+refreshes the expiry. The file is bounded: every store evicts the
+least-recently-used rows until the compressed payloads fit in ``max_bytes``.
+
+TTLs follow :data:`CONNECTOR_TTL_POLICY`: slowly changing structure and
+protein records stay fresh for a week, literature indexes for a day, and
+preprint feeds for six hours.
+
+The cache lives at ``$XDG_CACHE_HOME/template/connector-http.sqlite``;
+``TEMPLATE_CONNECTOR_HTTP_CACHE=<path>`` moves it and ``=off`` disables it.
+``TEMPLATE_CONNECTOR_HTTP_OFFLINE=1`` replays stored responses regardless of
+age and turns every miss into an error instead of a network request, so CI can
+rerun a connector-search stage from a cache file with no network at all. An
+unwritable location only costs the speed-up.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+
+from infrastructure.core.logging.utils import get_logger
+from infrastructure.core.user_cache import CacheStats, connect_cache_db, user_cache_path
+
+logger = get_logger(__name__)
+
+__all__ = [
+    "CONNECTOR_TTL_POLICY",
+    "DEFAULT_CONNECTOR_TTL",
+    "DEFAULT_MAX_BYTES",
+    "ENV_CONNECTOR_HTTP_CACHE",
+    "ENV_CONNECTOR_HTTP_OFFLINE",
+    "CachedResponse",
+    "ConnectorHttpCache",
+    "ConnectorHttpCacheStats",
+    "connector_ttl",
+    "default_connector_http_cache",
+    "offline_replay_enabled",
+    "response_cache_key",
+]
+
+ENV_CONNECTOR_HTTP_CACHE = "TEMPLATE_CONNECTOR_HTTP_CACHE"
+ENV_CONNECTOR_HTTP_OFFLINE = "TEMPLATE_CONNECTOR_HTTP_OFFLINE"
+
+#: TTL (seconds) for clients that do not name a connector.
+DEFAULT_CONNECTOR_TTL = 300.0
+
+#: Default upper bound on the stored (compressed) payload bytes.
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_HOUR = 3600.0
+_DAY = 24 * _HOUR
+
+#: Freshness lifetime per connector id; stale entries are revalidated, not refetched.
+CONNECTOR_TTL_POLICY: Mapping[str, float] = {
+    "arxiv": 6 * _HOUR,
+    "biorxiv": 6 * _HOUR,
+    "crossref": _DAY,
+    "europepmc": _DAY,
+    "openalex": _DAY,
+    "semantic_scholar": _DAY,
+    "pdb": 7 * _DAY,
+    "uniprot": 7 * _DAY,
+}
+
+# Bump when the key layout, payload encoding or table layout changes.
+_CACHE_SCHEMA_VERSION = 1
+
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    cache_key     TEXT PRIMARY KEY,
+    namespace     TEXT NOT NULL,
+    url           TEXT NOT NULL,
+    body          BLOB NOT NULL,
+    size          INTEGER NOT NULL,
+    etag          TEXT,
+    last_modified TEXT,
+    stored_at     REAL NOT NULL,
+    expires_at    REAL NOT NULL,
+    last_used     REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used);
+"""
+
+
+@dataclass
+class ConnectorHttpCacheStats(CacheStats):
+    """Counters for one cache instance.
+
+    ``hits`` were served without a request, ``revalidated`` were confirmed by a
+    ``304``, ``misses`` needed a full response, ``stores`` were written and
+    ``evictions`` were dropped to respect the size bound.
+    """
+
+    revalidated: int = 0
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A stored response body with its validators and wall-clock expiry."""
+
+    body: bytes
+    etag: str | None
+    last_modified: str | None
+    expires_at: float
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Return the ``If-None-Match`` / ``If-Modified-Since`` headers for revalidation."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def connector_ttl(connector_id: str | None) -> float:
+    """Return the :data:`CONNECTOR_TTL_POLICY` lifetime for *connector_id*."""
+    if not connector_id:
+        return DEFAULT_CONNECTOR_TTL
+    return CONNECTOR_TTL_POLICY.get(connector_id, DEFAULT_CONNECTOR_TTL)
+
+
+def response_cache_key(url: str, headers: Mapping[str, str]) -> str:
+    """Identify a GET by its full URL and the request headers that shape the body.
+
+    ``User-Agent`` is excluded so a polite-pool contact change does not
+    invalidate every stored response.
+    """
+    varying = {name.lower(): value for name, value in headers.items() if name.lower() != "user-agent"}
+    payload = json.dumps({"schema": _CACHE_SCHEMA_VERSION, "url": url, "headers": varying}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def offline_replay_enabled() -> bool:
+    """Return whether ``TEMPLATE_CONNECTOR_HTTP_OFFLINE`` asks for cache-only replay."""
+    return os.environ.get(ENV_CONNECTOR_HTTP_OFFLINE, "").strip().lower() in _TRUTHY
+
+
+class ConnectorHttpCache:
+    """SQLite store of compressed connector responses with LRU size eviction.
+
+    Process-safe: each operation opens its own connection, so concurrent
+    pipeline stages and agent sessions can share one file.
+    """
+
+    def __init__(self, db_path: Path | str, *, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """Open (lazily) the cache at ``db_path``, bounded to ``max_bytes`` of payload."""
+        self.db_path = Path(db_path)
+        self.max_bytes = max_bytes
+        self.stats = ConnectorHttpCacheStats()
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        return connect_cache_db(self.db_path, _SCHEMA, schema_version=_CACHE_SCHEMA_VERSION)
+
+    def record(self, field: str, amount: int = 1) -> None:
+        """Add *amount* to the ``stats`` counter named *field*."""
+        with self._lock:
+            setattr(self.stats, field, getattr(self.stats, field) + amount)
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Return the stored response for *key* (fresh or stale) and mark it recently used."""
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    row = conn.execute(
+                        "SELECT body, etag, last_modified, expires_at FROM responses WHERE cache_key = ?",
+                        (key,),
+                    ).fetchone()
+                    if row is not None:
+                        conn.execute("UPDATE responses SET last_used = ? WHERE cache_key = ?", (time.time(), key))
+            finally:
+                conn.close()
+            if row is None:
+                return None
+            return CachedResponse(
+                body=zlib.decompress(row[0]),
+                etag=row[1],
+                last_modified=row[2],
+                expires_at=float(row[3]),
+            )
+        except (OSError, sqlite3.Error, zlib.error) as exc:
+            logger.debug("connector HTTP cache unavailable at %s: %s", self.db_path, exc)
+            return None
+
+    def put(
+        self,
+        key: str,
+        *,
+        namespace: str,
+        url: str,
+        body: bytes,
+        ttl: float,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Store *body* for *ttl* seconds, then evict LRU rows beyond ``max_bytes``.
+
+        Storage errors are ignored; the cache is an optimisation only.
+        """
+        compressed = zlib.compress(body, 6)
+        now = time.time()
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO responses (cache_key, namespace, url, body, size, etag,"
+                        " last_modified, stored_at, expires_at, last_used) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (key, namespace, url, compressed, len(compressed), etag, last_modified, now, now + ttl, now),
+                    )
+                    evicted = conn.execute(
+                        "DELETE FROM responses WHERE cache_key IN ("
+                        " SELECT cache_key FROM ("
+                        "  SELECT cache_key, SUM(size) OVER (ORDER BY last_used DESC, stored_at DESC) AS running"
+                        "  FROM responses)"
+                        " WHERE running > ?)",
+                        (self.max_bytes,),
+                    ).rowcount
+            finally:
+                conn.close()
+        except (OSError, sqlite3.Error) as exc:
+            logger.debug("connector HTTP cache not writable at %s: %s", self.db_path, exc)
+            return
+        self.record("stores")
+        if evicted:
+            self.record("evictions", evicted)
+
+    def refresh(self, key: str, ttl: float) -> None:
+        """Extend a revalidated entry's expiry by *ttl* seconds from now."""
+        now = time.time()
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.execute(
+                        "UPDATE responses SET expires_at = ?, last_used = ? WHERE cache_key = ?",
+                        (now + ttl, now, key),
+                    )
+            finally:
+                conn.close()
+        except (OSError, sqlite3.Error) as exc:
+            logger.debug("connector HTTP cache not writable at %s: %s", self.db_path, exc)
+
+    def total_bytes(self) -> int:
+        """Return the compressed payload bytes currently stored."""
+        if not self.db_path.exists():
+            return 0
+        conn = self._connect()
+        try:
+            return int(conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0])
+        finally:
+            conn.close()
+
+    def clear(self, namespace: str | None = None) -> int:
+        """Delete stored responses (only *namespace*'s when given). Returns the number of rows removed."""
+        if not self.db_path.exists():
+            return 0
+        conn = self._connect()
+        try:
+            with conn:
+                if namespace is None:
+                    return conn.execute("DELETE FROM responses").rowcount
+                return conn.execute("DELETE FROM responses WHERE namespace = ?", (namespace,)).rowcount
+        finally:
+            conn.close()
+
+
+def default_connector_http_cache() -> ConnectorHttpCache | None:
+    """Return a cache at the location selected by ``TEMPLATE_CONNECTOR_HTTP_CACHE``, or ``None`` when disabled."""
+    path = user_cache_path(ENV_CONNECTOR_HTTP_CACHE, "connector-http.sqlite")
+    return ConnectorHttpCache(path) if path is not None else None
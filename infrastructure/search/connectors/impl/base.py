@@ -31,7 +31,7 @@ class BaseConnector:
         self,
         http: ConnectorHttpClient | None = None,
     ) -> None:
-        self._http = http if http is not None else ConnectorHttpClient()
+        self._http = http if http is not None else ConnectorHttpClient.for_connector(self.name)
 
     def search(
         self,
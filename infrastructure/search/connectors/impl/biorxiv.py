@@ -34,7 +34,7 @@ class BiorxivConnector:
         base_url: str = _BASE_URL,
     ) -> None:
         self.server = server  # "biorxiv" or "medrxiv"
-        self._http = http_client or ConnectorHttpClient()
+        self._http = http_client or ConnectorHttpClient.for_connector(self.name)
         self.base_url = base_url
 
     def search(
@@ -35,7 +35,7 @@ class CrossrefConnector:
         base_url: str = _BASE_URL,
     ) -> None:
         self.mailto = mailto
-        self._http = http_client or ConnectorHttpClient()
+        self._http = http_client or ConnectorHttpClient.for_connector(self.name)
         self.base_url = base_url
 
     def search(
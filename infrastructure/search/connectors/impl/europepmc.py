@@ -32,7 +32,7 @@ class EuropePMCConnector:
         http_client: ConnectorHttpClient | None = None,
         base_url: str = _BASE_URL,
     ) -> None:
-        self._http = http_client or ConnectorHttpClient()
+        self._http = http_client or ConnectorHttpClient.for_connector(self.name)
         self.base_url = base_url
 
     def search(
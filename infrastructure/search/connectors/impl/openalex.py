@@ -36,7 +36,7 @@ class OpenAlexConnector:
         base_url: str = _BASE_URL,
     ) -> None:
         self.mailto = mailto
-        self._http = http_client or ConnectorHttpClient()
+        self._http = http_client or ConnectorHttpClient.for_connector(self.name)
         self.base_url = base_url
 
     def search(
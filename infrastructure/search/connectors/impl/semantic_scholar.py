@@ -36,7 +36,7 @@ class SemanticScholarConnector:
         base_url: str = _BASE_URL,
     ) -> None:
         self._api_key = api_key
-        self._http = http_client or ConnectorHttpClient()
+        self._http = http_client or ConnectorHttpClient.for_connector(self.name)
         self.base_url = base_url
 
     def _headers(self) -> dict[str, str]:
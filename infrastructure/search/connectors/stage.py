@@ -10,6 +10,8 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Sequence
@@ -17,7 +19,13 @@ from typing import Any, Sequence
 import yaml
 
 from infrastructure.core.logging.utils import get_logger, log_header, log_success
+from infrastructure.core.cli_parser import positive_int_arg
 from infrastructure.core.project_paths import find_repo_root, resolve_project_root
+from infrastructure.core.worker_policy import (
+    ENV_CONNECTOR_SEARCH_WORKERS,
+    clamp_worker_count,
+    resolve_bounded_workers,
+)
 from infrastructure.search.connectors import ConnectorRegistry, get_registry
 from infrastructure.search.connectors.types import SearchOptions
 
@@ -28,6 +36,9 @@ FAILURE = 1
 SKIP = 2
 DEFAULT_MAX_RESULTS = 10
 DEFAULT_OUTPUT = Path("output/data/connector_search/results.json")
+# Searches are network-bound, so the default is not tied to the CPU count;
+# per-connector politeness limits live on each connector's HTTP client.
+DEFAULT_SEARCH_WORKERS = 16
 _CONFIG_KEYS = frozenset({"enabled", "max_results", "connectors"})
 
 
@@ -58,14 +69,6 @@ class ConnectorSearchPlan:
     requests: tuple[ConnectorSearchRequest, ...]
 
 
-def _positive_int(value: str) -> int:
-    """Parse an argparse value that must be strictly positive."""
-    parsed = int(value)
-    if parsed <= 0:
-        raise argparse.ArgumentTypeError("must be a positive integer")
-    return parsed
-
-
 def build_parser() -> argparse.ArgumentParser:
     """Build the Stage 08 command-line parser."""
     parser = argparse.ArgumentParser(description="Connector Search Stage")
@@ -85,7 +88,7 @@ def build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "--max-results",
-        type=_positive_int,
+        type=positive_int_arg,
         help=f"Maximum results per query (default: config value or {DEFAULT_MAX_RESULTS})",
     )
     return parser
@@ -203,51 +206,82 @@ def build_plan(
     )
 
 
+def _search_workers(request_count: int, workers: int | None) -> int:
+    """Resolve the thread count for a plan: argument, then ``CONNECTOR_SEARCH_WORKERS``, then the default."""
+    if workers is not None:
+        return clamp_worker_count(workers, request_count)
+    if os.environ.get(ENV_CONNECTOR_SEARCH_WORKERS, "").strip():
+        return resolve_bounded_workers(env_name=ENV_CONNECTOR_SEARCH_WORKERS, item_count=request_count)
+    return clamp_worker_count(DEFAULT_SEARCH_WORKERS, request_count)
+
+
+def _run_search(
+    request: ConnectorSearchRequest,
+    registry: ConnectorRegistry,
+    max_results: int,
+) -> dict[str, Any]:
+    """Run one request and return its report entry; connector failures become ``status: error``."""
+    logger.info(f"Searching {request.connector}: {request.query}")
+    try:
+        connector = registry.get(request.connector)
+        hits = connector.search(
+            request.query,
+            SearchOptions(max_results=max_results),
+        )
+    except Exception as exc:  # noqa: BLE001 - connector boundary records per-source failures
+        return {
+            "connector": request.connector,
+            "query": request.query,
+            "status": "error",
+            "error": str(exc),
+            "results": [],
+        }
+    return {
+        "connector": request.connector,
+        "query": request.query,
+        "status": "success",
+        "error": None,
+        "results": [hit.to_dict() for hit in hits],
+    }
+
+
 def execute_plan(
     plan: ConnectorSearchPlan,
     *,
     registry: ConnectorRegistry | None = None,
+    workers: int | None = None,
 ) -> tuple[dict[str, Any], bool]:
-    """Execute a plan, isolating connector failures and returning its report."""
+    """Execute a plan, isolating connector failures and returning its report.
+
+    Requests run concurrently on a thread pool; each connector's HTTP client
+    enforces its own concurrency and spacing limits, so a plan takes about
+    as long as its slowest connector. Each search is logged as it starts;
+    the per-search outcomes are logged afterwards in plan order, which is
+    also the order of ``searches``.
+    """
     active_registry = registry or get_registry()
-    searches: list[dict[str, Any]] = []
+    pool_size = _search_workers(len(plan.requests), workers)
+    if pool_size <= 1:
+        searches = [_run_search(request, active_registry, plan.max_results) for request in plan.requests]
+    else:
+        with ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="connector-search") as executor:
+            searches = list(
+                executor.map(
+                    lambda request: _run_search(request, active_registry, plan.max_results),
+                    plan.requests,
+                )
+            )
+
     successful = 0
     total_hits = 0
-
-    for request in plan.requests:
-        logger.info(f"Searching {request.connector}: {request.query}")
-        try:
-            connector = active_registry.get(request.connector)
-            hits = connector.search(
-                request.query,
-                SearchOptions(max_results=plan.max_results),
-            )
-        except Exception as exc:  # noqa: BLE001 - connector boundary records per-source failures
-            logger.error(f"  → Failed: {exc}")
-            searches.append(
-                {
-                    "connector": request.connector,
-                    "query": request.query,
-                    "status": "error",
-                    "error": str(exc),
-                    "results": [],
-                }
-            )
+    for search in searches:
+        label = f"{search['connector']}: {search['query']}"
+        if search["status"] == "error":
+            logger.error(f"  {label} → Failed: {search['error']}")
             continue
-
-        serialised_hits = [hit.to_dict() for hit in hits]
-        searches.append(
-            {
-                "connector": request.connector,
-                "query": request.query,
-                "status": "success",
-                "error": None,
-                "results": serialised_hits,
-            }
-        )
         successful += 1
-        total_hits += len(hits)
-        logger.info(f"  → {len(hits)} results")
+        total_hits += len(search["results"])
+        logger.info(f"  {label} → {len(search['results'])} results")
 
     failed = len(searches) - successful
     report: dict[str, Any] = {
@@ -0,0 +1,158 @@
+"""Keep-alive connection pooling and per-connector rate limits.
+
+:class:`HostConnectionPool` keeps idle :class:`http.client.HTTPConnection`
+objects per ``(scheme, host, port)``, so consecutive requests to the same API
+reuse one TCP (and TLS) session instead of paying a handshake each time.
+:func:`shared_pool` is the process-wide pool every
+:class:`~infrastructure.search.connectors.http.ConnectorHttpClient` uses.
+
+:class:`ConnectorRateLimiter` caps how many requests one connector has in
+flight and spaces their start times, following :data:`CONNECTOR_RATE_POLICY`
+(arXiv asks for one request every three seconds, the unauthenticated Semantic
+Scholar pool for one per second). Limiters are shared per connector name via
+:func:`rate_limiter_for`, so concurrent searches against one source queue up
+while other sources proceed.
+"""
+
+from __future__ import annotations
+
+import http.client
+import ssl
+import threading
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+__all__ = [
+    "CONNECTOR_RATE_POLICY",
+    "ConnectorRateLimiter",
+    "HostConnectionPool",
+    "RateLimit",
+    "rate_limiter_for",
+    "shared_pool",
+]
+
+#: Idle connections kept per host before extra ones are closed.
+_MAX_IDLE_PER_HOST = 8
+
+_PoolKey = tuple[str, str, int]
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """At most ``concurrency`` requests in flight, started at least ``min_interval`` seconds apart."""
+
+    concurrency: int = 4
+    min_interval: float = 0.0
+
+
+#: Politeness limits per connector name; unlisted connectors use :class:`RateLimit` defaults.
+CONNECTOR_RATE_POLICY: Mapping[str, RateLimit] = {
+    "arxiv": RateLimit(concurrency=1, min_interval=3.0),
+    "semantic_scholar": RateLimit(concurrency=1, min_interval=1.0),
+    "openalex": RateLimit(concurrency=4, min_interval=0.1),
+    "biorxiv": RateLimit(concurrency=2),
+    "crossref": RateLimit(concurrency=4),
+    "europepmc": RateLimit(concurrency=4),
+    "pdb": RateLimit(concurrency=4),
+    "uniprot": RateLimit(concurrency=4),
+}
+
+
+class ConnectorRateLimiter:
+    """Bounded, evenly spaced request slots for one connector."""
+
+    def __init__(self, limit: RateLimit) -> None:
+        if limit.concurrency < 1:
+            raise ValueError("concurrency must be positive")
+        self.limit = limit
+        self._slots = threading.BoundedSemaphore(limit.concurrency)
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold one request slot, waiting for a free slot and the spacing interval first."""
+        with self._slots:
+            with self._lock:
+                now = time.monotonic()
+                start = max(now, self._next_start)
+                self._next_start = start + self.limit.min_interval
+            if start > now:
+                time.sleep(start - now)
+            yield
+
+
+_LIMITERS: dict[str, ConnectorRateLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def rate_limiter_for(connector_name: str) -> ConnectorRateLimiter:
+    """Return the process-wide limiter for *connector_name*, creating it from the policy on first use."""
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(connector_name)
+        if limiter is None:
+            limiter = ConnectorRateLimiter(CONNECTOR_RATE_POLICY.get(connector_name, RateLimit()))
+            _LIMITERS[connector_name] = limiter
+        return limiter
+
+
+class HostConnectionPool:
+    """Thread-safe pool of idle keep-alive connections keyed by ``(scheme, host, port)``."""
+
+    def __init__(self, max_idle_per_host: int = _MAX_IDLE_PER_HOST) -> None:
+        self.max_idle_per_host = max_idle_per_host
+        self._idle: dict[_PoolKey, list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self._ssl_context: ssl.SSLContext | None = None
+
+    def acquire(self, key: _PoolKey, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        """Return ``(connection, reused)`` for *key*, preferring an idle one."""
+        with self._lock:
+            idle = self._idle.get(key)
+            conn = idle.pop() if idle else None
+        if conn is not None:
+            conn.timeout = timeout
+            try:
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+            except OSError:
+                conn.close()
+        scheme, host, port = key
+        if scheme == "https":
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            return http.client.HTTPSConnection(host, port, timeout=timeout, context=self._ssl_context), False
+        return http.client.HTTPConnection(host, port, timeout=timeout), False
+
+    def release(self, key: _PoolKey, conn: http.client.HTTPConnection) -> None:
+        """Return a connection whose response was fully read; closes it when the host's pool is full."""
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def idle_count(self, key: _PoolKey) -> int:
+        with self._lock:
+            return len(self._idle.get(key, ()))
+
+    def close_all(self) -> int:
+        """Close every idle connection and return how many were closed."""
+        with self._lock:
+            conns = [conn for idle in self._idle.values() for conn in idle]
+            self._idle.clear()
+        for conn in conns:
+            conn.close()
+        return len(conns)
+
+
+_SHARED_POOL = HostConnectionPool()
+
+
+def shared_pool() -> HostConnectionPool:
+    """Return the process-wide pool used by connector HTTP clients."""
+    return _SHARED_POOL
@@ -9,7 +9,7 @@ from typing import Iterable
 from infrastructure.search.deep_research.models import DeepResearchRequest
 from infrastructure.search.deep_research.prompting import build_research_instructions
 from infrastructure.core.exceptions import PDFValidationError
-from infrastructure.validation.content.pdf_validator import extract_text_from_pdf
+from infrastructure.validation.content.pdf_validator import pdf_text_prefix
 
 TEXT_EXTENSIONS = {".md", ".markdown", ".txt", ".json", ".yaml", ".yml", ".toml", ".csv", ".log", ".bib"}
 DEFAULT_CONTEXT_FILES = ("README.md", "AGENTS.md", "manuscript/config.yaml", "manuscript/config.yml")
@@ -246,7 +246,8 @@ def _read_text(path: Path, *, max_chars: int) -> str:
 def _read_artifact_text(path: Path, *, max_chars: int) -> str:
     if path.suffix.lower() == ".pdf":
         try:
-            text = extract_text_from_pdf(path).strip()
+            # Only the budgeted prefix is needed; later pages are never extracted.
+            text = pdf_text_prefix(path, max_chars).strip()
         except PDFValidationError as exc:
             return f"[PDF extraction unavailable for {path.name}: {exc}]"
         if len(text) <= max_chars:
@@ -71,7 +71,7 @@ def _build_client(args: argparse.Namespace) -> LiteratureClient:
     cache: SearchCache | None = None
     if args.cache_dir:
         cache = SearchCache(args.cache_dir, ttl_seconds=args.cache_ttl)
-    return LiteratureClient(backends, cache=cache)
+    return LiteratureClient(backends, cache=cache, backend_timeout=args.backend_timeout)
 
 
 def _cmd_search(args: argparse.Namespace) -> int:
@@ -163,6 +163,12 @@ def build_parser() -> argparse.ArgumentParser:
             action="store_true",
             help="Bypass cache reads (still writes results back)",
         )
+        p.add_argument(
+            "--backend-timeout",
+            type=float,
+            default=None,
+            help="Seconds each backend may run before it is abandoned and partial results are returned",
+        )
         p.add_argument("--output", "-o", default="-", help="Output path or '-' for stdout")
 
     sub = parser.add_subparsers(dest="command", required=True)
@@ -7,8 +7,19 @@ re-applies year filters defensively, and re-ranks by score.
 
 Per-backend errors are captured into :attr:`SearchResult.errors` rather than
 raised so a single offline source never breaks a search.
+
+Backends are queried concurrently on a small thread pool, so a query costs
+roughly its slowest backend instead of the sum of all of them. An optional
+``backend_timeout`` bounds each backend from the moment it starts: a backend
+still running past its own deadline is abandoned, named in
+:attr:`SearchResult.timed_out` and :attr:`SearchResult.errors`, and the search
+returns the partial results the others produced. Results are always merged in
+backend order, so :func:`merge_papers` tie-breaks do not depend on which
+backend answered first.
 """
 
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from typing import Iterable
 
 from infrastructure.core.logging.utils import get_logger
@@ -23,6 +34,12 @@ from infrastructure.search.literature.models import (
 
 logger = get_logger(__name__)
 
+#: Upper bound on concurrently queried backends when ``max_workers`` is unset.
+DEFAULT_MAX_BACKEND_WORKERS = 8
+
+#: How often a deadline-bound search re-checks for queued backends to start.
+_QUEUED_BACKEND_POLL_SECONDS = 0.05
+
 
 class LiteratureClient:
     """Run a :class:`SearchQuery` across multiple :class:`SearchBackend`s.
@@ -32,6 +49,11 @@ class LiteratureClient:
             preserved — earlier backends contribute records first, which
             biases tie-breaks during deduplication.
         cache: Optional :class:`SearchCache` for deterministic replay.
+        max_workers: Backends queried at once; ``1`` restores the sequential
+            loop. Defaults to :data:`DEFAULT_MAX_BACKEND_WORKERS`.
+        backend_timeout: Seconds each backend may run, counted from when it
+            starts, before it is abandoned; ``None`` waits for every backend.
+            Results that include a timed-out backend are not cached.
     """
 
     def __init__(
@@ -39,9 +61,17 @@ class LiteratureClient:
         backends: Iterable[SearchBackend],
         *,
         cache: SearchCache | None = None,
+        max_workers: int | None = None,
+        backend_timeout: float | None = None,
     ) -> None:
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be positive")
+        if backend_timeout is not None and backend_timeout <= 0:
+            raise ValueError("backend_timeout must be positive")
         self.backends: list[SearchBackend] = list(backends)
         self.cache = cache
+        self.max_workers = max_workers if max_workers is not None else DEFAULT_MAX_BACKEND_WORKERS
+        self.backend_timeout = backend_timeout
 
     def search(self, query: SearchQuery, *, use_cache: bool = True) -> SearchResult:
         """Execute *query*. Returns aggregated, deduplicated results."""
@@ -53,27 +83,25 @@ class LiteratureClient:
 
         result = self._search_uncached(query)
 
-        if self.cache is not None:
+        if self.cache is not None and not result.timed_out:
             self.cache.put(result)
         return result
 
     def _search_uncached(self, query: SearchQuery) -> SearchResult:
+        """Query the selected backends and merge their papers."""
         wanted_sources = {s.lower() for s in (query.sources or [])}
+        selected = [b for b in self.backends if not wanted_sources or b.name.lower() in wanted_sources]
         all_papers: list[Paper] = []
         per_source_counts: dict[str, int] = {}
         errors: dict[str, str] = {}
 
-        for backend in self.backends:
-            if wanted_sources and backend.name.lower() not in wanted_sources:
+        outcomes, timed_out = self._run_backends(selected, query)
+        for backend, outcome in zip(selected, outcomes):
+            if isinstance(outcome, str):
+                errors[backend.name] = outcome
                 continue
-            try:
-                papers = backend.search(query)
-            except BackendError as exc:
-                errors[backend.name] = str(exc)
-                logger.warning("Backend %s failed: %s", backend.name, exc)
-                continue
-            per_source_counts[backend.name] = len(papers)
-            for paper in papers:
+            per_source_counts[backend.name] = len(outcome)
+            for paper in outcome:
                 if paper.source is None:
                     paper.source = backend.name
                 if query.matches_year(paper.year):
@@ -89,8 +117,96 @@ class LiteratureClient:
             papers=merged,
             per_source_counts=per_source_counts,
             errors=errors,
+            timed_out=timed_out,
         )
 
+    def _run_backends(
+        self, backends: list[SearchBackend], query: SearchQuery
+    ) -> tuple[list[list[Paper] | str], list[str]]:
+        """Return each backend's papers or error message, plus the names that timed out.
+
+        Each backend gets its own ``backend_timeout`` measured from the moment
+        a worker starts it, so a backend queued behind a full pool is not
+        charged for the wait.
+        """
+        if self.backend_timeout is None and (self.max_workers == 1 or len(backends) <= 1):
+            return [_call_backend(backend, query) for backend in backends], []
+
+        workers = min(self.max_workers, max(1, len(backends)))
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="literature-search")
+        started_at: dict[int, float] = {}
+
+        def _timed_call(index: int, backend: SearchBackend) -> list[Paper] | str:
+            started_at[index] = time.monotonic()
+            return _call_backend(backend, query)
+
+        try:
+            futures: list[Future[list[Paper] | str]] = [
+                pool.submit(_timed_call, index, backend) for index, backend in enumerate(backends)
+            ]
+            if self.backend_timeout is None:
+                # Re-raises anything other than BackendError, as the
+                # sequential loop would.
+                return [future.result() for future in futures], []
+            return self._collect_with_deadlines(backends, futures, started_at, workers, self.backend_timeout)
+        finally:
+            # Stragglers finish in the background; their results are discarded.
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _collect_with_deadlines(
+        backends: list[SearchBackend],
+        futures: list[Future[list[Paper] | str]],
+        started_at: dict[int, float],
+        workers: int,
+        timeout: float,
+    ) -> tuple[list[list[Paper] | str], list[str]]:
+        """Wait for ``futures``, abandoning each one ``timeout`` seconds after it started."""
+        outcomes: dict[int, list[Paper] | str] = {}
+        timed_out: list[str] = []
+        abandoned: list[Future[list[Paper] | str]] = []
+        pending = set(range(len(futures)))
+        while pending:
+            now = time.monotonic()
+            for index in sorted(pending):
+                future = futures[index]
+                if future.done():
+                    outcomes[index] = future.result()
+                elif index in started_at and now - started_at[index] >= timeout:
+                    outcomes[index] = f"timed out after {timeout:.1f}s"
+                    timed_out.append(backends[index].name)
+                    abandoned.append(future)
+                    logger.warning(
+                        "Backend %s timed out after %.1fs; returning partial results", backends[index].name, timeout
+                    )
+                else:
+                    continue
+                pending.discard(index)
+            if not pending:
+                break
+            deadlines = [started_at[index] + timeout for index in pending if index in started_at]
+            stuck = [future for future in abandoned if not future.done()]
+            if not deadlines and len(stuck) >= workers:
+                # Every worker is held by an abandoned backend: the queued ones would never start.
+                for index in sorted(pending):
+                    futures[index].cancel()
+                    outcomes[index] = "not started: every worker is held by a timed-out backend"
+                    timed_out.append(backends[index].name)
+                break
+            # Queued backends get a short poll until a worker picks them up.
+            wake = min(deadlines) - now if deadlines else _QUEUED_BACKEND_POLL_SECONDS
+            wait([*(futures[index] for index in pending), *stuck], timeout=max(0.0, wake), return_when=FIRST_COMPLETED)
+        return [outcomes[index] for index in range(len(futures))], timed_out
+
+
+def _call_backend(backend: SearchBackend, query: SearchQuery) -> list[Paper] | str:
+    """Run one backend, turning :class:`BackendError` into its message."""
+    try:
+        return backend.search(query)
+    except BackendError as exc:
+        logger.warning("Backend %s failed: %s", backend.name, exc)
+        return str(exc)
+
 
 def _rank_key(paper: Paper) -> tuple[float, int]:
     """Sort key for ranking merged results: score desc, then year desc."""
@@ -1,66 +1,92 @@
-"""Local JSON corpus backend."""
+"""Local JSON corpus backend.
+
+Queries are answered from a :class:`~infrastructure.search.literature.local_index.CorpusIndex`
+built once per backend (and optionally persisted under ``index_dir``, keyed to
+the corpus file's SHA-256), so a query costs postings lookups rather than a
+scan of every paper.
+"""
 
 from __future__ import annotations
 
+import copy
+import hashlib
 import json
 import re
 from pathlib import Path
 
 from infrastructure.search.literature.base import BackendError, SearchBackend
+from infrastructure.search.literature.local_index import CorpusIndex, Ranking, load_or_build_index
 from infrastructure.search.literature.models import Paper, SearchQuery
 
+_RANKINGS: frozenset[str] = frozenset({"hits", "bm25"})
+
 
 class LocalBackend(SearchBackend):
-    """Search a JSON corpus on disk."""
+    """Search a JSON corpus on disk.
+
+    Args:
+        corpus_path: JSON list of paper records, or ``{"papers": [...]}``.
+        ranking: ``"hits"`` scores by the fraction of query terms found (the
+            default, stable across releases); ``"bm25"`` ranks by Okapi BM25.
+        index_dir: Optional directory for the persisted inverted index.
+    """
 
     name = "local"
 
-    def __init__(self, corpus_path: Path | str) -> None:
+    def __init__(
+        self,
+        corpus_path: Path | str,
+        *,
+        ranking: Ranking = "hits",
+        index_dir: Path | str | None = None,
+    ) -> None:
+        if ranking not in _RANKINGS:
+            raise ValueError(f"ranking must be one of {sorted(_RANKINGS)}, got {ranking!r}")
         self.corpus_path = Path(corpus_path)
+        self.ranking: Ranking = ranking
+        self.index_dir = Path(index_dir) if index_dir is not None else None
         self._corpus: list[Paper] | None = None
+        self._index: CorpusIndex | None = None
 
-    def _load(self) -> list[Paper]:
-        if self._corpus is not None:
-            return self._corpus
-        raw = json.loads(self.corpus_path.read_text(encoding="utf-8"))
+    def _load(self) -> tuple[list[Paper], CorpusIndex]:
+        if self._corpus is not None and self._index is not None:
+            return self._corpus, self._index
+        payload = self.corpus_path.read_bytes()
+        raw = json.loads(payload)
         records = raw["papers"] if isinstance(raw, dict) and "papers" in raw else raw
         if not isinstance(records, list):
             raise BackendError(f"LocalBackend corpus {self.corpus_path} must be a list or {{'papers': [...]}}")
-        self._corpus = [Paper.from_dict(r) for r in records]
-        return self._corpus
+        corpus = [Paper.from_dict(r) for r in records]
+        self._index = load_or_build_index(
+            corpus,
+            corpus_path=self.corpus_path,
+            corpus_sha256=hashlib.sha256(payload).hexdigest(),
+            index_dir=self.index_dir,
+        )
+        self._corpus = corpus
+        return corpus, self._index
 
     def search(self, query: SearchQuery) -> list[Paper]:
         """Search for results matching a query."""
         try:
-            corpus = self._load()
+            corpus, index = self._load()
         except (OSError, json.JSONDecodeError) as exc:
             raise BackendError(f"Cannot load corpus {self.corpus_path}: {exc}") from exc
         terms = [t.lower() for t in re.split(r"\s+", query.text.strip()) if t]
         if not terms:
             return []
-        scored: list[tuple[int, Paper]] = []
-        for paper in corpus:
-            if not query.matches_year(paper.year):
-                continue
-            haystack = " ".join(
-                filter(
-                    None,
-                    [
-                        paper.title or "",
-                        paper.abstract or "",
-                        " ".join(paper.keywords or []),
-                        " ".join(paper.authors or []),
-                    ],
-                )
-            ).lower()
-            hits = sum(1 for term in terms if term in haystack)
-            if hits == 0:
-                continue
-            paper_copy = Paper.from_dict({**paper.to_dict(), "source": self.name})
-            paper_copy.score = hits / max(1, len(terms))
-            scored.append((hits, paper_copy))
-        scored.sort(key=lambda item: item[0], reverse=True)
-        return [p for _, p in scored[: query.max_results]]
+        ranked = index.search(terms, year_filter=query.matches_year, ranking=self.ranking, limit=query.max_results)
+        return [self._result_copy(corpus[doc], score) for doc, score in ranked]
+
+    def _result_copy(self, paper: Paper, score: float) -> Paper:
+        """Return an independent copy of a corpus paper stamped for this result."""
+        result = copy.copy(paper)
+        result.authors = list(paper.authors)
+        result.keywords = list(paper.keywords)
+        result.raw = copy.deepcopy(paper.raw)
+        result.source = self.name
+        result.score = score
+        return result
 
 
 __all__ = ["LocalBackend"]
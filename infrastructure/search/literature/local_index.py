@@ -0,0 +1,279 @@
+"""Inverted index over a local JSON corpus for :class:`LocalBackend`.
+
+:class:`CorpusIndex` tokenizes each paper's searchable text (title, abstract,
+keywords, authors) once and answers queries from postings instead of scanning
+every paper. Matching keeps :class:`LocalBackend`'s original contract exactly:
+a query term matches a paper when it is a case-insensitive *substring* of the
+paper's searchable text. Because query terms never contain whitespace, that is
+the same as being a substring of one whitespace-delimited token, so a term is
+resolved against the (much smaller) vocabulary — exact tokens by dictionary
+lookup, partial tokens through a lazily built trigram index — and the union of
+those tokens' postings is the matching document set. Resolved terms are
+memoized per index.
+
+Two rankings are offered: ``"hits"`` (fraction of query terms matched, the
+historical score) and ``"bm25"`` (Okapi BM25 normalised to ``[0, 1]``). Year
+filters are answered from a year facet, so excluded years are never scored.
+
+An index can be persisted as JSON keyed to the SHA-256 of the corpus file; a
+stale, foreign or malformed index file is ignored and rebuilt.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import math
+import os
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Any, Literal
+
+from infrastructure.core.logging.utils import get_logger
+from infrastructure.search.literature.models import Paper
+
+logger = get_logger(__name__)
+
+Ranking = Literal["hits", "bm25"]
+
+INDEX_SCHEMA_VERSION = 1
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+_TERM_CACHE_LIMIT = 4096
+
+
+def searchable_text(paper: Paper) -> str:
+    """Return the lowercase text a query is matched against."""
+    return " ".join(
+        filter(
+            None,
+            [
+                paper.title or "",
+                paper.abstract or "",
+                " ".join(paper.keywords or []),
+                " ".join(paper.authors or []),
+            ],
+        )
+    ).lower()
+
+
+class CorpusIndex:
+    """Token postings, document lengths and a year facet for one corpus.
+
+    ``postings`` maps each token to the ascending ids of the documents it
+    occurs in, repeated once per occurrence, so a document's term frequency
+    is the length of its run. That layout is the cheapest to build and to
+    (de)serialize for large corpora.
+    """
+
+    def __init__(
+        self,
+        postings: dict[str, list[int]],
+        doc_lengths: Sequence[int],
+        years: Sequence[int | None],
+    ) -> None:
+        self.postings = postings
+        self.doc_lengths = list(doc_lengths)
+        self.years = list(years)
+        self.year_facet: dict[int | None, list[int]] = {}
+        for doc, year in enumerate(self.years):
+            self.year_facet.setdefault(year, []).append(doc)
+        total = sum(self.doc_lengths)
+        self.avg_doc_length = total / len(self.doc_lengths) if self.doc_lengths else 0.0
+        self._trigrams: dict[str, set[str]] | None = None
+        self._term_cache: dict[str, dict[int, int]] = {}
+        self._facet_cache: dict[frozenset[int | None], set[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+
+    @classmethod
+    def build(cls, papers: Sequence[Paper]) -> "CorpusIndex":
+        """Tokenize ``papers`` into a fresh index."""
+        postings: dict[str, list[int]] = {}
+        doc_lengths: list[int] = []
+        for doc, paper in enumerate(papers):
+            tokens = searchable_text(paper).split()
+            doc_lengths.append(len(tokens))
+            for token in tokens:
+                row = postings.get(token)
+                if row is None:
+                    postings[token] = [doc]
+                else:
+                    row.append(doc)
+        return cls(postings, doc_lengths, [paper.year for paper in papers])
+
+    # -- Lookup ---------------------------------------------------------------
+
+    def term_frequencies(self, term: str) -> dict[int, int]:
+        """Return ``doc -> occurrences`` of tokens containing ``term``."""
+        cached = self._term_cache.get(term)
+        if cached is not None:
+            return cached
+        matched: dict[int, int] = {}
+        for token in self._tokens_containing(term):
+            for doc in self.postings[token]:
+                matched[doc] = matched.get(doc, 0) + 1
+        if len(self._term_cache) >= _TERM_CACHE_LIMIT:
+            self._term_cache.clear()
+        self._term_cache[term] = matched
+        return matched
+
+    def _tokens_containing(self, term: str) -> list[str]:
+        if len(term) < 3:
+            return [token for token in self.postings if term in token]
+        trigrams = self._trigram_index()
+        candidates: set[str] | None = None
+        for start in range(len(term) - 2):
+            bucket = trigrams.get(term[start : start + 3])
+            if not bucket:
+                return []
+            candidates = set(bucket) if candidates is None else candidates & bucket
+            if not candidates:
+                return []
+        return [token for token in candidates or () if term in token]
+
+    def _trigram_index(self) -> dict[str, set[str]]:
+        if self._trigrams is None:
+            trigrams: dict[str, set[str]] = {}
+            for token in self.postings:
+                for start in range(len(token) - 2):
+                    trigrams.setdefault(token[start : start + 3], set()).add(token)
+            self._trigrams = trigrams
+        return self._trigrams
+
+    def search(
+        self,
+        terms: Sequence[str],
+        *,
+        year_filter: Callable[[int | None], bool],
+        ranking: Ranking = "hits",
+        limit: int,
+    ) -> list[tuple[int, float]]:
+        """Return up to ``limit`` ``(doc, score)`` pairs, best first, ties in corpus order."""
+        allowed = self._allowed_documents(year_filter)
+
+        scores: dict[int, float] = {}
+        document_count = len(self)
+        for term in terms:
+            frequencies = self.term_frequencies(term)
+            if not frequencies:
+                continue
+            if ranking == "bm25":
+                df = len(frequencies)
+                idf = math.log(1.0 + (document_count - df + 0.5) / (df + 0.5))
+            for doc, tf in frequencies.items():
+                if allowed is not None and doc not in allowed:
+                    continue
+                if ranking == "bm25":
+                    norm = 1.0 - _BM25_B + _BM25_B * self.doc_lengths[doc] / (self.avg_doc_length or 1.0)
+                    gain = idf * tf * (_BM25_K1 + 1.0) / (tf + _BM25_K1 * norm)
+                else:
+                    gain = 1.0
+                scores[doc] = scores.get(doc, 0.0) + gain
+
+        ranked = heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], item[0]))
+        if ranking == "bm25":
+            top = ranked[0][1] if ranked else 0.0
+            return [(doc, score / top if top > 0 else 0.0) for doc, score in ranked]
+        return [(doc, score / max(1, len(terms))) for doc, score in ranked]
+
+    def _allowed_documents(self, year_filter: Callable[[int | None], bool]) -> set[int] | None:
+        """Return the documents whose year passes ``year_filter``; ``None`` when all do."""
+        years = frozenset(year for year in self.year_facet if year_filter(year))
+        if len(years) == len(self.year_facet):
+            return None
+        cached = self._facet_cache.get(years)
+        if cached is None:
+            cached = {doc for year in years for doc in self.year_facet[year]}
+            self._facet_cache = {years: cached}
+        return cached
+
+    # -- Persistence ----------------------------------------------------------
+
+    def to_dict(self, corpus_sha256: str) -> dict[str, Any]:
+        """Serialize the index, tagged with the corpus digest it was built from."""
+        return {
+            "version": INDEX_SCHEMA_VERSION,
+            "corpus_sha256": corpus_sha256,
+            "doc_lengths": self.doc_lengths,
+            "years": self.years,
+            "postings": self.postings,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: object, *, corpus_sha256: str, document_count: int) -> "CorpusIndex | None":
+        """Rebuild an index from :meth:`to_dict` output; ``None`` when it does not fit the corpus."""
+        if (
+            not isinstance(payload, dict)
+            or payload.get("version") != INDEX_SCHEMA_VERSION
+            or payload.get("corpus_sha256") != corpus_sha256
+        ):
+            return None
+        doc_lengths = payload.get("doc_lengths")
+        years = payload.get("years")
+        raw_postings = payload.get("postings")
+        if (
+            not isinstance(doc_lengths, list)
+            or not isinstance(years, list)
+            or not isinstance(raw_postings, dict)
+            or len(doc_lengths) != document_count
+            or len(years) != document_count
+        ):
+            return None
+        if not all(isinstance(rows, list) for rows in raw_postings.values()):
+            return None
+        return cls(raw_postings, doc_lengths, years)
+
+
+def index_path_for(index_dir: Path, corpus_path: Path, corpus_sha256: str) -> Path:
+    """Return the index file for a corpus at a given content digest."""
+    return index_dir / f"{corpus_path.stem}.{corpus_sha256[:16]}.index.json"
+
+
+def load_or_build_index(
+    papers: Sequence[Paper],
+    *,
+    corpus_path: Path,
+    corpus_sha256: str,
+    index_dir: Path | None,
+) -> CorpusIndex:
+    """Load the persisted index for this corpus digest, or build (and persist) one.
+
+    Persisting a new build removes the indexes of earlier corpus versions.
+    """
+    if index_dir is None:
+        return CorpusIndex.build(papers)
+    path = index_path_for(index_dir, corpus_path, corpus_sha256)
+    if path.is_file():
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning("Ignoring unreadable corpus index %s: %s", path, exc)
+        else:
+            loaded = CorpusIndex.from_dict(payload, corpus_sha256=corpus_sha256, document_count=len(papers))
+            if loaded is not None:
+                return loaded
+            logger.info("Rebuilding corpus index %s (stale or foreign)", path)
+    index = CorpusIndex.build(papers)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(index.to_dict(corpus_sha256), separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, path)
+        for stale in index_dir.glob(f"{corpus_path.stem}.*.index.json"):
+            if stale != path:
+                stale.unlink()
+    except OSError as exc:
+        logger.warning("Could not persist corpus index %s: %s", path, exc)
+    return index
+
+
+__all__ = [
+    "INDEX_SCHEMA_VERSION",
+    "CorpusIndex",
+    "Ranking",
+    "index_path_for",
+    "load_or_build_index",
+    "searchable_text",
+]
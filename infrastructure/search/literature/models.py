@@ -157,12 +157,15 @@ class SearchResult:
         errors: Map of backend name → error message for any backends that
             failed. Aggregator does not raise on per-backend failures so a
             single offline source does not break the whole search.
+        timed_out: Names of backends abandoned at their ``backend_timeout``;
+            each one also has an entry in ``errors``.
     """
 
     query: SearchQuery
     papers: list[Paper] = field(default_factory=list)
     per_source_counts: dict[str, int] = field(default_factory=dict)
     errors: dict[str, str] = field(default_factory=dict)
+    timed_out: list[str] = field(default_factory=list)
 
     def __len__(self) -> int:
         return len(self.papers)
@@ -177,6 +180,7 @@ class SearchResult:
             "papers": [p.to_dict() for p in self.papers],
             "per_source_counts": dict(self.per_source_counts),
             "errors": dict(self.errors),
+            "timed_out": list(self.timed_out),
         }
 
     def to_json(self, *, indent: int = 2) -> str:
@@ -54,6 +54,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterator, Sequence
 
+from infrastructure.core.ast_index import PythonAstIndex, runtime_top_level_statements
 from infrastructure.core.logging.utils import get_logger
 
 logger = get_logger(__name__)
@@ -122,8 +123,11 @@ def _line_has_noqa_f401(source_lines: Sequence[str], node: ast.AST) -> bool:
     end = getattr(node, "end_lineno", start)
     if start is None:
         return False
-    if end is None:
-        end = start
+    return _span_has_noqa_f401(source_lines, start, start if end is None else end)
+
+
+def _span_has_noqa_f401(source_lines: Sequence[str], start: int, end: int) -> bool:
+    """Return True if any line in ``start..end`` (inclusive) carries ``# noqa: F401``."""
     for n in range(start, end + 1):
         text = _line_text(source_lines, n).lower()
         # Accept "noqa: f401" or "noqa:f401" or "noqa: e501,f401"
@@ -158,43 +162,6 @@ def is_top_level_reexport_node(
     return False, ""
 
 
-def _is_typechecking_block(node: ast.If) -> bool:
-    """Return True if *node* is ``if TYPE_CHECKING:`` (or dotted form)."""
-    test = node.test
-    if isinstance(test, ast.Name) and test.id == "TYPE_CHECKING":
-        return True
-    if isinstance(test, ast.Attribute) and test.attr == "TYPE_CHECKING":
-        return True
-    return False
-
-
-def _walk_top_level_statements(tree: ast.Module) -> Iterator[ast.stmt]:
-    """Yield top-level statements, descending into ``try`` handlers and
-    ``if`` branches, but skipping ``if TYPE_CHECKING:`` bodies.
-
-    Re-export shims commonly wrap imports in ``try: from x import Y; except
-    ImportError: ...``. Those are still re-exports when the try succeeds,
-    so we descend into them.
-    """
-    for stmt in tree.body:
-        if isinstance(stmt, ast.If) and _is_typechecking_block(stmt):
-            # Skip TYPE_CHECKING blocks entirely — they are not real re-exports.
-            continue
-        if isinstance(stmt, ast.Try):
-            yield from stmt.body
-            for handler in stmt.handlers:
-                yield from handler.body
-            yield from stmt.orelse
-            yield from stmt.finalbody
-            continue
-        if isinstance(stmt, ast.If):
-            # Non-TYPE_CHECKING if at top level — descend into both branches.
-            yield from stmt.body
-            yield from stmt.orelse
-            continue
-        yield stmt
-
-
 def module_has_dunder_all(tree: ast.Module) -> bool:
     """Return True if the module assigns ``__all__`` at top level."""
     for stmt in tree.body:
@@ -224,7 +191,7 @@ def module_reexports_at_top_level(
     found, suitable for a violation message. If no re-export is found,
     returns ``(False, 0, "")``.
     """
-    for stmt in _walk_top_level_statements(tree):
+    for stmt in runtime_top_level_statements(tree):
         ok, reason = is_top_level_reexport_node(stmt, source_lines=source_lines)
         if ok:
             return True, getattr(stmt, "lineno", 0) or 0, reason
@@ -265,44 +232,62 @@ def iter_python_files(root: Path, *, skip_dirs: Sequence[str] = ("tests", "__pyc
         yield path
 
 
-def audit_file(path: Path) -> AllExportViolation | None:
+def audit_file(path: Path, *, index: PythonAstIndex | None = None) -> AllExportViolation | None:
     """Return a violation for *path* if it re-exports without ``__all__``.
 
     Returns ``None`` if the file is fine (either does not re-export, or
-    re-exports and declares ``__all__``).
+    re-exports and declares ``__all__``). Works from the file's cached
+    :class:`~infrastructure.core.ast_index.ModuleSummary`, so an unchanged
+    file is not re-parsed.
 
     Raises:
         SyntaxError: If the file cannot be parsed. Callers may catch and
             convert to a violation with a parse-error reason if desired.
     """
-    source = path.read_text(encoding="utf-8")
-    tree = ast.parse(source, filename=str(path))
-    has_re, line, reason = module_reexports_at_top_level(tree, source_lines=source.splitlines())
-    if not has_re:
-        return None
-    if module_has_dunder_all(tree):
+    index = index if index is not None else PythonAstIndex.default()
+    summary = index.summary(path)
+    error = summary.syntax_error_for(path)
+    if error is not None:
+        raise error
+    if summary.has_dunder_all:
         return None
-    return AllExportViolation(path=path.resolve(), line=line, reason=reason)
+    source_lines = index.source(path).splitlines()
+    runtime_imports = sorted((r for r in summary.imports if r.runtime_top_level), key=lambda r: r.lineno)
+    for record in runtime_imports:
+        if _span_has_noqa_f401(source_lines, record.lineno, record.end_lineno):
+            module = (record.module if record.names is not None else "") or "<imports>"
+            return AllExportViolation(
+                path=path.resolve(),
+                line=record.lineno,
+                reason=f"top-level F401 re-export from {module!r} without __all__",
+            )
+    return None
 
 
 def audit_directory(
     root: Path,
     *,
     skip_dirs: Sequence[str] = ("tests", "__pycache__"),
+    index: PythonAstIndex | None = None,
 ) -> list[AllExportViolation]:
     """Audit every public ``.py`` file under *root* for missing ``__all__``.
 
     Args:
         root: Root directory to walk recursively.
         skip_dirs: Directory names to skip (matched against any path part).
+        index: Shared :class:`~infrastructure.core.ast_index.PythonAstIndex`;
+            defaults to one backed by the persistent summary cache.
 
     Returns:
         A sorted list of violations (by path then line). Empty if clean.
     """
+    index = index if index is not None else PythonAstIndex.default()
+    paths = list(iter_python_files(root, skip_dirs=skip_dirs))
+    index.summaries(paths)
     violations: list[AllExportViolation] = []
-    for path in iter_python_files(root, skip_dirs=skip_dirs):
+    for path in paths:
         try:
-            v = audit_file(path)
+            v = audit_file(path, index=index)
         except SyntaxError as exc:
             violations.append(
                 AllExportViolation(
@@ -12,6 +12,8 @@ Implementation split across:
 """
 
 import io
+from collections.abc import Sequence
+from typing import Any
 
 from infrastructure.core.logging.utils import get_logger
 
@@ -44,6 +46,7 @@ __all__ = [
     "build_integrity_qr_text",
     # this module
     "create_barcode_strip_overlay",
+    "create_barcode_strip_overlays",
 ]
 
 
@@ -95,10 +98,114 @@ def create_barcode_strip_overlay(
         PDF bytes of the one-page overlay.
     """
     rl_canvas_mod, _inch, _mm, ImageReader = _get_reportlab()
+    qr_images = _render_qr_images(
+        title=title,
+        authors=authors,
+        author_emails=author_emails,
+        document_id=document_id,
+        hashes=hashes,
+    )
 
     buf = io.BytesIO()
     c = rl_canvas_mod.Canvas(buf, pagesize=(page_width, page_height))
+    _draw_barcode_strip(c, ImageReader, page_width, code128_data, qr_images, strip_height, resolve_build_timestamp())
+    c.save()
+    return buf.getvalue()
+
+
+def create_barcode_strip_overlays(
+    page_sizes: Sequence[tuple[float, float]],
+    code128_payloads: Sequence[str],
+    strip_height: float = 68.0,
+    title: str = "",
+    authors: list[str] | None = None,
+    author_emails: list[str] | None = None,
+    document_id: str = "",
+    hashes: dict[str, str] | None = None,
+    timestamp: str | None = None,
+) -> bytes:
+    """Create the barcode strips of many pages as one multi-page PDF.
+
+    Only the Code128 payload differs from page to page, so the four QR codes
+    are generated once and reportlab embeds each image a single time for the
+    whole document. Page *i* matches :func:`create_barcode_strip_overlay`
+    for ``page_sizes[i]`` and ``code128_payloads[i]``.
+
+    Args:
+        page_sizes: ``(page_width, page_height)`` for each page, in order.
+        code128_payloads: Code128 data for each page.
+        strip_height: Height of the barcode strip area in points.
+        title: Document title for QR content.
+        authors: Author names for QR content.
+        author_emails: Author emails for mailto QR.
+        document_id: Document ID for integrity QR.
+        hashes: Hash digests for integrity QR.
+        timestamp: Build timestamp shared by every strip (resolved once when omitted).
+
+    Returns:
+        PDF bytes with one strip page per entry of ``page_sizes``.
+    """
+    if len(page_sizes) != len(code128_payloads):
+        raise ValueError("page_sizes and code128_payloads must have the same length")
+
+    rl_canvas_mod, _inch, _mm, ImageReader = _get_reportlab()
+    qr_images = _render_qr_images(
+        title=title,
+        authors=authors,
+        author_emails=author_emails,
+        document_id=document_id,
+        hashes=hashes,
+    )
+    if timestamp is None:
+        timestamp = resolve_build_timestamp()
 
+    buf = io.BytesIO()
+    c = rl_canvas_mod.Canvas(buf)
+    for (page_width, page_height), code128_data in zip(page_sizes, code128_payloads, strict=True):
+        c.setPageSize((page_width, page_height))
+        _draw_barcode_strip(c, ImageReader, page_width, code128_data, qr_images, strip_height, timestamp)
+        c.showPage()
+    c.save()
+    return buf.getvalue()
+
+
+def _render_qr_images(
+    *,
+    title: str,
+    authors: list[str] | None,
+    author_emails: list[str] | None,
+    document_id: str,
+    hashes: dict[str, str] | None,
+) -> list[tuple[str, bytes | None]]:
+    """Return ``(label, png)`` for the four strip QR codes (``png`` is ``None`` on failure)."""
+    # ── Build QR contents (compact -- <=100 chars each) ────────────────
+    qr_items = [
+        ("Metadata", build_metadata_qr_text(title=title, authors=authors, document_id=document_id)),
+        ("Citation", build_citation_qr_text(title=title, authors=authors)),
+        ("Contact", build_mailto_qr_text(title=title, authors=authors, author_emails=author_emails)),
+        ("Integrity", build_integrity_qr_text(document_id=document_id, hashes=hashes)),
+    ]
+
+    images: list[tuple[str, bytes | None]] = []
+    for label, data in qr_items:
+        try:
+            images.append((label, generate_qr_code(data, box_size=3, border=1)))
+        except Exception as exc:  # noqa: BLE001 — QR backends raise assorted encoding errors
+            logger.warning(f"QR code rendering failed for {label}: {exc}")
+            images.append((label, None))
+    return images
+
+
+def _draw_barcode_strip(
+    c: Any,
+    image_reader: Any,
+    page_width: float,
+    code128_data: str,
+    qr_images: Sequence[tuple[str, bytes | None]],
+    strip_height: float,
+    timestamp: str,
+) -> None:
+    """Draw the labeled QR codes, Code128 bars and timestamp onto the current page of ``c``."""
     # ── Layout constants ─────────────────────────────────────────────
     label_font_size = 5
     label_y = 6  # label text baseline (near page bottom, moved up from 4)
@@ -106,7 +213,7 @@ def create_barcode_strip_overlay(
     qr_size = strip_height - qr_y - 2  # fill remaining strip height (approx 50pt)
 
     # Distribute QR codes evenly across available width
-    n_qr = 4
+    n_qr = len(qr_images)
     code128_width = 100  # reserve space for Code128 on the right
     margin = 14
     available_width = page_width - code128_width - margin * 2
@@ -114,54 +221,23 @@ def create_barcode_strip_overlay(
     if qr_spacing < 8:
         qr_spacing = 8
 
-    # ── Build QR contents (compact -- <=100 chars each) ────────────────
-    qr_items = []
-
-    # 1. Metadata QR
-    meta_text = build_metadata_qr_text(
-        title=title,
-        authors=authors,
-        document_id=document_id,
-    )
-    qr_items.append(("Metadata", meta_text))
-
-    # 2. Citation QR
-    cite_text = build_citation_qr_text(title=title, authors=authors)
-    qr_items.append(("Citation", cite_text))
-
-    # 3. Contact QR (mailto: link)
-    contact_text = build_mailto_qr_text(
-        title=title,
-        authors=authors,
-        author_emails=author_emails,
-    )
-    qr_items.append(("Contact", contact_text))
-
-    # 4. Integrity QR (compact hash)
-    integrity_text = build_integrity_qr_text(
-        document_id=document_id,
-        hashes=hashes,
-    )
-    qr_items.append(("Integrity", integrity_text))
-
     # ── Draw QR codes with labels ────────────────────────────────────
     x_cursor = margin
 
-    for label, data in qr_items:
-        try:
-            qr_png = generate_qr_code(data, box_size=3, border=1)
-            qr_reader = ImageReader(io.BytesIO(qr_png))
-            c.drawImage(
-                qr_reader,
-                x=x_cursor,
-                y=qr_y,
-                width=qr_size,
-                height=qr_size,
-                preserveAspectRatio=True,
-                mask="auto",
-            )
-        except Exception as exc:  # noqa: BLE001 — reportlab rendering exceptions vary by backend
-            logger.warning(f"QR code rendering failed for {label}: {exc}")
+    for label, qr_png in qr_images:
+        if qr_png is not None:
+            try:
+                c.drawImage(
+                    image_reader(io.BytesIO(qr_png)),
+                    x=x_cursor,
+                    y=qr_y,
+                    width=qr_size,
+                    height=qr_size,
+                    preserveAspectRatio=True,
+                    mask="auto",
+                )
+            except Exception as exc:  # noqa: BLE001 — reportlab rendering exceptions vary by backend
+                logger.warning(f"QR code rendering failed for {label}: {exc}")
 
         # Label centred below QR
         c.saveState()
@@ -200,9 +276,5 @@ def create_barcode_strip_overlay(
     c.saveState()
     c.setFont("Courier", 3.5)
     c.setFillColorRGB(0.5, 0.5, 0.5)
-    ts = resolve_build_timestamp()
-    c.drawRightString(page_width - 6, qr_y + qr_size + 2, ts)
+    c.drawRightString(page_width - 6, qr_y + qr_size + 2, timestamp)
     c.restoreState()
-
-    c.save()
-    return buf.getvalue()
@@ -205,6 +205,8 @@ class SteganographyConfig:
         overlay_qr_data: Custom data for QR overlay mode (auto if None).
 
         barcode_content: Data to encode in barcodes (None → auto).
+        stamp_workers: Worker processes drawing footer/barcode overlays for
+            page ranges (1 = in-process; ranges smaller than 25 pages are not split).
         hash_algorithms: Hash algorithms to compute.
         pdf_password: Optional password for PDF-level encryption.
         output_suffix: Suffix appended to the output filename.
@@ -240,6 +242,9 @@ class SteganographyConfig:
     # ── Barcode strip settings ────────────────────────────────────────
     barcode_content: str | None = None
 
+    # ── Stamping ──────────────────────────────────────────────────────
+    stamp_workers: int = 1
+
     # ── Hashing ───────────────────────────────────────────────────────
     hash_algorithms: list[str] = field(default_factory=lambda: ["sha256", "sha512"])
 
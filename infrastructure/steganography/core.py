@@ -185,115 +185,142 @@ class SteganographyProcessor:
         working_pdf: Path,
         ctx: BarcodeBuildContext,
     ) -> Path:
-        """Merge overlay and barcode pages onto every page of the PDF."""
+        """Stamp overlay and barcode layers onto every page of the PDF.
+
+        Each layer becomes a Form XObject painted over the page (see
+        :mod:`infrastructure.steganography.stamping`): one shared form per
+        page size for the full-page overlay, and per-page footer/barcode forms
+        drawn from a single multi-page reportlab document per page range.
+        """
         try:
             from pypdf import PdfReader, PdfWriter
         except ImportError:
             raise ImportError("The 'pypdf' package is required. Install with: pip install pypdf") from None
+        from infrastructure.steganography.config import resolve_build_timestamp
+        from infrastructure.steganography.stamping import (
+            MIN_PAGES_PER_CHUNK,
+            OverlayChunk,
+            OverlayStamper,
+            full_page_overlay_pdf,
+            render_overlay_chunks,
+        )
 
         reader = PdfReader(str(working_pdf))
         writer = PdfWriter()
-        total_pages = len(reader.pages)
+        for page in reader.pages:
+            writer.add_page(page)
+        total_pages = len(writer.pages)
+        page_sizes = [(float(page.mediabox.width), float(page.mediabox.height)) for page in writer.pages]
+        layers: list[list[object]] = [[] for _ in range(total_pages)]
+        stamper = OverlayStamper(writer)
 
         hash_short = ""
         if ctx.hashes:
             first_algo = next(iter(ctx.hashes))
             hash_short = ctx.hashes[first_algo][:16]
 
-        # Build QR overlay data once if in QR mode
-        qr_overlay_data = ""
-        if self.config.overlays_enabled and self.config.overlay_mode == "qr":
-            from infrastructure.steganography.barcodes import build_barcode_payload
+        # ── Full-page overlay (text, QR, or none): one form per page size ──
+        mode = self.config.overlay_mode
+        if self.config.overlays_enabled and mode != "none":
+            settings: tuple[object, ...]
+            if mode == "qr":
+                from infrastructure.steganography.barcodes import build_barcode_payload
 
-            qr_overlay_data = self.config.overlay_qr_data or build_barcode_payload(
-                title=ctx.title,
-                hashes=ctx.hashes,
-                document_id=ctx.document_id,
-            )
+                qr_overlay_data = self.config.overlay_qr_data or build_barcode_payload(
+                    title=ctx.title,
+                    hashes=ctx.hashes,
+                    document_id=ctx.document_id,
+                )
+                settings = (qr_overlay_data, self.config.overlay_opacity)
+            else:  # 'text' (default)
+                mode = "text"
+                settings = (
+                    self.config.overlay_text,
+                    self.config.overlay_opacity,
+                    tuple(self.config.overlay_color_rgb),
+                    self.config.overlay_font_size,
+                    self.config.overlay_repeat_count,
+                )
+            for page_idx, (page_width, page_height) in enumerate(page_sizes):
+                layers[page_idx].append(
+                    stamper.form_for(
+                        (mode, page_width, page_height, settings),
+                        lambda w=page_width, h=page_height: PdfReader(
+                            io.BytesIO(full_page_overlay_pdf(mode, w, h, settings))
+                        ).pages[0],
+                    )
+                )
 
-        for page_idx, page in enumerate(reader.pages):
-            page_width = float(page.mediabox.width)
-            page_height = float(page.mediabox.height)
-            writer.add_page(page)
-            out_page = writer.pages[-1]
-
-            # ── Full-page overlay (text, QR, or none) ────────────
-            if self.config.overlays_enabled and self.config.overlay_mode != "none":
-                if self.config.overlay_mode == "qr":
-                    from infrastructure.steganography.overlays import create_qr_overlay
-
-                    wm_bytes = create_qr_overlay(
-                        page_width,
-                        page_height,
-                        qr_data=qr_overlay_data,
-                        opacity=self.config.overlay_opacity,
+        # ── Footer + barcode strip: one multi-page document per page range ──
+        chunks: list[OverlayChunk] = []
+        if self.config.overlays_enabled or self.config.barcodes_enabled:
+            from infrastructure.steganography.overlays import FooterConfig
+
+            workers = max(1, self.config.stamp_workers)
+            chunk_size = max(MIN_PAGES_PER_CHUNK, -(-total_pages // workers))
+            timestamp = resolve_build_timestamp()
+            authors = ", ".join(a for a in ctx.authors if a) if ctx.authors else ""
+            barcode_fields = {
+                "title": ctx.title,
+                "authors": ctx.authors,
+                "author_emails": ctx.author_emails,
+                "document_id": ctx.document_id,
+                "hashes": ctx.hashes,
+            }
+            for first in range(0, total_pages, chunk_size):
+                numbers = range(first + 1, min(first + chunk_size, total_pages) + 1)
+                footers: tuple[FooterConfig, ...] = ()
+                if self.config.overlays_enabled:
+                    footers = tuple(
+                        FooterConfig(
+                            document_id=ctx.document_id,
+                            page_number=n,
+                            total_pages=total_pages,
+                            hash_short=hash_short,
+                            title=ctx.title,
+                            authors=authors,
+                            source_filename=ctx.source_filename,
+                            source_file_size=ctx.source_file_size,
+                        )
+                        for n in numbers
                     )
-                else:  # 'text' (default)
-                    from infrastructure.steganography.overlays import create_watermark_overlay
-
-                    wm_bytes = create_watermark_overlay(
-                        page_width,
-                        page_height,
-                        text=self.config.overlay_text,
-                        opacity=self.config.overlay_opacity,
-                        color_rgb=self.config.overlay_color_rgb,
-                        font_size=self.config.overlay_font_size,
-                        repeat_count=self.config.overlay_repeat_count,
+                payloads: tuple[str, ...] = ()
+                if self.config.barcodes_enabled:
+                    payloads = tuple(f"ID:{ctx.document_id[:16]}|P:{n}" for n in numbers)
+                chunks.append(
+                    OverlayChunk(
+                        page_sizes=tuple(page_sizes[n - 1] for n in numbers),
+                        timestamp=timestamp,
+                        footers=footers,
+                        code128_payloads=payloads,
+                        barcode_fields=barcode_fields,
                     )
-                wm_page = PdfReader(io.BytesIO(wm_bytes)).pages[0]
-                out_page.merge_page(wm_page)
-
-            # ── Footer overlay (always if overlays enabled) ──────
-            if self.config.overlays_enabled:
-                from infrastructure.steganography.overlays import (
-                    FooterConfig,
-                    create_footer_overlay,
-                    create_invisible_text_overlay,
                 )
 
-                footer_cfg = FooterConfig(
-                    document_id=ctx.document_id,
-                    page_number=page_idx + 1,
-                    total_pages=total_pages,
-                    hash_short=hash_short,
-                    title=ctx.title,
-                    authors=", ".join(a for a in ctx.authors if a) if ctx.authors else "",
-                    source_filename=ctx.source_filename,
-                    source_file_size=ctx.source_file_size,
-                )
-                footer_bytes = create_footer_overlay(page_width, page_height, footer_cfg)
-                footer_page = PdfReader(io.BytesIO(footer_bytes)).pages[0]
-                out_page.merge_page(footer_page)
+        footer_forms: list[object] = []
+        barcode_forms: list[object] = []
+        for footer_pdf, barcode_pdf in render_overlay_chunks(chunks, workers=self.config.stamp_workers):
+            if footer_pdf is not None:
+                footer_forms.extend(stamper.form_from_page(p) for p in PdfReader(io.BytesIO(footer_pdf)).pages)
+            if barcode_pdf is not None:
+                barcode_forms.extend(stamper.form_from_page(p) for p in PdfReader(io.BytesIO(barcode_pdf)).pages)
+
+        for page_idx, page in enumerate(writer.pages):
+            page_layers = layers[page_idx]
+            if footer_forms:
+                page_layers.append(footer_forms[page_idx])
 
                 # Invisible text layer (first page only)
                 if page_idx == 0:
-                    hidden_data = f"STEG_ID:{ctx.document_id}|TITLE:{ctx.title}|HASHES:{hash_short}"
-                    inv_bytes = create_invisible_text_overlay(page_width, page_height, hidden_data)
-                    inv_page = PdfReader(io.BytesIO(inv_bytes)).pages[0]
-                    out_page.merge_page(inv_page)
-
-            # ── Barcode strip ────────────────────────────────────
-            if self.config.barcodes_enabled:
-                from infrastructure.steganography.barcodes import create_barcode_strip_overlay
+                    from infrastructure.steganography.overlays import create_invisible_text_overlay
 
-                c128_payload = f"ID:{ctx.document_id[:16]}|P:{page_idx + 1}"
+                    hidden_data = f"STEG_ID:{ctx.document_id}|TITLE:{ctx.title}|HASHES:{hash_short}"
+                    inv_bytes = create_invisible_text_overlay(*page_sizes[0], hidden_data)
+                    page_layers.append(stamper.form_from_page(PdfReader(io.BytesIO(inv_bytes)).pages[0]))
 
-                bc_bytes = create_barcode_strip_overlay(
-                    page_width,
-                    page_height,
-                    code128_data=c128_payload,
-                    title=ctx.title,
-                    authors=ctx.authors,
-                    keywords=ctx.keywords,
-                    author_emails=ctx.author_emails,
-                    document_id=ctx.document_id,
-                    hashes=ctx.hashes,
-                    source_filename=ctx.source_filename,
-                    total_pages=total_pages,
-                    source_file_size=ctx.source_file_size,
-                )
-                bc_page = PdfReader(io.BytesIO(bc_bytes)).pages[0]
-                out_page.merge_page(bc_page)
+            if barcode_forms:
+                page_layers.append(barcode_forms[page_idx])
+            stamper.stamp(page, page_layers)
 
         # Write merged PDF back to the working file
         out_path = working_pdf.with_suffix(".merged.pdf")
@@ -303,7 +330,10 @@ class SteganographyProcessor:
         # Replace working copy
         working_pdf.unlink()
         out_path.rename(working_pdf)
-        logger.info(f"║  ✓ Overlays and barcodes applied to {total_pages} pages")
+        logger.info(
+            f"║  ✓ Overlays and barcodes applied to {total_pages} pages "
+            f"({stamper.forms_created} overlay forms, {len(chunks)} page range(s))"
+        )
         return working_pdf
 
     def _step_metadata(
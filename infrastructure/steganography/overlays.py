@@ -7,6 +7,7 @@ document-ID stamps.
 """
 
 import io
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
@@ -230,7 +231,51 @@ def create_footer_overlay(
 
     buf = io.BytesIO()
     c = rl_canvas.Canvas(buf, pagesize=(page_width, page_height))
+    _draw_footer(c, page_width, cfg, resolve_build_timestamp())
+    c.save()
+
+    return buf.getvalue()
+
+
+def create_footer_overlays(
+    pages: Sequence[tuple[float, float, FooterConfig]],
+    *,
+    timestamp: str | None = None,
+) -> bytes:
+    """Generate the footer overlays of many pages as one multi-page PDF.
+
+    Page *i* of the result is the footer for ``pages[i]`` — identical to
+    :func:`create_footer_overlay` for the same size and config — so a whole
+    document is stamped from a single reportlab canvas and a single parse
+    instead of one of each per page.
+
+    Args:
+        pages: ``(page_width, page_height, cfg)`` for each page, in order.
+        timestamp: Build timestamp shared by every footer (resolved once
+            via :func:`resolve_build_timestamp` when omitted).
+
+    Returns:
+        PDF bytes with one footer page per entry of ``pages``.
+    """
+    rl_canvas, _letter, _inch = _get_reportlab()
+    if timestamp is None:
+        from infrastructure.steganography.config import resolve_build_timestamp
+
+        timestamp = resolve_build_timestamp()
+
+    buf = io.BytesIO()
+    c = rl_canvas.Canvas(buf)
+    for page_width, page_height, cfg in pages:
+        c.setPageSize((page_width, page_height))
+        _draw_footer(c, page_width, cfg, timestamp)
+        c.showPage()
+    c.save()
 
+    return buf.getvalue()
+
+
+def _draw_footer(c: Any, page_width: float, cfg: FooterConfig, timestamp: str) -> None:
+    """Draw the two-line footer for ``cfg`` onto the current page of canvas ``c``."""
     c.saveState()
 
     # Clear the bottom 90pt so our steganography footer is pristine.
@@ -278,16 +323,12 @@ def create_footer_overlay(
     if cfg.hash_short:
         parts.append(f"SHA256 (compiled PDF): {cfg.hash_short}")
 
-    ts = resolve_build_timestamp()
-    parts.append(ts)
+    parts.append(timestamp)
 
     metrics_text = "  │  ".join(parts)
     c.drawString(margin, line2_y, metrics_text)
 
     c.restoreState()
-    c.save()
-
-    return buf.getvalue()
 
 
 def create_invisible_text_overlay(
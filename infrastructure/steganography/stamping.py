@@ -0,0 +1,265 @@
+"""Overlay stamping with shared Form XObjects.
+
+Merging a freshly generated overlay PDF into every page with
+``PageObject.merge_page`` copies the overlay's content stream and resources
+into each page and costs one reportlab canvas plus one ``PdfReader`` parse per
+overlay per page. For a long document most of that work is redundant:
+
+* The full-page watermark / QR tiling is identical on every page of the same
+  size. :func:`full_page_overlay_pdf` memoises its PDF by (mode, page size,
+  overlay settings) and :class:`OverlayStamper` turns it into **one** Form
+  XObject that every page paints with a single ``Do`` operator.
+* Footers and barcode strips differ only by page number, so all pages are
+  drawn on one multi-page reportlab canvas per layer
+  (:func:`render_overlay_chunk`) and parsed once. Their fonts and QR images
+  are embedded once and shared by every page form.
+* Drawing those canvases is CPU-bound pure Python; ``stamp_workers > 1``
+  renders contiguous page ranges in worker processes
+  (:func:`render_overlay_chunks`) while the parent assembles the output.
+
+Stamping wraps the page's original content in ``q`` … ``Q`` before painting
+the overlays, exactly as ``merge_page`` isolates the graphics state, so the
+rendered result is unchanged.
+"""
+
+from __future__ import annotations
+
+import functools
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from infrastructure.core.logging.utils import get_logger
+from infrastructure.steganography.overlays import FooterConfig
+
+logger = get_logger(__name__)
+
+__all__ = [
+    "MIN_PAGES_PER_CHUNK",
+    "OverlayChunk",
+    "OverlayStamper",
+    "full_page_overlay_pdf",
+    "render_overlay_chunk",
+    "render_overlay_chunks",
+]
+
+MIN_PAGES_PER_CHUNK = 25
+"""Smallest page range worth a worker process (process start-up dominates below this)."""
+
+_FORM_PREFIX = "/StegOverlay"
+
+
+@functools.lru_cache(maxsize=32)
+def full_page_overlay_pdf(
+    mode: str,
+    page_width: float,
+    page_height: float,
+    settings: tuple[Any, ...],
+) -> bytes:
+    """Return the one-page watermark (``mode='text'``) or QR-tile (``mode='qr'``) overlay PDF.
+
+    ``settings`` is the hashable overlay configuration for ``mode``:
+    ``(text, opacity, color_rgb, font_size, repeat_count)`` for text and
+    ``(qr_data, opacity)`` for QR. Results are memoised per process, so every
+    page of a given size — and every document stamped with the same settings —
+    reuses one rendering.
+    """
+    if mode == "qr":
+        from infrastructure.steganography.overlays import create_qr_overlay
+
+        qr_data, opacity = settings
+        return create_qr_overlay(page_width, page_height, qr_data=qr_data, opacity=opacity)
+
+    from infrastructure.steganography.overlays import create_watermark_overlay
+
+    text, opacity, color_rgb, font_size, repeat_count = settings
+    return create_watermark_overlay(
+        page_width,
+        page_height,
+        text=text,
+        opacity=opacity,
+        color_rgb=color_rgb,
+        font_size=font_size,
+        repeat_count=repeat_count,
+    )
+
+
+@dataclass(frozen=True)
+class OverlayChunk:
+    """Everything needed to draw the per-page layers of one contiguous page range.
+
+    Picklable so a range can be rendered in a worker process. ``footers`` and
+    ``code128_payloads`` are empty when the corresponding layer is disabled.
+    """
+
+    page_sizes: tuple[tuple[float, float], ...]
+    timestamp: str
+    footers: tuple[FooterConfig, ...] = ()
+    code128_payloads: tuple[str, ...] = ()
+    barcode_fields: dict[str, Any] = field(default_factory=dict)
+
+
+def render_overlay_chunk(chunk: OverlayChunk) -> tuple[bytes | None, bytes | None]:
+    """Draw the footer and barcode-strip documents for ``chunk``.
+
+    Returns ``(footer_pdf, barcode_pdf)``; each is a multi-page PDF with one
+    page per entry of ``chunk.page_sizes``, or ``None`` when the layer is off.
+    """
+    footer_pdf = None
+    if chunk.footers:
+        from infrastructure.steganography.overlays import create_footer_overlays
+
+        footer_pdf = create_footer_overlays(
+            [(w, h, cfg) for (w, h), cfg in zip(chunk.page_sizes, chunk.footers, strict=True)],
+            timestamp=chunk.timestamp,
+        )
+
+    barcode_pdf = None
+    if chunk.code128_payloads:
+        from infrastructure.steganography.barcodes import create_barcode_strip_overlays
+
+        barcode_pdf = create_barcode_strip_overlays(
+            chunk.page_sizes,
+            chunk.code128_payloads,
+            timestamp=chunk.timestamp,
+            **chunk.barcode_fields,
+        )
+    return footer_pdf, barcode_pdf
+
+
+def render_overlay_chunks(
+    chunks: Sequence[OverlayChunk],
+    workers: int = 1,
+) -> list[tuple[bytes | None, bytes | None]]:
+    """Render ``chunks`` in order, using up to ``workers`` processes when there is more than one chunk."""
+    if workers <= 1 or len(chunks) <= 1:
+        return [render_overlay_chunk(chunk) for chunk in chunks]
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+        return list(pool.map(render_overlay_chunk, chunks))
+
+
+class OverlayStamper:
+    """Paints overlay pages onto the pages of one ``PdfWriter`` as shared Form XObjects.
+
+    Usage::
+
+        stamper = OverlayStamper(writer)
+        watermark = stamper.form_for(("text", 612.0, 792.0), lambda: overlay_page)
+        stamper.stamp(writer.pages[0], [watermark, footer_form])
+    """
+
+    def __init__(self, writer: Any) -> None:
+        """Bind the stamper to ``writer``; forms and wrapper streams are added to it lazily."""
+        self._writer = writer
+        self._forms: dict[Any, Any] = {}
+        self._paint_streams: dict[tuple[str, ...], Any] = {}
+        self._save_stream: Any = None
+        self.forms_created = 0
+
+    def form_for(self, key: Any, page_factory: Any) -> Any:
+        """Return the form for ``key``, building it from ``page_factory()`` on first use."""
+        form = self._forms.get(key)
+        if form is None:
+            form = self.form_from_page(page_factory())
+            self._forms[key] = form
+        return form
+
+    def form_from_page(self, page: Any) -> Any:
+        """Add ``page`` (from any reader) to the writer as a Form XObject and return its reference.
+
+        Resources are cloned through the writer, which de-duplicates objects
+        already cloned from the same source — pages of one multi-page overlay
+        document share their fonts and images.
+        """
+        from pypdf.generic import ArrayObject, DecodedStreamObject, DictionaryObject, FloatObject, NameObject
+
+        form = DecodedStreamObject()
+        contents = page.get_contents()
+        form.set_data(contents.get_data() if contents is not None else b"")
+        resources = page.get("/Resources")
+        form.update(
+            {
+                NameObject("/Type"): NameObject("/XObject"),
+                NameObject("/Subtype"): NameObject("/Form"),
+                NameObject("/BBox"): ArrayObject(FloatObject(float(v)) for v in page.mediabox),
+                NameObject("/Resources"): (
+                    resources.get_object().clone(self._writer) if resources is not None else DictionaryObject()
+                ),
+            }
+        )
+        self.forms_created += 1
+        return self._register(form.flate_encode())
+
+    def stamp(self, page: Any, forms: Sequence[Any]) -> None:
+        """Paint ``forms`` (in order, topmost last) over ``page``, a page already in the writer."""
+        if not forms:
+            return
+        from pypdf.generic import ArrayObject, DictionaryObject, NameObject
+
+        # Shallow copies: pages may share one /Resources (or /XObject) dictionary.
+        resources = page.get("/Resources")
+        resources = DictionaryObject(resources.get_object()) if resources is not None else DictionaryObject()
+        xobjects = resources.get("/XObject")
+        xobjects = DictionaryObject(xobjects.get_object()) if xobjects is not None else DictionaryObject()
+
+        names: list[str] = []
+        index = 0
+        for form in forms:
+            while f"{_FORM_PREFIX}{index}" in xobjects:
+                index += 1
+            name = f"{_FORM_PREFIX}{index}"
+            xobjects[NameObject(name)] = form
+            names.append(name)
+            index += 1
+        resources[NameObject("/XObject")] = xobjects
+        page[NameObject("/Resources")] = resources
+
+        page[NameObject("/Contents")] = ArrayObject(
+            [self._save(), *self._content_refs(page), self._paint(tuple(names))]
+        )
+
+    # ── Internals ────────────────────────────────────────────────────
+
+    def _register(self, obj: Any) -> Any:
+        """Add ``obj`` to the writer as a new indirect object and return its reference.
+
+        pypdf has no public call for this (its own ``PageObject.replace_contents``
+        uses ``PdfWriter._add_object``), so this is the only place the stamper
+        touches a private writer method. ``pyproject.toml`` keeps pypdf below 7
+        for that reason, and ``test_stamping`` checks the method still exists.
+        """
+        return self._writer._add_object(obj)
+
+    def _content_refs(self, page: Any) -> list[Any]:
+        from pypdf.generic import ArrayObject, IndirectObject
+
+        if "/Contents" not in page:
+            return []
+        raw = page.raw_get("/Contents")
+        contents = raw.get_object()
+        if isinstance(contents, ArrayObject):
+            return list(contents)
+        if isinstance(raw, IndirectObject):
+            return [raw]
+        return [self._register(contents)]
+
+    def _stream(self, data: bytes) -> Any:
+        from pypdf.generic import DecodedStreamObject
+
+        stream = DecodedStreamObject()
+        stream.set_data(data)
+        return self._register(stream)
+
+    def _save(self) -> Any:
+        if self._save_stream is None:
+            self._save_stream = self._stream(b"q\n")
+        return self._save_stream
+
+    def _paint(self, names: tuple[str, ...]) -> Any:
+        stream = self._paint_streams.get(names)
+        if stream is None:
+            ops = " ".join(f"q {name} Do Q" for name in names)
+            stream = self._stream(f"\nQ\n{ops}\n".encode("ascii"))
+            self._paint_streams[names] = stream
+        return stream
@@ -0,0 +1,269 @@
+"""Content-addressed cache of per-page PDF text.
+
+Output validation, LLM manuscript review and deep-research project context
+each extract text from the same combined manuscript PDF in separate pipeline
+stages. Extraction is a pure function of the PDF bytes and the extractor, so
+the pages are stored once under ``(sha256(pdf), EXTRACTOR_VERSION)`` and every
+later caller — in any process — reads them back from SQLite.
+
+The cache lives at ``$XDG_CACHE_HOME/template/pdf-text.sqlite`` (``~/.cache``
+when unset). ``PDF_TEXT_CACHE=<path>`` moves it and ``PDF_TEXT_CACHE=off``
+disables it. It is bounded to ``max_documents`` PDFs with least-recently-used
+eviction; an unwritable cache location only costs the speed-up, never the
+extraction.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from infrastructure.core.logging.utils import get_logger
+from infrastructure.core.user_cache import CacheStats, connect_cache_db, user_cache_path
+
+logger = get_logger(__name__)
+
+__all__ = [
+    "DEFAULT_PDF_TEXT_CACHE_MAX_DOCUMENTS",
+    "ENV_PDF_TEXT_CACHE",
+    "PdfPageText",
+    "PdfTextCache",
+    "PdfTextCacheStats",
+    "PdfTextExtraction",
+    "default_pdf_text_cache",
+    "extractor_version",
+    "join_page_texts",
+    "pdf_sha256",
+]
+
+ENV_PDF_TEXT_CACHE = "PDF_TEXT_CACHE"
+DEFAULT_PDF_TEXT_CACHE_MAX_DOCUMENTS = 64
+
+# Bump when the page/joining rules in pdf_validator change.
+_CACHE_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    sha256     TEXT NOT NULL,
+    extractor  TEXT NOT NULL,
+    method     TEXT NOT NULL,
+    page_count INTEGER NOT NULL,
+    used_at    REAL NOT NULL,
+    PRIMARY KEY (sha256, extractor)
+);
+CREATE TABLE IF NOT EXISTS pages (
+    sha256    TEXT NOT NULL,
+    extractor TEXT NOT NULL,
+    number    INTEGER NOT NULL,
+    text      TEXT NOT NULL,
+    width     REAL NOT NULL,
+    height    REAL NOT NULL,
+    rotation  INTEGER NOT NULL,
+    PRIMARY KEY (sha256, extractor, number)
+);
+"""
+
+
+@dataclass(frozen=True)
+class PdfPageText:
+    """Text and layout metadata of one page (``number`` is 1-based).
+
+    ``width``/``height`` are the page box in points and ``rotation`` the
+    ``/Rotate`` angle; they are 0 when the extractor does not report them.
+    """
+
+    number: int
+    text: str
+    width: float = 0.0
+    height: float = 0.0
+    rotation: int = 0
+
+
+def join_page_texts(method: str, texts: list[str]) -> str:
+    """Join page texts the way ``method`` joins a whole document.
+
+    pypdf pages are newline-joined, pdfplumber keeps only non-empty pages
+    separated by a blank line, and ``pdftotext`` pages are split on (and
+    re-joined with) its form-feed page breaks.
+    """
+    if method == "pdfplumber":
+        return "\n\n".join(text for text in texts if text)
+    if method == "pdftotext":
+        return "\f".join(texts)
+    return "\n".join(texts)
+
+
+@dataclass(frozen=True)
+class PdfTextExtraction:
+    """All pages of one PDF as extracted by ``method``."""
+
+    sha256: str
+    method: str
+    pages: tuple[PdfPageText, ...]
+
+    @property
+    def text(self) -> str:
+        """The whole-document text, identical to an uncached extraction."""
+        return join_page_texts(self.method, [page.text for page in self.pages])
+
+
+#: Hit/miss/store/eviction counters for one :class:`PdfTextCache` instance.
+PdfTextCacheStats = CacheStats
+
+
+def extractor_version() -> str:
+    """Return the cache-key component identifying the extraction code and pypdf release."""
+    try:
+        import pypdf
+
+        pypdf_version = pypdf.__version__
+    except ImportError:
+        pypdf_version = "missing"
+    return f"{_CACHE_SCHEMA_VERSION}/pypdf-{pypdf_version}"
+
+
+_digest_memo: dict[tuple[str, int, int, int], str] = {}
+_digest_lock = threading.Lock()
+
+
+def pdf_sha256(pdf_path: Path) -> str:
+    """Return the SHA-256 of ``pdf_path``, streamed and memoised per file version in this process."""
+    st = pdf_path.stat()
+    key = (str(pdf_path.resolve()), st.st_size, st.st_mtime_ns, st.st_ino)
+    with _digest_lock:
+        cached = _digest_memo.get(key)
+    if cached is not None:
+        return cached
+    digest = hashlib.sha256()
+    with open(pdf_path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1024 * 1024), b""):
+            digest.update(chunk)
+    value = digest.hexdigest()
+    with _digest_lock:
+        _digest_memo[key] = value
+    return value
+
+
+class PdfTextCache:
+    """SQLite-backed page store keyed by ``(pdf sha256, extractor version)``.
+
+    Thread- and process-safe: each operation opens its own connection and the
+    counters are guarded by a Lock.
+    """
+
+    def __init__(
+        self,
+        db_path: Path | str,
+        *,
+        max_documents: int = DEFAULT_PDF_TEXT_CACHE_MAX_DOCUMENTS,
+    ) -> None:
+        """Open (lazily) the cache at ``db_path``."""
+        self.db_path = Path(db_path)
+        self.max_documents = max(1, max_documents)
+        self.stats = PdfTextCacheStats()
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        return connect_cache_db(self.db_path, _SCHEMA)
+
+    def get(self, sha256: str, extractor: str) -> PdfTextExtraction | None:
+        """Return the cached extraction (refreshing its recency), or ``None``."""
+        conn = self._connect()
+        try:
+            with conn:
+                row = conn.execute(
+                    "SELECT method, page_count FROM documents WHERE sha256 = ? AND extractor = ?",
+                    (sha256, extractor),
+                ).fetchone()
+                pages: list[PdfPageText] = []
+                if row is not None:
+                    pages = [
+                        PdfPageText(number, text, width, height, rotation)
+                        for number, text, width, height, rotation in conn.execute(
+                            "SELECT number, text, width, height, rotation FROM pages "
+                            "WHERE sha256 = ? AND extractor = ? ORDER BY number",
+                            (sha256, extractor),
+                        )
+                    ]
+                    conn.execute(
+                        "UPDATE documents SET used_at = ? WHERE sha256 = ? AND extractor = ?",
+                        (time.time(), sha256, extractor),
+                    )
+        finally:
+            conn.close()
+        hit = row is not None and len(pages) == row[1]
+        with self._lock:
+            if hit:
+                self.stats.hits += 1
+            else:
+                self.stats.misses += 1
+        return PdfTextExtraction(sha256, str(row[0]), tuple(pages)) if hit else None
+
+    def put(self, extraction: PdfTextExtraction, extractor: str) -> None:
+        """Store ``extraction``, evicting least-recently-used documents beyond ``max_documents``."""
+        conn = self._connect()
+        try:
+            with conn:
+                key = (extraction.sha256, extractor)
+                conn.execute("DELETE FROM pages WHERE sha256 = ? AND extractor = ?", key)
+                conn.execute(
+                    "INSERT OR REPLACE INTO documents (sha256, extractor, method, page_count, used_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (*key, extraction.method, len(extraction.pages), time.time()),
+                )
+                conn.executemany(
+                    "INSERT INTO pages (sha256, extractor, number, text, width, height, rotation) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    ((*key, p.number, p.text, p.width, p.height, p.rotation) for p in extraction.pages),
+                )
+                stale = conn.execute(
+                    "SELECT sha256, extractor FROM documents ORDER BY used_at DESC, rowid DESC LIMIT -1 OFFSET ?",
+                    (self.max_documents,),
+                ).fetchall()
+                for stale_key in stale:
+                    conn.execute("DELETE FROM pages WHERE sha256 = ? AND extractor = ?", stale_key)
+                    conn.execute("DELETE FROM documents WHERE sha256 = ? AND extractor = ?", stale_key)
+        finally:
+            conn.close()
+        with self._lock:
+            self.stats.stores += 1
+            self.stats.evictions += len(stale)
+
+    def __len__(self) -> int:
+        if not self.db_path.exists():
+            return 0
+        conn = self._connect()
+        try:
+            return int(conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0])
+        finally:
+            conn.close()
+
+    def clear(self) -> int:
+        """Delete every cached document. Returns the number of documents removed."""
+        if not self.db_path.exists():
+            return 0
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM pages")
+                return conn.execute("DELETE FROM documents").rowcount
+        finally:
+            conn.close()
+
+
+_default_caches: dict[Path, PdfTextCache] = {}
+
+
+def default_pdf_text_cache() -> PdfTextCache | None:
+    """Return the process-wide cache selected by ``PDF_TEXT_CACHE``, or ``None`` when disabled."""
+    path = user_cache_path(ENV_PDF_TEXT_CACHE, "pdf-text.sqlite")
+    if path is None:
+        return None
+    cache = _default_caches.get(path)
+    if cache is None:
+        cache = _default_caches.setdefault(path, PdfTextCache(path))
+    return cache
@@ -2,7 +2,9 @@
 PDF validation module for detecting rendering issues and verifying document structure.
 
 This module provides functions to:
-- Extract text from PDF files
+- Extract text from PDF files (whole-document or page by page), served from
+  the content-addressed page cache in :mod:`.pdf_text_cache` when the same
+  PDF bytes were extracted before — by this or any other pipeline stage
 - Scan for rendering issues (unresolved references, warnings, errors)
 - Extract first N words to verify document structure
 - Generate comprehensive validation reports
@@ -14,16 +16,40 @@ import contextlib
 import io
 import re
 import shutil
+import sqlite3
 import subprocess
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
 from infrastructure.core.exceptions import PDFValidationError
 from infrastructure.core.logging.utils import get_logger
+from infrastructure.core.worker_policy import ENV_PDF_TEXT_WORKERS, resolve_bounded_workers
+from infrastructure.validation.content.pdf_text_cache import (
+    PdfPageText,
+    PdfTextCache,
+    PdfTextExtraction,
+    default_pdf_text_cache,
+    extractor_version,
+    join_page_texts,
+    pdf_sha256,
+)
 
 logger = get_logger(__name__)
 
-__all__ = ["PDFValidationError", "extract_text_from_pdf", "validate_pdf_rendering"]
+__all__ = [
+    "PDFValidationError",
+    "extract_pdf_pages",
+    "extract_text_from_pdf",
+    "iter_pdf_pages",
+    "pdf_text_prefix",
+    "validate_pdf_rendering",
+]
+
+# Below this many pages a worker pool costs more than it saves.
+_PARALLEL_MIN_PAGES = 48
+_DEFAULT_MAX_PDF_TEXT_WORKERS = 4
 
 
 def extract_text_from_pdf(pdf_path: Path) -> str:
@@ -32,6 +58,7 @@ def extract_text_from_pdf(pdf_path: Path) -> str:
 
     Performs comprehensive validation and uses multiple PDF libraries as fallbacks
     for maximum compatibility with different PDF formats and corruption levels.
+    Results are cached per PDF content (see :func:`extract_pdf_pages`).
 
     Args:
         pdf_path: Path to the PDF file
@@ -42,6 +69,114 @@ def extract_text_from_pdf(pdf_path: Path) -> str:
     Raises:
         PDFValidationError: If file doesn't exist, is corrupted, or text extraction fails
     """
+    return extract_pdf_pages(pdf_path).text
+
+
+def extract_pdf_pages(
+    pdf_path: Path,
+    *,
+    cache: PdfTextCache | None = None,
+    workers: int | None = None,
+) -> PdfTextExtraction:
+    """
+    Extract every page of a PDF, consulting the content-addressed page cache first.
+
+    On a miss, pypdf extracts page ranges in parallel worker processes for
+    documents of 48+ pages (``PDF_TEXT_WORKERS`` overrides the CPU-bounded
+    default of at most 4), then pdfplumber and ``pdftotext`` are tried in turn
+    as fallbacks. Successful extractions are stored for later callers.
+
+    Args:
+        pdf_path: Path to the PDF file
+        cache: Page cache to use (default: :func:`default_pdf_text_cache`,
+            which honours ``PDF_TEXT_CACHE``)
+        workers: pypdf worker processes (default: ``PDF_TEXT_WORKERS`` policy)
+
+    Returns:
+        Per-page text and layout metadata; ``.text`` is the joined document text
+
+    Raises:
+        PDFValidationError: If file doesn't exist, is corrupted, or text extraction fails
+    """
+    file_size = _check_pdf_file(pdf_path)
+    cache = cache if cache is not None else default_pdf_text_cache()
+    sha256 = pdf_sha256(pdf_path)
+    cached = _cache_get(cache, sha256)
+    if cached is not None:
+        logger.debug(f"PDF text cache hit for {pdf_path.name} ({len(cached.pages)} pages)")
+        return cached
+
+    extraction = _extract_uncached(pdf_path, sha256, file_size, workers)
+    _cache_put(cache, extraction)
+    return extraction
+
+
+def iter_pdf_pages(pdf_path: Path, *, cache: PdfTextCache | None = None) -> Iterator[PdfPageText]:
+    """
+    Yield the pages of a PDF in order, extracting lazily on a cache miss.
+
+    The pages are exactly those of :func:`extract_pdf_pages`, but a caller that
+    stops iterating early (see :func:`pdf_text_prefix`) never pays for the
+    rest of the document. A fully consumed pypdf pass is stored in the cache.
+
+    Raises:
+        PDFValidationError: If file doesn't exist, is corrupted, or text extraction fails
+    """
+    _check_pdf_file(pdf_path)
+    cache = cache if cache is not None else default_pdf_text_cache()
+    sha256 = pdf_sha256(pdf_path)
+    cached = _cache_get(cache, sha256)
+    if cached is not None:
+        yield from cached.pages
+        return
+
+    collected: list[PdfPageText] = []
+    yielded = 0
+    try:
+        from pypdf import PdfReader
+
+        with open(pdf_path, "rb") as fh:
+            with contextlib.redirect_stderr(io.StringIO()):
+                reader = PdfReader(fh)
+                page_count = len(reader.pages)
+            for index in range(page_count):
+                with contextlib.redirect_stderr(io.StringIO()):
+                    collected.append(_pypdf_page(reader.pages[index], index + 1))
+                # Hold back leading blank pages: an all-blank pypdf pass falls back below.
+                if yielded or collected[-1].text.strip():
+                    yield from collected[yielded:]
+                    yielded = len(collected)
+    except Exception as e:  # noqa: BLE001 — PDF library exceptions vary by backend
+        if yielded:
+            raise PDFValidationError(f"pypdf extraction failed after page {yielded}: {e}") from e
+        logger.debug(f"Lazy pypdf extraction unavailable ({e}); falling back to full extraction")
+    else:
+        if yielded:
+            _cache_put(cache, PdfTextExtraction(sha256, "pypdf", tuple(collected)))
+            return
+
+    yield from extract_pdf_pages(pdf_path, cache=cache).pages
+
+
+def pdf_text_prefix(pdf_path: Path, max_chars: int) -> str:
+    """
+    Return newline-joined page text, stopping once it holds more than ``max_chars`` non-blank characters.
+
+    ``pdf_text_prefix(p, n).strip()[:n]`` equals the same slice of the full
+    document text (for the pypdf extractor), so callers that truncate to a
+    budget can skip extracting the remaining pages.
+    """
+    texts: list[str] = []
+    for page in iter_pdf_pages(pdf_path):
+        texts.append(page.text)
+        joined = "\n".join(texts)
+        if len(joined.strip()) > max_chars:
+            return joined
+    return "\n".join(texts)
+
+
+def _check_pdf_file(pdf_path: Path) -> int:
+    """Validate existence and size bounds; return the file size in bytes."""
     if not pdf_path.exists():
         raise PDFValidationError(f"PDF file not found: {pdf_path}")
 
@@ -54,22 +189,46 @@ def extract_text_from_pdf(pdf_path: Path) -> str:
 
     if file_size > 100 * 1024 * 1024:  # More than 100MB
         raise PDFValidationError(f"PDF file is too large ({file_size / 1024 / 1024:.1f} MB) - exceeds safety limit")
+    return file_size
+
 
+def _cache_get(cache: PdfTextCache | None, sha256: str) -> PdfTextExtraction | None:
+    if cache is None:
+        return None
+    try:
+        return cache.get(sha256, extractor_version())
+    except (sqlite3.Error, OSError) as e:
+        logger.debug(f"PDF text cache unavailable at {cache.db_path}: {e}")
+        return None
+
+
+def _cache_put(cache: PdfTextCache | None, extraction: PdfTextExtraction) -> None:
+    if cache is None:
+        return
+    try:
+        cache.put(extraction, extractor_version())
+    except (sqlite3.Error, OSError) as e:
+        logger.debug(f"Could not store PDF text in cache at {cache.db_path}: {e}")
+
+
+def _extract_uncached(pdf_path: Path, sha256: str, file_size: int, workers: int | None) -> PdfTextExtraction:
+    """Run the extractor fallback chain and return the first non-empty result."""
     # Try extraction with multiple libraries in order of preference
-    extraction_methods = [
-        ("pypdf", _extract_with_pypdf),
-        ("pdfplumber", _extract_with_pdfplumber),
-        ("pdftotext", _extract_with_pdftotext),
+    extraction_methods: list[tuple[str, Callable[[Path], list[PdfPageText]]]] = [
+        ("pypdf", lambda path: _pages_with_pypdf(path, workers)),
+        ("pdfplumber", _pages_with_pdfplumber),
+        ("pdftotext", _pages_with_pdftotext),
     ]
 
     last_error = None
     for method_name, extract_func in extraction_methods:
         try:
             logger.debug(f"Attempting PDF text extraction with {method_name}")
-            text = extract_func(pdf_path)
+            pages = extract_func(pdf_path)
+            text = join_page_texts(method_name, [page.text for page in pages])
             if text and text.strip():
                 logger.debug(f"Successfully extracted {len(text)} characters with {method_name}")
-                return text
+                return PdfTextExtraction(sha256, method_name, tuple(pages))
             else:
                 logger.debug(f"{method_name} returned empty text, trying next method")
                 continue
@@ -108,9 +267,19 @@ def extract_text_from_pdf(pdf_path: Path) -> str:
     )
 
 
-def _extract_with_pypdf(pdf_path: Path) -> str:
-    """Extract text using pypdf library."""
+def _pypdf_page(page: Any, number: int) -> PdfPageText:
+    box = page.mediabox
+    return PdfPageText(
+        number=number,
+        text=page.extract_text(),
+        width=float(box.width),
+        height=float(box.height),
+        rotation=int(page.rotation or 0),
+    )
 
+
+def _pypdf_page_range(pdf_path: str, start: int, stop: int) -> list[PdfPageText]:
+    """Extract pages ``[start, stop)`` with a private reader (process-pool worker)."""
     from pypdf import PdfReader
 
     with open(pdf_path, "rb") as file:
@@ -118,30 +287,55 @@ def _extract_with_pypdf(pdf_path: Path) -> str:
         stderr_capture = io.StringIO()
         with contextlib.redirect_stderr(stderr_capture):
             pdf_reader = PdfReader(file)
-            text_parts = []
-
-            for page in pdf_reader.pages:
-                text_parts.append(page.extract_text())
+            return [_pypdf_page(pdf_reader.pages[index], index + 1) for index in range(start, stop)]
 
-        return "\n".join(text_parts)
 
+def _pages_with_pypdf(pdf_path: Path, workers: int | None = None) -> list[PdfPageText]:
+    """Extract pages with pypdf, splitting long documents across worker processes."""
+    from pypdf import PdfReader
 
-def _extract_with_pdfplumber(pdf_path: Path) -> str:
-    """Extract text using pdfplumber library."""
+    with open(pdf_path, "rb") as file, contextlib.redirect_stderr(io.StringIO()):
+        page_count = len(PdfReader(file).pages)
+
+    if workers is None:
+        workers = (
+            resolve_bounded_workers(
+                env_name=ENV_PDF_TEXT_WORKERS,
+                item_count=page_count,
+                default_cap=_DEFAULT_MAX_PDF_TEXT_WORKERS,
+                invalid="fallback",
+            )
+            if page_count >= _PARALLEL_MIN_PAGES
+            else 1
+        )
+    if workers <= 1 or page_count < 2:
+        return _pypdf_page_range(str(pdf_path), 0, page_count)
+
+    step = -(-page_count // workers)
+    ranges = [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+    logger.debug(f"Extracting {page_count} pages with {len(ranges)} pypdf workers")
+    with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+        chunks = pool.map(_pypdf_page_range, [str(pdf_path)] * len(ranges), *zip(*ranges, strict=True))
+        return [page for chunk in chunks for page in chunk]
+
+
+def _pages_with_pdfplumber(pdf_path: Path) -> list[PdfPageText]:
     import pdfplumber
 
-    text_parts = []
     with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
-            page_text = page.extract_text()
-            if page_text:
-                text_parts.append(page_text)
-
-    return "\n\n".join(text_parts)
-
-
-def _extract_with_pdftotext(pdf_path: Path) -> str:
-    """Extract text using the Poppler ``pdftotext`` CLI when available."""
+        return [
+            PdfPageText(
+                number=index,
+                text=page.extract_text() or "",
+                width=float(page.width),
+                height=float(page.height),
+                rotation=int(getattr(page, "rotation", 0) or 0),
+            )
+            for index, page in enumerate(pdf.pages, start=1)
+        ]
+
+
+def _pages_with_pdftotext(pdf_path: Path) -> list[PdfPageText]:
     if shutil.which("pdftotext") is None:
         raise ImportError("pdftotext CLI is not available")
 
@@ -156,7 +350,23 @@ def _extract_with_pdftotext(pdf_path: Path) -> str:
         stderr = result.stderr.strip()
         raise PDFValidationError(f"pdftotext failed with exit code {result.returncode}: {stderr}")
 
-    return result.stdout
+    # pdftotext ends every page with a form feed; splitting on it keeps the join lossless.
+    return [PdfPageText(number=index, text=text) for index, text in enumerate(result.stdout.split("\f"), start=1)]
+
+
+def _extract_with_pypdf(pdf_path: Path) -> str:
+    """Extract text using pypdf library."""
+    return join_page_texts("pypdf", [page.text for page in _pages_with_pypdf(pdf_path, workers=1)])
+
+
+def _extract_with_pdfplumber(pdf_path: Path) -> str:
+    """Extract text using pdfplumber library."""
+    return join_page_texts("pdfplumber", [page.text for page in _pages_with_pdfplumber(pdf_path)])
+
+
+def _extract_with_pdftotext(pdf_path: Path) -> str:
+    """Extract text using the Poppler ``pdftotext`` CLI when available."""
+    return join_page_texts("pdftotext", [page.text for page in _pages_with_pdftotext(pdf_path)])
 
 
 def scan_for_issues(text: str) -> dict[str, int]:
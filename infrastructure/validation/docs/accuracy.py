@@ -8,6 +8,7 @@ import yaml
 
 from infrastructure.core.logging.utils import get_logger
 from infrastructure.validation.docs.consistency_lint import is_placeholder_name
+from infrastructure.validation.docs.corpus import heading_slug
 from infrastructure.validation.docs.models import LinkIssue, ScanAccuracyIssue
 
 logger = get_logger(__name__)
@@ -16,9 +17,6 @@ _CONFIG_REF_RE = re.compile(
     r"`([a-z][a-z0-9_]*(?:\.[a-z][a-z0-9_]*)+)`",
     re.IGNORECASE,
 )
-_INLINE_CODE_RE = re.compile(r"`([^`]*)`")
-_MD_LINK_TEXT_RE = re.compile(r"!?\[([^\]]*)\]\([^)]*\)")
-_HTML_TAG_RE = re.compile(r"<[^>]+>")
 
 _TERMINOLOGY_RULES: tuple[tuple[re.Pattern[str], str, str], ...] = (
     (
@@ -34,16 +32,6 @@ _TERMINOLOGY_RULES: tuple[tuple[re.Pattern[str], str, str], ...] = (
 )
 
 
-def heading_slug(text: str) -> str:
-    """Return the GitHub-Flavored-Markdown anchor slug for heading text."""
-    rendered = _INLINE_CODE_RE.sub(r"\1", text.strip())
-    rendered = _MD_LINK_TEXT_RE.sub(r"\1", rendered)
-    rendered = _HTML_TAG_RE.sub("", rendered)
-    rendered = re.sub(r"[*~]+", "", rendered).lower()
-    rendered = re.sub(r"[^\w\s-]", "", rendered, flags=re.UNICODE)
-    return rendered.replace(" ", "-")
-
-
 def extract_headings(content: str) -> set[str]:
     """Extract GitHub-compatible heading and explicit HTML anchors.
 
@@ -6,12 +6,16 @@ import re
 from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from infrastructure.core.logging.utils import get_logger
 from infrastructure.project.public_scope import PUBLIC_PROJECT_NAMES
 from infrastructure.validation.docs._io import read_markdown as read_markdown  # back-compat re-export  # noqa: PLC0414
 from infrastructure.validation.docs.scan_scope import DEFAULT_EXCLUDE_PARTS
 
+if TYPE_CHECKING:
+    from infrastructure.validation.docs.corpus import MarkdownCorpus, MarkdownDocument
+
 logger = get_logger(__name__)
 
 DEFAULT_LONG_LIVED_DOC_ROOTS: tuple[str, ...] = (
@@ -64,6 +68,8 @@ CONDITIONAL_PHRASES: tuple[str, ...] = (
     "noqa: docs-lint",
 )
 
+_CONDITIONAL_RE = re.compile("|".join(re.escape(phrase) for phrase in CONDITIONAL_PHRASES))
+
 MD_GLOB = "*.md"
 
 #: Dated point-in-time assessment reports at the repo root (e.g.
@@ -117,8 +123,7 @@ def line_has_noqa(line: str) -> bool:
 
 def line_is_conditional(line: str) -> bool:
     """True if *line* contains language that contextualizes a rotating-project mention."""
-    low = line.lower()
-    return any(phrase in low for phrase in CONDITIONAL_PHRASES)
+    return _CONDITIONAL_RE.search(line.lower()) is not None
 
 
 def discover_infra_packages(repo_root: Path) -> list[str]:
@@ -173,3 +178,14 @@ def iter_long_lived_docs(
             seen.add(md)
             out.append(md)
     return sorted(out)
+
+
+def long_lived_documents(repo_root: Path, corpus: MarkdownCorpus) -> list[MarkdownDocument]:
+    """Return the readable :func:`iter_long_lived_docs` files parsed through *corpus*.
+
+    Discovery is memoised on the corpus, so the checks of one sweep walk the
+    long-lived roots once and share each file's parse.
+    """
+    files = corpus.scope(("long-lived", repo_root), lambda: iter_long_lived_docs(repo_root))
+    corpus.prime(files)
+    return corpus.documents(files)
@@ -10,12 +10,11 @@ from infrastructure.project.discovery import discover_projects
 from infrastructure.project.public_scope import PUBLIC_PROJECT_NAMES
 from infrastructure.validation.docs.consistency._shared import (
     Inconsistency,
-    blank_fences,
-    iter_long_lived_docs,
     line_has_noqa,
     line_is_conditional,
-    read_markdown,
+    long_lived_documents,
 )
+from infrastructure.validation.docs.corpus import MarkdownCorpus
 
 STATIC_PLACEHOLDER_NAMES: frozenset[str] = frozenset(
     {
@@ -62,6 +61,8 @@ def check_no_ghost_projects(
     repo_root: Path,
     canonical: tuple[str, ...] = PUBLIC_PROJECT_NAMES,
     extra_active: Iterable[str] | None = None,
+    *,
+    corpus: MarkdownCorpus | None = None,
 ) -> list[Inconsistency]:
     """Flag unconditional ``projects/<name>/...`` references for non-active projects.
 
@@ -83,12 +84,8 @@ def check_no_ghost_projects(
     )
 
     issues: list[Inconsistency] = []
-    for md in iter_long_lived_docs(repo_root):
-        raw = read_markdown(md)
-        if raw is None:
-            continue
-        text = blank_fences(raw)
-        for line_no, raw_line in enumerate(text.splitlines(), start=1):
+    for document in long_lived_documents(repo_root, corpus if corpus is not None else MarkdownCorpus()):
+        for line_no, raw_line in enumerate(document.fence_blanked_lines, start=1):
             if line_is_conditional(raw_line) or line_has_noqa(raw_line):
                 continue
             for match in pattern.finditer(raw_line):
@@ -119,7 +116,7 @@ def check_no_ghost_projects(
                     continue
                 issues.append(
                     Inconsistency(
-                        file=md,
+                        file=document.path,
                         line=line_no,
                         category="ghost-project",
                         detail=(
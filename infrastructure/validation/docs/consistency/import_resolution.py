@@ -11,16 +11,11 @@ from pathlib import Path
 from infrastructure.validation.docs.consistency._shared import (
     Inconsistency,
     SHELL_NOQA_RE,
-    iter_long_lived_docs,
     line_has_noqa,
-    read_markdown,
+    long_lived_documents,
 )
+from infrastructure.validation.docs.corpus import MarkdownCorpus
 
-_ANY_FENCE_RE = re.compile(
-    r"^[ \t]*(?P<fence>`{3,}|~{3,})[ \t]*(?P<lang>[A-Za-z0-9_+-]*)[ \t]*\n"
-    r"(?P<body>.*?)\n[ \t]*(?P=fence)[ \t]*$",
-    re.MULTILINE | re.DOTALL,
-)
 _CODE_LANGS: frozenset[str] = frozenset({"python", "py", "python3", "", "text", "console", "bash", "sh", "shell"})
 _DASH_M_RE = re.compile(r"-m\s+(?P<mod>infrastructure(?:\.[A-Za-z_]\w*)+)")
 _IMPORT_START_RE = re.compile(r"^\s*(?:from\s+infrastructure|import\s+infrastructure)\b")
@@ -88,19 +83,16 @@ def _resolve_import_statement(stmt: str) -> str | None:
     return None
 
 
-def check_doc_imports_resolve(repo_root: Path) -> list[Inconsistency]:
+def check_doc_imports_resolve(repo_root: Path, *, corpus: MarkdownCorpus | None = None) -> list[Inconsistency]:
     """Flag ``infrastructure`` imports / ``-m infrastructure.X`` in docs that don't resolve."""
     issues: list[Inconsistency] = []
-    for md in iter_long_lived_docs(repo_root):
-        raw = read_markdown(md)
-        if raw is None:
-            continue
-        for fence in _ANY_FENCE_RE.finditer(raw):
-            if fence.group("lang").lower() not in _CODE_LANGS:
+    for document in long_lived_documents(repo_root, corpus if corpus is not None else MarkdownCorpus()):
+        md = document.path
+        for fence in document.code_fences:
+            if fence.lang.lower() not in _CODE_LANGS:
                 continue
-            body = fence.group("body")
-            base_line = raw[: fence.start("body")].count("\n") + 1
-            body_lines = body.splitlines()
+            base_line = fence.body_line
+            body_lines = fence.body.splitlines()
             i = 0
             while i < len(body_lines):
                 line = body_lines[i]
@@ -6,7 +6,8 @@ from collections.abc import Sequence
 from pathlib import Path
 
 from infrastructure.project.public_scope import PUBLIC_PROJECT_NAMES
-from infrastructure.validation.docs.consistency._shared import Inconsistency, read_markdown
+from infrastructure.validation.docs.consistency._shared import Inconsistency
+from infrastructure.validation.docs.corpus import MarkdownCorpus
 
 MEMORY_DECISION_RULE = "docs/rules/memory_and_decision_records.md"
 MEMORY_DECISION_BASENAME = "memory_and_decision_records.md"
@@ -26,31 +27,28 @@ def _has_memory_rule_link(text: str) -> bool:
     return MEMORY_DECISION_BASENAME in text or MEMORY_DECISION_RULE in text
 
 
-def _line_for_end(path: Path) -> int:
-    text = read_markdown(path)
-    return len(text.splitlines()) if text else 1
-
-
 def check_memory_decision_rule_links(
     repo_root: Path,
     *,
     required_relative_docs: Sequence[str] = DEFAULT_REQUIRED_MEMORY_RULE_DOCS,
     public_project_names: Sequence[str] = PUBLIC_PROJECT_NAMES,
+    corpus: MarkdownCorpus | None = None,
 ) -> list[Inconsistency]:
     """Flag agent/workflow docs that omit the decision-memory rule link."""
+    corpus = corpus if corpus is not None else MarkdownCorpus()
     issues: list[Inconsistency] = []
 
     for relative in required_relative_docs:
         doc = repo_root / relative
         if not doc.is_file():
             continue
-        text = read_markdown(doc)
-        if text is None or _has_memory_rule_link(text):
+        document = corpus.get(doc)
+        if document is None or _has_memory_rule_link(document.text):
             continue
         issues.append(
             Inconsistency(
                 file=doc,
-                line=_line_for_end(doc),
+                line=len(document.lines) or 1,
                 category="memory-decision-rule",
                 detail=(
                     "agent or workflow policy doc should link to "
@@ -65,13 +63,13 @@ def check_memory_decision_rule_links(
         doc = repo_root / "projects" / project_name / "AGENTS.md"
         if not doc.is_file():
             continue
-        text = read_markdown(doc)
-        if text is None or _has_memory_rule_link(text):
+        document = corpus.get(doc)
+        if document is None or _has_memory_rule_link(document.text):
             continue
         issues.append(
             Inconsistency(
                 file=doc,
-                line=_line_for_end(doc),
+                line=len(document.lines) or 1,
                 category="memory-decision-rule",
                 detail=(
                     "public exemplar AGENTS.md should link to "
@@ -7,12 +7,11 @@ from pathlib import Path
 
 from infrastructure.validation.docs.consistency._shared import (
     Inconsistency,
-    blank_fences,
     discover_infra_packages,
-    iter_long_lived_docs,
     line_has_noqa,
-    read_markdown,
+    long_lived_documents,
 )
+from infrastructure.validation.docs.corpus import MarkdownCorpus
 
 _PACKAGE_COUNT_LINE_RE = re.compile(
     r"^(?=.*(?:\b(?:Python|importable|subpackages)\b|`infrastructure/`)).*?"
@@ -58,15 +57,22 @@ def line_records_correction(line: str, claimed: int) -> bool:
     return False
 
 
-def check_module_count_claims(repo_root: Path, expected_count: int | None = None) -> list[Inconsistency]:
+def check_module_count_claims(
+    repo_root: Path,
+    expected_count: int | None = None,
+    *,
+    corpus: MarkdownCorpus | None = None,
+) -> list[Inconsistency]:
     """Verify Markdown claims about ``N Python (sub)packages`` match reality."""
     expected = expected_count if expected_count is not None else len(discover_infra_packages(repo_root))
     issues: list[Inconsistency] = []
-    for md in iter_long_lived_docs(repo_root):
-        raw = read_markdown(md)
-        if raw is None:
+    for document in long_lived_documents(repo_root, corpus if corpus is not None else MarkdownCorpus()):
+        text, lines = document.fence_blanked, document.fence_blanked_lines
+        # Every claim regex needs a literal "packages" or "areas"; skip the
+        # (expensive, line-anchored) scans on documents with neither.
+        low = text.lower()
+        if "packages" not in low and "areas" not in low:
             continue
-        text = blank_fences(raw)
         seen_lines: set[int] = set()
         for regex in (
             _PACKAGE_COUNT_LINE_RE,
@@ -80,14 +86,14 @@ def check_module_count_claims(repo_root: Path, expected_count: int | None = None
                     if line in seen_lines:
                         continue
                     seen_lines.add(line)
-                    line_text = text.splitlines()[line - 1] if 0 < line <= len(text.splitlines()) else ""
+                    line_text = lines[line - 1] if 0 < line <= len(lines) else ""
                     if line_has_noqa(line_text):
                         continue
                     if line_records_correction(line_text, claimed):
                         continue
                     issues.append(
                         Inconsistency(
-                            file=md,
+                            file=document.path,
                             line=line,
                             category="module-count",
                             detail=(f"claims {claimed} Python (sub)packages but infrastructure/ ships {expected}"),
@@ -96,23 +102,20 @@ def check_module_count_claims(repo_root: Path, expected_count: int | None = None
     return issues
 
 
-def check_canonical_count_singularity(repo_root: Path) -> list[Inconsistency]:
+def check_canonical_count_singularity(repo_root: Path, *, corpus: MarkdownCorpus | None = None) -> list[Inconsistency]:
     """Flag a bare ``NNN .py files`` literal outside COUNTS.md."""
     from infrastructure.validation.docs.consistency._shared import SHELL_NOQA_RE
 
-    canonical = repo_root / "docs" / "_generated" / "COUNTS.md"
+    canonical = (repo_root / "docs" / "_generated" / "COUNTS.md").resolve()
     issues: list[Inconsistency] = []
-    for md in iter_long_lived_docs(repo_root):
-        if md.resolve() == canonical.resolve():
+    for document in long_lived_documents(repo_root, corpus if corpus is not None else MarkdownCorpus()):
+        if document.path.resolve() == canonical:
             continue
-        raw = read_markdown(md)
-        if raw is None:
-            continue
-        for n, line in enumerate(raw.splitlines(), 1):
+        for n, line in enumerate(document.lines, 1):
             if _PY_COUNT_RE.search(line) and not (line_has_noqa(line) or SHELL_NOQA_RE.search(line)):
                 issues.append(
                     Inconsistency(
-                        file=md,
+                        file=document.path,
                         line=n,
                         category="count-singularity",
                         detail=(
@@ -7,11 +7,10 @@ from pathlib import Path
 
 from infrastructure.validation.docs.consistency._shared import (
     Inconsistency,
-    blank_fences,
-    iter_long_lived_docs,
     line_has_noqa,
-    read_markdown,
+    long_lived_documents,
 )
+from infrastructure.validation.docs.corpus import MarkdownCorpus
 
 _CONFIG_DISCOVERY_RE = re.compile(
     r"project[^\n|.]{0,80}(?:auto-?discover|discover|finds?)[^\n|.]{0,120}"
@@ -29,7 +28,7 @@ def _mentions_required_markers(line: str) -> bool:
     return "src/" in low and "tests/" in low
 
 
-def check_project_discovery_claims(repo_root: Path) -> list[Inconsistency]:
+def check_project_discovery_claims(repo_root: Path, *, corpus: MarkdownCorpus | None = None) -> list[Inconsistency]:
     """Flag docs that describe ``manuscript/config.yaml`` as the project discovery predicate.
 
     The live discovery contract is stricter: ``validate_project_structure``
@@ -37,12 +36,8 @@ def check_project_discovery_claims(repo_root: Path) -> list[Inconsistency]:
     is metadata/rendering configuration, not the low-level discovery condition.
     """
     issues: list[Inconsistency] = []
-    for md in iter_long_lived_docs(repo_root):
-        raw = read_markdown(md)
-        if raw is None:
-            continue
-        text = blank_fences(raw)
-        lines = text.splitlines()
+    for document in long_lived_documents(repo_root, corpus if corpus is not None else MarkdownCorpus()):
+        lines = document.fence_blanked_lines
         for line_no, line in enumerate(lines, start=1):
             if line_has_noqa(line) or not _CONFIG_DISCOVERY_RE.search(line):
                 continue
@@ -51,7 +46,7 @@ def check_project_discovery_claims(repo_root: Path) -> list[Inconsistency]:
                 continue
             issues.append(
                 Inconsistency(
-                    file=md,
+                    file=document.path,
                     line=line_no,
                     category="project-discovery",
                     detail=(
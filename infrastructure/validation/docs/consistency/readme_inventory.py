@@ -6,15 +6,17 @@ import re
 from pathlib import Path
 
 from infrastructure.validation.docs.consistency._shared import Inconsistency, line_has_noqa
+from infrastructure.validation.docs.corpus import MarkdownCorpus
 
 _FILES_LIST_RE = re.compile(r"^\s*[-*]\s*`?(?P<f>[A-Za-z_]\w*\.py)`?\s*(?:[—:-].*)?$")
 
 
-def check_readme_files_list(repo_root: Path) -> list[Inconsistency]:
+def check_readme_files_list(repo_root: Path, *, corpus: MarkdownCorpus | None = None) -> list[Inconsistency]:
     """Flag ``foo.py`` listed in a package README/AGENTS that exists nowhere in that package."""
     infra = repo_root / "infrastructure"
     if not infra.is_dir():
         return []
+    corpus = corpus if corpus is not None else MarkdownCorpus()
     issues: list[Inconsistency] = []
     for doc_name in ("README.md", "AGENTS.md"):
         for doc in infra.rglob(doc_name):
@@ -22,10 +24,10 @@ def check_readme_files_list(repo_root: Path) -> list[Inconsistency]:
             if not (pkg_dir / "__init__.py").is_file():
                 continue
             present = {p.name for p in pkg_dir.rglob("*.py")}
-            try:
-                lines = doc.read_text(encoding="utf-8").splitlines()
-            except (OSError, UnicodeDecodeError):
+            document = corpus.get(doc)
+            if document is None:
                 continue
+            lines = document.lines
             in_fence = False
             for n, line in enumerate(lines, 1):
                 if re.match(r"^[ \t]*(`{3,}|~{3,})", line):
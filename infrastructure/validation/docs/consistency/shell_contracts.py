@@ -8,17 +8,11 @@ from pathlib import Path
 from infrastructure.validation.docs.consistency._shared import (
     Inconsistency,
     SHELL_NOQA_RE,
-    blank_fences,
-    iter_long_lived_docs,
     line_has_noqa,
-    read_markdown,
+    long_lived_documents,
 )
+from infrastructure.validation.docs.corpus import MarkdownCorpus
 
-_SHELL_FENCE_RE = re.compile(
-    r"^[ \t]*(?P<fence>`{3,}|~{3,})[ \t]*(?P<lang>[A-Za-z0-9_+-]*)[ \t]*\n"
-    r"(?P<body>.*?)\n[ \t]*(?P=fence)[ \t]*$",
-    re.MULTILINE | re.DOTALL,
-)
 _SHELL_LANGS: frozenset[str] = frozenset({"bash", "sh", "shell", "console", "zsh"})
 _BARE_CMD_RE = re.compile(r"^\s*(?:\$\s+)?(?P<cmd>pytest|python3)(?:\s|$)")
 _UV_RUN_PYTHON3_RE = re.compile(r"^\s*(?:\$\s+)?uv\s+run\s+python3(?:\s|$)")
@@ -40,18 +34,16 @@ _DETERMINISTIC_SHELL_STRIP_ACTION_RE = re.compile(
 _DETERMINISTIC_MENTION_RE = re.compile(r"--deterministic|\bdeterministic\b", re.IGNORECASE)
 
 
-def check_command_conventions(repo_root: Path) -> list[Inconsistency]:
+def check_command_conventions(repo_root: Path, *, corpus: MarkdownCorpus | None = None) -> list[Inconsistency]:
     """Flag stale or unpinned repository commands in shell fences."""
     issues: list[Inconsistency] = []
-    for md in iter_long_lived_docs(repo_root):
-        raw = read_markdown(md)
-        if raw is None:
-            continue
-        for fence in _SHELL_FENCE_RE.finditer(raw):
-            if fence.group("lang").lower() not in _SHELL_LANGS:
+    for document in long_lived_documents(repo_root, corpus if corpus is not None else MarkdownCorpus()):
+        md = document.path
+        for fence in document.code_fences:
+            if fence.lang.lower() not in _SHELL_LANGS:
                 continue
-            body_start_line = raw[: fence.start("body")].count("\n") + 1
-            for offset, line in enumerate(fence.group("body").splitlines()):
+            body_start_line = fence.body_line
+            for offset, line in enumerate(fence.body.splitlines()):
                 if _UVX_RUFF_RE.search(line) and not line_has_noqa(line) and not SHELL_NOQA_RE.search(line):
                     issues.append(
                         Inconsistency(
@@ -96,15 +88,12 @@ def check_command_conventions(repo_root: Path) -> list[Inconsistency]:
     return issues
 
 
-def check_stale_shell_contracts(repo_root: Path) -> list[Inconsistency]:
+def check_stale_shell_contracts(repo_root: Path, *, corpus: MarkdownCorpus | None = None) -> list[Inconsistency]:
     """Flag stale bash-orchestration claims superseded by ``shell_bootstrap.sh`` + Python CLI."""
     issues: list[Inconsistency] = []
-    for md in iter_long_lived_docs(repo_root):
-        raw = read_markdown(md)
-        if raw is None:
-            continue
-        text = blank_fences(raw)
-        for line_no, raw_line in enumerate(text.splitlines(), start=1):
+    for document in long_lived_documents(repo_root, corpus if corpus is not None else MarkdownCorpus()):
+        md = document.path
+        for line_no, raw_line in enumerate(document.fence_blanked_lines, start=1):
             if line_has_noqa(raw_line):
                 continue
             if _EXPORT_PIPELINE_MODE_RE.search(raw_line):
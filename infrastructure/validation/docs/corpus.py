@@ -0,0 +1,380 @@
+"""Parse-once Markdown corpus shared by the documentation linters.
+
+The mermaid, cross-link and consistency linters all need the same per-file
+views of the same Markdown: the raw text, the text with fenced code blanked,
+the text with fenced *and* inline code blanked, heading anchors, relative
+links, fenced code blocks and ``mermaid`` fences. :class:`MarkdownCorpus`
+reads each file once, computes each view at most once (lazily, or eagerly
+across worker processes via :meth:`MarkdownCorpus.prime`), and hands the same
+:class:`MarkdownDocument` to every linter in a ``run_docs_lint`` sweep.
+
+Documents are fingerprinted by ``(size, mtime_ns)`` plus a SHA-256 of their
+text. :meth:`MarkdownCorpus.refresh` re-stats every loaded file, re-reads only
+those whose stat signature moved, and reports only those whose content
+actually changed, so incremental consumers such as
+:class:`~infrastructure.validation.docs.cross_link_lint.IncrementalLinkChecker`
+recheck just the files an edit can affect.
+
+Blanking replaces code with same-shape whitespace, so every line number
+reported from a view maps to the source file.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from collections.abc import Callable, Hashable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+
+from infrastructure.core.logging.utils import get_logger
+from infrastructure.core.worker_policy import ENV_DOCS_CORPUS_WORKERS, resolve_bounded_workers
+from infrastructure.validation.docs._io import read_markdown
+from infrastructure.validation.docs.consistency._shared import FENCE_RE, blank_content, blank_fences
+from infrastructure.validation.docs.scan_scope import DEFAULT_EXCLUDE_PARTS, iter_markdown_files
+
+logger = get_logger(__name__)
+
+# Below this many unparsed files, process start-up costs more than parsing.
+_PARALLEL_MIN_FILES = 256
+_DEFAULT_MAX_CORPUS_WORKERS = 8
+
+# Match double-backtick spans first (so the single-backtick stripper doesn't mangle them).
+_DOUBLE_BACKTICK_RE = re.compile(r"``[^`\n]+?``")
+# Match single-backtick spans (no embedded backticks, no newlines).
+_SINGLE_BACKTICK_RE = re.compile(r"`[^`\n]+?`")
+
+# Match `[text](url)` — text can have nested brackets minimally; url is balanced parens-free.
+LINK_RE = re.compile(r"\[(?P<text>[^\]\n]*)\]\((?P<url>[^)\n\s]+)(?:\s+\"[^\"]*\")?\)")
+
+# A fenced block with its info-string language and body (used by the
+# command-convention and doc-import checks).
+CODE_FENCE_RE = re.compile(
+    r"^[ \t]*(?P<fence>`{3,}|~{3,})[ \t]*(?P<lang>[A-Za-z0-9_+-]*)[ \t]*\n"
+    r"(?P<body>.*?)\n[ \t]*(?P=fence)[ \t]*$",
+    re.MULTILINE | re.DOTALL,
+)
+
+# Match fenced mermaid blocks. Captures the body. Multiline. Non-greedy.
+MERMAID_FENCE_RE = re.compile(
+    r"^(?P<fence>`{3,}|~{3,})mermaid[^\n]*\n(?P<body>.*?)\n(?P=fence)",
+    re.MULTILINE | re.DOTALL,
+)
+
+_ATX_HEADING_RE = re.compile(r"^\s{0,3}(#{1,6})\s+(.*?)\s*#*\s*$", re.MULTILINE)
+_EXPLICIT_ID_RE = re.compile(r"""<a\s+(?:id|name)\s*=\s*["']([^"']+)["']""", re.IGNORECASE)
+_CURLY_ID_RE = re.compile(r"\{#([A-Za-z0-9_:.-]+)\}")
+_INLINE_CODE_RE = re.compile(r"`([^`]*)`")
+_MD_LINK_TEXT_RE = re.compile(r"!?\[([^\]]*)\]\([^)]*\)")
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def heading_slug(text: str) -> str:
+    """Return the GitHub-Flavored-Markdown anchor slug for heading text."""
+    rendered = _INLINE_CODE_RE.sub(r"\1", text.strip())
+    rendered = _MD_LINK_TEXT_RE.sub(r"\1", rendered)
+    rendered = _HTML_TAG_RE.sub("", rendered)
+    rendered = re.sub(r"[*~]+", "", rendered).lower()
+    rendered = re.sub(r"[^\w\s-]", "", rendered, flags=re.UNICODE)
+    return rendered.replace(" ", "-")
+
+
+def strip_code(text: str) -> str:
+    """Replace fenced and inline code spans with same-length whitespace."""
+    return _strip_inline_code(FENCE_RE.sub(blank_content, text))
+
+
+def _strip_inline_code(fence_blanked: str) -> str:
+    text = _DOUBLE_BACKTICK_RE.sub(blank_content, fence_blanked)
+    return _SINGLE_BACKTICK_RE.sub(blank_content, text)
+
+
+def anchors_in(raw: str, fence_blanked: str | None = None) -> frozenset[str]:
+    """Return every in-page anchor defined by Markdown source *raw*.
+
+    Covers ATX heading slugs (with GitHub's ``-1``/``-2`` duplicate suffixes),
+    explicit ``<a id="...">``/``<a name="...">`` targets, and ``{#custom-id}``
+    heading attributes. Headings are read from fence-blanked text that keeps
+    inline code, because GitHub slugs the code's text content.
+    """
+    anchors: set[str] = set(_EXPLICIT_ID_RE.findall(raw))
+    seen: dict[str, int] = {}
+    for match in _ATX_HEADING_RE.finditer(blank_fences(raw) if fence_blanked is None else fence_blanked):
+        heading = match.group(2)
+        custom = _CURLY_ID_RE.search(heading)
+        if custom:
+            anchors.add(custom.group(1))
+            heading = _CURLY_ID_RE.sub("", heading)
+        slug = heading_slug(heading)
+        if not slug:
+            continue
+        count = seen.get(slug, 0)
+        seen[slug] = count + 1
+        anchors.add(slug if count == 0 else f"{slug}-{count}")
+    return frozenset(anchors)
+
+
+def _line_numbers(text: str, offsets: Iterable[int]) -> list[int]:
+    """Map ascending character *offsets* to 1-based line numbers in one pass."""
+    lines: list[int] = []
+    line, position = 1, 0
+    for offset in offsets:
+        line += text.count("\n", position, offset)
+        position = offset
+        lines.append(line)
+    return lines
+
+
+@dataclass(frozen=True)
+class MarkdownLink:
+    """A ``[text](target)`` link found outside code."""
+
+    line: int
+    text: str  # original (unblanked) link text
+    target: str
+
+
+@dataclass(frozen=True)
+class CodeFence:
+    """A fenced code block matched by :data:`CODE_FENCE_RE`."""
+
+    lang: str
+    body: str
+    body_line: int  # 1-indexed line of the first body line
+
+
+@dataclass(frozen=True)
+class MermaidFence:
+    """A fenced ``mermaid`` block matched by :data:`MERMAID_FENCE_RE`."""
+
+    line: int  # 1-indexed line of the opening fence
+    body: str  # raw mermaid source between the fences (no trailing newline)
+
+
+class MarkdownDocument:
+    """One Markdown file and its lazily computed parse views.
+
+    Views are ``cached_property`` values, so a document parsed in a worker
+    process pickles back with every view already populated.
+    """
+
+    def __init__(self, path: Path, text: str, signature: tuple[int, int]) -> None:
+        """Wrap *text* read from *path* with stat *signature* ``(size, mtime_ns)``."""
+        self.path = path
+        self.text = text
+        self.signature = signature
+        self.digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def load(cls, path: Path) -> MarkdownDocument | None:
+        """Read *path*, or return ``None`` when it is missing or not valid UTF-8."""
+        signature = _stat_signature(path)
+        text = read_markdown(path) if signature is not None else None
+        if signature is None or text is None:
+            return None
+        return cls(path, text, signature)
+
+    @cached_property
+    def lines(self) -> list[str]:
+        """Raw source lines."""
+        return self.text.splitlines()
+
+    @cached_property
+    def fence_blanked(self) -> str:
+        """Source with fenced code blocks blanked; inline code kept."""
+        return blank_fences(self.text)
+
+    @cached_property
+    def fence_blanked_lines(self) -> list[str]:
+        """Lines of :attr:`fence_blanked`."""
+        return self.fence_blanked.splitlines()
+
+    @cached_property
+    def code_stripped(self) -> str:
+        """Source with fenced code blocks and inline code spans blanked."""
+        return _strip_inline_code(self.fence_blanked)
+
+    @cached_property
+    def anchors(self) -> frozenset[str]:
+        """In-page anchors this document defines (see :func:`anchors_in`)."""
+        return anchors_in(self.text, self.fence_blanked)
+
+    @cached_property
+    def links(self) -> tuple[MarkdownLink, ...]:
+        """Every ``[text](target)`` link outside code, in source order."""
+        matches = list(LINK_RE.finditer(self.code_stripped))
+        lines = _line_numbers(self.code_stripped, (m.start() for m in matches))
+        return tuple(
+            MarkdownLink(line=line, text=self.text[m.start("text") : m.end("text")], target=m.group("url"))
+            for m, line in zip(matches, lines)
+        )
+
+    @cached_property
+    def code_fences(self) -> tuple[CodeFence, ...]:
+        """Fenced code blocks with their info-string language."""
+        matches = list(CODE_FENCE_RE.finditer(self.text))
+        lines = _line_numbers(self.text, (m.start("body") for m in matches))
+        return tuple(
+            CodeFence(lang=m.group("lang"), body=m.group("body"), body_line=line) for m, line in zip(matches, lines)
+        )
+
+    @cached_property
+    def mermaid_fences(self) -> tuple[MermaidFence, ...]:
+        """Fenced ``mermaid`` blocks, including ones carrying a noqa comment."""
+        matches = list(MERMAID_FENCE_RE.finditer(self.text))
+        lines = _line_numbers(self.text, (m.start() for m in matches))
+        return tuple(MermaidFence(line=line, body=m.group("body")) for m, line in zip(matches, lines))
+
+    def parse(self) -> MarkdownDocument:
+        """Compute every view now and return ``self``."""
+        for view in _VIEWS:
+            getattr(self, view)
+        return self
+
+
+_VIEWS = ("lines", "fence_blanked_lines", "code_stripped", "anchors", "links", "code_fences", "mermaid_fences")
+
+
+def _stat_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _parse_documents(paths: list[str]) -> list[MarkdownDocument | None]:
+    """Worker entry point: load and fully parse a chunk of files."""
+    parsed: list[MarkdownDocument | None] = []
+    for raw_path in paths:
+        document = MarkdownDocument.load(Path(raw_path))
+        parsed.append(document.parse() if document is not None else None)
+    return parsed
+
+
+class MarkdownCorpus:
+    """Memoised, path-keyed collection of :class:`MarkdownDocument` objects.
+
+    Also memoises file discovery (:meth:`markdown_files`, :meth:`scope`) so the
+    linters in one sweep walk each scan scope once. Not thread-safe.
+    """
+
+    def __init__(self, *, workers: int | None = None) -> None:
+        """Create an empty corpus; *workers* overrides ``DOCS_CORPUS_WORKERS`` for :meth:`prime`."""
+        self.workers = workers
+        self._documents: dict[Path, MarkdownDocument | None] = {}
+        self._scopes: dict[Hashable, list[Path]] = {}
+
+    def get(self, path: Path) -> MarkdownDocument | None:
+        """Return the document for *path*, reading it on first use (``None`` if unreadable)."""
+        if path not in self._documents:
+            self._documents[path] = MarkdownDocument.load(path)
+        return self._documents[path]
+
+    def documents(self, paths: Iterable[Path]) -> list[MarkdownDocument]:
+        """Return the readable documents among *paths*, in order."""
+        return [document for document in map(self.get, paths) if document is not None]
+
+    def scope(self, key: Hashable, discover: Callable[[], list[Path]]) -> list[Path]:
+        """Return the file list memoised under *key*, running *discover* on first use."""
+        if key not in self._scopes:
+            self._scopes[key] = discover()
+        return self._scopes[key]
+
+    def markdown_files(
+        self,
+        roots: Iterable[Path],
+        *,
+        exclude_parts: Iterable[str] = DEFAULT_EXCLUDE_PARTS,
+        exclude_globs: Iterable[str] = (),
+    ) -> list[Path]:
+        """Memoised :func:`~infrastructure.validation.docs.scan_scope.iter_markdown_files`.
+
+        The tree is walked once per ``(roots, exclude_parts)``; each set of
+        *exclude_globs* is applied to that walk in memory.
+        """
+        roots, exclude_parts, globs = tuple(roots), frozenset(exclude_parts), tuple(exclude_globs)
+        walked = self.scope(
+            ("markdown", roots, exclude_parts),
+            lambda: iter_markdown_files(roots, exclude_parts=exclude_parts),
+        )
+        if not globs:
+            return walked
+        return self.scope(
+            ("markdown", roots, exclude_parts, globs),
+            lambda: [md for md in walked if not any(md.match(glob) for glob in globs)],
+        )
+
+    def prime(self, paths: Iterable[Path]) -> None:
+        """Load and fully parse every not-yet-loaded path, across processes when worthwhile.
+
+        Worker count comes from ``DOCS_CORPUS_WORKERS`` (or the constructor),
+        bounded by the CPU count. Small batches and single-worker hosts parse
+        lazily in-process instead.
+        """
+        pending = [path for path in dict.fromkeys(paths) if path not in self._documents]
+        workers = self.workers
+        if workers is None:
+            workers = (
+                resolve_bounded_workers(
+                    env_name=ENV_DOCS_CORPUS_WORKERS,
+                    item_count=len(pending),
+                    default_cap=_DEFAULT_MAX_CORPUS_WORKERS,
+                    invalid="fallback",
+                )
+                if len(pending) >= _PARALLEL_MIN_FILES
+                else 1
+            )
+        if workers <= 1 or len(pending) < 2:
+            return
+        chunk_count = workers * 4
+        chunks = [[str(path) for path in pending[i::chunk_count]] for i in range(chunk_count)]
+        logger.debug("Parsing %d Markdown files with %d workers", len(pending), workers)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for chunk, parsed in zip(chunks, pool.map(_parse_documents, chunks)):
+                for raw_path, document in zip(chunk, parsed):
+                    self._documents[Path(raw_path)] = document
+
+    def refresh(self) -> set[Path]:
+        """Re-check every loaded file and return the paths whose content changed.
+
+        Files whose ``(size, mtime_ns)`` is unchanged are not read. A moved
+        signature triggers a re-read, but a file is only reported (and its
+        parse views dropped) when its SHA-256 differs, so a bare ``touch`` is
+        free. Vanished and newly unreadable files are reported too. Discovery
+        memos are always cleared so new files are picked up.
+        """
+        self._scopes.clear()
+        changed: set[Path] = set()
+        for path, document in list(self._documents.items()):
+            signature = _stat_signature(path)
+            if document is not None and signature == document.signature:
+                continue
+            if document is None and signature is None:
+                continue
+            fresh = MarkdownDocument.load(path)
+            if document is None and fresh is None:
+                continue
+            if document is not None and fresh is not None and fresh.digest == document.digest:
+                document.signature = fresh.signature
+                continue
+            self._documents[path] = fresh
+            changed.add(path)
+        return changed
+
+
+__all__ = [
+    "CODE_FENCE_RE",
+    "LINK_RE",
+    "MERMAID_FENCE_RE",
+    "CodeFence",
+    "MarkdownCorpus",
+    "MarkdownDocument",
+    "MarkdownLink",
+    "MermaidFence",
+    "anchors_in",
+    "heading_slug",
+    "strip_code",
+]
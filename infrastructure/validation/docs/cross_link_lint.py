@@ -4,8 +4,16 @@ Sweeps Markdown files for relative `[text](path)` and `[text](path#anchor)` link
 returns links that don't resolve on disk. Skips fenced code blocks AND inline-code
 spans (single + double backticks) so URLs inside backticks aren't flagged.
 
+Files are read and parsed through a shared
+:class:`~infrastructure.validation.docs.corpus.MarkdownCorpus`;
+:class:`IncrementalLinkChecker` keeps per-file results between sweeps, in
+memory or across processes through a
+:class:`~infrastructure.validation.docs.link_cache.LinkStateCache`, and
+rechecks only files an edit can affect.
+
 Public API:
     - :class:`BrokenLink`
+    - :class:`IncrementalLinkChecker`
     - :func:`find_broken_links`
 """
 
@@ -18,10 +26,9 @@ from urllib.parse import unquote, urlsplit
 
 from infrastructure.core.logging.utils import get_logger
 from infrastructure.project.public_scope import PUBLIC_PROJECT_NAMES
-from infrastructure.validation.docs._io import read_markdown
-from infrastructure.validation.docs.accuracy import heading_slug
-from infrastructure.validation.docs.consistency._shared import blank_content
-from infrastructure.validation.docs.scan_scope import DEFAULT_EXCLUDE_PARTS, iter_markdown_files
+from infrastructure.validation.docs.corpus import MarkdownCorpus, MarkdownDocument
+from infrastructure.validation.docs.link_cache import LinkStateCache, StoredLinkFile
+from infrastructure.validation.docs.scan_scope import DEFAULT_EXCLUDE_PARTS
 
 logger = get_logger(__name__)
 
@@ -99,21 +106,6 @@ _DEFAULT_EXCLUDE_GLOBS: tuple[str, ...] = (
     "**/_skill-eval/**",
 )
 
-# Match a fenced code block (``` or ~~~), capturing the entire block (incl fences).
-# Allow leading whitespace so indented fences (e.g. inside list items) are matched.
-_FENCE_RE = re.compile(
-    r"^[ \t]*(?P<fence>`{3,}|~{3,}).*?\n.*?\n[ \t]*(?P=fence)",
-    re.MULTILINE | re.DOTALL,
-)
-
-# Match double-backtick spans first (so single-backtick stripper doesn't mangle them).
-_DOUBLE_BACKTICK_RE = re.compile(r"``[^`\n]+?``")
-# Match single-backtick spans (no embedded backticks, no newlines).
-_SINGLE_BACKTICK_RE = re.compile(r"`[^`\n]+?`")
-
-# Match `[text](url)` — text can have nested brackets minimally; url is balanced parens-free.
-_LINK_RE = re.compile(r"\[(?P<text>[^\]\n]*)\]\((?P<url>[^)\n\s]+)(?:\s+\"[^\"]*\")?\)")
-
 # Inline escape hatch — append `<!-- noqa: docs-lint -->` (optionally with a
 # free-form explanatory comment that may itself contain hyphens) to a Markdown
 # line to suppress broken-link warnings on that line.
@@ -135,72 +127,32 @@ class BrokenLink:
         return f"{self.file}:{self.line}: broken link [{self.text}]({self.target}) — {self.reason}"
 
 
-def _iter_markdown_files(roots: Iterable[Path], exclude_globs: Iterable[str]) -> list[Path]:
+def _iter_markdown_files(
+    roots: Iterable[Path], exclude_globs: Iterable[str], corpus: MarkdownCorpus | None = None
+) -> list[Path]:
     """Walk *roots*, return Markdown files, honour exclude globs and dirs."""
-    return iter_markdown_files(
+    return (corpus if corpus is not None else MarkdownCorpus()).markdown_files(
         roots,
         exclude_parts=_DEFAULT_EXCLUDE_PARTS,
         exclude_globs=exclude_globs,
     )
 
 
-def _strip_code(text: str) -> str:
-    """Replace fenced and inline code spans with same-length whitespace.
-
-    Whitespace replacement (rather than deletion) keeps line/column offsets correct
-    so reported line numbers map to the source file faithfully.
-    """
-    text = _FENCE_RE.sub(blank_content, text)
-    text = _DOUBLE_BACKTICK_RE.sub(blank_content, text)
-    text = _SINGLE_BACKTICK_RE.sub(blank_content, text)
-    return text
-
-
 #: Fragment prefixes that are a domain DSL rather than a GitHub heading anchor.
 #: ``template_textbook`` renders ``[**term**](#gl:slug)`` glossary references through
 #: its own resolver, so those fragments must not be measured against heading slugs.
 _NON_ANCHOR_FRAGMENT_PREFIXES: tuple[str, ...] = ("gl:",)
 
-_ATX_HEADING_RE = re.compile(r"^\s{0,3}(#{1,6})\s+(.*?)\s*#*\s*$", re.MULTILINE)
-_EXPLICIT_ID_RE = re.compile(r"""<a\s+(?:id|name)\s*=\s*["']([^"']+)["']""", re.IGNORECASE)
-_CURLY_ID_RE = re.compile(r"\{#([A-Za-z0-9_:.-]+)\}")
-
-
-def _blank_fences(text: str) -> str:
-    """Blank fenced code blocks while PRESERVING inline-code spans.
-
-    Headings legitimately contain inline code (``## `uv` command not found``) and
-    GitHub slugs the code's *text content*, so the inline-span blanking used for
-    link discovery would mis-slug those headings.
-    """
-    return _FENCE_RE.sub(blank_content, text)
-
 
-def collect_anchors(md_file: Path) -> frozenset[str]:
+def collect_anchors(md_file: Path, corpus: MarkdownCorpus | None = None) -> frozenset[str]:
     """Return every in-page anchor *md_file* defines.
 
     Covers ATX heading slugs (with GitHub's ``-1``/``-2`` duplicate suffixes),
     explicit ``<a id="...">``/``<a name="...">`` targets, and ``{#custom-id}``
     heading attributes.
     """
-    raw = read_markdown(md_file)
-    if raw is None:
-        return frozenset()
-    anchors: set[str] = set(_EXPLICIT_ID_RE.findall(raw))
-    seen: dict[str, int] = {}
-    for match in _ATX_HEADING_RE.finditer(_blank_fences(raw)):
-        heading = match.group(2)
-        custom = _CURLY_ID_RE.search(heading)
-        if custom:
-            anchors.add(custom.group(1))
-            heading = _CURLY_ID_RE.sub("", heading)
-        slug = heading_slug(heading)
-        if not slug:
-            continue
-        count = seen.get(slug, 0)
-        seen[slug] = count + 1
-        anchors.add(slug if count == 0 else f"{slug}-{count}")
-    return frozenset(anchors)
+    document = (corpus if corpus is not None else MarkdownCorpus()).get(md_file)
+    return document.anchors if document is not None else frozenset()
 
 
 def _is_external(target: str) -> bool:
@@ -270,97 +222,208 @@ def _fragment_failure(
     return f"anchor '#{decoded}' not found in {target_file.name}"
 
 
+def _document_broken_links(
+    document: MarkdownDocument,
+    anchors_for: "Callable[[Path], frozenset[str]]",
+) -> list[BrokenLink]:
+    """Return the broken links in one parsed document."""
+    md = document.path
+    raw_lines = document.lines
+
+    def _suppressed(line: int) -> bool:
+        # Allow inline `<!-- noqa: docs-lint -->` on the source line.
+        return 0 < line <= len(raw_lines) and bool(_NOQA_RE.search(raw_lines[line - 1]))
+
+    broken: list[BrokenLink] = []
+    for link in document.links:
+        target = link.target
+        if _is_external(target):
+            # A pure `#fragment` still has to resolve within THIS file.
+            if target.startswith("#"):
+                reason = _fragment_failure(md, target[1:], anchors_for)
+                if reason and not _suppressed(link.line):
+                    broken.append(BrokenLink(file=md, line=link.line, text=link.text, target=target, reason=reason))
+            continue
+        resolved, reason = _resolve_target(md, target)
+        if resolved is None:
+            if _suppressed(link.line):
+                continue
+            # A link into a deliberately-untracked project area (the
+            # non-rendered typed subfolders projects/working|ongoing|archive/, or any
+            # non-exemplar projects/ name) is absent
+            # BY DESIGN in a public/confidential checkout — not a broken link.
+            _base = unquote(target.split("#", 1)[0].split("?", 1)[0])
+            if _base and _is_intentionally_absent_project(md, _base):
+                continue
+            # Project-local output is generated by pipeline stages and is
+            # deliberately ignored in clean public checkouts.
+            if _base and _is_generated_project_output(md, _base):
+                continue
+            broken.append(BrokenLink(file=md, line=link.line, text=link.text, target=target, reason=reason))
+            continue
+        # File resolved — now the `#fragment`, if any, must resolve inside it.
+        if "#" in target:
+            frag_reason = _fragment_failure(resolved, target.split("#", 1)[1], anchors_for)
+            if frag_reason and not _suppressed(link.line):
+                broken.append(BrokenLink(file=md, line=link.line, text=link.text, target=target, reason=frag_reason))
+    return broken
+
+
+def _link_dependencies(document: MarkdownDocument) -> frozenset[Path]:
+    """Return every path whose existence or anchors can change *document*'s verdicts.
+
+    Mirrors the candidates :func:`_resolve_target` probes, so a checker that
+    watches these paths knows when a link may have started or stopped resolving.
+    """
+    deps: set[Path] = set()
+    for link in document.links:
+        if _is_external(link.target):
+            continue
+        decoded = unquote(link.target.split("#", 1)[0].split("?", 1)[0])
+        if not decoded or decoded.startswith("/"):
+            continue
+        deps.add((document.path.parent / decoded).resolve())
+        if decoded.endswith("/"):
+            deps.add((document.path.parent / decoded.rstrip("/")).resolve())
+    return frozenset(deps)
+
+
+def _path_state(path: Path) -> str:
+    """Return ``dir``, ``missing`` or ``file:<size>:<mtime_ns>`` for *path*."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return "missing"
+    if path.is_dir():
+        return "dir"
+    return f"file:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+#: Bump when a verdict rule changes in a way the stored inputs do not capture.
+_LINK_RULES_VERSION = 1
+
+
+def _link_rules() -> str:
+    """Identify the verdict rules that persisted checker state was computed under."""
+    return f"{_LINK_RULES_VERSION}:" + ",".join(sorted(PUBLIC_PROJECT_NAMES))
+
+
 def find_broken_links(
     roots: Iterable[Path],
     exclude_globs: Iterable[str] = _DEFAULT_EXCLUDE_GLOBS,
+    *,
+    corpus: MarkdownCorpus | None = None,
 ) -> list[BrokenLink]:
     """Return all broken relative Markdown links under *roots*.
 
     Skips fenced code blocks and inline-code spans (single + double backticks),
     skips external URLs (http/https/mailto/etc.), and skips pure-anchor links.
+    Pass a shared *corpus* to reuse files already read by another linter.
     """
-    broken: list[BrokenLink] = []
-    anchor_cache: dict[Path, frozenset[str]] = {}
+    corpus = corpus if corpus is not None else MarkdownCorpus()
+    files = _iter_markdown_files(roots, exclude_globs, corpus)
+    corpus.prime(files)
 
     def _anchors(path: Path) -> frozenset[str]:
-        if path not in anchor_cache:
-            anchor_cache[path] = collect_anchors(path)
-        return anchor_cache[path]
+        return collect_anchors(path, corpus)
 
-    for md in _iter_markdown_files(roots, exclude_globs):
-        raw = read_markdown(md)
-        if raw is None:
-            continue
-        scrubbed = _strip_code(raw)
-        raw_lines = raw.splitlines()
-        for match in _LINK_RE.finditer(scrubbed):
-            target = match.group("url")
-            if _is_external(target):
-                # A pure `#fragment` still has to resolve within THIS file.
-                if target.startswith("#"):
-                    line = scrubbed[: match.start()].count("\n") + 1
-                    reason = _fragment_failure(md, target[1:], _anchors)
-                    if reason and not (0 < line <= len(raw_lines) and _NOQA_RE.search(raw_lines[line - 1])):
-                        broken.append(
-                            BrokenLink(
-                                file=md,
-                                line=line,
-                                text=raw[match.start("text") : match.end("text")],
-                                target=target,
-                                reason=reason,
-                            )
-                        )
-                continue
-            resolved, reason = _resolve_target(md, target)
-            if resolved is None:
-                line = scrubbed[: match.start()].count("\n") + 1
-                # Allow inline `<!-- noqa: docs-lint -->` on the source line.
-                if 0 < line <= len(raw_lines) and _NOQA_RE.search(raw_lines[line - 1]):
-                    continue
-                # A link into a deliberately-untracked project area (the
-                # non-rendered typed subfolders projects/working|ongoing|archive/, or any
-                # non-exemplar projects/ name) is absent
-                # BY DESIGN in a public/confidential checkout — not a broken link.
-                _base = unquote(target.split("#", 1)[0].split("?", 1)[0])
-                if _base and _is_intentionally_absent_project(md, _base):
-                    continue
-                # Project-local output is generated by pipeline stages and is
-                # deliberately ignored in clean public checkouts.
-                if _base and _is_generated_project_output(md, _base):
-                    continue
-                # Pull the original (non-scrubbed) text from the same span.
-                original_text = raw[match.start("text") : match.end("text")]
-                broken.append(
-                    BrokenLink(
-                        file=md,
-                        line=line,
-                        text=original_text,
-                        target=target,
-                        reason=reason,
-                    )
-                )
-                continue
-            # File resolved — now the `#fragment`, if any, must resolve inside it.
-            if "#" in target and resolved is not None:
-                fragment = target.split("#", 1)[1]
-                frag_reason = _fragment_failure(resolved, fragment, _anchors)
-                if not frag_reason:
-                    continue
-                line = scrubbed[: match.start()].count("\n") + 1
-                if 0 < line <= len(raw_lines) and _NOQA_RE.search(raw_lines[line - 1]):
-                    continue
-                broken.append(
-                    BrokenLink(
-                        file=md,
-                        line=line,
-                        text=raw[match.start("text") : match.end("text")],
-                        target=target,
-                        reason=frag_reason,
-                    )
-                )
+    broken: list[BrokenLink] = []
+    for document in corpus.documents(files):
+        broken.extend(_document_broken_links(document, _anchors))
     return broken
 
 
+class IncrementalLinkChecker:
+    """Broken-link checker that, after the first sweep, rechecks only affected files.
+
+    Each :meth:`check` refreshes the corpus (re-reading only files whose
+    ``(size, mtime_ns)`` moved and whose content hash changed) and rechecks a
+    file when it is new, when its own stat fingerprint moved, or when one of
+    its link targets changed or appeared, vanished or changed kind. With a
+    *cache* the first :meth:`check` starts from the state the previous process
+    stored, and every check stores its results for the next one. Results are
+    identical to :func:`find_broken_links` over the same tree.
+    """
+
+    def __init__(
+        self,
+        roots: Iterable[Path],
+        exclude_globs: Iterable[str] = _DEFAULT_EXCLUDE_GLOBS,
+        *,
+        corpus: MarkdownCorpus | None = None,
+        cache: LinkStateCache | None = None,
+    ) -> None:
+        """Prepare a checker over *roots*; nothing is read until :meth:`check`."""
+        self.roots = tuple(roots)
+        self.exclude_globs = tuple(exclude_globs)
+        self.corpus = corpus if corpus is not None else MarkdownCorpus()
+        self.cache = cache
+        self.rechecked: list[Path] = []
+        self._checked = False
+        self._results: dict[Path, list[BrokenLink]] = {}
+        self._deps: dict[Path, frozenset[Path]] = {}
+        self._states: dict[Path, str] = {}
+
+    def _restore(self, files: list[Path]) -> None:
+        """Seed results, dependencies and path fingerprints from :attr:`cache`."""
+        assert self.cache is not None
+        entries, states = self.cache.load(_link_rules(), [str(md) for md in files])
+        for raw_path, entry in entries.items():
+            md = Path(raw_path)
+            self._results[md] = [
+                BrokenLink(file=md, line=line, text=text, target=target, reason=reason)
+                for line, text, target, reason in entry.broken
+            ]
+            self._deps[md] = frozenset(map(Path, entry.deps))
+        self._states.update((Path(raw_path), state) for raw_path, state in states.items())
+
+    def _store(self, files: list[Path]) -> None:
+        assert self.cache is not None
+        entries = {
+            str(md): StoredLinkFile(
+                broken=tuple((link.line, link.text, link.target, link.reason) for link in self._results[md]),
+                deps=tuple(sorted(map(str, self._deps[md]))),
+            )
+            for md in files
+        }
+        tracked = {md.resolve() for md in files} | {dep for md in files for dep in self._deps[md]}
+        self.cache.record(
+            _link_rules(), entries, {str(path): self._states[path] for path in tracked if path in self._states}
+        )
+
+    def check(self) -> list[BrokenLink]:
+        """Return every broken link under the roots; :attr:`rechecked` lists the files re-examined."""
+        refreshed = {path.resolve() for path in self.corpus.refresh()} if self._checked else set()
+        files = _iter_markdown_files(self.roots, self.exclude_globs, self.corpus)
+        if not self._checked and self.cache is not None:
+            self._restore(files)
+        dirty = refreshed | {path for path, state in self._states.items() if _path_state(path) != state}
+        stale = [
+            md
+            for md in files
+            if md not in self._results
+            or md.resolve() in dirty
+            or md.resolve() not in self._states
+            or not self._deps[md].isdisjoint(dirty)
+        ]
+        self.corpus.prime(stale)
+
+        def _anchors(path: Path) -> frozenset[str]:
+            return collect_anchors(path, self.corpus)
+
+        self._results = {md: self._results[md] for md in files if md in self._results}
+        for md in stale:
+            document = self.corpus.get(md)
+            self._results[md] = _document_broken_links(document, _anchors) if document is not None else []
+            self._deps[md] = _link_dependencies(document) if document is not None else frozenset()
+        for path in dirty | {md.resolve() for md in stale} | {dep for md in stale for dep in self._deps[md]}:
+            self._states[path] = _path_state(path)
+        self.rechecked, self._checked = stale, True
+        if self.cache is not None:
+            self._store(files)
+        return [link for md in files for link in self._results[md]]
+
+
 @dataclass(frozen=True)
 class LinkCycle:
     """A cycle in the relative Markdown file-link graph."""
@@ -381,18 +444,17 @@ def _file_link_target(md_file: Path, target: str) -> str | None:
     return str(resolved)
 
 
-def _collect_file_edges(roots: Iterable[Path], exclude_globs: Iterable[str]) -> dict[str, set[str]]:
+def _collect_file_edges(
+    roots: Iterable[Path], exclude_globs: Iterable[str], corpus: MarkdownCorpus | None = None
+) -> dict[str, set[str]]:
     """Build adjacency list of repo-relative markdown paths."""
+    corpus = corpus if corpus is not None else MarkdownCorpus()
     graph: dict[str, set[str]] = {}
-    for md in _iter_markdown_files(roots, exclude_globs):
-        raw = read_markdown(md)
-        if raw is None:
-            continue
-        source = str(md.resolve())
+    for document in corpus.documents(_iter_markdown_files(roots, exclude_globs, corpus)):
+        source = str(document.path.resolve())
         graph.setdefault(source, set())
-        scrubbed = _strip_code(raw)
-        for match in _LINK_RE.finditer(scrubbed):
-            target_path = _file_link_target(md, match.group("url"))
+        for link in document.links:
+            target_path = _file_link_target(document.path, link.target)
             if target_path is None:
                 continue
             graph.setdefault(source, set()).add(target_path)
@@ -403,9 +465,11 @@ def _collect_file_edges(roots: Iterable[Path], exclude_globs: Iterable[str]) ->
 def detect_markdown_link_cycles(
     roots: Iterable[Path],
     exclude_globs: Iterable[str] = _DEFAULT_EXCLUDE_GLOBS,
+    *,
+    corpus: MarkdownCorpus | None = None,
 ) -> list[LinkCycle]:
     """Detect directed cycles in relative Markdown file-to-file links under *roots*."""
-    graph = _collect_file_edges(roots, exclude_globs)
+    graph = _collect_file_edges(roots, exclude_globs, corpus)
     visited: set[str] = set()
     stack: set[str] = set()
     cycles: list[LinkCycle] = []
@@ -445,4 +509,10 @@ def detect_markdown_link_cycles(
     return unique
 
 
-__all__ = ["BrokenLink", "LinkCycle", "detect_markdown_link_cycles", "find_broken_links"]
+__all__ = [
+    "BrokenLink",
+    "IncrementalLinkChecker",
+    "LinkCycle",
+    "detect_markdown_link_cycles",
+    "find_broken_links",
+]
@@ -0,0 +1,189 @@
+"""Persistent state for the incremental cross-link checker.
+
+:class:`~infrastructure.validation.docs.cross_link_lint.IncrementalLinkChecker`
+keeps, for every Markdown file it checked, the broken links it found and the
+paths those verdicts depend on, plus a stat fingerprint of each of those
+paths. :class:`LinkStateCache` carries that state from one ``run_docs_lint``
+process to the next, so a run after a small edit rechecks only the edited
+files and the files that link to them.
+
+Rows are stored under a *rules* key supplied by the checker; results written
+under different verdict rules are never read back. The cache lives at
+``$XDG_CACHE_HOME/template/doc-links.sqlite``;
+``TEMPLATE_DOCS_LINK_CACHE=<path>`` moves it and ``=off`` disables it. Each
+table keeps its ``max_rows`` most recently used rows. An unwritable location
+only costs the speed-up.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+
+from infrastructure.core.logging.utils import get_logger
+from infrastructure.core.user_cache import CacheStats, connect_cache_db, evict_oldest, user_cache_path
+
+logger = get_logger(__name__)
+
+__all__ = [
+    "DEFAULT_LINK_CACHE_MAX_ROWS",
+    "ENV_DOCS_LINK_CACHE",
+    "LinkStateCache",
+    "StoredLinkFile",
+    "default_link_state_cache",
+]
+
+ENV_DOCS_LINK_CACHE = "TEMPLATE_DOCS_LINK_CACHE"
+# A few full checkouts of the ~2,400-file tree, counting dependency paths.
+DEFAULT_LINK_CACHE_MAX_ROWS = 50_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS link_files (
+    path    TEXT PRIMARY KEY,
+    rules   TEXT NOT NULL,
+    broken  TEXT NOT NULL,
+    deps    TEXT NOT NULL,
+    used_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS link_paths (
+    path    TEXT PRIMARY KEY,
+    state   TEXT NOT NULL,
+    used_at REAL NOT NULL
+);
+"""
+
+_CHUNK = 500
+
+
+@dataclass(frozen=True)
+class StoredLinkFile:
+    """One checked file: its broken links as ``(line, text, target, reason)`` and its dependency paths."""
+
+    broken: tuple[tuple[int, str, str, str], ...]
+    deps: tuple[str, ...]
+
+
+def _decode_entry(broken: str, deps: str) -> StoredLinkFile:
+    return StoredLinkFile(
+        broken=tuple((int(row[0]), str(row[1]), str(row[2]), str(row[3])) for row in json.loads(broken)),
+        deps=tuple(map(str, json.loads(deps))),
+    )
+
+
+def _chunks(items: list[str]) -> Iterable[list[str]]:
+    for start in range(0, len(items), _CHUNK):
+        yield items[start : start + _CHUNK]
+
+
+class LinkStateCache:
+    """SQLite store of per-file link verdicts and per-path stat fingerprints.
+
+    Process-safe: each operation opens its own connection. ``stats`` counts
+    requested files found in the store (hits) or not (misses), and entries
+    written.
+    """
+
+    def __init__(self, db_path: Path | str, *, max_rows: int = DEFAULT_LINK_CACHE_MAX_ROWS) -> None:
+        """Open (lazily) the cache at ``db_path``."""
+        self.db_path = Path(db_path)
+        self.max_rows = max(1, max_rows)
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        return connect_cache_db(self.db_path, _SCHEMA)
+
+    def load(self, rules: str, files: Iterable[str]) -> tuple[dict[str, StoredLinkFile], dict[str, str]]:
+        """Return the stored entries of *files* written under *rules*, and the fingerprints of their paths.
+
+        The fingerprints cover each file and each of its dependencies. A
+        missing or unreadable store loads as empty.
+        """
+        wanted = list(files)
+        entries: dict[str, StoredLinkFile] = {}
+        states: dict[str, str] = {}
+        try:
+            conn = self._connect()
+            try:
+                for chunk in _chunks(wanted):
+                    placeholders = ",".join("?" * len(chunk))
+                    for path, broken, deps in conn.execute(
+                        f"SELECT path, broken, deps FROM link_files WHERE rules = ? AND path IN ({placeholders})",  # noqa: S608 — placeholders only.
+                        [rules, *chunk],
+                    ):
+                        entries[path] = _decode_entry(broken, deps)
+                tracked = sorted({*entries, *(dep for entry in entries.values() for dep in entry.deps)})
+                for chunk in _chunks(tracked):
+                    placeholders = ",".join("?" * len(chunk))
+                    states.update(
+                        conn.execute(
+                            f"SELECT path, state FROM link_paths WHERE path IN ({placeholders})",  # noqa: S608 — placeholders only.
+                            chunk,
+                        ).fetchall()
+                    )
+            finally:
+                conn.close()
+        except (OSError, sqlite3.Error, ValueError) as exc:
+            logger.debug("link state cache unavailable at %s: %s", self.db_path, exc)
+            entries, states = {}, {}
+        with self._lock:
+            self.stats.hits += len(entries)
+            self.stats.misses += len(wanted) - len(entries)
+        return entries, states
+
+    def record(self, rules: str, entries: Mapping[str, StoredLinkFile], states: Mapping[str, str]) -> None:
+        """Write *entries* under *rules* and the path fingerprints *states*, then evict beyond ``max_rows``.
+
+        Storage errors are ignored; the cache is an optimisation only.
+        """
+        now = time.time()
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO link_files (path, rules, broken, deps, used_at) VALUES (?, ?, ?, ?, ?)",
+                        (
+                            (path, rules, json.dumps(entry.broken), json.dumps(entry.deps), now)
+                            for path, entry in entries.items()
+                        ),
+                    )
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO link_paths (path, state, used_at) VALUES (?, ?, ?)",
+                        ((path, state, now) for path, state in states.items()),
+                    )
+                    evicted = sum(
+                        evict_oldest(conn, table, order_by="used_at", keep=self.max_rows)
+                        for table in ("link_files", "link_paths")
+                    )
+            finally:
+                conn.close()
+        except (OSError, sqlite3.Error) as exc:
+            logger.debug("link state cache not writable at %s: %s", self.db_path, exc)
+            return
+        with self._lock:
+            self.stats.stores += len(entries)
+            self.stats.evictions += evicted
+
+    def clear(self) -> int:
+        """Delete every stored file entry. Returns the number of entries removed."""
+        if not self.db_path.exists():
+            return 0
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM link_paths")
+                return conn.execute("DELETE FROM link_files").rowcount
+        finally:
+            conn.close()
+
+
+def default_link_state_cache() -> LinkStateCache | None:
+    """Return a cache at the location selected by ``TEMPLATE_DOCS_LINK_CACHE``, or ``None`` when disabled."""
+    path = user_cache_path(ENV_DOCS_LINK_CACHE, "doc-links.sqlite")
+    return LinkStateCache(path) if path is not None else None
@@ -22,8 +22,11 @@ from infrastructure.validation.docs.consistency_lint import (
     check_readme_files_list,
     check_stale_shell_contracts,
 )
-from infrastructure.validation.docs.cross_link_lint import BrokenLink, find_broken_links
+from infrastructure.validation.docs.corpus import MarkdownCorpus
+from infrastructure.validation.docs.cross_link_lint import BrokenLink, IncrementalLinkChecker, find_broken_links
 from infrastructure.validation.docs.doc_pair_lint import DocPairIssue, find_doc_pair_issues
+from infrastructure.validation.docs.link_cache import LinkStateCache, default_link_state_cache
+from infrastructure.validation.docs.mermaid_cache import MermaidVerdictCache, default_mermaid_verdict_cache
 from infrastructure.validation.docs.mermaid_lint import (
     ValidationFailure,
     find_mermaid_blocks,
@@ -43,6 +46,8 @@ class DocsLintReport:
     consistency: list[Inconsistency] | None
     doc_pairs: list[DocPairIssue] | None
     runtime_error: str | None = None
+    mermaid_cache: dict[str, int] | None = None
+    link_cache: dict[str, int] | None = None
 
     @property
     def failed(self) -> bool:
@@ -89,9 +94,15 @@ def _is_rel(path: Path, root: Path) -> bool:
     return True
 
 
-def run_mermaid_lint(repo_root: Path, *, quiet: bool) -> list[ValidationFailure]:
-    """Run mermaid lint."""
-    blocks = find_mermaid_blocks(doc_roots(repo_root))
+def run_mermaid_lint(
+    repo_root: Path,
+    *,
+    quiet: bool,
+    corpus: MarkdownCorpus | None = None,
+    cache: MermaidVerdictCache | None = None,
+) -> list[ValidationFailure]:
+    """Run mermaid lint; blocks already passing in ``cache`` are not re-rendered."""
+    blocks = find_mermaid_blocks(doc_roots(repo_root), corpus=corpus)
     if not quiet:
         logger.info("mermaid: discovered %d blocks", len(blocks))
     mmdc_bin = resolve_mmdc_executable(repo_root)
@@ -103,29 +114,42 @@ def run_mermaid_lint(repo_root: Path, *, quiet: bool) -> list[ValidationFailure]
             "(set CHROME_EXECUTABLE_PATH or run "
             "`npx --no-install puppeteer browsers install chrome-headless-shell`)."
         )
-    return validate_blocks(blocks, mmdc_path=mmdc_bin)
+    return validate_blocks(blocks, mmdc_path=mmdc_bin, cache=cache)
 
 
-def run_links_lint(repo_root: Path, *, quiet: bool) -> list[BrokenLink]:
-    """Run links lint."""
-    broken = find_broken_links(doc_roots(repo_root))
+def run_links_lint(
+    repo_root: Path,
+    *,
+    quiet: bool,
+    corpus: MarkdownCorpus | None = None,
+    cache: LinkStateCache | None = None,
+) -> list[BrokenLink]:
+    """Run links lint; with ``cache``, only files affected since the stored run are rechecked."""
+    if cache is None:
+        broken = find_broken_links(doc_roots(repo_root), corpus=corpus)
+        if not quiet:
+            logger.info("cross-links: %d broken", len(broken))
+        return broken
+    checker = IncrementalLinkChecker(doc_roots(repo_root), corpus=corpus, cache=cache)
+    broken = checker.check()
     if not quiet:
-        logger.info("cross-links: %d broken", len(broken))
+        logger.info("cross-links: %d broken (%d files rechecked)", len(broken), len(checker.rechecked))
     return broken
 
 
-def run_consistency_lint(repo_root: Path, *, quiet: bool) -> list[Inconsistency]:
+def run_consistency_lint(repo_root: Path, *, quiet: bool, corpus: MarkdownCorpus | None = None) -> list[Inconsistency]:
     """Run consistency lint."""
+    corpus = corpus if corpus is not None else MarkdownCorpus()
     issues: list[Inconsistency] = []
-    issues.extend(check_module_count_claims(repo_root))
-    issues.extend(check_no_ghost_projects(repo_root))
-    issues.extend(check_command_conventions(repo_root))
-    issues.extend(check_doc_imports_resolve(repo_root))
-    issues.extend(check_readme_files_list(repo_root))
-    issues.extend(check_project_discovery_claims(repo_root))
-    issues.extend(check_canonical_count_singularity(repo_root))
-    issues.extend(check_memory_decision_rule_links(repo_root))
-    issues.extend(check_stale_shell_contracts(repo_root))
+    issues.extend(check_module_count_claims(repo_root, corpus=corpus))
+    issues.extend(check_no_ghost_projects(repo_root, corpus=corpus))
+    issues.extend(check_command_conventions(repo_root, corpus=corpus))
+    issues.extend(check_doc_imports_resolve(repo_root, corpus=corpus))
+    issues.extend(check_readme_files_list(repo_root, corpus=corpus))
+    issues.extend(check_project_discovery_claims(repo_root, corpus=corpus))
+    issues.extend(check_canonical_count_singularity(repo_root, corpus=corpus))
+    issues.extend(check_memory_decision_rule_links(repo_root, corpus=corpus))
+    issues.extend(check_stale_shell_contracts(repo_root, corpus=corpus))
     if not quiet:
         logger.info("consistency: %d issues", len(issues))
     return issues
@@ -141,6 +165,20 @@ def run_doc_pairs_lint(repo_root: Path, *, quiet: bool) -> list[DocPairIssue]:
 
 def emit_text_report(report: DocsLintReport) -> None:
     """Emit text report."""
+    if report.mermaid_cache is not None:
+        logger.info(
+            "mermaid cache: %d hits, %d misses, %d stored",
+            report.mermaid_cache["hits"],
+            report.mermaid_cache["misses"],
+            report.mermaid_cache["stores"],
+        )
+    if report.link_cache is not None:
+        logger.info(
+            "link cache: %d hits, %d misses, %d stored",
+            report.link_cache["hits"],
+            report.link_cache["misses"],
+            report.link_cache["stores"],
+        )
     if report.mermaid:
         log_header("MERMAID FAILURES", logger)
         for failure in report.mermaid:
@@ -201,6 +239,8 @@ def emit_json_report(report: DocsLintReport, repo_root: Path) -> str:
             }
             for issue in (report.doc_pairs or [])
         ],
+        "mermaid_cache": report.mermaid_cache,
+        "link_cache": report.link_cache,
     }
     return json.dumps(payload, indent=2) + "\n"
 
@@ -215,7 +255,17 @@ def run_docs_lint(
     quiet: bool = False,
     strict_mermaid: bool = False,
 ) -> DocsLintReport:
-    """Run docs lint."""
+    """Run docs lint.
+
+    Every selected linter reads from one :class:`MarkdownCorpus`, so each
+    Markdown file is read and parsed once per run (in parallel by the first
+    linter that needs it) and discovery of each scan scope is shared. Mermaid
+    verdicts persist across runs in :func:`default_mermaid_verdict_cache`
+    (``TEMPLATE_MERMAID_LINT_CACHE=off`` disables it), and cross-link results
+    in :func:`default_link_state_cache` (``TEMPLATE_DOCS_LINK_CACHE=off``), so
+    only files affected since the last run are rechecked. The report carries
+    both caches' hit/miss/store counts.
+    """
     only_flags = sum(1 for f in (mermaid_only, links_only, consistency_only, doc_pairs_only) if f)
     if only_flags > 1:
         raise ValueError("pass at most one of mermaid_only, links_only, consistency_only, doc_pairs_only")
@@ -242,10 +292,13 @@ def run_docs_lint(
     doc_pairs: list[DocPairIssue] | None = None
     runtime_error: str | None = None
 
+    corpus = MarkdownCorpus()
+    mermaid_cache = default_mermaid_verdict_cache() if run_mermaid else None
+    link_cache = default_link_state_cache() if run_links else None
     mermaid_strict = bool(strict_mermaid or os.environ.get("CI"))
     if run_mermaid:
         try:
-            mermaid_failures = run_mermaid_lint(repo_root, quiet=quiet)
+            mermaid_failures = run_mermaid_lint(repo_root, quiet=quiet, corpus=corpus, cache=mermaid_cache)
         except RuntimeError as exc:
             mermaid_failures = []
             if mermaid_strict:
@@ -258,9 +311,9 @@ def run_docs_lint(
                     exc,
                 )
     if run_links:
-        broken_links = run_links_lint(repo_root, quiet=quiet)
+        broken_links = run_links_lint(repo_root, quiet=quiet, corpus=corpus, cache=link_cache)
     if run_consistency:
-        consistency = run_consistency_lint(repo_root, quiet=quiet)
+        consistency = run_consistency_lint(repo_root, quiet=quiet, corpus=corpus)
     if run_doc_pairs:
         doc_pairs = run_doc_pairs_lint(repo_root, quiet=quiet)
 
@@ -270,6 +323,8 @@ def run_docs_lint(
         consistency=consistency,
         doc_pairs=doc_pairs,
         runtime_error=runtime_error,
+        mermaid_cache=mermaid_cache.stats.to_dict() if mermaid_cache is not None else None,
+        link_cache=link_cache.stats.to_dict() if link_cache is not None else None,
     )
 
 
@@ -0,0 +1,224 @@
+"""Persistent cache of passing Mermaid lint verdicts.
+
+A block's ``mmdc`` verdict is a function of its source, the Mermaid CLI and
+Mermaid releases, and the puppeteer configuration (browser binary and launch
+arguments). :func:`renderer_fingerprint` identifies the renderer from the
+installed ``package.json`` files and the browser binary's stat, and
+:class:`MermaidVerdictCache` stores every block that rendered cleanly under
+``sha256(normalised source, renderer fingerprint)``. On a run with no diagram
+edits every block is answered from SQLite and
+:func:`~infrastructure.validation.docs.mermaid_lint.validate_blocks` never
+starts Chrome.
+
+Only passes are stored: syntax errors, timeouts and browser hiccups always
+re-render, so a flaky environment can never be cached into a false verdict.
+The cache lives at ``$XDG_CACHE_HOME/template/mermaid-lint.sqlite``;
+``TEMPLATE_MERMAID_LINT_CACHE=<path>`` moves it and ``=off`` disables it. It
+keeps the ``max_entries`` most recently used verdicts. An unwritable location
+only costs the speed-up.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import textwrap
+import threading
+import time
+from collections.abc import Mapping
+from pathlib import Path
+
+from infrastructure.core.logging.utils import get_logger
+from infrastructure.core.user_cache import CacheStats, connect_cache_db, evict_oldest, user_cache_path
+
+logger = get_logger(__name__)
+
+__all__ = [
+    "DEFAULT_MERMAID_CACHE_MAX_ENTRIES",
+    "ENV_MERMAID_LINT_CACHE",
+    "MermaidCacheStats",
+    "MermaidVerdictCache",
+    "block_cache_key",
+    "default_mermaid_verdict_cache",
+    "normalize_mermaid_source",
+    "renderer_fingerprint",
+]
+
+ENV_MERMAID_LINT_CACHE = "TEMPLATE_MERMAID_LINT_CACHE"
+# Several times the number of diagrams in the tree, so renderer upgrades and
+# branch switches do not thrash the store.
+DEFAULT_MERMAID_CACHE_MAX_ENTRIES = 8192
+
+# Bump when normalisation or the key layout changes.
+_CACHE_SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS verdicts (
+    cache_key TEXT PRIMARY KEY,
+    used_at   REAL NOT NULL
+);
+"""
+
+#: Counters for one lint run: blocks answered from the cache, rendered, recorded and evicted.
+MermaidCacheStats = CacheStats
+
+
+def normalize_mermaid_source(body: str) -> str:
+    """Return *body* dedented, with line endings unified and trailing whitespace and surrounding blank lines dropped.
+
+    None of these change how Mermaid parses a diagram (relative indentation is
+    kept), so re-indenting a fence or re-saving a file with CRLF endings does
+    not invalidate its verdict.
+    """
+    lines = [line.rstrip() for line in body.replace("\r\n", "\n").replace("\r", "\n").split("\n")]
+    return textwrap.dedent("\n".join(lines)).strip("\n")
+
+
+def _package_version(start: Path, package: str) -> str | None:
+    """Return the ``version`` of *package* installed beside the resolved *start* path."""
+    for parent in start.parents:
+        for manifest in (parent / "package.json", parent / "node_modules" / package / "package.json"):
+            try:
+                data = json.loads(manifest.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            if isinstance(data, dict) and data.get("name") == package:
+                return str(data.get("version", "unknown"))
+    return None
+
+
+def _file_identity(path: str | None) -> str:
+    """Return ``path:size:mtime_ns`` so an in-place upgrade of a binary changes the identity."""
+    if not path:
+        return "none"
+    try:
+        stat = Path(path).stat()
+    except OSError:
+        return f"{path}:missing"
+    return f"{path}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def renderer_fingerprint(mmdc_bin: str, puppeteer_config: Mapping[str, object]) -> str:
+    """Return a SHA-256 identifying the Mermaid CLI, Mermaid release and puppeteer configuration.
+
+    Versions come from the ``package.json`` files next to the resolved ``mmdc``
+    entry point (a repository-local ``node_modules`` or a global install); an
+    ``mmdc`` outside any npm package is identified by its content digest.
+    ``userDataDir`` is a per-run temporary profile and is not part of the key.
+    """
+    resolved = Path(mmdc_bin).resolve()
+    cli_version = _package_version(resolved, "@mermaid-js/mermaid-cli")
+    if cli_version is None:
+        try:
+            cli_version = "sha256:" + hashlib.sha256(resolved.read_bytes()).hexdigest()
+        except OSError:
+            cli_version = _file_identity(str(resolved))
+    config = {key: value for key, value in puppeteer_config.items() if key != "userDataDir"}
+    executable = config.get("executablePath")
+    payload = {
+        "schema": _CACHE_SCHEMA_VERSION,
+        "mermaid-cli": cli_version,
+        "mermaid": _package_version(resolved, "mermaid"),
+        "puppeteer": config,
+        "browser": _file_identity(executable if isinstance(executable, str) else None),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def block_cache_key(body: str, fingerprint: str) -> str:
+    """Combine a block's normalised source with a :func:`renderer_fingerprint`."""
+    source = hashlib.sha256(normalize_mermaid_source(body).encode("utf-8")).hexdigest()
+    return hashlib.sha256(f"{fingerprint}\0{source}".encode()).hexdigest()
+
+
+class MermaidVerdictCache:
+    """SQLite set of cache keys whose blocks rendered cleanly.
+
+    Process-safe: each operation opens its own connection. ``stats`` counts
+    this instance's traffic and is surfaced in the docs-lint report. Keys
+    beyond ``max_entries`` are evicted least recently used first.
+    """
+
+    def __init__(self, db_path: Path | str, *, max_entries: int = DEFAULT_MERMAID_CACHE_MAX_ENTRIES) -> None:
+        """Open (lazily) the cache at ``db_path``."""
+        self.db_path = Path(db_path)
+        self.max_entries = max(1, max_entries)
+        self.stats = MermaidCacheStats()
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        return connect_cache_db(self.db_path, _SCHEMA)
+
+    def passed(self, keys: list[str]) -> set[str]:
+        """Return the subset of *keys* recorded as passing (refreshing their recency), updating hit/miss counters."""
+        found: set[str] = set()
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    for start in range(0, len(keys), 500):
+                        chunk = keys[start : start + 500]
+                        placeholders = ",".join("?" * len(chunk))
+                        found.update(
+                            row[0]
+                            for row in conn.execute(
+                                f"SELECT cache_key FROM verdicts WHERE cache_key IN ({placeholders})",  # noqa: S608 — placeholders only.
+                                chunk,
+                            )
+                        )
+                    now = time.time()
+                    conn.executemany(
+                        "UPDATE verdicts SET used_at = ? WHERE cache_key = ?", [(now, key) for key in found]
+                    )
+            finally:
+                conn.close()
+        except (OSError, sqlite3.Error) as exc:
+            logger.debug("mermaid verdict cache unavailable at %s: %s", self.db_path, exc)
+        with self._lock:
+            hits = sum(1 for key in keys if key in found)
+            self.stats.hits += hits
+            self.stats.misses += len(keys) - hits
+        return found
+
+    def record_passes(self, keys: list[str]) -> None:
+        """Record *keys* as passing, evicting beyond ``max_entries``.
+
+        Storage errors are ignored; the cache is an optimisation only.
+        """
+        if not keys:
+            return
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO verdicts (cache_key, used_at) VALUES (?, ?)",
+                        [(key, time.time()) for key in keys],
+                    )
+                    evicted = evict_oldest(conn, "verdicts", order_by="used_at", keep=self.max_entries)
+            finally:
+                conn.close()
+        except (OSError, sqlite3.Error) as exc:
+            logger.debug("mermaid verdict cache not writable at %s: %s", self.db_path, exc)
+            return
+        with self._lock:
+            self.stats.stores += len(keys)
+            self.stats.evictions += evicted
+
+    def clear(self) -> int:
+        """Delete every stored verdict. Returns the number of rows removed."""
+        if not self.db_path.exists():
+            return 0
+        conn = self._connect()
+        try:
+            with conn:
+                return conn.execute("DELETE FROM verdicts").rowcount
+        finally:
+            conn.close()
+
+
+def default_mermaid_verdict_cache() -> MermaidVerdictCache | None:
+    """Return a cache at the location selected by ``TEMPLATE_MERMAID_LINT_CACHE``, or ``None`` when disabled."""
+    path = user_cache_path(ENV_MERMAID_LINT_CACHE, "mermaid-lint.sqlite")
+    return MermaidVerdictCache(path) if path is not None else None
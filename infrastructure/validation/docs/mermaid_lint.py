@@ -7,6 +7,11 @@ in CI: this module raises a clear :class:`RuntimeError` so the gate fails loudly
 For local dev convenience, callers can ``pytest.importorskip``-style probe via
 :func:`mmdc_available`.
 
+Passing a :class:`~infrastructure.validation.docs.mermaid_cache.MermaidVerdictCache`
+to :func:`validate_blocks` skips every block whose normalised source already
+rendered cleanly under the same Mermaid CLI, Mermaid release and puppeteer
+configuration; when nothing changed, no browser is started.
+
 Public API:
     - :class:`MermaidBlock`
     - :class:`ValidationFailure`
@@ -32,17 +37,11 @@ from pathlib import Path
 from infrastructure.core._optional_deps import psutil
 from infrastructure.core.logging.utils import get_logger
 from infrastructure.rendering.chrome import resolve_chrome_executable
-from infrastructure.validation.docs._io import read_markdown
-from infrastructure.validation.docs.scan_scope import iter_markdown_files
+from infrastructure.validation.docs.corpus import MarkdownCorpus
+from infrastructure.validation.docs.mermaid_cache import MermaidVerdictCache, block_cache_key, renderer_fingerprint
 
 logger = get_logger(__name__)
 
-# Match fenced mermaid blocks. Captures the body. Multiline. Non-greedy.
-_MERMAID_FENCE = re.compile(
-    r"^(?P<fence>`{3,}|~{3,})mermaid[^\n]*\n(?P<body>.*?)\n(?P=fence)",
-    re.MULTILINE | re.DOTALL,
-)
-
 # Heuristic: first non-empty, non-comment line tells us the diagram kind.
 _KIND_RE = re.compile(r"^\s*(?P<kind>[A-Za-z][A-Za-z0-9_-]*)")
 _MMDC_TIMEOUT_SECONDS = float(os.environ.get("TEMPLATE_MERMAID_LINT_TIMEOUT", "30"))
@@ -105,11 +104,6 @@ def mmdc_available(mmdc_path: str | None = None, repo_root: Path | None = None)
     return bool(candidate and Path(candidate).exists())
 
 
-def _iter_markdown_files(roots: Iterable[Path]) -> list[Path]:
-    """Walk *roots* using the shared documentation scan scope."""
-    return iter_markdown_files(roots)
-
-
 _NOQA_RE = re.compile(r"%%\s*noqa:\s*docs-lint", re.IGNORECASE)
 
 
@@ -118,35 +112,33 @@ def _block_has_noqa(body: str) -> bool:
     return bool(_NOQA_RE.search(body))
 
 
-def find_mermaid_blocks(roots: Iterable[Path]) -> list[MermaidBlock]:
+def find_mermaid_blocks(roots: Iterable[Path], *, corpus: MarkdownCorpus | None = None) -> list[MermaidBlock]:
     """Return every fenced ```mermaid block under *roots*.
 
     *roots* may contain directories or individual ``.md`` files. Excluded directories
     (``output/``, the non-rendered typed subfolders ``projects/working|ongoing|archive/``,
-    etc.) are skipped.
+    etc.) are skipped. Pass a shared *corpus* to reuse files already read by
+    another linter.
 
     Blocks containing a ``%% noqa: docs-lint`` mermaid comment are excluded from
     discovery (they will not be validated by :func:`validate_blocks`).
     """
+    corpus = corpus if corpus is not None else MarkdownCorpus()
+    files = corpus.markdown_files(roots)
+    corpus.prime(files)
     blocks: list[MermaidBlock] = []
-    for md in _iter_markdown_files(roots):
-        text = read_markdown(md)
-        if text is None:
-            continue
-        for match in _MERMAID_FENCE.finditer(text):
-            body = match.group("body")
-            if _block_has_noqa(body):
+    for document in corpus.documents(files):
+        for fence in document.mermaid_fences:
+            if _block_has_noqa(fence.body):
                 continue
-            # 1-indexed line of the opening fence
-            line_no = text[: match.start()].count("\n") + 1
-            kind_match = _KIND_RE.match(_first_meaningful_line(body))
+            kind_match = _KIND_RE.match(_first_meaningful_line(fence.body))
             kind = kind_match.group("kind") if kind_match else "unknown"
             blocks.append(
                 MermaidBlock(
-                    file=md,
-                    line=line_no,
+                    file=document.path,
+                    line=fence.line,
                     kind=kind,
-                    body=body,
+                    body=fence.body,
                 )
             )
     return blocks
@@ -386,12 +378,18 @@ def validate_blocks(
     timeout_seconds: float = _MMDC_TIMEOUT_SECONDS,
     total_timeout_seconds: float = _MMDC_TOTAL_TIMEOUT_SECONDS,
     retries_on_timeout: int | None = None,
+    *,
+    cache: MermaidVerdictCache | None = None,
 ) -> list[ValidationFailure]:
     """Render each block with `mmdc` and return failures.
 
     ``retries_on_timeout`` overrides the per-block transient-timeout retry
     count (default: ``_MMDC_RETRY_ON_TIMEOUT`` from the environment).
 
+    With a ``cache``, blocks recorded as passing under the current renderer
+    fingerprint are not rendered, and every block that renders cleanly is
+    recorded. Failures and timeouts are never cached.
+
     Raises:
         RuntimeError: when `mmdc` is not available. CI must install it; we fail loudly
             rather than skipping silently.
@@ -408,6 +406,19 @@ def validate_blocks(
             "`npx --no-install puppeteer browsers install chrome-headless-shell`."
         )
     chrome_resolved = _resolve_chrome(chrome_path)
+    cache_keys: dict[MermaidBlock, str] = {}
+    if cache is not None:
+        fingerprint = renderer_fingerprint(mmdc_bin, _puppeteer_config(chrome_resolved, Path("chrome-profile")))
+        cache_keys = {block: block_cache_key(block.body, fingerprint) for block in blocks}
+        known = cache.passed([cache_keys[block] for block in blocks])
+        blocks = [block for block in blocks if cache_keys[block] not in known]
+        if not blocks:
+            return []
+
+    def record_passes(passed: Sequence[MermaidBlock]) -> None:
+        if cache is not None:
+            cache.record_passes([cache_keys[block] for block in passed])
+
     retries = _MMDC_RETRY_ON_TIMEOUT if retries_on_timeout is None else max(0, retries_on_timeout)
     failures: list[ValidationFailure] = []
     started_at = time.monotonic()
@@ -450,7 +461,9 @@ def validate_blocks(
                     timeout_description=batch_timeout_description,
                 )
                 if batch_rc == 0:
+                    record_passes(batch)
                     continue
+                rendered: list[MermaidBlock] = []
                 if batch_rc == 124:
                     failures.extend(
                         _validate_blocks_individually(
@@ -462,8 +475,10 @@ def validate_blocks(
                             total_timeout_seconds=total_timeout_seconds,
                             started_at=started_at,
                             retries_on_timeout=retries,
+                            passed=rendered,
                         )
                     )
+                    record_passes(rendered)
                     if failures and failures[-1].returncode == 124:
                         return failures
                     continue
@@ -477,8 +492,10 @@ def validate_blocks(
                         total_timeout_seconds=total_timeout_seconds,
                         started_at=started_at,
                         retries_on_timeout=retries,
+                        passed=rendered,
                     )
                 )
+                record_passes(rendered)
                 if failures and failures[-1].returncode == 124:
                     return failures
         finally:
@@ -496,8 +513,12 @@ def _validate_blocks_individually(
     total_timeout_seconds: float,
     started_at: float,
     retries_on_timeout: int,
+    passed: list[MermaidBlock] | None = None,
 ) -> list[ValidationFailure]:
-    """Validate blocks one at a time after a batch failure for precise errors."""
+    """Validate blocks one at a time after a batch failure for precise errors.
+
+    Blocks that render cleanly are appended to ``passed`` when given.
+    """
     failures: list[ValidationFailure] = []
     for block in blocks:
         elapsed = time.monotonic() - started_at
@@ -526,6 +547,8 @@ def _validate_blocks_individually(
         )
         if failure is not None:
             failures.append(failure)
+        elif passed is not None:
+            passed.append(block)
         if time.monotonic() - started_at >= total_timeout_seconds:
             break
     return failures
@@ -19,9 +19,8 @@ from infrastructure.core.project_paths import find_repo_root
 from infrastructure.validation.output.no_mock_enforcer import (
     SemanticStandInUse,
     StandInCategory,
-    scan_hand_rolled_fakes,
     scan_lexical_mock_policy,
-    scan_semantic_standins,
+    scan_semantic_standins_and_fakes,
     scan_test_roots,
 )
 
@@ -187,11 +186,10 @@ def collect_standin_inventory(
         errors.append(f"required tests directory not found: {repo_root / 'tests'}")
 
     for tests_dir in roots:
-        result = scan_semantic_standins(tests_dir, repo_root)
+        result, fake_result = scan_semantic_standins_and_fakes(tests_dir, repo_root)
         files_scanned += result.files_scanned
         uses.extend(result.uses)
         errors.extend(result.errors)
-        fake_result = scan_hand_rolled_fakes(tests_dir, repo_root)
         hand_rolled_fakes.extend(fake_result.findings)
         errors.extend(fake_result.errors)
 
@@ -53,6 +53,9 @@ _FORBIDDEN_UNITTEST_SUBMODULE = "mock"  # unittest.mock
 _FORBIDDEN_DYNAMIC_MODULES = frozenset({"mock", "pytest_mock", "unittest.mock"})
 _FORBIDDEN_DYNAMIC_ATTRIBUTES = frozenset({"Mock", "MagicMock", "create_autospec", "patch"})
 
+# Class names that suggest a hand-rolled substitute (advisory inventory only).
+_FAKE_CLASS_PATTERN = re.compile(r"\b(Fake|Stub|Dummy)[A-Z]", re.ASCII)
+
 # Call / decorator usage patterns, matched against comment-stripped lines.
 # Word boundaries keep ``monkeypatch`` (allowed) distinct from ``patch``.
 _USAGE_PATTERNS: tuple[re.Pattern[str], ...] = (
@@ -468,18 +471,18 @@ def _stand_in_category(method: str, node: ast.Call | None = None) -> StandInCate
     return StandInCategory.other
 
 
-def scan_semantic_standins(
+def scan_semantic_standins_and_fakes(
     tests_dir: Path,
     repo_root: Path,
-) -> SemanticStandInScanResult:
-    """Inventory monkeypatch operations for the zero-debt repository gate.
+) -> tuple[SemanticStandInScanResult, HandRolledFakeResult]:
+    """Run :func:`scan_semantic_standins` and :func:`scan_hand_rolled_fakes` in one pass.
 
-    Classification is intentionally syntactic. In particular, every
-    ``setattr``/``setitem`` call is recorded as dependency replacement even
-    when a human review may later decide it only redirects a path. This gives
-    the blocking gate a conservative, reproducible inventory.
+    Each test file is read and parsed once for both inventories; the stand-in
+    inventory report needs both, and a parsed test tree is too large to keep
+    around for a second walk.
     """
     uses: list[SemanticStandInUse] = []
+    findings: list[str] = []
     errors: list[str] = []
     py_files = _iter_test_python_files(tests_dir)
 
@@ -499,6 +502,11 @@ def scan_semantic_standins(
         aliases = _monkeypatch_aliases(tree)
         raw_lines = source.splitlines()
         for node in ast.walk(tree):
+            if isinstance(node, ast.ClassDef) and _FAKE_CLASS_PATTERN.search(node.name):
+                line = node.lineno
+                source_line = raw_lines[line - 1].strip() if 1 <= line <= len(raw_lines) else ""
+                findings.append(f"{relative_path}:{line}: {source_line}")
+                continue
             if not isinstance(node, ast.Call) or not isinstance(node.func, ast.Attribute):
                 continue
             receiver = node.func.value
@@ -517,7 +525,8 @@ def scan_semantic_standins(
                 )
             )
 
-    return SemanticStandInScanResult(
+    sorted_errors = tuple(sorted(errors))
+    standins = SemanticStandInScanResult(
         files_scanned=len(py_files),
         uses=tuple(
             sorted(
@@ -531,8 +540,28 @@ def scan_semantic_standins(
                 ),
             )
         ),
-        errors=tuple(sorted(errors)),
+        errors=sorted_errors,
     )
+    fakes = HandRolledFakeResult(
+        files_scanned=len(py_files),
+        findings=tuple(sorted(findings)),
+        errors=sorted_errors,
+    )
+    return standins, fakes
+
+
+def scan_semantic_standins(
+    tests_dir: Path,
+    repo_root: Path,
+) -> SemanticStandInScanResult:
+    """Inventory monkeypatch operations for the zero-debt repository gate.
+
+    Classification is intentionally syntactic. In particular, every
+    ``setattr``/``setitem`` call is recorded as dependency replacement even
+    when a human review may later decide it only redirects a path. This gives
+    the blocking gate a conservative, reproducible inventory.
+    """
+    return scan_semantic_standins_and_fakes(tests_dir, repo_root)[0]
 
 
 def validate_no_mocks(tests_dir: Path, repo_root: Path) -> list[str]:
@@ -566,37 +595,7 @@ def scan_hand_rolled_fakes(
     Returns:
         HandRolledFakeResult with advisory findings, never blocks gates.
     """
-    findings: list[str] = []
-    errors: list[str] = []
-    py_files = _iter_test_python_files(tests_dir)
-    _FAKE_PATTERNS = re.compile(r"\b(Fake|Stub|Dummy)[A-Z]", re.ASCII)
-
-    for py_file in py_files:
-        relative_path = _relative_path(py_file, repo_root)
-        try:
-            source = py_file.read_text(encoding="utf-8")
-        except (OSError, UnicodeDecodeError) as exc:
-            errors.append(f"{relative_path}: read error: {exc}")
-            continue
-        try:
-            tree = ast.parse(source, filename=str(py_file))
-        except SyntaxError as exc:
-            errors.append(f"{relative_path}:{exc.lineno or 0}: syntax error: {exc.msg}")
-            continue
-        raw_lines = source.splitlines()
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.ClassDef):
-                continue
-            if _FAKE_PATTERNS.search(node.name):
-                line = node.lineno
-                source_line = raw_lines[line - 1].strip() if 1 <= line <= len(raw_lines) else ""
-                findings.append(f"{relative_path}:{line}: {source_line}")
-
-    return HandRolledFakeResult(
-        files_scanned=len(py_files),
-        findings=tuple(sorted(findings)),
-        errors=tuple(sorted(errors)),
-    )
+    return scan_semantic_standins_and_fakes(tests_dir, repo_root)[1]
 
 
 __all__ = [
@@ -608,6 +607,7 @@ __all__ = [
     "scan_hand_rolled_fakes",
     "scan_lexical_mock_policy",
     "scan_semantic_standins",
+    "scan_semantic_standins_and_fakes",
     "scan_test_roots",
     "validate_no_mocks",
 ]
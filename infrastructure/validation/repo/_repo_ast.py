@@ -1,8 +1,14 @@
-"""AST helpers for repository scanner import verification."""
+"""AST helpers for repository scanner import verification.
+
+Both helpers read :class:`~infrastructure.core.ast_index.ModuleSummary` rows
+from a shared :class:`~infrastructure.core.ast_index.PythonAstIndex`, so a
+module verified from many scripts is parsed once (and not at all when its
+summary is already in the persistent cache).
+"""
 
-import ast
 from pathlib import Path
 
+from infrastructure.core.ast_index import PythonAstIndex
 from infrastructure.core.logging.utils import get_logger
 
 logger = get_logger(__name__)
@@ -33,52 +39,43 @@ def _candidate_module_paths(repo_root: Path, module_name: str) -> list[Path]:
     return list(dict.fromkeys(candidates))
 
 
-def _defined_symbols(module_path: Path) -> set[str]:
+def _defined_symbols(module_path: Path, index: PythonAstIndex | None = None) -> set[str]:
     """Return the function and class names defined in ``module_path``."""
-    content = module_path.read_text(encoding="utf-8")
-    tree = ast.parse(content)
-
-    defined: set[str] = set()
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef):
-            defined.add(node.name)
-        elif isinstance(node, ast.ClassDef):
-            defined.add(node.name)
-
-    return defined
+    summary = (index if index is not None else PythonAstIndex()).summary(module_path)
+    error = summary.syntax_error_for(module_path)
+    if error is not None:
+        raise error
+    return set(summary.defined_names)
 
 
-def extract_imports(file_path: Path) -> dict[str, list[str]]:
+def extract_imports(file_path: Path, *, index: PythonAstIndex | None = None) -> dict[str, list[str]]:
     """Extract import module names and symbols from a Python file."""
     imports: dict[str, list[str]] = {}
     try:
-        content = file_path.read_text(encoding="utf-8")
-        tree = ast.parse(content)
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    imports[alias.name] = []
-            elif isinstance(node, ast.ImportFrom):
-                module = node.module or ""
-                for alias in node.names:
-                    if module not in imports:
-                        imports[module] = []
-                    imports[module].append(alias.name)
+        summary = (index if index is not None else PythonAstIndex()).summary(file_path)
+        error = summary.syntax_error_for(file_path)
+        if error is not None:
+            raise error
+
+        for record in summary.imports:
+            if record.names is None:
+                imports[record.module] = []
+            else:
+                imports.setdefault(record.module, []).extend(record.names)
     except (OSError, UnicodeDecodeError, SyntaxError) as e:
         logger.debug("Failed to parse imports from script: %s", e)
 
     return imports
 
 
-def verify_import(repo_root: Path, module_name: str, items: list[str]) -> bool:
+def verify_import(repo_root: Path, module_name: str, items: list[str], *, index: PythonAstIndex | None = None) -> bool:
     """Return True if all named symbols exist in a matching repo module."""
     for module_path in _candidate_module_paths(repo_root, module_name):
         if not module_path.exists():
             continue
 
         try:
-            defined = _defined_symbols(module_path)
+            defined = _defined_symbols(module_path, index)
         except (OSError, UnicodeDecodeError, SyntaxError) as e:
             logger.debug("Failed to verify imports in module %s: %s", module_name, e)
             continue
@@ -16,6 +16,7 @@ from typing import Any
 
 import yaml
 
+from infrastructure.core.ast_index import PythonAstIndex
 from infrastructure.core.logging.constants import PIPELINE_STAGE_WIDTH
 from infrastructure.core.logging.utils import get_logger
 from infrastructure.validation.docs.models import CompletenessGap, ScanAccuracyIssue
@@ -48,6 +49,8 @@ class RepositoryScanner:
         self.script_files: list[Path] = []
         self.test_files: list[Path] = []
         self.documented_modules: set[str] = set()
+        # Scripts and the modules they import are parsed once per scan.
+        self.ast_index = PythonAstIndex.default()
 
     def scan_all(self) -> RepoScanResults:
         """Execute all 6 phases of the repository scan.
@@ -215,7 +218,7 @@ class RepositoryScanner:
             if script.suffix != ".py":
                 continue
             try:
-                imports = extract_imports(script)
+                imports = extract_imports(script, index=self.ast_index)
                 for imp in imports:
                     if self._is_local_import(imp) and not self._verify_import(script, imp, imports[imp]):
                         issues.append(
@@ -244,12 +247,12 @@ class RepositoryScanner:
 
     def _extract_imports(self, file_path: Path) -> dict[str, list[str]]:
         """Extract imports from a Python file (delegates to shared AST helper)."""
-        return extract_imports(file_path)
+        return extract_imports(file_path, index=self.ast_index)
 
     def _verify_import(self, script_path: Path, module_name: str, items: list[str]) -> bool:
         """Verify imported symbols exist in src (script_path reserved for API stability)."""
         _ = script_path
-        return verify_import(self.repo_root, module_name, items)
+        return verify_import(self.repo_root, module_name, items, index=self.ast_index)
 
     def _check_documented_commands(self) -> None:
         """Append documented-command issues to ``results`` (tests and scan phase 2)."""
@@ -424,7 +427,7 @@ class RepositoryScanner:
 
             try:
                 content = script.read_text(encoding="utf-8")
-                imports = extract_imports(script)
+                imports = extract_imports(script, index=self.ast_index)
 
                 has_repo_import = any(self._is_local_import(imp) for imp in imports)
 
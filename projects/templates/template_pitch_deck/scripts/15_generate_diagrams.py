@@ -5,7 +5,8 @@ Runs before ``20_render_decks.py`` (lexicographically between the content
 audit and the render step) so the diagram files referenced by
 ``manuscript/deck_content_*.yaml`` (``figure: <name>.png``) exist before
 rendering needs them. Uses
-``infrastructure.rendering.mermaid_figure.render_mermaid_png`` — the first
+``infrastructure.rendering.mermaid_figure.render_required_mermaid_pngs`` (one
+batched ``mmdc`` session for all diagrams) — the first
 standalone (non-manuscript-fence) Mermaid-to-PNG capability in this
 repository's infrastructure layer.
 
@@ -116,29 +117,19 @@ DIAGRAMS: dict[str, str] = {
 
 
 def main(argv: list[str] | None = None) -> int:
-    from infrastructure.rendering.mermaid_figure import render_mermaid_png
-
-    root = project_root()
-    figures_dir = root / "output" / "figures"
-
-    failures: list[str] = []
-    for filename, source in DIAGRAMS.items():
-        output_path = figures_dir / filename
-        try:
-            render_mermaid_png(source, output_path)
-        except Exception as exc:  # noqa: BLE001 - report every required diagram before failing the producer
-            failures.append(filename)
-            logger.error(
-                "Could not render required diagram %s (mmdc/Chrome unavailable or failed): %s",
-                filename,
-                exc,
-            )
-            continue
-        logger.info("Wrote diagram: %s", output_path)
-        print(output_path)
+    from infrastructure.rendering.mermaid_figure import render_required_mermaid_pngs
+
+    figures_dir = project_root() / "output" / "figures"
+    targets = {figures_dir / filename: source for filename, source in DIAGRAMS.items()}
+
+    failures = render_required_mermaid_pngs(targets, log=logger)
+    for output_path in targets:
+        if output_path not in failures:
+            print(output_path)
 
     if failures:
-        logger.error("Required Mermaid producer failed for %d diagram(s): %s", len(failures), ", ".join(failures))
+        names = ", ".join(path.name for path in failures)
+        logger.error("Required Mermaid producer failed for %d diagram(s): %s", len(failures), names)
         return 1
     return 0
 
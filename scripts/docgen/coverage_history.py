@@ -12,6 +12,11 @@ Two collection modes:
 * ``--from-gh`` — call ``gh run list`` + ``gh run download`` for the
   past ``--days`` of successful runs of the named workflow.
 
+Both modes go through the persistent coverage-history store, so each XML (or
+``gh`` run) is parsed only once. ``--store`` picks its file, and
+``TEMPLATE_COVERAGE_HISTORY_CACHE=off`` disables it. ``--module-trends=N``
+adds sparklines for the N least-covered packages.
+
 Run from repository root::
 
     uv run python scripts/docgen/coverage_history.py --from-dir=./_artefacts
@@ -38,6 +43,10 @@ from infrastructure.reporting.coverage_history import (  # noqa: E402
     collect_history_from_dir,
     collect_history_via_gh,
 )
+from infrastructure.reporting.coverage_history_store import (  # noqa: E402
+    CoverageHistoryStore,
+    default_coverage_history_store,
+)
 
 logger = get_logger(__name__)
 
@@ -55,9 +64,45 @@ def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         default=None,
         help="Output Markdown path (default: docs/_generated/coverage_history.md).",
     )
+    parser.add_argument(
+        "--store",
+        type=Path,
+        default=None,
+        help="Coverage-history SQLite store (default: $TEMPLATE_COVERAGE_HISTORY_CACHE or the user cache).",
+    )
+    parser.add_argument(
+        "--module-trends",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Add per-package sparklines for the N least-covered packages (requires a store).",
+    )
     return parser.parse_args(argv)
 
 
+def _module_trends(store: CoverageHistoryStore, points: list[CoveragePoint], limit: int) -> dict[str, list[float]]:
+    """Return sparkline series for the *limit* least-covered modules of the reports behind *points*.
+
+    Queries are scoped to the points' store sources, so other directories,
+    workflows or runs sharing the store never leak into the report. Each
+    trend stays within its own suite; with more than one suite the labels
+    read ``suite: name``.
+    """
+    sources = sorted({point.source for point in points if point.source})
+    suites = sorted({point.suite for point in points})
+    ranked = sorted(
+        (module.percentage, suite, module.name)
+        for suite in suites
+        for module in store.latest_modules(suite=suite, sources=sources)
+    )
+    return {
+        (name if len(suites) == 1 else f"{suite}: {name}"): [
+            pct for _, pct in store.module_trend(name, suite=suite, sources=sources)
+        ]
+        for _, suite, name in ranked[:limit]
+    }
+
+
 def main(argv: list[str] | None = None) -> int:
     log_header("Generate Coverage History Dashboard", logger)
     args = _parse_args(argv)
@@ -66,14 +111,21 @@ def main(argv: list[str] | None = None) -> int:
     out_path = args.output or repo_root / "docs" / "_generated" / "coverage_history.md"
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
+    store = CoverageHistoryStore(args.store) if args.store else default_coverage_history_store()
     points: list[CoveragePoint]
     if args.from_dir is not None:
-        points = collect_history_from_dir(args.from_dir)
+        points = collect_history_from_dir(args.from_dir, store=store)
     else:
-        points = collect_history_via_gh(workflow=args.workflow, days=args.days, repo_root=repo_root)
+        points = collect_history_via_gh(workflow=args.workflow, days=args.days, repo_root=repo_root, store=store)
+
+    module_trends: dict[str, list[float]] | None = None
+    if args.module_trends and store is not None and points:
+        module_trends = _module_trends(store, points, args.module_trends)
 
-    markdown = build_history_markdown(points, days=args.days)
+    markdown = build_history_markdown(points, days=args.days, module_trends=module_trends)
     out_path.write_text(markdown, encoding="utf-8")
+    if store is not None:
+        logger.info("Coverage history store %s: %s", store.db_path, store.stats.to_dict())
     log_success(f"Wrote {out_path} ({len(points)} coverage point(s))", logger)
     return 0
 
@@ -4,13 +4,13 @@
 from __future__ import annotations
 
 import argparse
-import ast
 import sys
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parent.parent.parent
 sys.path.insert(0, str(REPO_ROOT))
 
+from infrastructure.core.ast_index import PythonAstIndex  # noqa: E402
 from infrastructure.validation.line_count import (  # noqa: E402
     SOURCE_LINE_COUNT_RATCHETS,
     scan_infrastructure_and_scripts,
@@ -31,13 +31,27 @@ def _python_files(repo_root: Path) -> list[Path]:
 
 
 def _syntax_failures(repo_root: Path) -> list[tuple[str, str]]:
-    """Parse every counted Python file so malformed modules fail closed."""
+    """Parse every counted Python file so malformed modules fail closed.
+
+    Verdicts come from the shared AST summary cache, so only files whose
+    content changed since the last run are parsed again.
+    """
     failures: list[tuple[str, str]] = []
-    for path in _python_files(repo_root):
-        try:
-            ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
-        except (OSError, UnicodeError, SyntaxError) as exc:
-            failures.append((path.relative_to(repo_root).as_posix(), str(exc)))
+    paths = _python_files(repo_root)
+    summaries = PythonAstIndex.default().summaries(paths)
+    for path in paths:
+        summary = summaries.get(path)
+        error: Exception | None = None
+        if summary is not None:
+            error = summary.syntax_error_for(path)
+        else:
+            # Unreadable files are left out of the summaries; surface why.
+            try:
+                path.read_text(encoding="utf-8")
+            except (OSError, UnicodeError) as exc:
+                error = exc
+        if error is not None:
+            failures.append((path.relative_to(repo_root).as_posix(), str(error)))
     return failures
 
 
@@ -28,10 +28,10 @@ ensure_repo_root_on_path()
 from infrastructure.core.logging.utils import get_logger, log_header, log_success  # noqa: E402
 from infrastructure.core.project_paths import resolve_project_root, validate_project_name  # noqa: E402
 from infrastructure.provenance import (  # noqa: E402
-    Provenance,
     RunNode,
     ArtifactNode,
     EdgeRelation,
+    open_provenance_store,
 )
 
 logger = get_logger(__name__)
@@ -133,48 +133,49 @@ def main() -> int:
         logger.error("Invalid provenance store path: %s", exc)
         return 1
 
-    # Record the run node
-    store = Provenance.with_path(Path(store_path).parent, filename=Path(store_path).name)
-    run = store.record(
-        RunNode.create(
-            label=args.label or f"Pipeline: {args.stage}",
-            command=args.stage,
-            metadata={"project": args.project},
+    # Record the run node and its outputs in one write (a .sqlite store path selects the SQLite backend)
+    store = open_provenance_store(Path(store_path))
+    with store.batch():
+        run = store.record(
+            RunNode.create(
+                label=args.label or f"Pipeline: {args.stage}",
+                command=args.stage,
+                metadata={"project": args.project},
+            )
         )
-    )
-    logger.info(f"Recorded run node: {run.node_id}")
-
-    # Record outputs if glob given
-    if args.outputs:
-        import glob as glob_mod
-
-        try:
-            output_pattern = _validate_relative_pattern(args.outputs, label="outputs")
-        except ValueError as exc:
-            logger.error("Invalid output pattern: %s", exc)
-            return 1
-        for path_str in glob_mod.glob(str(project_dir / output_pattern), recursive=True):
-            p = Path(path_str)
-            if p.is_file():
-                if p.is_symlink():
-                    logger.error("Unsafe output path: symlinks are not recorded: %s", p)
-                    return 1
-                try:
-                    _confined_project_path(
-                        project_dir, str(p.resolve().relative_to(project_dir.resolve())), label="output"
-                    )
-                except ValueError as exc:
-                    logger.error("Unsafe output path: %s", exc)
-                    return 1
-                art = store.record(
-                    ArtifactNode.create(
-                        label=p.name,
-                        path=str(p.relative_to(project_dir)),
-                        size_bytes=p.stat().st_size,
+        logger.info(f"Recorded run node: {run.node_id}")
+
+        # Record outputs if glob given
+        if args.outputs:
+            import glob as glob_mod
+
+            try:
+                output_pattern = _validate_relative_pattern(args.outputs, label="outputs")
+            except ValueError as exc:
+                logger.error("Invalid output pattern: %s", exc)
+                return 1
+            for path_str in glob_mod.glob(str(project_dir / output_pattern), recursive=True):
+                p = Path(path_str)
+                if p.is_file():
+                    if p.is_symlink():
+                        logger.error("Unsafe output path: symlinks are not recorded: %s", p)
+                        return 1
+                    try:
+                        _confined_project_path(
+                            project_dir, str(p.resolve().relative_to(project_dir.resolve())), label="output"
+                        )
+                    except ValueError as exc:
+                        logger.error("Unsafe output path: %s", exc)
+                        return 1
+                    art = store.record(
+                        ArtifactNode.create(
+                            label=p.name,
+                            path=str(p.relative_to(project_dir)),
+                            size_bytes=p.stat().st_size,
+                        )
                     )
-                )
-                store.link(run.node_id, art.node_id, EdgeRelation.produced_by)
-                logger.info(f"  Produced: {p.name} ({art.node_id})")
+                    store.link(run.node_id, art.node_id, EdgeRelation.produced_by)
+                    logger.info(f"  Produced: {p.name} ({art.node_id})")
 
     log_success(f"Provenance recorded for stage: {args.stage}")
     return 0
@@ -6,6 +6,7 @@ Thin orchestrator over PipelineExecutor, post-run reporting, and HITL CLI.
 
 from __future__ import annotations
 
+import argparse
 import sys
 from collections.abc import Callable
 from pathlib import Path
@@ -22,6 +23,7 @@ from infrastructure.core.pipeline.incremental import IncrementalConfig
 from infrastructure.core.pipeline.single_stage import execute_single_stage
 from infrastructure.core.pipeline.stage_registry import known_stage_keys
 from infrastructure.core.runtime.environment import validate_interpreter
+from infrastructure.core.cli_parser import positive_int_arg
 
 # Public imports for callers using the canonical runner module.
 __all__ = ["PipelineArgs", "handle_hitl_command", "execute_pipeline", "execute_single_stage", "main"]
@@ -39,6 +41,7 @@ def execute_pipeline(
     hitl_mode: str = "full-auto",
     incremental: bool = False,
     *,
+    stage_parallelism: int = 1,
     pipeline_path: Path | None = None,
     executor_factory: Callable[[PipelineConfig], Any] = PipelineExecutor,
     interpreter_validator: Callable[[], object] = validate_interpreter,
@@ -56,6 +59,7 @@ def execute_pipeline(
             hitl_mode=hitl_mode,
             incremental=IncrementalConfig(enabled=incremental),
             pipeline_path=pipeline_path,
+            stage_parallelism=stage_parallelism,
         )
         executor = executor_factory(config)
         results = executor.execute_core_pipeline() if core_only else executor.execute_full_pipeline()
@@ -80,8 +84,6 @@ def execute_pipeline(
 
 
 def main() -> int:
-    import argparse
-
     parser = argparse.ArgumentParser(description="Execute research project pipeline")
     parser.add_argument("--project", required=True, help="Project name")
     parser.add_argument("--skip-infra", action="store_true", help="Skip infrastructure tests")
@@ -93,6 +95,13 @@ def main() -> int:
         action="store_true",
         help="Enable incremental stage skipping when stage inputs/outputs are unchanged (opt-in; default off)",
     )
+    parser.add_argument(
+        "--stage-parallelism",
+        type=positive_int_arg,
+        default=1,
+        metavar="N",
+        help="Run up to N independent stages concurrently (default 1: strictly serial)",
+    )
     parser.add_argument(
         "--hitl-mode",
         default="full-auto",
@@ -136,6 +145,7 @@ def main() -> int:
         resume=raw_args.resume,
         core_only=raw_args.core_only,
         incremental=raw_args.incremental,
+        stage_parallelism=raw_args.stage_parallelism,
         pipeline_path=str(raw_args.pipeline_yaml) if raw_args.pipeline_yaml is not None else None,
         stage=raw_args.stage,
         hitl_mode=raw_args.hitl_mode,
@@ -165,6 +175,7 @@ def main() -> int:
         core_only=args.core_only,
         hitl_mode=args.hitl_mode,
         incremental=args.incremental,
+        stage_parallelism=args.stage_parallelism,
         pipeline_path=Path(args.pipeline_path) if args.pipeline_path is not None else None,
     )
     if result == 0:
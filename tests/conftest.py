@@ -7,6 +7,7 @@ This file:
 - Inserts repository roots (infrastructure/, project/src/) ahead of tests/ to avoid shadowing
 - Keeps imports consistent for both infrastructure and project test suites
 - Provides credential fixtures for external service testing
+- Gives every test its own ``$XDG_CACHE_HOME`` so user-level caches stay untouched
 """
 
 import os
@@ -31,6 +32,15 @@ if not _git_config_parameters.endswith(_GIT_FSMONITOR_PARAMETER):
         parameter for parameter in (_git_config_parameters, _GIT_FSMONITOR_PARAMETER) if parameter
     )
 
+# Each test gets its own ``$XDG_CACHE_HOME`` (see ``_isolated_user_cache``) so
+# the repository's SQLite caches never touch the developer's ``~/.cache`` or
+# carry state between tests. uv also resolves its package cache from that
+# variable; pin it to the real location so ``uv`` subprocesses stay offline-fast.
+os.environ.setdefault(
+    "UV_CACHE_DIR",
+    str(Path(os.environ.get("XDG_CACHE_HOME") or (Path.home() / ".cache")) / "uv"),
+)
+
 # Read-only commands such as ``git status`` normally refresh cached index stat
 # data behind ``.git/index.lock``. Test workers only need the result, not that
 # optional cache write; mandatory operations such as add/commit remain enabled.
@@ -313,6 +323,17 @@ def ensure_ollama_for_tests():
     return True
 
 
+@pytest.fixture(autouse=True)
+def _isolated_user_cache(tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Point ``$XDG_CACHE_HOME`` at a fresh per-test directory.
+
+    The PDF-text, health-gate, Mermaid, AST, connector and coverage-history
+    caches default to ``$XDG_CACHE_HOME/template``; tests that need one set its
+    own environment variable on top of this.
+    """
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("xdg-cache")))
+
+
 @pytest.fixture(autouse=True)
 def _ollama_requires_session(request: pytest.FixtureRequest) -> None:
     """Run session-scoped Ollama ensure once for any ``requires_ollama`` test."""
@@ -0,0 +1,118 @@
+"""Tests for the run-scoped artifact digest ledger.
+
+Real files in a real Git worktree under ``tmp_path``: the ledger must produce
+exactly the manifests the ledger-less path produces while hashing, querying
+Git and parsing stage manifests only for what changed.
+"""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from infrastructure.core.pipeline.artifact_ledger import ArtifactDigestLedger
+from infrastructure.core.pipeline.artifacts import (
+    aggregate_artifact_manifests,
+    output_inventory_mode_for_project,
+    write_stage_artifact_manifest,
+)
+from infrastructure.core.pipeline.types import StageContract
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+_CONTRACT = StageContract(output_artifacts=("projects/{project}/output/data/",))
+
+
+def _project(tmp_path: Path) -> tuple[Path, Path]:
+    repo_root = tmp_path / "repo"
+    project_dir = repo_root / "projects" / "templates" / "p"
+    (project_dir / "output" / "data").mkdir(parents=True)
+    subprocess.run(["git", "init", "-q", str(repo_root)], check=True)
+    (repo_root / ".gitignore").write_text("*.tmp\n", encoding="utf-8")
+    return repo_root, project_dir
+
+
+def _stage(repo_root: Path, project_dir: Path, stage_num: int, ledger: ArtifactDigestLedger | None):
+    manifest = write_stage_artifact_manifest(
+        repo_root=repo_root,
+        project_dir=project_dir,
+        stage_num=stage_num,
+        stage_name=f"Stage {stage_num}",
+        contract=_CONTRACT,
+        ledger=ledger,
+    )
+    aggregate = aggregate_artifact_manifests(
+        project_dir / "output",
+        inventory_mode=output_inventory_mode_for_project(repo_root, project_dir),
+        ledger=ledger,
+    )
+    return manifest, aggregate
+
+
+def test_ledger_hashes_only_new_or_modified_artifacts(tmp_path: Path) -> None:
+    repo_root, project_dir = _project(tmp_path)
+    data = project_dir / "output" / "data"
+    (data / "a.json").write_text("a\n", encoding="utf-8")
+    (data / "scratch.tmp").write_text("ignored\n", encoding="utf-8")
+    ledger = ArtifactDigestLedger()
+
+    _stage(repo_root, project_dir, 1, ledger)
+    assert (ledger.stats.hashed, ledger.stats.reused) == (1, 0)
+
+    (data / "b.json").write_text("b\n", encoding="utf-8")
+    _stage(repo_root, project_dir, 2, ledger)
+    assert (ledger.stats.hashed, ledger.stats.reused) == (2, 1)
+    assert ledger.stats.ignore_reused == 2  # a.json and scratch.tmp were not re-sent to Git
+
+    (data / "a.json").write_text("a, revised\n", encoding="utf-8")
+    manifest, aggregate = _stage(repo_root, project_dir, 3, ledger)
+
+    assert (ledger.stats.hashed, ledger.stats.reused) == (3, 2)
+    assert ledger.stats.manifests_parsed == 3
+    assert ledger.stats.manifests_reused == 3
+    assert sorted(entry.path for entry in manifest.entries) == ["output/data/a.json", "output/data/b.json"]
+    assert {entry.path: entry.stage_num for entry in aggregate.entries}["output/data/a.json"] == 3
+
+
+def test_ledger_manifests_match_ledger_free_manifests(tmp_path: Path) -> None:
+    repo_root, project_dir = _project(tmp_path)
+    data = project_dir / "output" / "data"
+    (data / "a.json").write_text("a\n", encoding="utf-8")
+    ledger = ArtifactDigestLedger()
+    _stage(repo_root, project_dir, 1, ledger)
+    (data / "b.json").write_text("b\n", encoding="utf-8")
+
+    with_ledger, with_ledger_aggregate = _stage(repo_root, project_dir, 2, ledger)
+    without, without_aggregate = _stage(repo_root, project_dir, 2, None)
+
+    assert with_ledger.to_dict() == without.to_dict()
+    assert with_ledger_aggregate.to_dict() == without_aggregate.to_dict()
+
+
+def test_changed_ignore_rules_invalidate_cached_verdicts(tmp_path: Path) -> None:
+    repo_root, project_dir = _project(tmp_path)
+    data = project_dir / "output" / "data"
+    (data / "a.json").write_text("a\n", encoding="utf-8")
+    (data / "b.json").write_text("b\n", encoding="utf-8")
+    ledger = ArtifactDigestLedger()
+    _stage(repo_root, project_dir, 1, ledger)
+
+    (project_dir / "output" / "data" / ".gitignore").write_text("b.json\n", encoding="utf-8")
+    manifest, _ = _stage(repo_root, project_dir, 2, ledger)
+
+    assert [entry.path for entry in manifest.entries] == ["output/data/a.json"]
+
+
+def test_cached_sha256_serves_only_the_recorded_file_version(tmp_path: Path) -> None:
+    repo_root, project_dir = _project(tmp_path)
+    artifact = project_dir / "output" / "data" / "a.json"
+    artifact.write_text("a\n", encoding="utf-8")
+    ledger = ArtifactDigestLedger()
+    manifest, _ = _stage(repo_root, project_dir, 1, ledger)
+
+    assert ledger.cached_sha256(artifact.absolute(), artifact.lstat()) == manifest.entries[0].sha256
+    artifact.write_text("a, revised\n", encoding="utf-8")
+    assert ledger.cached_sha256(artifact.absolute(), artifact.lstat()) is None
@@ -8,6 +8,7 @@ hashes and asserting byte-stable equality.
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 from infrastructure.core.pipeline.incremental import (
@@ -15,8 +16,10 @@ from infrastructure.core.pipeline.incremental import (
     HashManifest,
     compute_stage_input_hash,
     load_hash_manifest,
+    load_stage_content_index,
     record_stage_hash,
     save_hash_manifest,
+    save_stage_content_index,
     compute_stage_output_hash,
     should_skip_stage,
 )
@@ -389,3 +392,72 @@ class TestRecordStageHash:
             contract=contract,
         )
         assert decision.skip is False
+
+
+class TestDirectoryInputsAndContentIndex:
+    def _old(self, path: Path) -> None:
+        # Push mtime outside the racy window so the index may cache the file.
+        os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+
+    def test_file_added_under_input_directory_changes_hash(self, tmp_path: Path) -> None:
+        repo_root, project_dir = _make_repo(tmp_path)
+        src = project_dir / "src"
+        src.mkdir()
+        (src / "a.py").write_text("a = 1\n", encoding="utf-8")
+        contract = StageContract(input_artifacts=("projects/{project}/src/",))
+        kwargs = dict(
+            repo_root=repo_root,
+            project_dir=project_dir,
+            stage_name="Stage A",
+            contract=contract,
+            upstream_output_hashes={},
+        )
+        before = compute_stage_input_hash(**kwargs)
+        (src / "b.py").write_text("b = 2\n", encoding="utf-8")
+        assert compute_stage_input_hash(**kwargs) != before
+
+    def test_own_outputs_inside_input_directory_are_ignored(self, tmp_path: Path) -> None:
+        repo_root, project_dir = _make_repo(tmp_path)
+        (project_dir / "manuscript").mkdir()
+        (project_dir / "manuscript" / "a.md").write_text("x", encoding="utf-8")
+        contract = StageContract(
+            input_artifacts=("projects/{project}/",),
+            output_artifacts=("projects/{project}/output/",),
+        )
+        kwargs = dict(
+            repo_root=repo_root,
+            project_dir=project_dir,
+            stage_name="Stage A",
+            contract=contract,
+            upstream_output_hashes={},
+        )
+        before = compute_stage_input_hash(**kwargs)
+        (project_dir / "output" / "report.txt").write_text("generated", encoding="utf-8")
+        assert compute_stage_input_hash(**kwargs) == before
+
+    def test_unchanged_files_are_served_from_index(self, tmp_path: Path) -> None:
+        repo_root, project_dir = _make_repo(tmp_path)
+        src = project_dir / "src"
+        src.mkdir()
+        for name in ("a.py", "b.py"):
+            (src / name).write_text(name, encoding="utf-8")
+            self._old(src / name)
+        contract = StageContract(input_artifacts=("projects/{project}/src/",))
+        index = load_stage_content_index(project_dir / "output")
+        kwargs = dict(
+            repo_root=repo_root,
+            project_dir=project_dir,
+            stage_name="Stage A",
+            contract=contract,
+            upstream_output_hashes={},
+        )
+        first = compute_stage_input_hash(**kwargs, index=index)
+        save_stage_content_index(project_dir / "output", index)
+
+        reloaded = load_stage_content_index(project_dir / "output")
+        assert compute_stage_input_hash(**kwargs, index=reloaded) == first
+        assert (reloaded.hits, reloaded.misses) == (2, 0)
+
+        (src / "a.py").write_text("changed", encoding="utf-8")
+        assert compute_stage_input_hash(**kwargs, index=reloaded) != first
+        assert reloaded.misses == 1
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""Tests for the ready-queue stage scheduler (``--stage-parallelism``).
+
+No Mocks: stages are plain Python closures; concurrency is proven with a real
+``threading.Barrier`` that only releases when two stages run at the same time.
+"""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+from infrastructure.core.pipeline.cli import DEFAULT_PIPELINE_YAML, OPT_IN_STAGE_TAGS
+from infrastructure.core.pipeline.dag import PipelineDAG
+from infrastructure.core.pipeline.executor import PipelineConfig, PipelineExecutor
+from infrastructure.core.pipeline.scheduler import (
+    ScheduledStage,
+    artifact_paths_overlap,
+    contracts_conflict,
+    run_ready_queue,
+)
+from infrastructure.core.pipeline.types import PipelineStageResult, StageContract, StageSpec
+
+
+def _contract(*outputs: str, inputs: tuple[str, ...] = ()) -> StageContract:
+    return StageContract(input_artifacts=inputs, output_artifacts=outputs)
+
+
+class TestArtifactConflicts:
+    def test_directory_prefix_overlaps(self) -> None:
+        assert artifact_paths_overlap("projects/{project}/output/", "projects/{project}/output/pdf/a.pdf")
+        assert not artifact_paths_overlap("output/pdf/", "output/pdfx/")
+
+    def test_disjoint_outputs_do_not_conflict(self) -> None:
+        assert not contracts_conflict(_contract("output/a/"), _contract("output/b/"))
+
+    def test_write_read_overlap_conflicts(self) -> None:
+        assert contracts_conflict(_contract("output/a/"), _contract("output/b/", inputs=("output/a/x.txt",)))
+
+    def test_undeclared_outputs_conflict_with_everything(self) -> None:
+        assert contracts_conflict(StageContract(), _contract("output/b/"))
+
+
+def _ok(stage: ScheduledStage) -> PipelineStageResult:
+    return PipelineStageResult(stage_num=stage.stage_num, stage_name=stage.spec.name, success=True, duration=0.0)
+
+
+class TestRunReadyQueue:
+    def test_independent_stages_overlap_and_commit_in_order(self) -> None:
+        barrier = threading.Barrier(2, timeout=5)
+        committed: list[tuple[str, bool]] = []
+
+        def run_stage(stage: ScheduledStage) -> PipelineStageResult:
+            if stage.spec.name in {"A", "B"}:
+                barrier.wait()  # raises BrokenBarrierError unless A and B run concurrently
+            return _ok(stage)
+
+        plan = [
+            ScheduledStage(1, StageSpec("A", lambda: True, _contract("out/a/"))),
+            ScheduledStage(2, StageSpec("B", lambda: True, _contract("out/b/"))),
+            ScheduledStage(3, StageSpec("C", lambda: True, _contract("out/c/"), depends_on=("A", "B"))),
+        ]
+        run_ready_queue(
+            plan,
+            max_workers=2,
+            run_stage=run_stage,
+            commit_stage=lambda stage, result, record: committed.append((stage.spec.name, record)),
+        )
+        assert committed == [("A", True), ("B", True), ("C", True)]
+
+    def test_conflicting_stages_never_overlap(self) -> None:
+        active: list[str] = []
+        overlaps: list[tuple[str, ...]] = []
+        lock = threading.Lock()
+
+        def run_stage(stage: ScheduledStage) -> PipelineStageResult:
+            with lock:
+                active.append(stage.spec.name)
+                if len(active) > 1:
+                    overlaps.append(tuple(active))
+            threading.Event().wait(0.05)
+            with lock:
+                active.remove(stage.spec.name)
+            return _ok(stage)
+
+        plan = [
+            ScheduledStage(1, StageSpec("A", lambda: True, _contract("out/shared/"))),
+            ScheduledStage(2, StageSpec("B", lambda: True, _contract("out/shared/b.txt"))),
+        ]
+        run_ready_queue(plan, max_workers=2, run_stage=run_stage, commit_stage=lambda *_: None)
+        assert overlaps == []
+
+    def test_failure_stops_dispatch_and_later_results_are_not_recorded(self) -> None:
+        committed: list[tuple[str, bool]] = []
+
+        def run_stage(stage: ScheduledStage) -> PipelineStageResult:
+            success = stage.spec.name != "A"
+            return PipelineStageResult(stage.stage_num, stage.spec.name, success=success, duration=0.0)
+
+        plan = [
+            ScheduledStage(1, StageSpec("A", lambda: True, _contract("out/a/"))),
+            ScheduledStage(2, StageSpec("B", lambda: True, _contract("out/b/"))),
+            ScheduledStage(3, StageSpec("C", lambda: True, _contract("out/c/"), depends_on=("A",))),
+        ]
+        run_ready_queue(
+            plan,
+            max_workers=2,
+            run_stage=run_stage,
+            commit_stage=lambda stage, result, record: committed.append((stage.spec.name, record)),
+        )
+        # C depends on the failed A and never runs; B ran alongside A but is
+        # reported without being checkpointed past the failure.
+        assert committed == [("A", True), ("B", False)]
+
+    def test_exclusive_stage_runs_alone(self) -> None:
+        active: list[str] = []
+        seen_with_exclusive: list[tuple[str, ...]] = []
+        lock = threading.Lock()
+
+        def run_stage(stage: ScheduledStage) -> PipelineStageResult:
+            with lock:
+                active.append(stage.spec.name)
+                if "Gate" in active and len(active) > 1:
+                    seen_with_exclusive.append(tuple(active))
+            threading.Event().wait(0.02)
+            with lock:
+                active.remove(stage.spec.name)
+            return _ok(stage)
+
+        plan = [
+            ScheduledStage(1, StageSpec("A", lambda: True, _contract("out/a/"))),
+            ScheduledStage(2, StageSpec("Gate", lambda: True, _contract("out/g/")), exclusive=True),
+            ScheduledStage(3, StageSpec("B", lambda: True, _contract("out/b/"))),
+        ]
+        run_ready_queue(plan, max_workers=3, run_stage=run_stage, commit_stage=lambda *_: None)
+        assert seen_with_exclusive == []
+
+
+def _shipped_plan(*, exclude: set[str]) -> list[ScheduledStage]:
+    """Schedule the shipped ``pipeline.yaml`` the way the executor does."""
+    dag = PipelineDAG.from_yaml(DEFAULT_PIPELINE_YAML)
+    dag.filter_tags(exclude=exclude)
+    stages = dag.sorted_stages()
+    present = {stage.name for stage in stages}
+    return [
+        ScheduledStage(
+            stage_num,
+            StageSpec(
+                stage.name,
+                lambda: True,
+                stage.contract,
+                key=stage.key,
+                depends_on=tuple(dep for dep in stage.depends_on if dep in present),
+            ),
+            exclusive=stage.key in {"clean", "validate"},
+        )
+        for stage_num, stage in enumerate(stages, start=1)
+    ]
+
+
+def _assert_waves(plan: list[ScheduledStage], waves: list[set[str]]) -> None:
+    """Run ``plan``; every stage named in ``waves`` must meet its wave-mates at a barrier."""
+    barriers: dict[str, threading.Barrier] = {}
+    for wave in waves:
+        barrier = threading.Barrier(len(wave), timeout=5)
+        barriers.update(dict.fromkeys(wave, barrier))
+
+    def run_stage(stage: ScheduledStage) -> PipelineStageResult:
+        barrier = barriers.get(stage.spec.name)
+        if barrier is not None:
+            barrier.wait()  # raises BrokenBarrierError unless the whole wave runs concurrently
+        return _ok(stage)
+
+    committed: list[str] = []
+    run_ready_queue(
+        plan,
+        max_workers=4,
+        run_stage=run_stage,
+        commit_stage=lambda stage, result, record: committed.append(stage.spec.name),
+    )
+    assert committed == [stage.spec.name for stage in plan]
+
+
+class TestShippedPipelineWaves:
+    def test_default_run_overlaps_the_two_test_stages(self) -> None:
+        plan = _shipped_plan(exclude={"llm", *OPT_IN_STAGE_TAGS})
+        _assert_waves(plan, [{"Infrastructure Tests", "Project Tests"}])
+
+    def test_opt_in_exports_run_together_after_validation(self) -> None:
+        plan = _shipped_plan(exclude={"llm", "bundle", "archival", "science", "provenance"})
+        _assert_waves(
+            plan,
+            [
+                {"Infrastructure Tests", "Project Tests"},
+                {"Ebook Generation", "docxplus Export"},
+            ],
+        )
+
+
+class TestExecutorParallelMode:
+    def test_parallel_run_checkpoints_full_plan(self, tmp_path: Path) -> None:
+        repo_root = tmp_path / "repo"
+        project_dir = repo_root / "projects" / "p"
+        (project_dir / "output").mkdir(parents=True)
+        barrier = threading.Barrier(2, timeout=5)
+
+        def branch(name: str):
+            def _run() -> bool:
+                barrier.wait()
+                (project_dir / "output" / name).mkdir(parents=True, exist_ok=True)
+                return True
+
+            return _run
+
+        plan = [
+            StageSpec("Left", branch("left"), _contract("projects/{project}/output/left/")),
+            StageSpec("Right", branch("right"), _contract("projects/{project}/output/right/")),
+            StageSpec("Join", lambda: True, _contract("projects/{project}/output/join/"), depends_on=("Left", "Right")),
+        ]
+        config = PipelineConfig(project_name="p", repo_root=repo_root, clean=False, stage_parallelism=2)
+        executor = PipelineExecutor(config)
+
+        results = executor._execute_pipeline(plan)
+
+        assert [r.stage_name for r in results] == ["Left", "Right", "Join"]
+        assert all(r.success for r in results)
+        checkpoint = executor.checkpoint_manager.load_checkpoint()
+        assert checkpoint is not None
+        assert [sr.name for sr in checkpoint.stage_results] == ["Left", "Right", "Join"]
+        telemetry_names = [stage.stage_name for stage in executor._telemetry.report.stages]
+        assert sorted(telemetry_names) == ["Join", "Left", "Right"]
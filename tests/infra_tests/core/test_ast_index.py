@@ -0,0 +1,173 @@
+"""Tests for the shared Python AST index and its persistent summary cache.
+
+No mocks: sources are real files under ``tmp_path``, summaries are stored in a
+real SQLite file, and the parallel path starts real worker processes.
+"""
+
+from __future__ import annotations
+
+import ast
+from pathlib import Path
+
+import pytest
+
+from infrastructure.core.ast_index import (
+    ENV_AST_CACHE,
+    AstSummaryCache,
+    ModuleSummary,
+    PythonAstIndex,
+    default_ast_summary_cache,
+    summarize_source,
+)
+from infrastructure.skills.check_all_exports import audit_file
+
+_MODULE = """from __future__ import annotations
+
+import os, sys
+from typing import TYPE_CHECKING
+
+try:
+    from yaml import safe_load  # noqa: F401
+except ImportError:
+    safe_load = None
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+__all__ = ["Widget", "build"]
+
+
+class Widget:
+    def render(self) -> str:
+        from json import dumps
+
+        return dumps({})
+
+
+async def fetch() -> None: ...
+
+
+def build() -> Widget:
+    return Widget()
+"""
+
+
+def _write(path: Path, body: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(body, encoding="utf-8")
+    return path
+
+
+class TestSummarizeSource:
+    def test_extracts_imports_names_and_dunder_all(self) -> None:
+        summary = summarize_source(_MODULE)
+
+        assert summary.line_count == len(_MODULE.splitlines())
+        assert summary.dunder_all == ("Widget", "build")
+        assert summary.has_dunder_all
+        assert summary.defined_names == frozenset({"Widget", "render", "build"})
+        runtime = {(r.module, r.names) for r in summary.imports if r.runtime_top_level}
+        assert runtime == {
+            ("__future__", ("annotations",)),
+            ("os", None),
+            ("sys", None),
+            ("typing", ("TYPE_CHECKING",)),
+            ("yaml", ("safe_load",)),
+        }
+        nested = {r.module for r in summary.imports if not r.runtime_top_level}
+        assert nested == {"pathlib", "json"}
+
+    def test_syntax_errors_round_trip_through_json(self, tmp_path: Path) -> None:
+        source = "def broken(:\n    pass\n"
+        summary = ModuleSummary.from_json(summarize_source(source).to_json())
+        path = tmp_path / "broken.py"
+
+        with pytest.raises(SyntaxError) as expected:
+            ast.parse(source, filename=str(path))
+        rebuilt = summary.syntax_error_for(path)
+        assert rebuilt is not None and str(rebuilt) == str(expected.value)
+        assert summary.imports == () and summary.line_count == 2
+
+    def test_json_round_trip_is_lossless(self) -> None:
+        summary = summarize_source(_MODULE)
+        assert ModuleSummary.from_json(summary.to_json()) == summary
+
+
+class TestPythonAstIndex:
+    def test_unchanged_files_are_answered_from_the_cache(self, tmp_path: Path) -> None:
+        paths = [_write(tmp_path / "src" / f"m{i}.py", f"def f{i}(): pass\n") for i in range(3)]
+        cache = AstSummaryCache(tmp_path / "ast.sqlite")
+
+        cold = PythonAstIndex(cache)
+        first = cold.summaries(paths)
+        assert cold.parsed == 3 and cache.stats.stores == 3
+
+        _write(paths[0], "def edited(): pass\n")
+        moved = _write(tmp_path / "elsewhere" / "copy.py", "def f1(): pass\n")
+        warm = PythonAstIndex(AstSummaryCache(cache.db_path))
+        second = warm.summaries([*paths, moved])
+
+        assert warm.parsed == 1
+        assert second[paths[0]].defined_names == frozenset({"edited"})
+        assert second[paths[1]] == first[paths[1]] == second[moved]
+
+    def test_cache_keeps_the_most_recently_used_summaries(self, tmp_path: Path) -> None:
+        cache = AstSummaryCache(tmp_path / "ast.sqlite", max_entries=2)
+        summaries = {digest: summarize_source(f"{name} = 1\n") for digest, name in (("a", "A"), ("b", "B"), ("c", "C"))}
+        cache.put_many({"a": summaries["a"]})
+        cache.put_many({"b": summaries["b"]})
+        assert set(cache.get_many(["a"])) == {"a"}  # refreshes "a"
+        cache.put_many({"c": summaries["c"]})
+
+        assert cache.get_many(["a", "b", "c"]) == {"a": summaries["a"], "c": summaries["c"]}
+        assert cache.stats.to_dict() == {"hits": 3, "misses": 1, "stores": 3, "evictions": 1}
+
+    def test_parallel_summaries_match_serial(self, tmp_path: Path) -> None:
+        paths = [_write(tmp_path / f"m{i:03d}.py", _MODULE.replace("Widget", f"Widget{i}")) for i in range(130)]
+
+        parallel = PythonAstIndex(workers=2).summaries(paths)
+        serial = {path: summarize_source(path.read_text(encoding="utf-8")) for path in paths}
+        assert parallel == serial
+
+    def test_tree_memo_is_bounded(self, tmp_path: Path) -> None:
+        a = _write(tmp_path / "a.py", "A = 1\n")
+        b = _write(tmp_path / "b.py", "B = 2\n")
+        index = PythonAstIndex(max_trees=1)
+
+        assert index.tree(a) is index.tree(a)
+        index.tree(b)
+        index.tree(a)
+        assert index.parsed == 3
+
+        bad = _write(tmp_path / "bad.py", "def (\n")
+        for _ in range(2):
+            with pytest.raises(SyntaxError):
+                index.tree(bad)
+
+    def test_walks_each_root_once(self, tmp_path: Path) -> None:
+        keep = _write(tmp_path / "pkg" / "mod.py", "")
+        _write(tmp_path / "pkg" / "tests" / "test_mod.py", "")
+        index = PythonAstIndex()
+
+        assert index.python_files(tmp_path, skip_dirs=("tests",)) == [keep]
+        _write(tmp_path / "late.py", "")
+        assert len(index.python_files(tmp_path)) == 2
+
+    def test_audit_file_uses_summary_verdicts(self, tmp_path: Path) -> None:
+        shim = _write(
+            tmp_path / "shim.py", "try:\n    from os import path  # noqa: F401\nexcept ImportError:\n    pass\n"
+        )
+        index = PythonAstIndex(AstSummaryCache(tmp_path / "ast.sqlite"))
+
+        violation = audit_file(shim, index=index)
+        assert violation is not None and violation.line == 2
+        assert "'os'" in violation.reason
+
+
+def test_default_cache_location_follows_the_environment(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(ENV_AST_CACHE, "off")
+    assert default_ast_summary_cache() is None
+    assert PythonAstIndex.default().cache is None
+    monkeypatch.setenv(ENV_AST_CACHE, str(tmp_path / "custom.sqlite"))
+    cache = default_ast_summary_cache()
+    assert cache is not None and cache.db_path == tmp_path / "custom.sqlite"
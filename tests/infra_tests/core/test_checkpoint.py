@@ -4,7 +4,9 @@ Comprehensive tests for pipeline checkpoint system including save, load, resume,
 and error handling scenarios.
 """
 
+import hashlib
 import json
+import os
 import tempfile
 from pathlib import Path
 
@@ -480,3 +482,96 @@ def test_validate_checkpoint_rejects_swapped_outputs(tmp_path):
     assert ok is False
     assert err is not None
     assert "digest" in err.lower()
+
+
+def _save_one_stage(manager):
+    from infrastructure.core.runtime.checkpoint import StageResult
+
+    return manager.save_checkpoint(
+        pipeline_start_time=1.0,
+        last_stage_completed=1,
+        stage_results=[StageResult(name="Analysis", exit_code=0, duration=0.1, completed=True)],
+        total_stages=3,
+    )
+
+
+def _age(path: Path, seconds: int = 60) -> int:
+    """Backdate ``path`` out of the racy window; returns the new mtime_ns."""
+    mtime_ns = path.stat().st_mtime_ns - seconds * 1_000_000_000
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+    return mtime_ns
+
+
+class TestStatFingerprintDigest:
+    """Checkpoint digests hash only files whose (size, mtime_ns) changed."""
+
+    def test_unchanged_stat_is_trusted_without_reading_content(self, tmp_path):
+        output = tmp_path / "output"
+        output.mkdir()
+        pdf = output / "paper.pdf"
+        pdf.write_bytes(b"%PDF original")
+        mtime_ns = _age(pdf)
+        manager = CheckpointManager(checkpoint_dir=output / ".checkpoints")
+        assert _save_one_stage(manager)
+
+        stored = json.loads(manager.checkpoint_file.read_text(encoding="utf-8"))["output_files"]
+        assert stored["paper.pdf"][:2] == [len(b"%PDF original"), mtime_ns]
+
+        # Same size, restored mtime: the stat tier vouches for it.
+        pdf.write_bytes(b"%PDF changed!")
+        os.utime(pdf, ns=(mtime_ns, mtime_ns))
+        assert CheckpointManager(checkpoint_dir=output / ".checkpoints").validate_checkpoint() == (True, None)
+
+        # A changed mtime forces a content hash, which catches the edit.
+        _age(pdf, seconds=30)
+        ok, err = CheckpointManager(checkpoint_dir=output / ".checkpoints").validate_checkpoint()
+        assert ok is False
+        assert "digest" in err.lower()
+
+    def test_files_written_within_the_racy_window_are_always_rehashed(self, tmp_path):
+        output = tmp_path / "output"
+        output.mkdir()
+        result = output / "result.txt"
+        result.write_text("original", encoding="utf-8")
+        manager = CheckpointManager(checkpoint_dir=output / ".checkpoints")
+        assert _save_one_stage(manager)
+        mtime_ns = result.stat().st_mtime_ns
+
+        result.write_text("TAMPERS!", encoding="utf-8")
+        os.utime(result, ns=(mtime_ns, mtime_ns))
+
+        ok, _err = CheckpointManager(checkpoint_dir=output / ".checkpoints").validate_checkpoint()
+        assert ok is False
+
+    def test_digest_hint_replaces_hashing_for_changed_files(self, tmp_path):
+        output = tmp_path / "output"
+        output.mkdir()
+        (output / "a.txt").write_text("a", encoding="utf-8")
+        asked: list[Path] = []
+        manager = CheckpointManager(checkpoint_dir=output / ".checkpoints")
+
+        def hint(path: Path, _stat: os.stat_result) -> str:
+            asked.append(path)
+            return hashlib.sha256(path.read_bytes()).hexdigest()
+
+        manager.digest_hint = hint
+        assert _save_one_stage(manager)
+        assert _save_one_stage(manager)  # racy entries re-consult the hint; aged ones would not
+
+        assert asked == [(output / "a.txt").absolute()] * 2
+        assert manager.validate_checkpoint() == (True, None)
+
+    def test_legacy_byte_digest_checkpoints_still_validate(self, tmp_path):
+        output = tmp_path / "output"
+        output.mkdir()
+        (output / "result.txt").write_text("original", encoding="utf-8")
+        manager = CheckpointManager(checkpoint_dir=output / ".checkpoints")
+        assert _save_one_stage(manager)
+        payload = json.loads(manager.checkpoint_file.read_text(encoding="utf-8"))
+        del payload["output_files"]
+        payload["output_digest"] = manager._legacy_output_tree_digest()
+        manager.checkpoint_file.write_text(json.dumps(payload), encoding="utf-8")
+
+        assert manager.validate_checkpoint() == (True, None)
+        (output / "result.txt").write_text("changed", encoding="utf-8")
+        assert manager.validate_checkpoint()[0] is False
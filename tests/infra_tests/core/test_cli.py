@@ -13,6 +13,7 @@ from pathlib import Path
 import pytest
 
 from infrastructure.core.cli import create_parser, main
+from infrastructure.core.cli_parser import positive_int_arg
 from infrastructure.core.cli_handlers import (
     handle_discover_command,
     handle_inventory_command,
@@ -512,3 +513,11 @@ class TestHandleInventoryCommand:
         )
         exit_code = handle_inventory_command(args)
         assert exit_code == 0  # Returns 0 with "No files found"
+
+
+def test_positive_int_arg_accepts_only_positive_integers() -> None:
+    assert positive_int_arg("3") == 3
+    with pytest.raises(argparse.ArgumentTypeError, match="must be an integer"):
+        positive_int_arg("three")
+    with pytest.raises(argparse.ArgumentTypeError, match="must be a positive integer"):
+        positive_int_arg("0")
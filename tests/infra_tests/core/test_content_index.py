@@ -0,0 +1,83 @@
+"""Real-I/O tests for the stat-cached content-hash index."""
+
+import hashlib
+import os
+from pathlib import Path
+
+from infrastructure.core.files.content_index import ContentHashIndex, load_content_index, save_content_index
+
+
+def _age(path: Path) -> None:
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+
+
+def test_file_digest_matches_sha256_and_caches_old_files(tmp_path: Path) -> None:
+    path = tmp_path / "a.txt"
+    path.write_bytes(b"payload")
+    _age(path)
+    index = ContentHashIndex()
+
+    assert index.file_digest(path) == hashlib.sha256(b"payload").hexdigest()
+    assert index.file_digest(path) == hashlib.sha256(b"payload").hexdigest()
+    assert (index.hits, index.misses) == (1, 1)
+
+
+def test_recently_modified_files_are_not_cached(tmp_path: Path) -> None:
+    path = tmp_path / "fresh.txt"
+    path.write_bytes(b"new")
+    index = ContentHashIndex()
+
+    index.file_digest(path)
+    index.file_digest(path)
+
+    assert index.misses == 2
+    assert len(index) == 0
+
+
+def test_tree_digest_tracks_adds_renames_and_ignores_hidden(tmp_path: Path) -> None:
+    root = tmp_path / "tree"
+    (root / "sub").mkdir(parents=True)
+    (root / "sub" / "a.txt").write_text("a", encoding="utf-8")
+    index = ContentHashIndex()
+    base = index.tree_digest(root)
+
+    (root / ".cache").write_text("ignored", encoding="utf-8")
+    (root / "__pycache__").mkdir()
+    assert index.tree_digest(root) == base
+
+    (root / "sub" / "a.txt").rename(root / "sub" / "b.txt")
+    renamed = index.tree_digest(root)
+    assert renamed != base
+
+    (root / "sub" / "c.txt").write_text("c", encoding="utf-8")
+    assert index.tree_digest(root) != renamed
+
+
+def test_tree_digest_exclude_skips_subtree(tmp_path: Path) -> None:
+    root = tmp_path / "tree"
+    (root / "output").mkdir(parents=True)
+    (root / "src.txt").write_text("s", encoding="utf-8")
+    index = ContentHashIndex()
+    base = index.tree_digest(root, exclude=(root / "output",))
+
+    (root / "output" / "generated.txt").write_text("g", encoding="utf-8")
+
+    assert index.tree_digest(root, exclude=(root / "output",)) == base
+    assert index.tree_digest(root) != base
+
+
+def test_round_trip_and_corrupt_index_loads_empty(tmp_path: Path) -> None:
+    data = tmp_path / "a.txt"
+    data.write_text("a", encoding="utf-8")
+    _age(data)
+    index = ContentHashIndex()
+    index.file_digest(data)
+    target = tmp_path / ".pipeline" / "content_index.json"
+    save_content_index(target, index)
+
+    reloaded = load_content_index(target)
+    reloaded.file_digest(data)
+    assert (reloaded.hits, reloaded.misses) == (1, 0)
+
+    target.write_text("{not json", encoding="utf-8")
+    assert len(load_content_index(target)) == 0
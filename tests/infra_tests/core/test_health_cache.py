@@ -0,0 +1,241 @@
+"""Real-process tests for the warm gate host and the input-keyed gate cache.
+
+No mocks: gates run in a real worker interpreter, snapshots come from a real
+``git init`` repository under ``tmp_path``, and results are stored in a real
+SQLite file.
+"""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from infrastructure.core.health import build_gate_specs, gate_spec_sha256, run_health_checks
+from infrastructure.core.health_cache import (
+    ENV_HEALTH_CACHE,
+    GateResultCache,
+    RepositorySnapshot,
+    default_health_cache_path,
+    gate_input_paths,
+)
+from infrastructure.core.health_host import WARM_GATE_NAMES, WarmGateHost, host_request
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+requires_git = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def _git_repo(tmp_path: Path) -> Path:
+    repo = tmp_path / "repo"
+    (repo / "docs").mkdir(parents=True)
+    (repo / "src").mkdir()
+    (repo / "docs" / "guide.md").write_text("# Guide\n", encoding="utf-8")
+    (repo / "src" / "module.py").write_text("VALUE = 1\n", encoding="utf-8")
+    subprocess.run(["git", "init", "-q", str(repo)], check=True)
+    subprocess.run(["git", "-C", str(repo), "add", "."], check=True)
+    return repo
+
+
+class TestHostRequest:
+    def test_python_invocations_are_translated(self) -> None:
+        assert host_request(["uv", "run", "python", "scripts/x.py", "--check"]) == {
+            "kind": "script",
+            "target": "scripts/x.py",
+            "args": ["--check"],
+        }
+        assert host_request(["uv", "run", "python", "-m", "pkg", "check"])["kind"] == "module"  # type: ignore[index]
+        assert host_request([sys.executable, "-c", "pass"])["kind"] == "code"  # type: ignore[index]
+
+    def test_non_python_invocations_are_rejected(self) -> None:
+        assert host_request(["uv", "run", "ruff", "check", "."]) is None
+        assert host_request(["uv", "run", "python"]) is None
+
+    def test_warm_gates_are_registered_python_gates(self) -> None:
+        specs = dict(build_gate_specs(REPO_ROOT))
+        assert WARM_GATE_NAMES <= set(specs)
+        assert all(host_request(specs[name]) is not None for name in WARM_GATE_NAMES)
+
+
+class TestWarmGateHost:
+    def test_gates_share_one_worker_with_isolated_state(self, tmp_path: Path) -> None:
+        script = tmp_path / "gate.py"
+        script.write_text(
+            "import os, subprocess, sys\n"
+            "print('argv', sys.argv[1:])\n"
+            "subprocess.run([sys.executable, '-c', 'print(\"from child\")'], check=True)\n"
+            "os.chdir('/')\n"
+            "sys.exit(int(sys.argv[1]))\n",
+            encoding="utf-8",
+        )
+        pid = "import os; print(os.getpid())"
+        with WarmGateHost(tmp_path) as host:
+            first_pid = host.run([sys.executable, "-c", pid], timeout_seconds=60)[1].strip()
+            code, output = host.run(["uv", "run", "python", str(script), "3"], timeout_seconds=60)
+            assert code == 3
+            assert "argv ['3']" in output
+            assert "from child" in output
+            assert host.run([sys.executable, "-c", "import os; print(os.getcwd())"], timeout_seconds=60) == (
+                0,
+                f"{tmp_path}\n",
+            )
+            assert host.run([sys.executable, "-c", pid], timeout_seconds=60)[1].strip() == first_pid
+
+    def test_uncaught_exception_fails_the_gate(self, tmp_path: Path) -> None:
+        with WarmGateHost(tmp_path) as host:
+            code, output = host.run([sys.executable, "-c", "raise RuntimeError('boom')"], timeout_seconds=60)
+        assert code == 1
+        assert "RuntimeError: boom" in output
+
+    def test_timeout_kills_the_worker_and_the_next_gate_gets_a_fresh_one(self, tmp_path: Path) -> None:
+        with WarmGateHost(tmp_path) as host:
+            with pytest.raises(subprocess.TimeoutExpired):
+                host.run([sys.executable, "-c", "import time; time.sleep(30)"], timeout_seconds=0.5)
+            assert host.run([sys.executable, "-c", "print('alive')"], timeout_seconds=60) == (0, "alive\n")
+
+
+@requires_git
+class TestRepositorySnapshot:
+    def test_digest_tracks_worktree_edits_and_untracked_files(self, tmp_path: Path) -> None:
+        repo = _git_repo(tmp_path)
+        before = RepositorySnapshot.capture(repo)
+        assert before is not None
+
+        (repo / "src" / "module.py").write_text("VALUE = 2\n", encoding="utf-8")
+        edited = RepositorySnapshot.capture(repo)
+        assert edited is not None
+        assert edited.digest(["src"]) != before.digest(["src"])
+        assert edited.digest(["docs"]) == before.digest(["docs"])
+
+        (repo / "docs" / "new.md").write_text("new\n", encoding="utf-8")
+        added = RepositorySnapshot.capture(repo)
+        assert added is not None
+        assert added.digest(["docs"]) != before.digest(["docs"])
+        assert added.digest(["."]) != edited.digest(["."])
+
+    def test_globs_match_anywhere_and_the_tree_listing_sees_names_only(self, tmp_path: Path) -> None:
+        repo = _git_repo(tmp_path)
+        before = RepositorySnapshot.capture(repo)
+        assert before is not None
+
+        (repo / "src" / "module.py").write_text("VALUE = 2\n", encoding="utf-8")
+        edited = RepositorySnapshot.capture(repo)
+        assert edited is not None
+        assert edited.digest(["*.md", ":tree"]) == before.digest(["*.md", ":tree"])
+        assert edited.digest(["*.py"]) != before.digest(["*.py"])
+
+        (repo / "src" / "data.csv").write_text("a,b\n", encoding="utf-8")
+        added = RepositorySnapshot.capture(repo)
+        assert added is not None
+        assert added.digest(["*.md"]) == edited.digest(["*.md"])
+        assert added.digest(["*.md", ":tree"]) != edited.digest(["*.md", ":tree"])
+
+    def test_outside_git_there_is_no_snapshot(self, tmp_path: Path) -> None:
+        assert RepositorySnapshot.capture(tmp_path) is None
+
+
+class TestGateResultCache:
+    def test_time_dependent_gates_are_never_cached(self, tmp_path: Path) -> None:
+        specs = dict(build_gate_specs(REPO_ROOT))
+        assert gate_input_paths("status-freshness", specs["status-freshness"]) is None
+        ruff_inputs = gate_input_paths("ruff", specs["ruff"])
+        assert ruff_inputs is not None and "uv.lock" in ruff_inputs and "infrastructure" in ruff_inputs
+
+        snapshot = RepositorySnapshot({"a.py": "t:1"})
+        key, hit = GateResultCache(tmp_path / "c.sqlite").lookup(
+            snapshot, "status-freshness", specs["status-freshness"], gate_spec_sha256([])
+        )
+        assert (key, hit) == (None, None)
+
+    def test_gates_declare_their_own_inputs(self) -> None:
+        specs = dict(build_gate_specs(REPO_ROOT))
+        mypy_inputs = gate_input_paths("mypy", specs["mypy"])
+        assert mypy_inputs is not None
+        assert {"infrastructure", "pyproject.toml", "scripts/gates/mypy_ratchet.py"} <= set(mypy_inputs)
+        assert "docs" not in mypy_inputs and "." not in mypy_inputs
+        bandit_inputs = gate_input_paths("bandit", specs["bandit"])
+        assert bandit_inputs is not None and "bandit.yaml" in bandit_inputs and "bandit" not in bandit_inputs
+        assert gate_input_paths("codeowners", specs["codeowners"]) == (
+            ".github",
+            "infrastructure",
+            "pyproject.toml",
+            "uv.lock",
+        )
+        assert gate_input_paths("template-drift", specs["template-drift"]) == (".",)
+
+    @requires_git
+    def test_unrelated_edit_keeps_the_cached_verdict(self, tmp_path: Path) -> None:
+        repo = _git_repo(tmp_path)
+        (repo / "src" / "data.csv").write_text("a,b\n", encoding="utf-8")
+        cache = GateResultCache(tmp_path / "gates.sqlite")
+        argv = ["uv", "run", "python", "scripts/audit/lint_docs.py", "--quiet"]
+        spec = gate_spec_sha256([("docs-lint", argv)])
+
+        before = RepositorySnapshot.capture(repo)
+        key, hit = cache.lookup(before, "docs-lint", argv, spec)
+        assert key is not None and hit is None
+        cache.put(key, "docs-lint", 5.0, "docs ok")
+
+        (repo / "src" / "data.csv").write_text("a,b\n1,2\n", encoding="utf-8")
+        assert cache.lookup(RepositorySnapshot.capture(repo), "docs-lint", argv, spec) == (key, "docs ok")
+
+        (repo / "docs" / "guide.md").write_text("# Guide\n\nMore.\n", encoding="utf-8")
+        edited_key, edited_hit = cache.lookup(RepositorySnapshot.capture(repo), "docs-lint", argv, spec)
+        assert edited_key != key and edited_hit is None
+
+    def test_store_keeps_the_most_recently_used_results(self, tmp_path: Path) -> None:
+        cache = GateResultCache(tmp_path / "gates.sqlite", max_entries=2)
+        cache.put("a", "gate-a", 1.0, "a ok")
+        cache.put("b", "gate-b", 1.0, "b ok")
+        assert cache.get("a") == (1.0, "a ok")  # refreshes "a"
+        cache.put("c", "gate-c", 1.0, "c ok")
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None and cache.get("c") is not None
+        assert cache.stats.to_dict() == {"hits": 3, "misses": 1, "stores": 3, "evictions": 1}
+
+    def test_off_disables_the_default_store(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv(ENV_HEALTH_CACHE, "off")
+        assert default_health_cache_path() is None
+        monkeypatch.setenv(ENV_HEALTH_CACHE, str(tmp_path / "gates.sqlite"))
+        assert default_health_cache_path() == tmp_path / "gates.sqlite"
+
+    @requires_git
+    def test_unchanged_gate_is_replayed_from_cache(self, tmp_path: Path) -> None:
+        cache = GateResultCache(tmp_path / "gates.sqlite")
+
+        first = run_health_checks(REPO_ROOT, gates=["codeowners"], cache=cache)
+        second = run_health_checks(REPO_ROOT, gates=["codeowners"], cache=GateResultCache(cache.db_path))
+
+        assert first.passed and not first.results[0].cached
+        assert cache.stats.stores == 1
+        assert second.passed and second.results[0].cached
+        assert second.results[0].output == first.results[0].output
+
+    # pytest-timeout's thread method ends an overrunning test with os._exit,
+    # taking the xdist worker down; three interpreter start-ups on a busy
+    # worker need more than the 10 s default.
+    @pytest.mark.timeout(60)
+    def test_warm_sweep_matches_subprocess_sweep(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        # A small stand-in repository keeps both sweeps to a few files. The
+        # real CODEOWNERS inputs make one gate pass; a bare ``xml.etree`` parse
+        # makes the other fail, so the two modes must agree on both verdicts.
+        repo = tmp_path / "repo"
+        (repo / ".github").mkdir(parents=True)
+        for name in ("CODEOWNERS", "sensitive-ownership.yaml"):
+            shutil.copyfile(REPO_ROOT / ".github" / name, repo / ".github" / name)
+        (repo / "infrastructure").mkdir()
+        (repo / "infrastructure" / "reader.py").write_text(
+            "import xml.etree.ElementTree as ET\n\ntree = ET.parse('doc.xml')\n", encoding="utf-8"
+        )
+        monkeypatch.setenv("PYTHONPATH", str(REPO_ROOT))
+
+        gates = ["codeowners", "xml-parser-policy"]
+        warm = run_health_checks(repo, gates=gates, warm=True, workers=2)
+        cold = run_health_checks(repo, gates=gates, workers=2)
+
+        assert [r.name for r in warm.results] == gates
+        assert [r.passed for r in warm.results] == [r.passed for r in cold.results] == [True, False]
@@ -23,6 +23,7 @@ from infrastructure.core.security import (
     SecurityMonitor,
     SecurityValidator,
     SecurityViolation,
+    TokenBucketLimiter,
     get_cors_headers,
     get_rate_limiter,
     get_security_headers,
@@ -329,6 +330,55 @@ class TestRateLimiter:
         assert limiter.is_allowed("user1") is True
 
 
+class _FakeClock:
+    """Deterministic clock whose sleeps advance time instantly."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucketLimiter:
+    """Test TokenBucketLimiter with an injected clock."""
+
+    def test_burst_then_paced(self):
+        clock = _FakeClock()
+        limiter = TokenBucketLimiter(2.0, clock=clock, sleeper=clock.sleep)
+
+        assert [limiter.acquire("host") for _ in range(2)] == [0.0, 0.0]
+        assert limiter.acquire("host") == pytest.approx(0.5)
+        assert limiter.acquire("host") == pytest.approx(0.5)
+
+    def test_keys_are_independent_and_overridable(self):
+        clock = _FakeClock()
+        limiter = TokenBucketLimiter(10.0, rates={"slow": 0.5}, clock=clock, sleeper=clock.sleep)
+
+        assert limiter.acquire("slow") == 0.0
+        assert limiter.acquire("fast") == 0.0
+        assert limiter.acquire("slow") == pytest.approx(2.0)
+
+    def test_idle_time_refills_up_to_capacity(self):
+        clock = _FakeClock()
+        limiter = TokenBucketLimiter(1.0, burst=2, clock=clock, sleeper=clock.sleep)
+        limiter.acquire("k")
+        limiter.acquire("k")
+        clock.now += 60
+
+        assert [limiter.acquire("k") for _ in range(2)] == [0.0, 0.0]
+        assert limiter.acquire("k") == pytest.approx(1.0)
+
+    def test_rejects_non_positive_rate(self):
+        with pytest.raises(ValueError):
+            TokenBucketLimiter(0)
+
+
 class TestSecurityMonitor:
     """Tests for SecurityMonitor class."""
 
@@ -7,8 +7,12 @@ Zero-Mock policy.
 from __future__ import annotations
 
 import json
+import subprocess
+import sys
 from pathlib import Path
 
+import pytest
+
 from infrastructure.core.logging.diagnostic import (
     DiagnosticReporter,
 )
@@ -453,3 +457,72 @@ class TestTelemetryCollectorEnabled:
         collector = TelemetryCollector(config, "proj")
         info = collector.capture_system_info()
         assert info == {}
+
+
+# ── Child-process accounting ────────────────────────────────────────
+
+
+class TestChildProcessTelemetry:
+    """Stages run as subprocesses; their resources must reach StageTelemetry."""
+
+    _ALLOCATE = (
+        "import time\n"
+        "block = bytearray(200 * 1024 * 1024)\n"
+        "for i in range(0, len(block), 4096):\n"
+        "    block[i] = 1\n"
+        "deadline = time.process_time() + 0.3\n"
+        "while time.process_time() < deadline:\n"
+        "    pass\n"
+        "time.sleep(0.6)\n"
+    )
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="getrusage(RUSAGE_CHILDREN) is POSIX-only")
+    def test_stage_records_child_peak_rss_and_cpu(self) -> None:
+        config = TelemetryConfig(enabled=True, persist_report=False, child_sample_interval=0.1)
+        collector = TelemetryCollector(config, "proj")
+
+        collector.start_stage("render", 1)
+        subprocess.run([sys.executable, "-c", self._ALLOCATE], check=True)
+        stage = collector.end_stage("render", 1)
+
+        assert stage.child_peak_rss_mb > 150
+        assert stage.child_cpu_user_s + stage.child_cpu_system_s >= 0.25
+        assert stage.peak_memory_mb == stage.child_peak_rss_mb
+        assert stage.to_dict()["child_peak_rss_mb"] > 150
+        assert collector._sampler is None
+
+    def test_child_usage_drives_memory_and_cpu_warnings(self) -> None:
+        config = TelemetryConfig(enabled=True, persist_report=False, high_memory_mb=1024.0, high_cpu_percent=90.0)
+        collector = TelemetryCollector(config, "proj")
+        collector._cpu_count = 1
+        collector._report.stages = [
+            StageTelemetry(
+                stage_name="latex",
+                duration=10.0,
+                memory_mb=80.0,
+                child_peak_rss_mb=3000.0,
+                child_cpu_user_s=9.0,
+                child_cpu_system_s=1.0,
+            ),
+        ]
+
+        warnings = {w.warning_type: w for w in collector._detect_warnings()}
+
+        assert warnings["high_memory"].value == 3000.0
+        assert "child-process peak" in warnings["high_memory"].message
+        assert warnings["high_cpu"].value == pytest.approx(100.0)
+        assert "child processes across 1 core(s)" in warnings["high_cpu"].message
+
+    def test_parallel_child_cpu_is_normalised_by_core_count(self) -> None:
+        config = TelemetryConfig(enabled=True, persist_report=False, high_cpu_percent=90.0)
+        collector = TelemetryCollector(config, "proj")
+        collector._cpu_count = 4
+        # Three cores busy for the whole stage: 300% summed, 75% of the machine.
+        busy = StageTelemetry(stage_name="render", duration=10.0, child_cpu_user_s=30.0)
+        collector._report.stages = [busy]
+        assert not [w for w in collector._detect_warnings() if w.warning_type == "high_cpu"]
+
+        # All four cores saturated does warn.
+        busy.child_cpu_user_s = 40.0
+        (warning,) = [w for w in collector._detect_warnings() if w.warning_type == "high_cpu"]
+        assert warning.value == pytest.approx(100.0)
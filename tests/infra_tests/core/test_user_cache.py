@@ -0,0 +1,84 @@
+"""Tests for the shared per-user SQLite cache helpers (real files, no mocks)."""
+
+from __future__ import annotations
+
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+
+import pytest
+
+from infrastructure.core.user_cache import (
+    CacheStats,
+    connect_cache_db,
+    evict_oldest,
+    user_cache_path,
+    user_cache_root,
+)
+
+_SCHEMA = "CREATE TABLE IF NOT EXISTS items (key TEXT PRIMARY KEY, used_at REAL NOT NULL);"
+
+
+def test_cache_root_follows_xdg_cache_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert user_cache_root() == tmp_path / "template"
+
+    monkeypatch.delenv("XDG_CACHE_HOME")
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    assert user_cache_root() == tmp_path / "home" / ".cache" / "template"
+
+
+@pytest.mark.parametrize("value", ["off", "0", "False", " none "])
+def test_cache_path_env_switch_disables(value: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("TEMPLATE_EXAMPLE_CACHE", value)
+    assert user_cache_path("TEMPLATE_EXAMPLE_CACHE", "example.sqlite") is None
+
+
+def test_cache_path_env_switch_moves_or_defaults(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.delenv("TEMPLATE_EXAMPLE_CACHE", raising=False)
+    assert user_cache_path("TEMPLATE_EXAMPLE_CACHE", "example.sqlite") == tmp_path / "template" / "example.sqlite"
+
+    monkeypatch.setenv("TEMPLATE_EXAMPLE_CACHE", str(tmp_path / "elsewhere.sqlite"))
+    assert user_cache_path("TEMPLATE_EXAMPLE_CACHE", "example.sqlite") == tmp_path / "elsewhere.sqlite"
+
+
+def test_connect_creates_schema_and_resets_on_version_change(tmp_path: Path) -> None:
+    db_path = tmp_path / "nested" / "cache.sqlite"
+    with closing(connect_cache_db(db_path, _SCHEMA)) as conn, conn:
+        conn.execute("INSERT INTO items VALUES ('a', 1.0)")
+    with closing(connect_cache_db(db_path, _SCHEMA)) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 1
+
+    v2 = "CREATE TABLE IF NOT EXISTS items (key TEXT PRIMARY KEY, used_at REAL NOT NULL, size INTEGER);"
+    with closing(connect_cache_db(db_path, v2, schema_version=2)) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 0
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == 2
+        conn.execute("INSERT INTO items VALUES ('b', 2.0, 3)")
+
+
+def test_connect_resets_a_pre_versioned_file(tmp_path: Path) -> None:
+    db_path = tmp_path / "cache.sqlite"
+    with closing(sqlite3.connect(db_path)) as conn, conn:
+        conn.execute("CREATE TABLE items (key TEXT PRIMARY KEY)")
+        conn.execute("INSERT INTO items VALUES ('legacy')")
+
+    with closing(connect_cache_db(db_path, _SCHEMA)) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 0
+        conn.execute("INSERT INTO items VALUES ('a', 1.0)")
+
+
+def test_evict_oldest_keeps_newest_rows(tmp_path: Path) -> None:
+    with closing(connect_cache_db(tmp_path / "cache.sqlite", _SCHEMA)) as conn, conn:
+        conn.executemany("INSERT INTO items VALUES (?, ?)", [(f"k{i}", float(i % 3)) for i in range(6)])
+        removed = evict_oldest(conn, "items", order_by="used_at", keep=3)
+        kept = sorted(key for (key,) in conn.execute("SELECT key FROM items"))
+
+    assert removed == 3
+    # used_at 2.0 (k2, k5) survive, then the later-inserted of the 1.0 rows (k4).
+    assert kept == ["k2", "k4", "k5"]
+
+
+def test_cache_stats_to_dict() -> None:
+    stats = CacheStats(hits=2, misses=1)
+    assert stats.to_dict() == {"hits": 2, "misses": 1, "stores": 0, "evictions": 0}
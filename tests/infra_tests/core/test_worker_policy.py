@@ -4,7 +4,11 @@ from __future__ import annotations
 
 import pytest
 
-from infrastructure.core.worker_policy import clamp_worker_count, resolve_bounded_workers
+from infrastructure.core.worker_policy import (
+    clamp_worker_count,
+    parse_positive_int,
+    resolve_bounded_workers,
+)
 
 
 def test_explicit_worker_count_is_capped_to_items() -> None:
@@ -38,3 +42,8 @@ def test_invalid_environment_can_fail_closed(monkeypatch: pytest.MonkeyPatch) ->
     monkeypatch.setenv("PYTEST_XDIST_WORKERS", "invalid")
     with pytest.raises(ValueError, match="PYTEST_XDIST_WORKERS"):
         resolve_bounded_workers(env_name="PYTEST_XDIST_WORKERS")
+
+
+def test_parse_positive_int_returns_none_for_unusable_values() -> None:
+    assert parse_positive_int(" 4 ") == 4
+    assert [parse_positive_int(raw) for raw in (None, "", "auto", "0", "-2")] == [None] * 5
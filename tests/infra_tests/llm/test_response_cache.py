@@ -0,0 +1,140 @@
+"""Tests for the pooled session and persistent LLM response cache.
+
+No mocks: a real ``pytest-httpserver`` stands in for Ollama and counts the
+chat requests it serves; the cache is a real SQLite file under ``tmp_path``.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+from infrastructure.llm.core import GenerationOptions, LLMClient, OllamaClientConfig
+from infrastructure.llm.core.response_cache import (
+    LLMResponseCache,
+    is_deterministic_request,
+    response_cache_key,
+)
+
+
+@pytest.fixture
+def chat_server(httpserver: HTTPServer) -> list[dict[str, object]]:
+    """Serve ``/api/tags`` with a digest and echo the last user message on ``/api/chat``."""
+    served: list[dict[str, object]] = []
+
+    def chat(request: Request) -> Response:
+        payload = json.loads(request.data)
+        served.append(payload)
+        reply = f"echo: {payload['messages'][-1]['content']}"
+        if payload.get("stream"):
+            lines = [{"message": {"content": part}, "done": False} for part in (reply[:5], reply[5:])]
+            body = "\n".join(json.dumps(line) for line in [*lines, {"done": True}])
+            return Response(body, content_type="application/x-ndjson")
+        return Response(json.dumps({"message": {"content": reply}}), content_type="application/json")
+
+    httpserver.expect_request("/api/tags").respond_with_json(
+        {"models": [{"name": "tiny:latest", "digest": "sha256:aaa"}]}
+    )
+    httpserver.expect_request("/api/chat", method="POST").respond_with_handler(chat)
+    return served
+
+
+def _client(httpserver: HTTPServer, tmp_path: Path, **overrides: object) -> LLMClient:
+    settings: dict[str, object] = {
+        "base_url": httpserver.url_for("").rstrip("/"),
+        "default_model": "tiny",
+        "auto_inject_system_prompt": False,
+        "response_cache_path": str(tmp_path / "responses.db"),
+        **overrides,
+    }
+    config = OllamaClientConfig(**settings)
+    return LLMClient(config)
+
+
+class TestKeysAndStore:
+    def test_key_is_canonical_and_content_sensitive(self) -> None:
+        messages = [{"role": "user", "content": "hi"}]
+        key = response_cache_key(model_digest="d1", messages=messages, ollama_options={"seed": 1, "top_p": 0.9})
+
+        assert key == response_cache_key(model_digest="d1", messages=messages, ollama_options={"top_p": 0.9, "seed": 1})
+        assert key != response_cache_key(model_digest="d2", messages=messages, ollama_options={"seed": 1, "top_p": 0.9})
+        assert key != response_cache_key(
+            model_digest="d1", messages=[{"role": "user", "content": "hi!"}], ollama_options={"seed": 1, "top_p": 0.9}
+        )
+
+    def test_only_seeded_or_zero_temperature_requests_are_deterministic(self) -> None:
+        assert is_deterministic_request({"temperature": 0.7, "seed": 3})
+        assert is_deterministic_request({"temperature": 0})
+        assert not is_deterministic_request({"temperature": 0.7})
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path: Path) -> None:
+        cache = LLMResponseCache(tmp_path / "r.db", max_entries=2)
+        cache.put("a", "A", model="m")
+        cache.put("b", "B", model="m")
+        assert cache.get("a") == "A"
+        cache.put("c", "C", model="m")
+
+        assert cache.get("b") is None
+        assert (cache.get("a"), cache.get("c")) == ("A", "C")
+        assert len(cache) == 2
+        assert (cache.stats.hits, cache.stats.misses, cache.stats.stores, cache.stats.evictions) == (3, 1, 3, 1)
+
+
+class TestClientCaching:
+    def test_seeded_requests_are_served_from_disk_across_clients(
+        self, httpserver: HTTPServer, tmp_path: Path, chat_server: list[dict[str, object]]
+    ) -> None:
+        options = GenerationOptions(seed=7)
+        first = _client(httpserver, tmp_path).query("review A", options=options)
+
+        rerun = _client(httpserver, tmp_path)
+        again = rerun.query("review A", options=options)
+        changed = rerun.query("review B", options=options, reset_context=True)
+
+        assert first == again == "echo: review A"
+        assert changed == "echo: review B"
+        assert len(chat_server) == 2
+        assert (rerun.response_cache.stats.hits, rerun.response_cache.stats.misses) == (1, 1)
+
+    def test_sampled_requests_bypass_the_cache(
+        self, httpserver: HTTPServer, tmp_path: Path, chat_server: list[dict[str, object]]
+    ) -> None:
+        client = _client(httpserver, tmp_path)
+        client.query("same", options=GenerationOptions(temperature=0.7))
+        client.query("same", options=GenerationOptions(temperature=0.7), reset_context=True)
+
+        assert len(chat_server) == 2
+        assert len(client.response_cache) == 0
+
+    def test_streamed_response_is_cached_and_replayed(
+        self, httpserver: HTTPServer, tmp_path: Path, chat_server: list[dict[str, object]]
+    ) -> None:
+        options = GenerationOptions(temperature=0.0)
+        streamed = "".join(_client(httpserver, tmp_path).stream_query("stream me", options=options))
+
+        rerun = _client(httpserver, tmp_path)
+        replayed = list(rerun.stream_query("stream me", options=options))
+
+        assert streamed == "echo: stream me"
+        assert replayed == [streamed]
+        assert rerun.context.get_messages()[-1] == {"role": "assistant", "content": streamed}
+        assert len(chat_server) == 1
+
+    def test_unknown_model_digest_disables_caching(
+        self, httpserver: HTTPServer, tmp_path: Path, chat_server: list[dict[str, object]]
+    ) -> None:
+        client = _client(httpserver, tmp_path, default_model="not-installed")
+        client.query("x", options=GenerationOptions(seed=1))
+        client.query("x", options=GenerationOptions(seed=1), reset_context=True)
+
+        assert len(chat_server) == 2
+
+    def test_session_is_pooled_per_client(self, httpserver: HTTPServer, tmp_path: Path) -> None:
+        client = _client(httpserver, tmp_path)
+
+        assert client.session is client.session
+        assert client.session is not _client(httpserver, tmp_path).session
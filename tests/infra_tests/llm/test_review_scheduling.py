@@ -0,0 +1,156 @@
+"""Tests for bounded-concurrency review scheduling.
+
+No mocks: jobs are plain callables that sleep and record which thread and
+"client" served them, so ordering, concurrency and deadlines are observed
+directly.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from infrastructure.core.worker_policy import ENV_LLM_REVIEW_WORKERS
+from infrastructure.llm.review.metrics import ReviewMetrics
+from infrastructure.llm.review.scheduling import (
+    ENV_OLLAMA_NUM_PARALLEL,
+    ReviewJob,
+    ReviewOutcome,
+    resolve_review_workers,
+    review_cancelled,
+    run_review_jobs,
+)
+
+
+class _Client:
+    """Stand-in for an LLM client: only its identity matters here."""
+
+    def __init__(self, label: str) -> None:
+        self.label = label
+
+
+def _job(name: str, delay: float, seen: list[tuple[str, str]] | None = None) -> ReviewJob[_Client]:
+    def run(client: _Client) -> tuple[str | None, ReviewMetrics]:
+        time.sleep(delay)
+        if seen is not None:
+            seen.append((name, client.label))
+        return f"{name} text", ReviewMetrics(output_chars=len(name))
+
+    return ReviewJob(name, name.title(), run)
+
+
+class TestResolveReviewWorkers:
+    @pytest.mark.parametrize(
+        ("env", "expected"),
+        [
+            ({}, 1),
+            ({ENV_LLM_REVIEW_WORKERS: "serial"}, 1),
+            ({ENV_LLM_REVIEW_WORKERS: "3"}, 3),
+            ({ENV_LLM_REVIEW_WORKERS: "16"}, 5),
+            ({ENV_LLM_REVIEW_WORKERS: "auto", ENV_OLLAMA_NUM_PARALLEL: "4"}, 4),
+            ({ENV_LLM_REVIEW_WORKERS: "auto"}, 1),
+            ({ENV_LLM_REVIEW_WORKERS: "many"}, 1),
+            ({ENV_LLM_REVIEW_WORKERS: "0"}, 1),
+        ],
+    )
+    def test_policy(self, env: dict[str, str], expected: int) -> None:
+        assert resolve_review_workers(5, env=env) == expected
+
+
+class TestRunReviewJobs:
+    def test_serial_runs_inline_on_the_primary_client(self) -> None:
+        seen: list[tuple[str, str]] = []
+        jobs = [_job("a", 0, seen), _job("b", 0, seen)]
+
+        outcomes = run_review_jobs(jobs, client=_Client("primary"), client_factory=lambda: _Client("worker"))
+
+        assert [o.name for o in outcomes] == ["a", "b"]
+        assert seen == [("a", "primary"), ("b", "primary")]
+
+    def test_parallel_results_are_emitted_in_job_order(self) -> None:
+        emitted: list[str] = []
+        jobs = [_job("slow", 0.3), _job("fast", 0.0), _job("medium", 0.1)]
+
+        start = time.monotonic()
+        outcomes = run_review_jobs(
+            jobs,
+            client=_Client("primary"),
+            client_factory=lambda: _Client("worker"),
+            workers=3,
+            on_result=lambda outcome: emitted.append(outcome.name),
+        )
+
+        assert emitted == ["slow", "fast", "medium"]
+        assert [o.response for o in outcomes] == ["slow text", "fast text", "medium text"]
+        assert time.monotonic() - start < 0.35
+
+    def test_each_worker_thread_gets_its_own_client(self) -> None:
+        seen: list[tuple[str, str]] = []
+        created: list[str] = []
+        lock = threading.Lock()
+
+        def factory() -> _Client:
+            with lock:
+                created.append(threading.current_thread().name)
+                return _Client(f"worker-{len(created)}")
+
+        jobs = [_job(str(i), 0.05, seen) for i in range(6)]
+        run_review_jobs(jobs, client=_Client("primary"), client_factory=factory, workers=2)
+
+        assert len(created) == 2
+        assert {label for _, label in seen} == {"worker-1", "worker-2"}
+
+    def test_overdue_and_failing_jobs_do_not_block_the_rest(self) -> None:
+        def boom(client: _Client) -> tuple[str | None, ReviewMetrics]:
+            raise RuntimeError("connection reset")
+
+        jobs = [_job("stuck", 2.0), ReviewJob("broken", "Broken", boom), _job("ok", 0.0)]
+        emitted: list[ReviewOutcome] = []
+
+        start = time.monotonic()
+        run_review_jobs(
+            jobs,
+            client=_Client("primary"),
+            client_factory=lambda: _Client("worker"),
+            workers=3,
+            deadline=0.2,
+            on_result=emitted.append,
+        )
+
+        assert time.monotonic() - start < 1.5
+        assert [(o.name, o.response, o.timed_out) for o in emitted] == [
+            ("stuck", None, True),
+            ("broken", None, False),
+            ("ok", "ok text", False),
+        ]
+        assert emitted[1].error == "connection reset"
+
+    def test_abandoned_job_is_asked_to_stop(self) -> None:
+        stopped = threading.Event()
+
+        def cooperative(client: _Client) -> tuple[str | None, ReviewMetrics]:
+            give_up = time.monotonic() + 5
+            while not review_cancelled() and time.monotonic() < give_up:
+                time.sleep(0.01)
+            if review_cancelled():
+                stopped.set()
+            return "late text", ReviewMetrics()
+
+        jobs = [ReviewJob("stuck", "Stuck", cooperative), _job("ok", 0.0)]
+
+        outcomes = run_review_jobs(
+            jobs,
+            client=_Client("primary"),
+            client_factory=lambda: _Client("worker"),
+            workers=2,
+            deadline=0.2,
+        )
+
+        assert stopped.wait(2), "the abandoned job never saw its cancellation flag"
+        assert [(o.name, o.response, o.timed_out) for o in outcomes] == [
+            ("stuck", None, True),
+            ("ok", "ok text", False),
+        ]
+        assert not review_cancelled()
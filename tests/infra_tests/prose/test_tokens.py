@@ -0,0 +1,92 @@
+"""Tests for infrastructure.prose.analysis.tokens — real text, no mocks."""
+
+from __future__ import annotations
+
+import pytest
+
+from infrastructure.prose.analysis import (
+    analyze_quality,
+    clear_token_caches,
+    compute_metrics,
+    split_paragraphs,
+    split_sentences,
+    tokenize_document,
+    tokenize_paragraph,
+    tokenize_words,
+    word_profile,
+)
+
+_TEXT = (
+    "The model was trained on three corpora. It may generalize.\n\n"
+    "Results are shown in Table 2! Approximately half were rejected.\n"
+    "\n"
+    "this paragraph has no capital\n\n"
+    "and continues here. The data were\n\n"
+    "collected in 2024."
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches():
+    clear_token_caches()
+    yield
+    clear_token_caches()
+
+
+class TestTokenStream:
+    def test_spans_point_into_the_document(self):
+        doc = tokenize_document(_TEXT)
+        assert [_TEXT[p.start : p.end] for p in doc.paragraphs] == split_paragraphs(_TEXT)
+        assert [word for word, _, _ in doc.words()] == tokenize_words(_TEXT)
+        assert all(_TEXT[start:end] == word for word, start, end in doc.words())
+        assert all(_TEXT[s.start : s.end] == s.text for s in doc.sentences)
+
+    def test_document_sentences_match_split_sentences(self):
+        doc = tokenize_document(_TEXT)
+        assert [s.text for s in doc.sentences] == split_sentences(_TEXT)
+        # Sentences join across a break unless the paragraph ends in . ! ? and the next is capitalised.
+        assert doc.paragraph_sentence_count == 8
+        assert len(doc.sentences) == 5
+        assert doc.sentences[3].word_count == 12
+
+    def test_passive_voice_is_detected_across_a_joined_break(self):
+        doc = tokenize_document(_TEXT)
+        passive = [s.text for s in doc.sentences if s.passive]
+        assert passive == [
+            "The model was trained on three corpora.",
+            "Approximately half were rejected.\n\nthis paragraph has no capital\n\nand continues here.",
+            "The data were\n\ncollected in 2024.",
+        ]
+
+    def test_word_counts_and_lexicon(self):
+        doc = tokenize_document(_TEXT)
+        assert doc.word_count == len(tokenize_words(_TEXT))
+        assert doc.hedge_words == ["may", "approximately"]
+        profile = word_profile("corpora")
+        assert (profile.syllables, profile.complex, profile.hedge) == (3, True, False)
+        assert word_profile("were").be_form and word_profile("collected").participle
+
+    def test_analysers_share_one_stream(self):
+        compute_metrics(_TEXT)
+        analyze_quality(_TEXT)
+        info = tokenize_document.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
+
+class TestIncrementalReanalysis:
+    def test_one_paragraph_edit_only_retokenizes_that_paragraph(self):
+        paragraphs = [f"Paragraph {i} was written carefully. It could be clearer." for i in range(200)]
+        before = compute_metrics("\n\n".join(paragraphs))
+        assert tokenize_paragraph.cache_info().misses == 200
+        lexicon_misses = word_profile.cache_info().misses
+
+        paragraphs[57] = "Paragraph fifty-seven was rewritten entirely."
+        after = compute_metrics("\n\n".join(paragraphs))
+
+        assert tokenize_paragraph.cache_info().misses == 201
+        assert word_profile.cache_info().misses == lexicon_misses + 3  # fifty-seven, rewritten, entirely
+        assert after.word_count == before.word_count - 3
+
+    def test_repeated_words_are_scored_once(self):
+        tokenize_document("Optimization optimization optimization. Optimization again.")
+        assert word_profile.cache_info().misses == 3
@@ -177,6 +177,20 @@ class TestReview:
         assert data.get("is_valid") is True
 
 
+class TestMainExport:
+    """Tests for the export subcommand and the SQLite backend."""
+
+    def test_sqlite_store_exports_json_document(self, tmp_path, capsys):
+        """record-artifact into a .sqlite store, then export a dag.json the JSON store can load."""
+        db = tmp_path / "dag.sqlite"
+        assert main(["--dag-path", str(db), "record-artifact", "fig1", "--path", "fig1.pdf"]) == 0
+        rc = main(["--dag-path", str(db), "export", str(tmp_path / "dag.json")])
+        captured = capsys.readouterr()
+        assert rc == 0
+        assert "exported 1 nodes" in captured.out
+        assert [n.label for n in _store(tmp_path).list()] == ["fig1"]
+
+
 class TestMainNoCommand:
     """Tests for main() with no subcommand."""
 
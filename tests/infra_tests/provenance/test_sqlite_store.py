@@ -0,0 +1,142 @@
+"""Tests for infrastructure.provenance.sqlite_store and backend selection."""
+
+from __future__ import annotations
+
+import json
+import time
+
+import pytest
+
+from infrastructure.provenance import (
+    ArtifactNode,
+    ClaimNode,
+    EdgeRelation,
+    NodeKind,
+    Provenance,
+    ProvenanceStoreError,
+    RunNode,
+    SourceNode,
+    SqliteProvenance,
+    open_provenance_store,
+)
+
+
+def _populate(store, count: int = 3) -> None:
+    """Record the same small DAG (with non-ASCII metadata) into any backend."""
+    run = RunNode.create("analysis", command="python analysis.py", exit_code=0)
+    source = SourceNode.create("paper", uri="https://doi.org/10.1/x")
+    claim = ClaimNode.create("claim", "Café effect is positive")
+    with store.batch():
+        for node in (run, source, claim):
+            store.record(node)
+        for index in range(count):
+            art = store.record(ArtifactNode.create(f"fig{index}", path=f"output/fig{index}.pdf", size_bytes=index))
+            store.link(run.node_id, art.node_id, EdgeRelation.produced_by, {"step": index, "note": "ü"})
+        store.link(source.node_id, claim.node_id, EdgeRelation.supports)
+
+
+class TestSqliteProvenance:
+    def test_record_get_and_persist(self, tmp_path):
+        db = tmp_path / "dag.sqlite"
+        store = SqliteProvenance(db)
+        node = store.record(ArtifactNode.create("fig", path="f.pdf"))
+        assert node.created_at != ""
+        store.record(node)  # idempotent
+        store.close()
+
+        reopened = SqliteProvenance(db)
+        assert len(reopened) == 1
+        loaded = reopened.get(node.node_id)
+        assert loaded is not None and loaded.to_dict() == node.to_dict()
+        assert reopened.get("missing") is None
+        assert "SqliteProvenance(nodes=1, edges=0" in repr(reopened)
+
+    def test_link_requires_recorded_nodes(self, tmp_path):
+        store = SqliteProvenance(tmp_path / "dag.sqlite")
+        art = store.record(ArtifactNode.create("a", path="a"))
+        with pytest.raises(KeyError, match="ghost"):
+            store.link("ghost", art.node_id, EdgeRelation.derived_from)
+        with pytest.raises(KeyError, match="ghost"):
+            store.link(art.node_id, "ghost", EdgeRelation.derived_from)
+
+    def test_matches_json_backend(self, tmp_path):
+        json_store = Provenance(tmp_path / "dag.json")
+        sqlite_store = SqliteProvenance(tmp_path / "dag.sqlite")
+        _populate(json_store)
+        _populate(sqlite_store)
+
+        assert [n.node_id for n in sqlite_store] == [n.node_id for n in json_store]
+        assert [n.node_id for n in sqlite_store.list(kind=NodeKind.artifact)] == [
+            n.node_id for n in json_store.list(kind=NodeKind.artifact)
+        ]
+        run_id = json_store.list(kind=NodeKind.run)[0].node_id
+        for criteria in ({}, {"from_id": run_id}, {"relation": EdgeRelation.supports}, {"to_id": run_id}):
+            assert sqlite_store.query(**criteria) == json_store.query(**criteria)
+        assert sqlite_store.clear() == json_store.clear() == (6, 4)
+
+    def test_export_is_byte_identical_to_json_store(self, tmp_path):
+        json_store = Provenance(tmp_path / "dag.json")
+        sqlite_store = SqliteProvenance(tmp_path / "dag.sqlite")
+        _populate(json_store)
+        for node in json_store.list():
+            sqlite_store._insert_node(node.to_dict())  # same created_at stamps
+        for edge in json_store.query():
+            sqlite_store._insert_edge(edge)
+
+        exported = sqlite_store.export_json(tmp_path / "export" / "dag.json")
+        assert exported.read_bytes() == json_store.path.read_bytes()
+        assert Provenance(exported).query() == json_store.query()
+
+    def test_empty_export_matches_json_store(self, tmp_path):
+        json_store = Provenance(tmp_path / "dag.json")
+        json_store.export_json(tmp_path / "a.json")
+        SqliteProvenance(tmp_path / "dag.sqlite").export_json(tmp_path / "b.json")
+        assert (tmp_path / "b.json").read_bytes() == (tmp_path / "a.json").read_bytes()
+        assert json.loads((tmp_path / "b.json").read_text()) == {"nodes": [], "edges": []}
+
+    def test_batch_rolls_back_on_error(self, tmp_path):
+        store = SqliteProvenance(tmp_path / "dag.sqlite")
+        kept = store.record(ArtifactNode.create("kept", path="k"))
+        with pytest.raises(RuntimeError):
+            with store.batch():
+                dropped = store.record(ArtifactNode.create("dropped", path="d"))
+                with store.batch():
+                    store.link(kept.node_id, dropped.node_id, EdgeRelation.derived_from)
+                raise RuntimeError("abort")
+        assert store.get(dropped.node_id) is None
+        assert store.query() == []
+        assert len(store) == 1
+
+    def test_from_json_migrates_existing_dag(self, tmp_path):
+        json_store = Provenance(tmp_path / "dag.json")
+        _populate(json_store)
+        migrated = SqliteProvenance.from_json(json_store.path, tmp_path / "dag.sqlite")
+        assert [n.to_dict() for n in migrated] == [n.to_dict() for n in json_store]
+        assert migrated.query() == json_store.query()
+
+    def test_bulk_recording_is_fast(self, tmp_path):
+        store = SqliteProvenance(tmp_path / "dag.sqlite")
+        run = store.record(RunNode.create("render", command="render"))
+        started = time.perf_counter()
+        with store.batch():
+            for index in range(10_000):
+                art = store.record(ArtifactNode.create(f"a{index}", path=f"out/{index}.pdf"))
+                store.link(run.node_id, art.node_id, EdgeRelation.produced_by)
+        assert time.perf_counter() - started < 20
+        assert len(store) == 10_001
+        assert len(store.query(to_id=art.node_id)) == 1
+
+    def test_unreadable_database_fails_closed(self, tmp_path):
+        db = tmp_path / "dag.sqlite"
+        db.write_bytes(b"not a database" * 100)
+        with pytest.raises(ProvenanceStoreError, match="Could not open"):
+            SqliteProvenance(db)
+
+
+class TestOpenProvenanceStore:
+    @pytest.mark.parametrize("name", ["dag.sqlite", "dag.sqlite3", "dag.db"])
+    def test_sqlite_suffixes_select_sqlite(self, tmp_path, name):
+        assert isinstance(open_provenance_store(tmp_path / name), SqliteProvenance)
+
+    def test_other_paths_select_json(self, tmp_path):
+        assert isinstance(open_provenance_store(tmp_path / "dag.json"), Provenance)
@@ -321,3 +321,47 @@ class TestProvenance:
         dag.write_text(json.dumps(payload), encoding="utf-8")
         with pytest.raises(ProvenanceStoreError, match=message):
             Provenance(dag)
+
+    def test_batch_writes_once_on_exit(self, tmp_path):
+        dag = tmp_path / "dag.json"
+        prov = Provenance(dag)
+        with prov.batch():
+            run = prov.record(RunNode.create("r", command="c"))
+            for index in range(5):
+                art = prov.record(ArtifactNode.create(f"a{index}", path=f"a{index}"))
+                prov.link(run.node_id, art.node_id, EdgeRelation.produced_by)
+            with prov.batch():
+                prov.record(ClaimNode.create("c", "claim"))
+            assert not dag.exists()
+        assert len(Provenance(dag)) == 7
+        assert len(Provenance(dag).query(from_id=run.node_id)) == 5
+
+    def test_batch_rolls_back_on_error(self, tmp_path):
+        prov = Provenance.with_path(tmp_path)
+        kept = prov.record(ArtifactNode.create("kept", path="k"))
+        with pytest.raises(RuntimeError):
+            with prov.batch():
+                dropped = prov.record(ArtifactNode.create("dropped", path="d"))
+                prov.link(kept.node_id, dropped.node_id, EdgeRelation.derived_from)
+                raise RuntimeError("abort")
+        assert prov.get(dropped.node_id) is None
+        assert prov.query() == []
+        assert len(Provenance(prov.path)) == 1
+
+    def test_query_combines_indexed_criteria(self, tmp_path):
+        prov = Provenance.with_path(tmp_path)
+        src = prov.record(SourceNode.create("s", uri="http://x.com"))
+        claims = [prov.record(ClaimNode.create(f"c{i}", f"claim {i}")) for i in range(3)]
+        for claim in claims:
+            prov.link(src.node_id, claim.node_id, EdgeRelation.supports)
+        prov.link(src.node_id, claims[0].node_id, EdgeRelation.cites)
+        assert len(prov.query(from_id=src.node_id)) == 4
+        assert len(prov.query(to_id=claims[0].node_id)) == 2
+        assert len(prov.query(from_id=src.node_id, to_id=claims[0].node_id, relation=EdgeRelation.cites)) == 1
+        assert prov.query(to_id=src.node_id) == []
+
+    def test_export_json_matches_store_file(self, tmp_path):
+        prov = Provenance.with_path(tmp_path)
+        prov.record(ArtifactNode.create("a", path="a"))
+        exported = prov.export_json(tmp_path / "published" / "dag.json")
+        assert exported.read_text(encoding="utf-8") == prov.path.read_text(encoding="utf-8")
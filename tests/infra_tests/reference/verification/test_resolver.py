@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
 
 from infrastructure.reference.verification.cache import CACHE_MISS, ResolutionCache
 from infrastructure.reference.verification.resolver import (
     ReferenceResolver,
+    ResolutionRequest,
     normalize_doi,
     title_similarity,
 )
@@ -98,6 +101,14 @@ class TestResolutionCache:
         assert cache.clear() == 2
         assert cache.get("a") is CACHE_MISS
 
+    def test_get_many_partitions_hits_and_put_many_roundtrips(self, tmp_path: Path):
+        cache = ResolutionCache(tmp_path / "c.db")
+        cache.put_many([("a", Paper(id="x", title="T"), "crossref"), ("b", None, None)])
+        got = cache.get_many(["a", "b", "c", "a"])
+        assert set(got) == {"a", "b"}
+        assert isinstance(got["a"], Paper) and got["a"].source == "crossref"
+        assert got["b"] is None
+
 
 class TestResolverOffline:
     def test_offline_cache_miss_is_unchecked(self, tmp_path: Path):
@@ -200,3 +211,79 @@ class TestResolverOnline:
         second = resolver.resolve(doi="10.1234/abcd")
         assert second.from_cache is True
         assert second.paper is not None and second.paper.title == first.paper.title
+
+
+def _crossref_item(doi: str) -> dict[str, object]:
+    return {"DOI": doi.upper(), "title": [f"Paper {doi}"], "issued": {"date-parts": [[2020]]}}
+
+
+class TestResolveMany:
+    def _resolver(self, httpserver: HTTPServer, tmp_path: Path) -> ReferenceResolver:
+        return ReferenceResolver(
+            cache=ResolutionCache(tmp_path / "c.db"),
+            allow_network=True,
+            crossref_base_url=httpserver.url_for("/crossref/works"),
+            openalex_base_url=httpserver.url_for("/openalex/works"),
+            arxiv_base_url=httpserver.url_for("/arxiv/query"),
+        )
+
+    def test_dois_resolve_through_multi_doi_filters(self, httpserver: HTTPServer, tmp_path: Path):
+        def crossref(request: Request) -> Response:
+            dois = [part[len("doi:") :] for part in request.args["filter"].split(",")]
+            items = [_crossref_item(doi) for doi in dois if doi != "10.1/oa" and doi != "10.1/gone"]
+            return Response(json.dumps({"message": {"items": items}}), content_type="application/json")
+
+        httpserver.expect_request("/crossref/works").respond_with_handler(crossref)
+        httpserver.expect_request(
+            "/openalex/works", query_string={"filter": "doi:10.1/oa|10.1/gone", "per-page": "2"}
+        ).respond_with_json({"results": [{"title": "Only In OpenAlex", "doi": "https://doi.org/10.1/OA", "id": "W1"}]})
+        resolver = self._resolver(httpserver, tmp_path)
+        requests = [ResolutionRequest(doi=f"10.1/p{i}") for i in range(25)]
+        requests += [
+            ResolutionRequest(doi="10.1/oa"),
+            ResolutionRequest(doi="10.1/gone"),
+            ResolutionRequest(doi="10.1/p0"),
+        ]
+
+        results = resolver.resolve_many(requests)
+
+        assert [r.via for r in results[:25]] == ["crossref"] * 25
+        assert results[25].via == "openalex" and results[25].paper.title == "Only In OpenAlex"
+        assert results[26].checked is True and results[26].paper is None
+        assert results[27].paper.doi == results[0].paper.doi
+        # 25 + 2 DOIs: two Crossref chunks and one OpenAlex chunk, no per-DOI requests.
+        assert len(httpserver.log) == 3
+
+    def test_warm_cache_answers_without_network(self, httpserver: HTTPServer, tmp_path: Path):
+        httpserver.expect_request("/crossref/works").respond_with_json(
+            {"message": {"items": [_crossref_item("10.1/a"), _crossref_item("10.1/b")]}}
+        )
+        requests = [ResolutionRequest(doi="10.1/a"), ResolutionRequest(doi="10.1/b")]
+        self._resolver(httpserver, tmp_path).resolve_many(requests)
+        httpserver.clear_log()
+
+        offline = ReferenceResolver(cache=ResolutionCache(tmp_path / "c.db"), allow_network=False)
+        results = offline.resolve_many([*requests, ResolutionRequest(doi="10.1/never")])
+
+        assert [r.from_cache for r in results] == [True, True, False]
+        assert results[2].checked is False
+        assert httpserver.log == []
+
+    def test_failed_batch_falls_back_to_single_lookups(self, httpserver: HTTPServer, tmp_path: Path):
+        httpserver.expect_request("/crossref/works").respond_with_data("", status=503)
+        httpserver.expect_request("/crossref/works/10.1234/abcd").respond_with_json(CROSSREF_MESSAGE)
+        httpserver.expect_request("/crossref/works/10.9/zz").respond_with_data("", status=503)
+        httpserver.expect_request("/openalex/works").respond_with_data("", status=503)
+        httpserver.expect_request("/arxiv/query").respond_with_data(ARXIV_FEED, content_type="application/atom+xml")
+
+        results = self._resolver(httpserver, tmp_path).resolve_many(
+            [
+                ResolutionRequest(doi="10.1234/abcd"),
+                ResolutionRequest(doi="10.9/zz"),
+                ResolutionRequest(arxiv_id="2501.12948"),
+            ]
+        )
+
+        assert results[0].via == "crossref"
+        assert results[1].checked is False  # transient failure stays unchecked
+        assert results[2].via == "arxiv"
@@ -190,3 +190,30 @@ class TestVerifyDatabaseAndFile:
         assert len(report.verdicts) == 1
         assert report.verdicts[0].status is VerificationStatus.UNCHECKED
         assert report.network_used is False
+
+    def test_verify_database_batches_lookups_and_matches_per_entry_verdicts(
+        self, httpserver: HTTPServer, tmp_path: Path
+    ):
+        httpserver.expect_request("/crossref/works").respond_with_json(
+            {"message": {"items": [CROSSREF_MESSAGE["message"]]}}
+        )
+        httpserver.expect_request("/openalex/works").respond_with_json({"results": []})
+        db = parse_bibtex(
+            "@article{a, title={A Study of Deterministic Gates}, author={Lovelace, Ada}, year={2020}, doi={10.1234/abcd}}\n"
+            "@article{b, title={Invented}, year={2021}, doi={10.9/invented}}\n"
+            "@article{c, title={Later}, year={2099}, doi={10.9/later}}\n"
+        )
+
+        report = verify_database(db, _online_resolver(httpserver, tmp_path), as_of_year=2026)
+
+        assert [v.status for v in report.verdicts] == [
+            VerificationStatus.OK,
+            VerificationStatus.FABRICATED,
+            VerificationStatus.ANACHRONISM,
+        ]
+        # One Crossref and one OpenAlex filter query cover both resolvable DOIs.
+        assert len(httpserver.log) == 2
+        replay = ReferenceResolver(cache=ResolutionCache(tmp_path / "c.db"), allow_network=False)
+        assert [verify_entry(entry, replay, as_of_year=2026).status for entry in db] == [
+            v.status for v in report.verdicts
+        ]
@@ -0,0 +1,133 @@
+"""Tests for batched, content-addressed Mermaid rendering.
+
+No Mocks: a real executable stand-in for ``mmdc`` on ``PATH`` implements the
+two mermaid-cli input modes used here (one ``.mmd`` diagram, or every fence
+of a Markdown file in one session) and logs each invocation.
+"""
+
+from __future__ import annotations
+
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+from infrastructure.rendering._mermaid_batch import MermaidRenderOptions, render_mermaid_batch
+from infrastructure.rendering._pdf_mermaid import replace_inline_mermaid
+
+_FAKE_MMDC = """
+import os, re, sys
+args = sys.argv[1:]
+src = args[args.index("--input") + 1]
+out = args[args.index("--output") + 1]
+with open(os.environ["MMDC_LOG"], "a", encoding="utf-8") as log:
+    log.write(os.path.splitext(src)[1] + "\\n")
+text = open(src, encoding="utf-8").read()
+if src.endswith(".md"):
+    fences = re.findall(r"```mermaid\\n(.*?)```", text, flags=re.S)
+    if any("BROKEN" in fence for fence in fences):
+        sys.exit("parse error in batch")
+    for index, fence in enumerate(fences, start=1):
+        with open(f"{out[:-3]}-{index}.png", "w", encoding="utf-8") as fh:
+            fh.write("png:" + fence)
+else:
+    if "BROKEN" in text:
+        sys.exit("parse error")
+    with open(out, "w", encoding="utf-8") as fh:
+        fh.write("png:" + text)
+"""
+
+
+@pytest.fixture
+def mmdc_log(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    mmdc = bin_dir / "mmdc"
+    mmdc.write_text(f"#!{sys.executable}\n{_FAKE_MMDC}", encoding="utf-8")
+    mmdc.chmod(mmdc.stat().st_mode | stat.S_IXUSR)
+    (tmp_path / "project" / "manuscript").mkdir(parents=True)
+    (tmp_path / "project" / ".puppeteer.json").write_text("{}\n", encoding="utf-8")
+    log = tmp_path / "mmdc.log"
+    log.touch()
+    monkeypatch.setenv("PATH", str(bin_dir))
+    monkeypatch.setenv("MMDC_LOG", str(log))
+    monkeypatch.setenv("MERMAID_RENDER_WORKERS", "1")
+    return log
+
+
+def _invocations(log: Path) -> list[str]:
+    return log.read_text(encoding="utf-8").split()
+
+
+def _fences(*sources: str) -> str:
+    return "".join(f"```mermaid\n{source}\n```\n*Figure {i}*\n\n" for i, source in enumerate(sources))
+
+
+class TestRenderMermaidBatch:
+    def test_misses_render_in_one_session_and_duplicates_render_once(self, tmp_path: Path, mmdc_log: Path) -> None:
+        jobs = {
+            tmp_path / "out" / "a.png": "graph TD\nA-->B",
+            tmp_path / "out" / "b.png": "graph TD\nB-->C",
+            tmp_path / "out" / "a_copy.png": "graph TD\nA-->B",
+        }
+
+        outcome = render_mermaid_batch(jobs, mmdc="mmdc")
+
+        assert _invocations(mmdc_log) == [".md"]
+        assert outcome.failed == {}
+        assert sorted(outcome.rendered) == sorted(jobs)
+        assert (tmp_path / "out" / "a_copy.png").read_text(encoding="utf-8") == "png:graph TD\nA-->B\n"
+
+        again = render_mermaid_batch(jobs, mmdc="mmdc")
+        assert again.cache_hits == 3
+        assert _invocations(mmdc_log) == [".md"]
+
+    def test_failed_session_isolates_the_broken_diagram(self, tmp_path: Path, mmdc_log: Path) -> None:
+        good = tmp_path / "good.png"
+        bad = tmp_path / "bad.png"
+
+        outcome = render_mermaid_batch({good: "graph TD\nA-->B", bad: "BROKEN"}, mmdc="mmdc")
+
+        assert list(outcome.rendered) == [good]
+        assert "parse error" in str(outcome.failed[bad])
+        assert _invocations(mmdc_log) == [".md", ".mmd", ".mmd"]
+
+    def test_workers_split_misses_across_sessions(self, tmp_path: Path, mmdc_log: Path) -> None:
+        jobs = {tmp_path / f"d{i}.png": f"graph TD\nN{i}-->M" for i in range(4)}
+
+        outcome = render_mermaid_batch(jobs, mmdc="mmdc", options=MermaidRenderOptions(), workers=2)
+
+        assert outcome.browser_sessions == 2
+        assert _invocations(mmdc_log) == [".md", ".md"]
+        assert len(outcome.rendered) == 4
+
+
+class TestInlineContentAddressedStore:
+    def test_reordered_and_repeated_diagrams_reuse_renders(self, tmp_path: Path, mmdc_log: Path) -> None:
+        manuscript = tmp_path / "project" / "manuscript"
+        first = replace_inline_mermaid(_fences("graph TD\nA-->B", "graph TD\nC-->D"), manuscript)
+        assert first.diagrams_rendered == 2
+        assert _invocations(mmdc_log) == [".md"]
+
+        second = replace_inline_mermaid(_fences("graph TD\nC-->D", "graph TD\nA-->B", "graph TD\nA-->B"), manuscript)
+
+        assert second.diagrams_rendered == 3
+        assert _invocations(mmdc_log) == [".md"]
+        store = tmp_path / "project" / "output" / "figures" / "mermaid_inline"
+        assert len(list(store.glob("inline_mermaid_*.png"))) == 2
+
+    def test_legacy_index_prefixed_artifacts_are_adopted(self, tmp_path: Path, mmdc_log: Path) -> None:
+        manuscript = tmp_path / "project" / "manuscript"
+        replace_inline_mermaid(_fences("graph TD\nA-->B"), manuscript)
+        store = tmp_path / "project" / "output" / "figures" / "mermaid_inline"
+        (png,) = store.glob("inline_mermaid_*.png")
+        digest = png.stem.rsplit("_", 1)[1]
+        for suffix in (".png", ".mmd"):
+            png.with_suffix(suffix).rename(store / f"inline_mermaid_0007_{digest}{suffix}")
+
+        result = replace_inline_mermaid(_fences("graph TD\nA-->B"), manuscript)
+
+        assert result.diagrams_rendered == 1
+        assert _invocations(mmdc_log) == [".mmd"]
+        assert sorted(p.name for p in store.glob("inline_mermaid_*.png")) == [png.name]
@@ -13,7 +13,7 @@ from pathlib import Path
 import pytest
 
 from infrastructure.core.exceptions import RenderingError
-from infrastructure.rendering.mermaid_figure import render_mermaid_png
+from infrastructure.rendering.mermaid_figure import render_mermaid_png, render_required_mermaid_pngs
 
 _MMDC_AVAILABLE = shutil.which("mmdc") is not None
 
@@ -31,6 +31,15 @@ def test_render_mermaid_png_raises_clear_error_without_mmdc(tmp_path: Path):
         )
 
 
+def test_render_required_mermaid_pngs_fails_every_diagram_without_mmdc(tmp_path: Path):
+    targets = {tmp_path / "a.png": _SIMPLE_DIAGRAM, tmp_path / "b.png": _SIMPLE_DIAGRAM}
+
+    failures = render_required_mermaid_pngs(targets, executable_resolver=lambda _name: None)
+
+    assert failures == list(targets)
+    assert not any(path.exists() for path in targets)
+
+
 @pytest.mark.skipif(not _MMDC_AVAILABLE, reason="mmdc (mermaid-cli) not installed")
 def test_render_mermaid_png_produces_real_file(tmp_path: Path):
     output = render_mermaid_png(_SIMPLE_DIAGRAM, tmp_path / "diagram.png")
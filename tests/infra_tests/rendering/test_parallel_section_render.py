@@ -0,0 +1,99 @@
+"""Tests for process-pool rendering of individual manuscript sections.
+
+No Mocks: module-level ``RenderManager`` subclasses (picklable, so they cross
+the process boundary) write real files; parallelism is enabled through the
+real ``RENDER_SECTION_WORKERS`` environment variable.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from infrastructure.core.exceptions import RenderingError
+from infrastructure.core.logging.diagnostic import DiagnosticReporter
+from infrastructure.rendering import RenderManager
+from infrastructure.rendering._manuscript_source import render_individual_files, resolve_section_render_workers
+from infrastructure.rendering.config import RenderingConfig
+
+
+class _ScratchReportingManager(RenderManager):
+    """Writes the worker pid and temp directory it rendered with."""
+
+    def render_all(self, source_file: Path) -> list[Path]:
+        if "broken" in source_file.stem:
+            raise RenderingError(f"render failed for {source_file.name}", context={"source": str(source_file)})
+        out = Path(self.config.output_dir) / f"{source_file.stem}.out"
+        out.write_text(f"{os.getpid()}\n{tempfile.gettempdir()}\n{os.environ.get('TMPDIR', '')}\n", encoding="utf-8")
+        return [out]
+
+
+def _sections(tmp_path: Path, names: list[str]) -> list[Path]:
+    manuscript = tmp_path / "manuscript"
+    manuscript.mkdir()
+    paths = []
+    for name in names:
+        path = manuscript / f"{name}.md"
+        path.write_text(f"# {name}\n", encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def _render(tmp_path: Path, sources: list[Path]) -> tuple[tuple[int, list[str]], DiagnosticReporter]:
+    output = tmp_path / "output"
+    output.mkdir(exist_ok=True)
+    manager = _ScratchReportingManager(RenderingConfig(output_dir=str(output), web_dir=str(output / "web")))
+    reporter = DiagnosticReporter(project_name="t", output_dir=tmp_path / "reports", load_existing=False)
+    return render_individual_files(manager, sources, reporter), reporter
+
+
+class TestResolveSectionRenderWorkers:
+    def test_serial_by_default(self) -> None:
+        assert resolve_section_render_workers(20, env={}) == 1
+
+    def test_explicit_count_is_bounded_by_sections(self) -> None:
+        assert resolve_section_render_workers(3, env={"RENDER_SECTION_WORKERS": "8"}) == 3
+
+    def test_auto_uses_cpus(self) -> None:
+        expected = min(os.cpu_count() or 1, 50)
+        assert resolve_section_render_workers(50, env={"RENDER_SECTION_WORKERS": "auto"}) == expected
+
+    def test_invalid_value_falls_back_to_serial(self) -> None:
+        assert resolve_section_render_workers(5, env={"RENDER_SECTION_WORKERS": "many"}) == 1
+
+
+class TestParallelRender:
+    def test_sections_render_in_isolated_worker_processes(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("RENDER_SECTION_WORKERS", "2")
+        sources = _sections(tmp_path, ["01_a", "02_b", "03_c"])
+
+        (rendered, failed), _ = _render(tmp_path, sources)
+
+        assert (rendered, failed) == (3, [])
+        records = [(tmp_path / "output" / f"{s.stem}.out").read_text(encoding="utf-8").split("\n") for s in sources]
+        assert all(int(pid) != os.getpid() for pid, *_ in records)
+        scratch_dirs = [gettempdir for _, gettempdir, _, _ in records]
+        assert len(set(scratch_dirs)) == 3
+        assert all(env_tmp == scratch for (_, scratch, env_tmp, _) in records)
+        assert not any(Path(scratch).exists() for scratch in scratch_dirs)
+
+    def test_failures_and_diagnostics_match_serial_order(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        names = ["01_ok", "02_broken", "03_ok", "04_broken"]
+        serial_root = tmp_path / "serial"
+        parallel_root = tmp_path / "parallel"
+        serial_root.mkdir()
+        parallel_root.mkdir()
+
+        monkeypatch.setenv("RENDER_SECTION_WORKERS", "serial")
+        serial_result, serial_reporter = _render(serial_root, _sections(serial_root, names))
+        monkeypatch.setenv("RENDER_SECTION_WORKERS", "4")
+        parallel_result, parallel_reporter = _render(parallel_root, _sections(parallel_root, names))
+
+        assert serial_result == parallel_result == (2, ["02_broken.md", "04_broken.md"])
+        assert [e.category for e in parallel_reporter.events] == [e.category for e in serial_reporter.events]
+        assert [Path(str(e.file_path)).name for e in parallel_reporter.events] == ["02_broken.md", "04_broken.md"]
@@ -20,6 +20,7 @@ from infrastructure.core.exceptions import RenderingError, TemplateError
 from infrastructure.core.logging.diagnostic import DiagnosticReporter
 from infrastructure.rendering import RenderManager
 from infrastructure.rendering._combined_exports import render_combined_outputs
+from infrastructure.rendering._section_render_cache import SectionRenderPlan
 from infrastructure.rendering.config import RenderingConfig
 from infrastructure.rendering.latex_validation import ValidationReport
 from infrastructure.rendering.pipeline import (
@@ -603,7 +604,7 @@ def _dependencies_for(project_root: Path, **overrides: object) -> RenderPipeline
         hydrate_manuscript=lambda _project_root, template_repo_root=None: 0,
         write_bookends=lambda _project_root, _project_name, repo_root: None,
         validate_latex=lambda report=None: 0,
-        render_individual=lambda _manager, _source_files, _reporter: (0, []),
+        render_individual=lambda _manager, _source_files, _reporter, section_cache=None: (0, []),
         render_combined=lambda *_args, **_kwargs: None,
         generate_summary=lambda project_name, repo_root=None: {
             "project": project_name,
@@ -771,7 +772,7 @@ def test_render_pipeline_impl_failed_files_exits_one(
     project = tmp_path / "fail_files_proj"
     _make_project_with_manuscript(project, n_md=1)
 
-    def _always_fail(manager, source_files, reporter):
+    def _always_fail(manager, source_files, reporter, section_cache=None):
         for sf in source_files:
             if sf.suffix == ".md":
                 from infrastructure.core.logging.diagnostic import DiagnosticEvent, DiagnosticSeverity
@@ -802,7 +803,7 @@ def test_render_pipeline_impl_reporter_events_triggers_print_save(
     print_called = []
     save_called = []
 
-    def _inject_event_and_succeed(manager, source_files, reporter):
+    def _inject_event_and_succeed(manager, source_files, reporter, section_cache=None):
         from infrastructure.core.logging.diagnostic import DiagnosticEvent, DiagnosticSeverity
 
         reporter.events.append(
@@ -835,6 +836,24 @@ def test_render_pipeline_impl_reporter_events_triggers_print_save(
     assert save_called, "reporter.save_report() was not called when events were present"
 
 
+def test_render_pipeline_impl_hands_its_section_plan_to_individual_render(tmp_path: Path) -> None:
+    """The plan that guards the stale sweep is the one the per-file render reuses."""
+    project = tmp_path / "section_plan_proj"
+    _make_project_with_manuscript(project, n_md=1)
+    received: list[object] = []
+
+    def _capture_plan(manager, source_files, reporter, section_cache=None):
+        received.append(section_cache)
+        return 0, []
+
+    dependencies = _dependencies_for(project, render_individual=_capture_plan)
+    rc = _render_pipeline_impl("section_plan_proj", repo_root=tmp_path, dependencies=dependencies)
+
+    assert rc == 0
+    assert len(received) == 1
+    assert isinstance(received[0], SectionRenderPlan)
+
+
 def test_render_pipeline_impl_figure_truncation_log(
     tmp_path: Path,
     caplog: pytest.LogCaptureFixture,
@@ -0,0 +1,193 @@
+"""Tests for dependency-aware per-section render reuse.
+
+No Mocks: a ``RenderManager`` subclass writes real output files and counts
+its renders; every cache decision is driven by real files under ``tmp_path``.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from infrastructure.core.logging.diagnostic import DiagnosticReporter
+from infrastructure.rendering import RenderManager
+from infrastructure.rendering._manuscript_source import clean_stale_render_deliverables, render_individual_files
+from infrastructure.rendering._section_render_cache import (
+    plan_section_render_cache,
+    plan_slide_refresh_cache,
+    referenced_figures,
+    section_cache_enabled,
+)
+from infrastructure.rendering.config import RenderingConfig
+
+
+class _CountingRenderManager(RenderManager):
+    """Writes one slide deck and one HTML page per section and counts renders."""
+
+    def __init__(self, config: RenderingConfig, manuscript_dir: Path, figures_dir: Path) -> None:
+        super().__init__(config, manuscript_dir=manuscript_dir, figures_dir=figures_dir)
+        self.rendered: list[str] = []
+
+    def render_all(self, source_file: Path) -> list[Path]:
+        self.rendered.append(source_file.name)
+        slides = Path(self.config.slides_dir) / f"{source_file.stem}_slides.pdf"
+        page = Path(self.config.web_dir) / f"manuscript__{source_file.stem}.html"
+        for output in (slides, page):
+            output.parent.mkdir(parents=True, exist_ok=True)
+            output.write_text(source_file.read_text(encoding="utf-8"), encoding="utf-8")
+        return [slides, page]
+
+
+def _project(tmp_path: Path, *, section_cache: bool = True) -> tuple[_CountingRenderManager, list[Path]]:
+    manuscript = tmp_path / "manuscript"
+    output = tmp_path / "output"
+    figures = output / "figures"
+    manuscript.mkdir()
+    figures.mkdir(parents=True)
+    (manuscript / "config.yaml").write_text("paper:\n  title: T\n", encoding="utf-8")
+    (manuscript / "references.bib").write_text("@misc{a, title={A}}\n", encoding="utf-8")
+    (figures / "plot.png").write_bytes(b"png-v1")
+    intro = manuscript / "01_intro.md"
+    results = manuscript / "02_results.md"
+    intro.write_text("# Intro\n", encoding="utf-8")
+    results.write_text("# Results\n\n![Plot](../output/figures/plot.png)\n", encoding="utf-8")
+    config = RenderingConfig(
+        manuscript_dir=str(manuscript),
+        figures_dir=str(figures),
+        output_dir=str(output),
+        slides_dir=str(output / "slides"),
+        web_dir=str(output / "web"),
+        pdf_dir=str(output / "pdf"),
+        docx_dir=str(output / "docx"),
+        epub_dir=str(output / "epub"),
+        section_cache=section_cache,
+    )
+    return _CountingRenderManager(config, manuscript, figures), [intro, results]
+
+
+def _render(manager: RenderManager, sources: list[Path], tmp_path: Path) -> tuple[int, list[str]]:
+    reporter = DiagnosticReporter(project_name="t", output_dir=tmp_path / "reports", load_existing=False)
+    return render_individual_files(manager, sources, reporter)
+
+
+class TestSectionReuse:
+    def test_second_run_reuses_every_unchanged_section(self, tmp_path: Path) -> None:
+        manager, sources = _project(tmp_path)
+        assert _render(manager, sources, tmp_path) == (2, [])
+        manager.rendered.clear()
+
+        assert _render(manager, sources, tmp_path) == (2, [])
+
+        assert manager.rendered == []
+        assert (tmp_path / "output" / "web" / "manuscript__01_intro.html").is_file()
+
+    def test_edited_section_renders_alone(self, tmp_path: Path) -> None:
+        manager, sources = _project(tmp_path)
+        _render(manager, sources, tmp_path)
+        manager.rendered.clear()
+
+        sources[0].write_text("# Intro, revised\n", encoding="utf-8")
+        _render(manager, sources, tmp_path)
+
+        assert manager.rendered == ["01_intro.md"]
+
+    def test_changed_figure_invalidates_only_the_section_that_includes_it(self, tmp_path: Path) -> None:
+        manager, sources = _project(tmp_path)
+        _render(manager, sources, tmp_path)
+        manager.rendered.clear()
+
+        (tmp_path / "output" / "figures" / "plot.png").write_bytes(b"png-v2")
+        _render(manager, sources, tmp_path)
+
+        assert manager.rendered == ["02_results.md"]
+
+    def test_bibliography_and_config_changes_invalidate_every_section(self, tmp_path: Path) -> None:
+        manager, sources = _project(tmp_path)
+        _render(manager, sources, tmp_path)
+
+        for edited in ("references.bib", "config.yaml"):
+            manager.rendered.clear()
+            path = tmp_path / "manuscript" / edited
+            path.write_text(path.read_text(encoding="utf-8") + "% edited\n", encoding="utf-8")
+            _render(manager, sources, tmp_path)
+            assert manager.rendered == ["01_intro.md", "02_results.md"]
+
+    def test_missing_output_forces_render(self, tmp_path: Path) -> None:
+        manager, sources = _project(tmp_path)
+        _render(manager, sources, tmp_path)
+        manager.rendered.clear()
+
+        (tmp_path / "output" / "slides" / "02_results_slides.pdf").unlink()
+        _render(manager, sources, tmp_path)
+
+        assert manager.rendered == ["02_results.md"]
+
+    def test_disabled_cache_always_renders(self, tmp_path: Path) -> None:
+        manager, sources = _project(tmp_path, section_cache=False)
+        _render(manager, sources, tmp_path)
+        _render(manager, sources, tmp_path)
+
+        assert manager.rendered == ["01_intro.md", "02_results.md"] * 2
+        assert not (tmp_path / "output" / ".render_cache.json").exists()
+
+
+class TestStaleCleanupPreservesReusableOutputs:
+    def test_cleanup_keeps_outputs_of_reusable_sections(self, tmp_path: Path) -> None:
+        manager, sources = _project(tmp_path)
+        _render(manager, sources, tmp_path)
+        sources[1].write_text("# Results, revised\n", encoding="utf-8")
+
+        plan = plan_section_render_cache(manager, sources)
+        assert plan is not None
+        clean_stale_render_deliverables(manager, sources, "p", preserve=plan.preserved_outputs())
+
+        slides = tmp_path / "output" / "slides"
+        assert (slides / "01_intro_slides.pdf").is_file()
+        assert not (slides / "02_results_slides.pdf").exists()
+
+
+class TestSlideRefreshCache:
+    def _refreshed(self, tmp_path: Path, labels: dict[str, str]) -> tuple[_CountingRenderManager, Path, Path]:
+        manager, sources = _project(tmp_path)
+        deck = Path(manager.config.slides_dir) / "01_intro_slides.pdf"
+        deck.parent.mkdir(parents=True, exist_ok=True)
+        deck.write_text("refreshed", encoding="utf-8")
+        plan = plan_slide_refresh_cache(manager, sources[:1], labels)
+        assert plan is not None
+        plan.record(sources[0], [deck])
+        return manager, sources[0], deck
+
+    def test_unchanged_labels_reuse_refreshed_deck(self, tmp_path: Path) -> None:
+        manager, source, deck = self._refreshed(tmp_path, {"eq:a": "1"})
+
+        plan = plan_slide_refresh_cache(manager, [source], {"eq:a": "1"})
+
+        assert plan is not None and plan.cached_outputs(source) is not None
+
+    def test_changed_label_numbers_invalidate(self, tmp_path: Path) -> None:
+        manager, source, _ = self._refreshed(tmp_path, {"eq:a": "1"})
+
+        plan = plan_slide_refresh_cache(manager, [source], {"eq:a": "2"})
+
+        assert plan is not None and plan.cached_outputs(source) is None
+
+    def test_deck_rewritten_after_refresh_invalidates(self, tmp_path: Path) -> None:
+        manager, source, deck = self._refreshed(tmp_path, {"eq:a": "1"})
+        deck.write_text("first-pass deck", encoding="utf-8")
+        later = deck.stat().st_mtime + 10
+        os.utime(deck, (later, later))
+
+        plan = plan_slide_refresh_cache(manager, [source], {"eq:a": "1"})
+
+        assert plan is not None and plan.cached_outputs(source) is None
+
+
+def test_referenced_figures_covers_markdown_and_latex_includes() -> None:
+    text = '![A](figures/a.png "title")\n\\includegraphics[width=1in]{b.pdf}\n![remote](https://x/y.png)\n'
+
+    assert referenced_figures(text) == ["figures/a.png", "b.pdf"]
+
+
+def test_section_cache_env_opt_out() -> None:
+    assert section_cache_enabled({})
+    assert not section_cache_enabled({"RENDER_SECTION_CACHE": "0"})
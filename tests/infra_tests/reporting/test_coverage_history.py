@@ -21,6 +21,7 @@ from infrastructure.reporting.coverage_history import (
     collect_history_via_gh,
     parse_coverage_xml,
 )
+from infrastructure.reporting.coverage_history_store import ENV_COVERAGE_HISTORY_CACHE
 
 
 # ---------------------------------------------------------------------------
@@ -28,6 +29,12 @@ from infrastructure.reporting.coverage_history import (
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(autouse=True)
+def _isolated_history_store(tmp_path, monkeypatch):
+    """Keep driver runs here away from the user's shared coverage-history store."""
+    monkeypatch.setenv(ENV_COVERAGE_HISTORY_CACHE, str(tmp_path / "coverage-history.sqlite"))
+
+
 def _write_cobertura(
     path: Path,
     *,
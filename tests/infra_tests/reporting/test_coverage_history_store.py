@@ -0,0 +1,377 @@
+"""Real-data tests for streaming coverage parsing and ``CoverageHistoryStore``.
+
+Zero mocks: Cobertura XML is written into ``tmp_path`` and the store is a
+real SQLite file.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from infrastructure.reporting.coverage_history import (
+    ModuleCoverage,
+    build_history_markdown,
+    collect_history_from_dir,
+    collect_history_via_gh,
+    parse_coverage_xml,
+)
+from infrastructure.reporting.coverage_history_store import (
+    ENV_COVERAGE_HISTORY_CACHE,
+    CoverageHistoryStore,
+    default_coverage_history_store,
+)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_history_store(tmp_path, monkeypatch):
+    """Keep stores created here away from the user's shared coverage-history store."""
+    monkeypatch.setenv(ENV_COVERAGE_HISTORY_CACHE, str(tmp_path / "coverage-history.sqlite"))
+
+
+def _write_report(
+    path: Path,
+    *,
+    when: datetime,
+    line_rate: float,
+    packages: dict[str, dict[str, float]],
+) -> Path:
+    """Write a Cobertura XML with ``packages`` mapping package name → {filename: rate}."""
+    epoch_ms = int(when.timestamp() * 1000)
+    parts = [
+        '<?xml version="1.0" ?>\n',
+        f'<coverage version="7.0" timestamp="{epoch_ms}" lines-valid="100" '
+        f'lines-covered="{round(line_rate * 100)}" line-rate="{line_rate}">\n',
+        "  <sources><source>/tmp/src</source></sources>\n  <packages>\n",
+    ]
+    for package, files in packages.items():
+        package_rate = sum(files.values()) / len(files)
+        parts.append(f'    <package name="{package}" line-rate="{package_rate}"><classes>\n')
+        for filename, rate in files.items():
+            parts.append(
+                f'      <class name="{Path(filename).stem}" filename="{filename}" line-rate="{rate}">'
+                '<lines><line number="1" hits="1"/></lines></class>\n'
+            )
+        parts.append("    </classes></package>\n")
+    parts.append("  </packages>\n</coverage>\n")
+    path.write_text("".join(parts), encoding="utf-8")
+    return path
+
+
+_PACKAGES = {
+    "infrastructure.core": {"infrastructure/core/a.py": 0.9, "infrastructure/core/b.py": 0.7},
+    "infrastructure.prose": {"infrastructure/prose/c.py": 0.5},
+}
+
+
+# ---------------------------------------------------------------------------
+# Streaming parse
+# ---------------------------------------------------------------------------
+
+
+def test_parse_without_detail_reads_only_root(tmp_path: Path) -> None:
+    when = datetime(2026, 5, 1, tzinfo=timezone.utc)
+    path = _write_report(tmp_path / "coverage-infra.xml", when=when, line_rate=0.8, packages=_PACKAGES)
+
+    point = parse_coverage_xml(path)
+
+    assert point.modules == ()
+    assert point.suite == "infra"
+    assert point.percentage == pytest.approx(80.0)
+
+
+def test_parse_streams_package_and_file_rates(tmp_path: Path) -> None:
+    when = datetime(2026, 5, 1, tzinfo=timezone.utc)
+    path = _write_report(tmp_path / "coverage-infra.xml", when=when, line_rate=0.8, packages=_PACKAGES)
+
+    packages = parse_coverage_xml(path, detail="package").modules
+    files = parse_coverage_xml(path, detail="file").modules
+
+    assert [m.name for m in packages] == ["infrastructure.core", "infrastructure.prose"]
+    assert packages[0].percentage == pytest.approx(80.0)
+    assert packages[1].percentage == pytest.approx(50.0)
+    assert files == (
+        ModuleCoverage("infrastructure/core/a.py", pytest.approx(90.0)),
+        ModuleCoverage("infrastructure/core/b.py", pytest.approx(70.0)),
+        ModuleCoverage("infrastructure/prose/c.py", pytest.approx(50.0)),
+    )
+
+
+def test_root_only_parse_ignores_large_body(tmp_path: Path) -> None:
+    """Suite totals come from the root element; the per-file body is never read."""
+    when = datetime(2026, 5, 1, tzinfo=timezone.utc)
+    big = {f"pkg{i}": {f"pkg{i}/mod{j}.py": 0.5 for j in range(50)} for i in range(200)}
+    path = _write_report(tmp_path / "coverage-infra.xml", when=when, line_rate=0.6, packages=big)
+    # Truncate the body: a full parse would now fail, the root-only parse must not care.
+    text = path.read_text(encoding="utf-8")
+    path.write_text(text[: len(text) // 2], encoding="utf-8")
+
+    point = parse_coverage_xml(path)
+
+    assert point.percentage == pytest.approx(60.0)
+
+
+# ---------------------------------------------------------------------------
+# CoverageHistoryStore
+# ---------------------------------------------------------------------------
+
+
+def test_store_reuses_unchanged_files_and_reparses_changed_ones(tmp_path: Path) -> None:
+    when = datetime(2026, 5, 1, tzinfo=timezone.utc)
+    path = _write_report(tmp_path / "coverage-infra.xml", when=when, line_rate=0.8, packages=_PACKAGES)
+    store = CoverageHistoryStore(tmp_path / "history.sqlite")
+
+    first = store.ingest(path)
+    again = CoverageHistoryStore(tmp_path / "history.sqlite")
+    second = again.ingest(path)
+
+    assert store.stats.to_dict() == {"parsed": 1, "reused": 0, "evictions": 0}
+    assert again.stats.to_dict() == {"parsed": 0, "reused": 1, "evictions": 0}
+    assert (second.date, second.suite, second.percentage) == (first.date, first.suite, first.percentage)
+
+    _write_report(path, when=when, line_rate=0.85, packages=_PACKAGES)
+    stamp = time.time() + 10
+    os.utime(path, (stamp, stamp))
+    third = again.ingest(path)
+
+    assert again.stats.parsed == 1
+    assert third.percentage == pytest.approx(85.0)
+
+
+def test_store_reparses_when_detail_changes(tmp_path: Path) -> None:
+    when = datetime(2026, 5, 1, tzinfo=timezone.utc)
+    path = _write_report(tmp_path / "coverage-infra.xml", when=when, line_rate=0.8, packages=_PACKAGES)
+    CoverageHistoryStore(tmp_path / "history.sqlite", detail=None).ingest(path)
+
+    files = CoverageHistoryStore(tmp_path / "history.sqlite", detail="file")
+    files.ingest(path)
+
+    assert files.stats.parsed == 1
+    assert len(files.latest_modules()) == 3
+
+
+def test_store_window_and_module_queries(tmp_path: Path) -> None:
+    store = CoverageHistoryStore(tmp_path / "history.sqlite")
+    start = datetime(2026, 5, 1, tzinfo=timezone.utc)
+    for day, prose_rate in enumerate((0.5, 0.6, 0.4)):
+        packages = {"infrastructure.core": {"a.py": 0.9}, "infrastructure.prose": {"c.py": prose_rate}}
+        run = tmp_path / f"run{day}"
+        run.mkdir()
+        when = start + timedelta(days=day)
+        store.ingest(_write_report(run / "coverage-infra.xml", when=when, line_rate=0.8, packages=packages))
+
+    assert len(store.points()) == 3
+    assert [p.date.day for p in store.points(since=start + timedelta(days=1))] == [2, 3]
+    assert [pct for _, pct in store.module_trend("infrastructure.prose")] == pytest.approx([50.0, 60.0, 40.0])
+    assert store.module_trend("infrastructure.prose", suite="project") == []
+    assert store.latest_modules() == [
+        ModuleCoverage("infrastructure.prose", pytest.approx(40.0)),
+        ModuleCoverage("infrastructure.core", pytest.approx(90.0)),
+    ]
+
+
+def test_store_drops_the_oldest_reports_beyond_its_bound(tmp_path: Path) -> None:
+    store = CoverageHistoryStore(tmp_path / "history.sqlite", max_points=2)
+    start = datetime(2026, 5, 1, tzinfo=timezone.utc)
+    for day in range(3):
+        run = tmp_path / f"run{day}"
+        run.mkdir()
+        report = _write_report(
+            run / "coverage-infra.xml", when=start + timedelta(days=day), line_rate=0.8, packages=_PACKAGES
+        )
+        store.ingest(report, source=f"gh:{day}/coverage-infra.xml")
+        store.mark_run(str(day))
+
+    assert [p.date.day for p in store.points()] == [2, 3]
+    assert len(store.module_trend("infrastructure.prose")) == 2
+    assert [store.has_run(str(day)) for day in range(3)] == [False, True, True]
+    assert store.stats.evictions == 1
+
+
+def test_collect_history_from_dir_with_store_matches_direct_parse(tmp_path: Path) -> None:
+    artefacts = tmp_path / "artefacts"
+    for day in range(3):
+        run = artefacts / f"run{day}"
+        run.mkdir(parents=True)
+        when = datetime(2026, 5, 1 + day, tzinfo=timezone.utc)
+        _write_report(run / "coverage-infra.xml", when=when, line_rate=0.7 + day / 100, packages=_PACKAGES)
+        _write_report(run / "coverage-project.xml", when=when, line_rate=0.9, packages=_PACKAGES)
+    store = CoverageHistoryStore(tmp_path / "history.sqlite")
+
+    direct = collect_history_from_dir(artefacts)
+    stored = collect_history_from_dir(artefacts, store=store)
+    cached = collect_history_from_dir(artefacts, store=store)
+
+    def key(points):
+        return [(p.date, p.suite, p.percentage, p.lines_covered, p.lines_total) for p in points]
+
+    assert key(stored) == key(direct)
+    assert key(cached) == key(direct)
+    assert store.stats.to_dict() == {"parsed": 6, "reused": 6, "evictions": 0}
+    today = date(2026, 5, 4)
+    assert build_history_markdown(cached, days=7, today=today) == build_history_markdown(direct, days=7, today=today)
+
+
+def test_module_queries_are_scoped_to_sources(tmp_path: Path) -> None:
+    store = CoverageHistoryStore(tmp_path / "history.sqlite")
+    when = datetime(2026, 5, 1, tzinfo=timezone.utc)
+    for name, rate in (("ours", 0.9), ("theirs", 0.1)):
+        run = tmp_path / name
+        run.mkdir()
+        packages = {f"pkg.{name}": {f"{name}.py": rate}}
+        store.ingest(_write_report(run / "coverage-infra.xml", when=when, line_rate=rate, packages=packages))
+    ours = [p.source for p in collect_history_from_dir(tmp_path / "ours", store=store)]
+
+    assert ours == [str((tmp_path / "ours" / "coverage-infra.xml").resolve())]
+    assert store.latest_modules(sources=ours) == [ModuleCoverage("pkg.ours", pytest.approx(90.0))]
+    assert store.module_trend("pkg.theirs", sources=ours) == []
+    assert len(store.latest_modules()) == 2
+
+
+def test_unreadable_store_answers_queries_empty(tmp_path: Path) -> None:
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("", encoding="utf-8")
+    store = CoverageHistoryStore(blocker / "history.sqlite")
+    report = _write_report(
+        tmp_path / "coverage-infra.xml",
+        when=datetime(2026, 5, 1, tzinfo=timezone.utc),
+        line_rate=0.8,
+        packages=_PACKAGES,
+    )
+
+    assert store.ingest(report).percentage == pytest.approx(80.0)
+    assert store.points() == []
+    assert store.module_trend("infrastructure.prose") == []
+    assert store.latest_modules() == []
+
+
+# Lists runs 1 and 2 and downloads a report for the requested run, logging
+# every download next to itself.
+_FAKE_GH = """#!{python}
+import json, pathlib, sys, time
+here = pathlib.Path(__file__).resolve().parent
+args = sys.argv[1:]
+if args[:2] == ["run", "list"]:
+    created = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(time.time() - 3600))
+    print(json.dumps([{{"databaseId": run, "createdAt": created, "conclusion": "success", "status": "completed"}}
+                      for run in (1, 2)]))
+elif args[:2] == ["run", "download"]:
+    run_id = args[2]
+    with open(here / "downloads.log", "a") as log:
+        log.write(run_id + "\\n")
+    stamp = int((time.time() - 3600 - int(run_id)) * 1000)
+    out = pathlib.Path(args[args.index("--dir") + 1]) / "coverage-infra.xml"
+    out.write_text('<coverage timestamp="%d" lines-valid="10" lines-covered="%s" line-rate="0.%s"/>'
+                   % (stamp, run_id, run_id))
+"""
+
+
+def _fake_gh(directory: Path) -> Path:
+    directory.mkdir(parents=True, exist_ok=True)
+    gh = directory / "gh"
+    gh.write_text(_FAKE_GH.format(python=sys.executable), encoding="utf-8")
+    gh.chmod(0o755)
+    return directory / "downloads.log"
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX executable script semantics")
+def test_gh_collection_merges_stored_and_downloaded_runs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    downloads = _fake_gh(tmp_path / "bin")
+    monkeypatch.setenv("PATH", str(tmp_path / "bin"))
+    store = CoverageHistoryStore(tmp_path / "history.sqlite")
+    when = datetime.now(timezone.utc) - timedelta(hours=2)
+    earlier = _write_report(tmp_path / "coverage-infra.xml", when=when, line_rate=0.5, packages=_PACKAGES)
+    store.ingest(earlier, source="gh:1/coverage-infra.xml")
+    store.mark_run("1")
+
+    points = collect_history_via_gh(days=1, store=store)
+
+    assert downloads.read_text(encoding="utf-8").split() == ["2"]
+    assert {p.source: p.percentage for p in points} == {
+        "gh:1/coverage-infra.xml": pytest.approx(50.0),
+        "gh:2/coverage-infra.xml": pytest.approx(20.0),
+    }
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX executable script semantics")
+def test_gh_collection_keeps_downloads_when_the_store_is_unusable(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _fake_gh(tmp_path / "bin")
+    monkeypatch.setenv("PATH", str(tmp_path / "bin"))
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("", encoding="utf-8")
+
+    points = collect_history_via_gh(days=1, store=CoverageHistoryStore(blocker / "history.sqlite"))
+
+    assert [p.percentage for p in points] == pytest.approx([20.0, 10.0])
+
+
+def test_default_store_follows_environment(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    store = default_coverage_history_store()
+    assert store is not None
+    assert store.db_path == tmp_path / "coverage-history.sqlite"
+
+    monkeypatch.setenv(ENV_COVERAGE_HISTORY_CACHE, "off")
+    assert default_coverage_history_store() is None
+
+    monkeypatch.delenv(ENV_COVERAGE_HISTORY_CACHE)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    store = default_coverage_history_store()
+    assert store is not None
+    assert store.db_path == tmp_path / "xdg" / "template" / "coverage-history.sqlite"
+
+
+# ---------------------------------------------------------------------------
+# Module trends in the report
+# ---------------------------------------------------------------------------
+
+
+def test_build_history_markdown_module_trends_section() -> None:
+    md = build_history_markdown(
+        [],
+        days=7,
+        today=date(2026, 5, 4),
+        module_trends={"infrastructure.prose": [50.0, 60.0, 40.0]},
+    )
+
+    assert "## Module trends" in md
+    assert "- `infrastructure.prose`" in md
+    assert md.index("## Module trends") < md.index("## Regenerate")
+    assert "Module trends" not in build_history_markdown([], days=7, today=date(2026, 5, 4))
+    assert "_No per-module coverage recorded._" in build_history_markdown(
+        [], days=7, today=date(2026, 5, 4), module_trends={}
+    )
+
+
+def test_driver_writes_module_trends_from_store(tmp_path: Path) -> None:
+    artefacts = tmp_path / "artefacts"
+    artefacts.mkdir()
+    when = datetime.now(timezone.utc) - timedelta(days=1)
+    _write_report(artefacts / "coverage-infra.xml", when=when, line_rate=0.8, packages=_PACKAGES)
+    out_path = tmp_path / "coverage_history.md"
+    store_path = tmp_path / "driver.sqlite"
+    repo_root = Path(__file__).resolve().parents[3]
+    cmd = [
+        sys.executable,
+        str(repo_root / "scripts" / "docgen" / "coverage_history.py"),
+        f"--from-dir={artefacts}",
+        "--days=7",
+        f"--output={out_path}",
+        f"--store={store_path}",
+        "--module-trends=1",
+    ]
+
+    completed = subprocess.run(cmd, capture_output=True, text=True, timeout=60, check=False)
+
+    assert completed.returncode == 0, f"Driver failed: {completed.stderr}"
+    rendered = out_path.read_text(encoding="utf-8")
+    assert "- `infrastructure.prose`" in rendered
+    assert "infrastructure.core" not in rendered
+    assert store_path.exists()
@@ -10,6 +10,7 @@ dataclasses and real JSON round-trips.
 from __future__ import annotations
 
 import json
+import sqlite3
 import subprocess
 import sys
 from pathlib import Path
@@ -23,7 +24,9 @@ from infrastructure.reporting.evidence_graph import (
     NodeType,
     RelationType,
     build_evidence_graph,
+    graph_from_sqlite,
     graph_to_json,
+    graph_to_sqlite,
     main,
 )
 from infrastructure.reporting.evidence_graph import _ingest_claims
@@ -163,6 +166,77 @@ def test_artifacts_missing_metadata_is_computable() -> None:
         assert not graph.neighbors(node.id)
 
 
+# --------------------------------------------------------------------------- #
+# Indexed traversal
+# --------------------------------------------------------------------------- #
+def _provenance_chain() -> EvidenceGraph:
+    """raw data -> analysis -> figure -> claim, with a validator and an unrelated stage."""
+    graph = EvidenceGraph(project=EXEMPLAR)
+    for node_id, node_type in [
+        ("artifact:raw", NodeType.ARTIFACT),
+        ("stage:analysis", NodeType.PRODUCER),
+        ("artifact:figure", NodeType.ARTIFACT),
+        ("claim:c1", NodeType.CLAIM),
+        ("stage:validate", NodeType.VALIDATOR),
+        ("stage:other", NodeType.PRODUCER),
+        ("artifact:other", NodeType.ARTIFACT),
+    ]:
+        graph.add_node(EvidenceNode(id=node_id, type=node_type, source_of_truth="test"))
+    for source, target, relation in [
+        ("stage:analysis", "artifact:raw", RelationType.CONSUMES),
+        ("stage:analysis", "artifact:figure", RelationType.PRODUCES),
+        ("artifact:figure", "claim:c1", RelationType.SUPPORTS),
+        ("stage:validate", "artifact:figure", RelationType.VALIDATES),
+        ("stage:other", "artifact:other", RelationType.PRODUCES),
+    ]:
+        graph.add_edge(EvidenceEdge(source=source, target=target, relation=relation))
+    return graph
+
+
+def test_upstream_follows_provenance_against_consumes_edges() -> None:
+    graph = _provenance_chain()
+    assert [n.id for n in graph.upstream("claim:c1")] == ["artifact:figure", "artifact:raw", "stage:analysis"]
+    assert graph.upstream("artifact:raw") == []
+
+
+def test_claims_affected_by_artifact_are_transitive() -> None:
+    graph = _provenance_chain()
+    assert [n.id for n in graph.downstream("artifact:raw")] == ["artifact:figure", "claim:c1", "stage:analysis"]
+    assert [n.id for n in graph.claims_affected_by("artifact:raw")] == ["claim:c1"]
+    assert graph.claims_affected_by("artifact:other") == []
+    with pytest.raises(KeyError):
+        graph.downstream("artifact:missing")
+
+
+def test_directly_appended_entries_are_indexed() -> None:
+    graph = EvidenceGraph.from_dict(_provenance_chain().to_dict())
+    graph.nodes.append(EvidenceNode(id="artifact:late", type=NodeType.ARTIFACT, source_of_truth="test"))
+
+    assert "artifact:late" in graph
+    assert [n.id for n in graph.artifacts_missing_metadata()] == ["artifact:late"]
+    assert [n.id for n in graph.neighbors("artifact:figure")] == ["claim:c1", "stage:analysis", "stage:validate"]
+    with pytest.raises(ValueError, match="duplicate node id"):
+        graph.add_node(EvidenceNode(id="artifact:late", type=NodeType.ARTIFACT, source_of_truth="test"))
+
+
+def test_sqlite_round_trip_preserves_to_dict(tmp_path: Path) -> None:
+    graph = build_evidence_graph(REPO_ROOT, EXEMPLAR)
+
+    restored = graph_from_sqlite(graph_to_sqlite(graph, tmp_path / "graph.sqlite"))
+
+    assert graph_to_json(restored) == graph_to_json(graph)
+    assert restored.nodes_by_type(NodeType.PRODUCER) == graph.nodes_by_type(NodeType.PRODUCER)
+
+
+def test_graph_from_sqlite_rejects_foreign_database(tmp_path: Path) -> None:
+    db = tmp_path / "other.sqlite"
+    conn = sqlite3.connect(str(db))
+    conn.execute("CREATE TABLE unrelated (x)")
+    conn.close()
+    with pytest.raises(ValueError, match="not an evidence-graph database"):
+        graph_from_sqlite(db)
+
+
 # --------------------------------------------------------------------------- #
 # Determinism
 # --------------------------------------------------------------------------- #
@@ -257,6 +331,14 @@ def test_main_writes_json_in_process(tmp_path: Path) -> None:
     assert parsed["nodes"]
 
 
+def test_main_writes_sqlite_alongside_json(tmp_path: Path) -> None:
+    out = tmp_path / "g.json"
+    db = tmp_path / "g.sqlite"
+    rc = main(["build", EXEMPLAR, "--json", str(out), "--sqlite", str(db), "--repo-root", str(REPO_ROOT)])
+    assert rc == 0
+    assert graph_to_json(graph_from_sqlite(db)) == out.read_text(encoding="utf-8").rstrip("\n")
+
+
 # --------------------------------------------------------------------------- #
 # Claim-ledger ingestion (real temp ledger — no mocks)
 # --------------------------------------------------------------------------- #
@@ -110,3 +110,57 @@ class TestLocalBackend:
         corpus.write_text(json.dumps([]), encoding="utf-8")
         results = backend.search(SearchQuery(text="convex"))
         assert len(results) == 1  # cached
+
+
+class TestLocalIndex:
+    def test_partial_terms_match_like_substrings(self, tmp_path: Path):
+        corpus = _write_corpus(tmp_path / "c.json", _sample_papers())
+        backend = LocalBackend(corpus)
+        assert {p.id for p in backend.search(SearchQuery(text="optim"))} == {"doi:10.1/x", "arxiv:1412.6980"}
+        assert [p.id for p in backend.search(SearchQuery(text="ba,"))] == ["arxiv:1412.6980"]
+
+    def test_results_are_independent_copies(self, tmp_path: Path):
+        corpus = _write_corpus(tmp_path / "c.json", _sample_papers())
+        backend = LocalBackend(corpus)
+        first = backend.search(SearchQuery(text="convex"))[0]
+        first.authors.append("Mutated, A")
+        assert "Mutated, A" not in backend.search(SearchQuery(text="convex"))[0].authors
+
+    def test_bm25_prefers_denser_matches(self, tmp_path: Path):
+        papers = _sample_papers() + [
+            {"id": "x:dense", "title": "Gradient gradient gradient", "abstract": "gradient flows"},
+        ]
+        corpus = _write_corpus(tmp_path / "c.json", papers)
+        results = LocalBackend(corpus, ranking="bm25").search(SearchQuery(text="gradient"))
+        assert [p.id for p in results] == ["x:dense", "x:gradient"]
+        assert results[0].score == 1.0 and 0.0 < results[1].score < 1.0
+
+    def test_unknown_ranking_rejected(self, tmp_path: Path):
+        with pytest.raises(ValueError, match="ranking"):
+            LocalBackend(tmp_path / "c.json", ranking="tfidf")  # type: ignore[arg-type]
+
+    def test_persisted_index_is_keyed_to_corpus_content(self, tmp_path: Path):
+        corpus = _write_corpus(tmp_path / "c.json", _sample_papers())
+        index_dir = tmp_path / "index"
+        LocalBackend(corpus, index_dir=index_dir).search(SearchQuery(text="convex"))
+        (first_index,) = index_dir.glob("c.*.index.json")
+
+        reloaded = LocalBackend(corpus, index_dir=index_dir).search(SearchQuery(text="convex"))
+        assert [p.id for p in reloaded] == ["doi:10.1/x"]
+
+        _write_corpus(corpus, _sample_papers()[1:])
+        assert LocalBackend(corpus, index_dir=index_dir).search(SearchQuery(text="convex")) == []
+        assert len(list(index_dir.glob("c.*.index.json"))) == 1
+        assert not first_index.exists()
+
+    def test_foreign_index_file_is_rebuilt(self, tmp_path: Path):
+        corpus = _write_corpus(tmp_path / "c.json", _sample_papers())
+        index_dir = tmp_path / "index"
+        LocalBackend(corpus, index_dir=index_dir).search(SearchQuery(text="convex"))
+        (index_file,) = index_dir.glob("c.*.index.json")
+        index_file.write_text(json.dumps({"version": 1, "corpus_sha256": "other"}), encoding="utf-8")
+
+        results = LocalBackend(corpus, index_dir=index_dir).search(SearchQuery(text="convex"))
+
+        assert [p.id for p in results] == ["doi:10.1/x"]
+        assert json.loads(index_file.read_text(encoding="utf-8"))["corpus_sha256"] != "other"
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import json
+import threading
 import time
 from pathlib import Path
 
+import pytest
 
 from infrastructure.search.literature.backends import (
     BackendError,
@@ -275,3 +277,139 @@ class TestSearchCache:
         client.search(q)
         client.search(q, use_cache=False)
         assert called["count"] == 2
+
+
+# ---------------------------------------------------------------------------
+# Concurrent fan-out
+# ---------------------------------------------------------------------------
+
+
+class _GatedBackend(SearchBackend):
+    """Waits on a real threading primitive before returning its papers."""
+
+    def __init__(self, name: str, papers: list[Paper], gate: threading.Barrier | threading.Event) -> None:
+        self.name = name
+        self._papers = papers
+        self._gate = gate
+
+    def search(self, query: SearchQuery) -> list[Paper]:
+        if isinstance(self._gate, threading.Barrier):
+            self._gate.wait()
+        else:
+            self._gate.wait(5)
+        return list(self._papers)
+
+
+class TestConcurrentFanOut:
+    def test_backends_run_concurrently(self):
+        barrier = threading.Barrier(3, timeout=5)  # breaks unless all three overlap
+        backends = [_GatedBackend(n, [Paper(id=f"{n}:1", title=n)], barrier) for n in ("a", "b", "c")]
+
+        result = LiteratureClient(backends).search(SearchQuery(text="q"))
+
+        assert result.per_source_counts == {"a": 1, "b": 1, "c": 1}
+
+    def test_merge_order_follows_backend_order_not_completion_order(self):
+        release_first = threading.Event()
+        slow_first = _GatedBackend(
+            "slow", [Paper(id="s:1", title="Slow", doi="10.1/x", score=0.5, venue="Slow venue")], release_first
+        )
+
+        class _FastThenRelease(SearchBackend):
+            name = "fast"
+
+            def search(self, query: SearchQuery) -> list[Paper]:
+                release_first.set()
+                return [Paper(id="f:1", title="Fast", doi="10.1/x", score=0.5, venue="Fast venue")]
+
+        result = LiteratureClient([slow_first, _FastThenRelease(), _FailingBackend("down")]).search(
+            SearchQuery(text="q")
+        )
+
+        assert [p.venue for p in result.papers] == ["Slow venue"]
+        assert list(result.per_source_counts) == ["slow", "fast"]
+        assert result.errors == {"down": "boom"}
+
+    def test_timeout_returns_partial_results_and_skips_cache(self, tmp_path: Path):
+        never = threading.Event()
+        cache = SearchCache(tmp_path / "cache")
+        client = LiteratureClient(
+            [
+                _FixedBackend("fast", [Paper(id="f:1", title="Fast")]),
+                _GatedBackend("stuck", [Paper(id="s:1", title="Stuck")], never),
+            ],
+            cache=cache,
+            backend_timeout=0.2,
+        )
+
+        started = time.monotonic()
+        result = client.search(SearchQuery(text="q"))
+        never.set()
+
+        assert time.monotonic() - started < 3
+        assert [p.id for p in result.papers] == ["f:1"]
+        assert "timed out" in result.errors["stuck"]
+        assert result.timed_out == ["stuck"]
+        assert cache.get(SearchQuery(text="q")) is None
+
+    def test_each_backend_deadline_starts_when_the_backend_starts(self):
+        class _Delayed(SearchBackend):
+            def __init__(self, name: str) -> None:
+                self.name = name
+
+            def search(self, query: SearchQuery) -> list[Paper]:
+                threading.Event().wait(0.2)
+                return [Paper(id=f"{self.name}:1", title=self.name)]
+
+        # One worker runs the two backends back to back (~0.4s in total); a
+        # single fan-out deadline of 0.3s would have cut off the second one.
+        client = LiteratureClient([_Delayed("first"), _Delayed("second")], max_workers=1, backend_timeout=0.3)
+
+        result = client.search(SearchQuery(text="q"))
+
+        assert result.per_source_counts == {"first": 1, "second": 1}
+        assert result.timed_out == []
+
+    def test_slow_backend_times_out_while_fast_backend_returns(self):
+        never = threading.Event()
+        client = LiteratureClient(
+            [
+                _GatedBackend("slow", [Paper(id="s:1", title="Slow")], never),
+                _FixedBackend("fast", [Paper(id="f:1", title="Fast")]),
+            ],
+            backend_timeout=0.2,
+        )
+
+        result = client.search(SearchQuery(text="q"))
+        never.set()
+
+        assert [p.id for p in result.papers] == ["f:1"]
+        assert result.timed_out == ["slow"]
+        assert result.errors == {"slow": "timed out after 0.2s"}
+
+    def test_queued_backends_are_abandoned_when_every_worker_is_stuck(self):
+        never = threading.Event()
+        client = LiteratureClient(
+            [
+                _GatedBackend("stuck", [Paper(id="s:1", title="Stuck")], never),
+                _FixedBackend("queued", [Paper(id="q:1", title="Queued")]),
+            ],
+            max_workers=1,
+            backend_timeout=0.2,
+        )
+
+        started = time.monotonic()
+        result = client.search(SearchQuery(text="q"))
+        never.set()
+
+        assert time.monotonic() - started < 3
+        assert result.timed_out == ["stuck", "queued"]
+        assert result.errors["queued"].startswith("not started")
+
+    def test_sequential_mode_and_validation(self):
+        client = LiteratureClient([_FixedBackend("a", [Paper(id="a:1", title="A")])], max_workers=1)
+        assert len(client.search(SearchQuery(text="q"))) == 1
+        with pytest.raises(ValueError):
+            LiteratureClient([], max_workers=0)
+        with pytest.raises(ValueError):
+            LiteratureClient([], backend_timeout=0)
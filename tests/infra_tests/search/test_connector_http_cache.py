@@ -0,0 +1,185 @@
+"""Tests for infrastructure.search.connectors.http_cache and the cached HTTP client.
+
+No mocks: a real threaded HTTP server on localhost serves ``ETag`` and
+``Last-Modified`` validators, answers conditional requests with ``304``, and
+records every request it receives; responses are stored in a real SQLite file.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from infrastructure.search.connectors import OpenAlexConnector, UniProtConnector
+from infrastructure.search.connectors.http import ConnectorHttpClient, ConnectorHttpError
+from infrastructure.search.connectors.http_cache import (
+    CONNECTOR_TTL_POLICY,
+    DEFAULT_CONNECTOR_TTL,
+    ENV_CONNECTOR_HTTP_CACHE,
+    ENV_CONNECTOR_HTTP_OFFLINE,
+    ConnectorHttpCache,
+    default_connector_http_cache,
+)
+
+_EXPIRED = 1e-9  # a TTL that is already over when the next request arrives
+
+
+class _Origin:
+    """A versioned JSON resource; requests are logged as (path, If-None-Match, If-Modified-Since)."""
+
+    def __init__(self) -> None:
+        self.version = 1
+        self.requests: list[tuple[str, str | None, str | None]] = []
+
+
+def _handler(origin: _Origin) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args: object) -> None:
+            pass
+
+        def do_GET(self) -> None:
+            etag = f'"v{origin.version}"'
+            origin.requests.append(
+                (self.path, self.headers.get("If-None-Match"), self.headers.get("If-Modified-Since"))
+            )
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.end_headers()
+                return
+            body = json.dumps({"path": self.path, "version": origin.version, "pad": "x" * 2000}).encode()
+            self.send_response(200)
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", "Wed, 01 Jul 2026 00:00:00 GMT")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return Handler
+
+
+@pytest.fixture
+def origin() -> Iterator[tuple[_Origin, str]]:
+    state = _Origin()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _handler(state))
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    try:
+        yield state, f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _client(cache: ConnectorHttpCache | None, ttl: float = 60.0, **kwargs: object) -> ConnectorHttpClient:
+    return ConnectorHttpClient(ttl=ttl, max_retries=0, cache=cache, **kwargs)  # type: ignore[arg-type]
+
+
+class TestDiskCache:
+    def test_new_process_is_served_from_disk(self, origin: tuple[_Origin, str], tmp_path: Path) -> None:
+        server, base = origin
+        cold = ConnectorHttpCache(tmp_path / "http.sqlite")
+        first = _client(cold).get_json(f"{base}/works", {"search": "crispr"})
+
+        warm = ConnectorHttpCache(cold.db_path)
+        second = _client(warm).get_json(f"{base}/works", {"search": "crispr"})
+
+        assert second == first and len(server.requests) == 1
+        assert cold.stats.to_dict() == {"hits": 0, "revalidated": 0, "misses": 1, "stores": 1, "evictions": 0}
+        assert warm.stats.hits == 1
+        assert 0 < cold.total_bytes() < len(json.dumps(first))  # payloads are compressed
+
+    def test_stale_entries_are_revalidated_with_validators(self, origin: tuple[_Origin, str], tmp_path: Path) -> None:
+        server, base = origin
+        cache = ConnectorHttpCache(tmp_path / "http.sqlite")
+        first = _client(cache, ttl=_EXPIRED).get_text(f"{base}/record")
+
+        assert _client(cache, ttl=_EXPIRED).get_text(f"{base}/record") == first
+        assert server.requests[-1] == ("/record", '"v1"', "Wed, 01 Jul 2026 00:00:00 GMT")
+        assert cache.stats.revalidated == 1
+
+        server.version = 2
+        changed = _client(cache, ttl=_EXPIRED).get_json(f"{base}/record")
+        assert changed["version"] == 2
+        assert (len(server.requests), cache.stats.stores) == (3, 2)
+
+    def test_offline_replay_serves_stale_entries_and_fails_on_misses(
+        self, origin: tuple[_Origin, str], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        server, base = origin
+        cache = ConnectorHttpCache(tmp_path / "http.sqlite")
+        recorded = _client(cache, ttl=_EXPIRED).get_json(f"{base}/recorded")
+
+        monkeypatch.setenv(ENV_CONNECTOR_HTTP_OFFLINE, "1")
+        assert _client(cache, ttl=_EXPIRED).get_json(f"{base}/recorded") == recorded
+        with pytest.raises(ConnectorHttpError, match="Offline replay"):
+            _client(cache).get_json(f"{base}/never-recorded")
+        assert len(server.requests) == 1
+
+    def test_least_recently_used_rows_are_evicted_over_the_size_bound(self, tmp_path: Path) -> None:
+        cache = ConnectorHttpCache(tmp_path / "http.sqlite", max_bytes=2500)
+        for name in ("a", "b"):
+            cache.put(name, namespace="t", url=name, body=os.urandom(1000), ttl=60)
+        assert cache.get("a") is not None  # "b" is now least recently used
+
+        cache.put("c", namespace="t", url="c", body=os.urandom(1000), ttl=60)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None and cache.get("c") is not None
+        assert cache.stats.evictions == 1 and cache.total_bytes() <= 2500
+
+    def test_a_file_from_an_older_layout_is_reset(self, tmp_path: Path) -> None:
+        old = sqlite3.connect(tmp_path / "http.sqlite")
+        old.execute("CREATE TABLE responses (cache_key TEXT PRIMARY KEY, body BLOB)")
+        old.execute("INSERT INTO responses VALUES ('a', x'00')")
+        old.commit()
+        old.close()
+
+        cache = ConnectorHttpCache(tmp_path / "http.sqlite")
+        assert cache.get("a") is None
+        cache.put("a", namespace="t", url="a", body=b"fresh", ttl=60)
+        stored = cache.get("a")
+        assert stored is not None and stored.body == b"fresh"
+
+    def test_clear_cache_only_drops_the_clients_namespace(self, origin: tuple[_Origin, str], tmp_path: Path) -> None:
+        _, base = origin
+        cache = ConnectorHttpCache(tmp_path / "http.sqlite")
+        mine, theirs = _client(cache, namespace="openalex"), _client(cache, namespace="uniprot")
+        mine.get_json(f"{base}/a")
+        theirs.get_json(f"{base}/b")
+
+        assert mine.clear_cache() == 2  # one in memory, one on disk
+        assert cache.clear() == 1
+
+
+class TestClientPolicy:
+    def test_memory_layer_is_bounded(self, origin: tuple[_Origin, str]) -> None:
+        server, base = origin
+        client = _client(None, max_memory_entries=2)
+        for path in ("/1", "/2", "/3", "/1"):
+            client.get_json(base + path)
+        assert len(client._cache) == 2 and len(server.requests) == 4
+
+    def test_connectors_use_the_ttl_policy(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv(ENV_CONNECTOR_HTTP_CACHE, str(tmp_path / "http.sqlite"))
+        uniprot = UniProtConnector()._http
+        assert (uniprot.ttl, uniprot.namespace) == (CONNECTOR_TTL_POLICY["uniprot"], "uniprot")
+        assert OpenAlexConnector()._http.ttl == CONNECTOR_TTL_POLICY["openalex"]
+        assert ConnectorHttpClient.for_connector("unlisted").ttl == DEFAULT_CONNECTOR_TTL
+
+    def test_default_cache_location_follows_the_environment(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv(ENV_CONNECTOR_HTTP_CACHE, "off")
+        assert default_connector_http_cache() is None
+        assert ConnectorHttpClient().cache is None
+        monkeypatch.delenv(ENV_CONNECTOR_HTTP_CACHE)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+        cache = default_connector_http_cache()
+        assert cache is not None and cache.db_path == tmp_path / "xdg" / "template" / "connector-http.sqlite"
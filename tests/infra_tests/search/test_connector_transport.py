@@ -0,0 +1,210 @@
+"""Tests for connector keep-alive pooling, rate limits and concurrent plan execution.
+
+No mocks: real connectors talk to a real threaded HTTP/1.1 server on localhost
+that delays or pairs up responses, records which TCP connection served them,
+and tracks how many requests were in flight at once.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from infrastructure.search.connectors import (
+    ConnectorRegistry,
+    CrossrefConnector,
+    EuropePMCConnector,
+    OpenAlexConnector,
+)
+from infrastructure.search.connectors.http import ConnectorHttpClient, ConnectorHttpError
+from infrastructure.search.connectors.stage import (
+    ConnectorSearchPlan,
+    ConnectorSearchRequest,
+    execute_plan,
+)
+from infrastructure.search.connectors.transport import (
+    CONNECTOR_RATE_POLICY,
+    ConnectorRateLimiter,
+    HostConnectionPool,
+    RateLimit,
+    rate_limiter_for,
+)
+
+_DELAY = 0.2
+
+
+class _Origin:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.connections: list[int] = []  # client port per request
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.fail_next = 0
+        # "/gate" requests wait here for a partner; a lone request breaks it.
+        self.gate = threading.Barrier(2, timeout=5)
+
+
+def _handler(origin: _Origin) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+        def do_GET(self) -> None:
+            with origin.lock:
+                origin.connections.append(self.client_address[1])
+                origin.in_flight += 1
+                origin.peak_in_flight = max(origin.peak_in_flight, origin.in_flight)
+                failing = origin.fail_next > 0
+                origin.fail_next -= int(failing)
+            time.sleep(_DELAY if self.path.startswith("/slow") else 0)
+            if self.path.startswith("/gate"):
+                try:
+                    origin.gate.wait()
+                except threading.BrokenBarrierError:
+                    failing = True
+            with origin.lock:
+                origin.in_flight -= 1
+            if failing:
+                self.send_response(503)
+                self.send_header("Retry-After", "0")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            if self.path.startswith("/moved"):
+                self.send_response(301)
+                self.send_header("Location", "/slow" + self.path.removeprefix("/moved"))
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            # "/drop" closes the connection without announcing it, as an idle timeout would.
+            self.close_connection = self.path.startswith("/drop")
+            body = json.dumps({"path": self.path}).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return Handler
+
+
+@pytest.fixture
+def origin() -> Iterator[tuple[_Origin, str]]:
+    state = _Origin()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _handler(state))
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    try:
+        yield state, f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _client(**kwargs: object) -> ConnectorHttpClient:
+    return ConnectorHttpClient(ttl=0, max_retries=0, cache=None, **kwargs)  # type: ignore[arg-type]
+
+
+class TestTransport:
+    def test_requests_reuse_one_keep_alive_connection(self, origin: tuple[_Origin, str]) -> None:
+        server, base = origin
+        client = _client()
+        for index in range(3):
+            assert client.get_json(f"{base}/fast/{index}") == {"path": f"/fast/{index}"}
+        assert len(set(server.connections)) == 1
+
+        one_shot = _client(keep_alive=False)
+        one_shot.get_json(f"{base}/fast/once")
+        assert len(set(server.connections)) == 2
+
+    def test_redirects_and_retry_after_are_followed(self, origin: tuple[_Origin, str]) -> None:
+        server, base = origin
+        server.fail_next = 1
+        client = ConnectorHttpClient(ttl=0, max_retries=1, backoff_base=30.0, cache=None)
+
+        started = time.monotonic()
+        assert client.get_json(f"{base}/moved/x") == {"path": "/slow/x"}
+        assert time.monotonic() - started < 5  # Retry-After: 0 replaced the 30 s back-off
+        assert len(server.connections) == 3
+
+        server.fail_next = 1
+        with pytest.raises(ConnectorHttpError, match="HTTP 503"):
+            _client().get_json(f"{base}/fast")
+
+    def test_pool_discards_connections_the_server_closed(self, origin: tuple[_Origin, str]) -> None:
+        server, base = origin
+        pool = HostConnectionPool(max_idle_per_host=1)
+        client = _client()
+        client.pool = pool
+        client.get_json(f"{base}/drop/a")
+        key = ("http", "127.0.0.1", int(base.rsplit(":", 1)[1]))
+        assert pool.idle_count(key) == 1
+        time.sleep(0.05)  # let the server finish closing its end
+
+        assert client.get_json(f"{base}/fast/b") == {"path": "/fast/b"}
+        assert len(set(server.connections)) == 2
+        assert pool.close_all() == 1
+
+    def test_rate_limiter_bounds_concurrency_and_spacing(self, origin: tuple[_Origin, str]) -> None:
+        server, base = origin
+        client = _client(rate_limiter=ConnectorRateLimiter(RateLimit(concurrency=1, min_interval=0.05)))
+        threads = [threading.Thread(target=client.get_json, args=(f"{base}/slow/{i}",)) for i in range(3)]
+        started = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert server.peak_in_flight == 1
+        assert time.monotonic() - started >= 3 * _DELAY
+
+    def test_connectors_share_policy_limiters(self) -> None:
+        assert rate_limiter_for("arxiv") is rate_limiter_for("arxiv")
+        assert rate_limiter_for("arxiv").limit == CONNECTOR_RATE_POLICY["arxiv"]
+        assert ConnectorHttpClient.for_connector("arxiv").rate_limiter is rate_limiter_for("arxiv")
+
+
+def _plan(tmp_path: Path, requests: list[ConnectorSearchRequest]) -> ConnectorSearchPlan:
+    return ConnectorSearchPlan(
+        project="demo",
+        project_dir=tmp_path,
+        output_path=tmp_path / "results.json",
+        max_results=3,
+        requests=tuple(requests),
+    )
+
+
+class TestConcurrentPlan:
+    def test_plan_runs_concurrently_and_keeps_request_order(self, origin: tuple[_Origin, str], tmp_path: Path) -> None:
+        server, base = origin
+        registry = ConnectorRegistry()
+        for connector_cls in (OpenAlexConnector, CrossrefConnector, EuropePMCConnector):
+            registry.register(connector_cls(http_client=_client(), base_url=f"{base}/gate"))
+        names = ["openalex", "crossref", "europepmc"]
+        requests = [ConnectorSearchRequest(names[i % 3], f"query {i}") for i in range(12)]
+        requests.insert(5, ConnectorSearchRequest("missing", "nowhere"))
+
+        report, success = execute_plan(_plan(tmp_path, requests), registry=registry, workers=4)
+
+        assert [(s["connector"], s["query"]) for s in report["searches"]] == [(r.connector, r.query) for r in requests]
+        assert report["summary"] == {"searches": 13, "successful": 12, "failed": 1, "hits": 0}
+        assert not success
+        # Every gated request was answered only once a second one arrived.
+        assert not server.gate.broken
+        assert server.peak_in_flight > 1
+
+    def test_single_worker_matches_concurrent_report(self, origin: tuple[_Origin, str], tmp_path: Path) -> None:
+        _, base = origin
+        registry = ConnectorRegistry()
+        registry.register(OpenAlexConnector(http_client=_client(), base_url=f"{base}/fast"))
+        plan = _plan(tmp_path, [ConnectorSearchRequest("openalex", f"q{i}") for i in range(4)])
+
+        serial, _ = execute_plan(plan, registry=registry, workers=4)
+        concurrent, _ = execute_plan(plan, registry=registry, workers=4)
+        assert serial == concurrent
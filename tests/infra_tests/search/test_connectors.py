@@ -35,6 +35,7 @@ from infrastructure.search.connectors.config import (
     load_connector_search_config,
 )
 from infrastructure.search.connectors.http import ConnectorHttpClient, ConnectorHttpError
+from infrastructure.search.connectors.http_cache import ENV_CONNECTOR_HTTP_CACHE
 from infrastructure.search.connectors.types import (
     CatalogEntry,
     FetchOptions,
@@ -46,6 +47,12 @@ from infrastructure.search.connectors.types import (
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(autouse=True)
+def _isolated_http_cache(tmp_path, monkeypatch):
+    """Keep clients created here away from the user's shared response cache."""
+    monkeypatch.setenv(ENV_CONNECTOR_HTTP_CACHE, str(tmp_path / "connector-http.sqlite"))
+
+
 def _make_server(handler_cls: type) -> tuple[HTTPServer, str]:
     """Start a throwaway HTTP server on localhost and return (server, base_url)."""
     server = HTTPServer(("127.0.0.1", 0), handler_cls)
@@ -0,0 +1,166 @@
+"""Tests for Form-XObject overlay stamping and page-range rendering.
+
+Real reportlab documents stamped by the real processor: the stamped pages must
+carry the same text as the per-page ``merge_page`` path did, with the
+full-page watermark stored once and shared by every page of a given size.
+"""
+
+from __future__ import annotations
+
+import io
+import re
+from pathlib import Path
+
+import pytest
+
+from tests.infra_tests.steganography.conftest import has_pypdf, has_qrcode, has_reportlab
+
+pytestmark = pytest.mark.skipif(
+    not (has_pypdf() and has_reportlab() and has_qrcode()), reason="pypdf, reportlab and qrcode required"
+)
+
+_TIMESTAMP = re.compile(r"\d{4}-\d{2}-\d{2}T[\d:]+(?:Z|[+-]\d{2}:\d{2})")
+_DIGEST = re.compile(r"[0-9a-f]{12,}")  # document IDs and output hashes differ run to run
+
+
+def _source_pdf(path: Path, pages: int, *, odd_size_page: int | None = None) -> Path:
+    from reportlab.pdfgen import canvas as rl_canvas
+
+    c = rl_canvas.Canvas(str(path))
+    for number in range(1, pages + 1):
+        c.setPageSize((400, 600) if number == odd_size_page else (612, 792))
+        c.drawString(72, 500, f"Body of page {number}")
+        c.showPage()
+    c.save()
+    return path
+
+
+def _stamp(source: Path, output: Path, **overrides: object) -> Path:
+    from infrastructure.steganography.config import SteganographyConfig
+    from infrastructure.steganography.core import SteganographyProcessor
+
+    config = SteganographyConfig(enabled=True, metadata_enabled=False, manifest_enabled=False, **overrides)
+    return SteganographyProcessor(config).process(source, output, title="Stamped", authors=["Ada Lovelace"])
+
+
+def _page_texts(pdf: Path) -> list[str]:
+    from pypdf import PdfReader
+
+    return [_DIGEST.sub("<id>", _TIMESTAMP.sub("<ts>", page.extract_text())) for page in PdfReader(str(pdf)).pages]
+
+
+def _overlay_forms(pdf: Path) -> list[dict[str, int]]:
+    from pypdf import PdfReader
+
+    forms = []
+    for page in PdfReader(str(pdf)).pages:
+        xobjects = page["/Resources"]["/XObject"]
+        forms.append({name: xobjects.raw_get(name).idnum for name in xobjects if name.startswith("/StegOverlay")})
+    return forms
+
+
+class TestProcessorStamping:
+    def test_every_page_carries_its_own_footer_and_barcode(self, tmp_path: Path) -> None:
+        stamped = _stamp(_source_pdf(tmp_path / "in.pdf", 3), tmp_path / "out.pdf")
+
+        texts = _page_texts(stamped)
+        assert len(texts) == 3
+        for number, text in enumerate(texts, start=1):
+            assert f"Body of page {number}" in text
+            assert "CONFIDENTIAL" in text
+            assert f"Page {number}/3" in text
+            assert f"|P:{number}" in text
+        assert "STEG_ID:" in texts[0]
+        assert "STEG_ID:" not in texts[1]
+
+    def test_watermark_form_is_shared_per_page_size(self, tmp_path: Path) -> None:
+        stamped = _stamp(_source_pdf(tmp_path / "in.pdf", 4, odd_size_page=3), tmp_path / "out.pdf")
+
+        watermarks = [forms["/StegOverlay0"] for forms in _overlay_forms(stamped)]
+        assert watermarks[0] == watermarks[1] == watermarks[3]
+        assert watermarks[2] != watermarks[0]
+        footers = [forms["/StegOverlay1"] for forms in _overlay_forms(stamped)]
+        assert len(set(footers)) == 4
+
+    def test_original_content_is_isolated_before_overlays(self, tmp_path: Path) -> None:
+        from pypdf import PdfReader
+
+        stamped = _stamp(_source_pdf(tmp_path / "in.pdf", 1), tmp_path / "out.pdf", barcodes_enabled=False)
+        data = PdfReader(str(stamped)).pages[0].get_contents().get_data()
+
+        assert data.startswith(b"q\n")
+        assert data.rstrip().endswith(b"\nQ\nq /StegOverlay0 Do Q q /StegOverlay1 Do Q q /StegOverlay2 Do Q")
+
+    def test_page_range_workers_match_serial_output(self, tmp_path: Path) -> None:
+        source = _source_pdf(tmp_path / "in.pdf", 60)
+
+        serial = _stamp(source, tmp_path / "serial.pdf")
+        parallel = _stamp(source, tmp_path / "parallel.pdf", stamp_workers=3)
+
+        assert _page_texts(parallel) == _page_texts(serial)
+
+
+class TestOverlayStamper:
+    def test_pinned_pypdf_still_provides_object_registration(self) -> None:
+        # OverlayStamper._register relies on this private writer method; the
+        # pyproject pin (<7) exists because pypdf offers no public equivalent.
+        from pypdf import PdfWriter
+
+        assert callable(getattr(PdfWriter, "_add_object", None))
+
+    def test_existing_xobject_names_are_not_overwritten(self, tmp_path: Path) -> None:
+        from pypdf import PdfReader, PdfWriter
+        from pypdf.generic import DictionaryObject, NameObject
+
+        from infrastructure.steganography.overlays import create_invisible_text_overlay
+        from infrastructure.steganography.stamping import OverlayStamper
+
+        writer = PdfWriter()
+        writer.add_page(PdfReader(str(_source_pdf(tmp_path / "in.pdf", 1))).pages[0])
+        page = writer.pages[0]
+        page["/Resources"][NameObject("/XObject")] = DictionaryObject({NameObject("/StegOverlay0"): NameObject("/X")})
+        stamper = OverlayStamper(writer)
+        form = stamper.form_from_page(PdfReader(io.BytesIO(create_invisible_text_overlay(612, 792, "hidden"))).pages[0])
+
+        stamper.stamp(page, [form])
+
+        xobjects = page["/Resources"]["/XObject"]
+        assert xobjects["/StegOverlay0"] == "/X"
+        assert xobjects.raw_get("/StegOverlay1") == form
+
+
+class TestMultiPageBuilders:
+    def test_footer_document_has_one_page_per_entry(self) -> None:
+        from pypdf import PdfReader
+
+        from infrastructure.steganography.overlays import FooterConfig, create_footer_overlays
+
+        pdf = create_footer_overlays(
+            [(612, 792, FooterConfig(page_number=n, total_pages=3)) for n in (1, 2, 3)], timestamp="T0"
+        )
+
+        pages = PdfReader(io.BytesIO(pdf)).pages
+        assert [float(p.mediabox.width) for p in pages] == [612, 612, 612]
+        assert ["Page 2/3" in p.extract_text() for p in pages] == [False, True, False]
+
+    def test_barcode_document_embeds_each_qr_image_once(self) -> None:
+        from pypdf import PdfReader
+
+        from infrastructure.steganography.barcodes import create_barcode_strip_overlays
+
+        pdf = create_barcode_strip_overlays(
+            [(612, 792)] * 5, [f"P:{n}" for n in range(5)], title="T", document_id="doc", timestamp="T0"
+        )
+
+        images = {
+            page["/Resources"]["/XObject"].raw_get(name).idnum
+            for page in PdfReader(io.BytesIO(pdf)).pages
+            for name in page["/Resources"]["/XObject"]
+        }
+        assert len(images) <= 4
+
+    def test_mismatched_payloads_are_rejected(self) -> None:
+        from infrastructure.steganography.barcodes import create_barcode_strip_overlays
+
+        with pytest.raises(ValueError, match="same length"):
+            create_barcode_strip_overlays([(612, 792)], ["a", "b"])
@@ -0,0 +1,173 @@
+"""Tests for infrastructure.validation.docs.corpus and the incremental link checker.
+
+Zero-mocks: every case writes a real Markdown tree under ``tmp_path``; the
+parallel path starts real worker processes.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from infrastructure.validation.docs.consistency import check_no_ghost_projects, check_stale_shell_contracts
+from infrastructure.validation.docs.corpus import MarkdownCorpus, MarkdownDocument, strip_code
+from infrastructure.validation.docs.cross_link_lint import (
+    IncrementalLinkChecker,
+    detect_markdown_link_cycles,
+    find_broken_links,
+)
+from infrastructure.validation.docs.mermaid_lint import find_mermaid_blocks
+from infrastructure.validation.docs.scan_scope import iter_markdown_files
+
+_SOURCE = """# Guide
+
+See [the `api`](api.md#usage) and [missing](gone.md).
+
+```bash
+[not a link](nowhere.md)
+uv run pytest
+```
+
+## Usage `code`
+
+```mermaid
+flowchart TD
+  A --> B
+```
+"""
+
+
+def _write(p: Path, body: str) -> Path:
+    p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_text(body, encoding="utf-8")
+    return p
+
+
+def _bump_mtime(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_document_views_skip_code_and_keep_line_numbers(tmp_path: Path) -> None:
+    document = MarkdownDocument.load(_write(tmp_path / "guide.md", _SOURCE))
+    assert document is not None
+
+    assert [(link.line, link.text, link.target) for link in document.links] == [
+        (3, "the `api`", "api.md#usage"),
+        (3, "missing", "gone.md"),
+    ]
+    assert document.code_stripped == strip_code(_SOURCE)
+    assert {"guide", "usage-code"} <= document.anchors
+    assert [(fence.lang, fence.body_line) for fence in document.code_fences] == [("bash", 6), ("mermaid", 13)]
+    assert [(fence.line, fence.body) for fence in document.mermaid_fences] == [(12, "flowchart TD\n  A --> B")]
+    assert len(document.fence_blanked_lines) == len(document.lines)
+
+
+def test_corpus_reads_each_file_once_and_memoises_discovery(tmp_path: Path) -> None:
+    guide = _write(tmp_path / "guide.md", _SOURCE)
+    _write(tmp_path / "CHANGELOG.md", "[x](nope.md)\n")
+    corpus = MarkdownCorpus()
+
+    assert corpus.get(guide) is corpus.get(guide)
+    assert corpus.get(tmp_path / "absent.md") is None
+    assert corpus.markdown_files([tmp_path]) is corpus.markdown_files([tmp_path])
+    assert corpus.markdown_files([tmp_path], exclude_globs=["**/CHANGELOG*.md"]) == iter_markdown_files(
+        [tmp_path], exclude_globs=["**/CHANGELOG*.md"]
+    )
+
+
+def test_parallel_prime_matches_lazy_parse(tmp_path: Path) -> None:
+    paths = [_write(tmp_path / f"doc{i}.md", _SOURCE.replace("Guide", f"Guide {i}")) for i in range(6)]
+    primed = MarkdownCorpus(workers=2)
+    primed.prime(paths)
+    lazy = MarkdownCorpus()
+
+    for path in paths:
+        parsed, expected = primed.get(path), lazy.get(path)
+        assert parsed is not None and expected is not None
+        assert "links" in vars(parsed), "worker-parsed views should arrive precomputed"
+        assert (parsed.links, parsed.anchors, parsed.code_fences, parsed.mermaid_fences) == (
+            expected.links,
+            expected.anchors,
+            expected.code_fences,
+            expected.mermaid_fences,
+        )
+
+
+def test_refresh_reports_only_content_changes(tmp_path: Path) -> None:
+    touched = _write(tmp_path / "touched.md", "# Same\n")
+    edited = _write(tmp_path / "edited.md", "# Before\n")
+    deleted = _write(tmp_path / "deleted.md", "# Gone\n")
+    corpus = MarkdownCorpus()
+    for path in (touched, edited, deleted):
+        corpus.get(path)
+
+    _bump_mtime(touched)
+    _write(edited, "# After\n")
+    _bump_mtime(edited)
+    deleted.unlink()
+
+    assert corpus.refresh() == {edited, deleted}
+    assert corpus.get(deleted) is None
+    refreshed = corpus.get(edited)
+    assert refreshed is not None and refreshed.anchors == frozenset({"after"})
+    assert corpus.refresh() == set()
+
+
+def test_linters_give_identical_results_through_a_shared_corpus(tmp_path: Path) -> None:
+    _write(tmp_path / "docs" / "guide.md", _SOURCE)
+    _write(tmp_path / "docs" / "api.md", "# API\n\n[back](guide.md)\n")
+    _write(tmp_path / "docs" / "notes.md", "We export PIPELINE_MODE here.\nSee projects/ghost_project/src.\n")
+    roots = [tmp_path / "docs"]
+    corpus = MarkdownCorpus()
+
+    assert find_broken_links(roots, corpus=corpus) == find_broken_links(roots)
+    assert find_mermaid_blocks(roots, corpus=corpus) == find_mermaid_blocks(roots)
+    assert detect_markdown_link_cycles(roots, corpus=corpus) == detect_markdown_link_cycles(roots)
+    assert check_no_ghost_projects(tmp_path, corpus=corpus) == check_no_ghost_projects(tmp_path)
+    assert check_stale_shell_contracts(tmp_path, corpus=corpus) == check_stale_shell_contracts(tmp_path)
+    assert [issue.category for issue in check_no_ghost_projects(tmp_path, corpus=corpus)] == ["ghost-project"]
+
+
+class TestIncrementalLinkChecker:
+    def _tree(self, tmp_path: Path) -> tuple[Path, Path, Path]:
+        index = _write(tmp_path / "index.md", "[api](api.md#usage)\n[later](later.md)\n")
+        api = _write(tmp_path / "api.md", "# Usage\n")
+        unrelated = _write(tmp_path / "unrelated.md", "# Unrelated\n[ext](https://example.org)\n")
+        return index, api, unrelated
+
+    def test_unchanged_tree_rechecks_nothing(self, tmp_path: Path) -> None:
+        index, _, _ = self._tree(tmp_path)
+        checker = IncrementalLinkChecker([tmp_path])
+
+        first = checker.check()
+        assert [link.target for link in first] == ["later.md"]
+        assert first == find_broken_links([tmp_path])
+        assert checker.check() == first
+        assert checker.rechecked == []
+        assert index in checker.corpus.markdown_files([tmp_path])
+
+    def test_target_edits_recheck_only_linking_files(self, tmp_path: Path) -> None:
+        index, api, _ = self._tree(tmp_path)
+        checker = IncrementalLinkChecker([tmp_path])
+        checker.check()
+
+        _write(api, "# Renamed\n")
+        _bump_mtime(api)
+        result = checker.check()
+        assert sorted(checker.rechecked) == [api, index]
+        assert result == find_broken_links([tmp_path])
+        assert {link.target for link in result} == {"api.md#usage", "later.md"}
+
+    def test_created_target_rechecks_its_sources(self, tmp_path: Path) -> None:
+        index, _, _ = self._tree(tmp_path)
+        checker = IncrementalLinkChecker([tmp_path])
+        checker.check()
+
+        later = _write(tmp_path / "later.md", "# Later\n")
+        assert checker.check() == []
+        assert sorted(checker.rechecked) == [index, later]
+
+        later.unlink()
+        assert [link.target for link in checker.check()] == ["later.md"]
+        assert checker.rechecked == [index]
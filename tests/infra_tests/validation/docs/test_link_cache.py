@@ -0,0 +1,111 @@
+"""Tests for the persisted cross-link checker state (real files and SQLite, no mocks)."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from infrastructure.validation.docs.cross_link_lint import IncrementalLinkChecker, find_broken_links
+from infrastructure.validation.docs.link_cache import (
+    ENV_DOCS_LINK_CACHE,
+    LinkStateCache,
+    StoredLinkFile,
+    default_link_state_cache,
+)
+from infrastructure.validation.docs.lint_runner import emit_json_report, run_docs_lint
+
+
+def _write(path: Path, body: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(body, encoding="utf-8")
+    return path
+
+
+def _bump_mtime(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def _tree(root: Path) -> tuple[Path, Path, Path]:
+    index = _write(root / "index.md", "[api](api.md#usage)\n[later](later.md)\n")
+    api = _write(root / "api.md", "# Usage\n")
+    unrelated = _write(root / "unrelated.md", "# Unrelated\n[ext](https://example.org)\n")
+    return index, api, unrelated
+
+
+def test_store_round_trips_entries_under_their_rules(tmp_path: Path) -> None:
+    cache = LinkStateCache(tmp_path / "links.sqlite")
+    entry = StoredLinkFile(broken=((3, "later", "later.md", "target does not exist on disk"),), deps=("/d/later.md",))
+    cache.record("rules-1", {"/d/index.md": entry}, {"/d/index.md": "file:1:2", "/d/later.md": "missing"})
+
+    entries, states = cache.load("rules-1", ["/d/index.md", "/d/other.md"])
+    assert entries == {"/d/index.md": entry}
+    assert states == {"/d/index.md": "file:1:2", "/d/later.md": "missing"}
+    assert cache.load("rules-2", ["/d/index.md"]) == ({}, {})
+    assert cache.stats.to_dict() == {"hits": 1, "misses": 2, "stores": 1, "evictions": 0}
+
+
+def test_store_keeps_the_most_recently_used_rows(tmp_path: Path) -> None:
+    cache = LinkStateCache(tmp_path / "links.sqlite", max_rows=2)
+    empty = StoredLinkFile(broken=(), deps=())
+    for name in ("a", "b", "c"):
+        cache.record("r", {name: empty}, {})
+
+    assert set(cache.load("r", ["a", "b", "c"])[0]) == {"b", "c"}
+    assert cache.stats.evictions == 1
+
+
+def test_a_new_checker_rechecks_only_files_affected_since_the_stored_run(tmp_path: Path) -> None:
+    index, api, unrelated = _tree(tmp_path / "docs")
+    cache = LinkStateCache(tmp_path / "links.sqlite")
+
+    first = IncrementalLinkChecker([tmp_path / "docs"], cache=cache)
+    assert first.check() == find_broken_links([tmp_path / "docs"])
+    assert sorted(first.rechecked) == [api, index, unrelated]
+
+    unchanged = IncrementalLinkChecker([tmp_path / "docs"], cache=cache)
+    assert unchanged.check() == find_broken_links([tmp_path / "docs"])
+    assert unchanged.rechecked == []
+
+    _write(api, "# Renamed\n")
+    _bump_mtime(api)
+    edited = IncrementalLinkChecker([tmp_path / "docs"], cache=cache)
+    result = edited.check()
+    assert sorted(edited.rechecked) == [api, index]
+    assert result == find_broken_links([tmp_path / "docs"])
+    assert {link.target for link in result} == {"api.md#usage", "later.md"}
+
+    later = _write(tmp_path / "docs" / "later.md", "# Later\n")
+    created = IncrementalLinkChecker([tmp_path / "docs"], cache=cache)
+    assert [link.target for link in created.check()] == ["api.md#usage"]
+    assert sorted(created.rechecked) == [index, later]
+
+
+def test_default_cache_location_follows_the_environment(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(ENV_DOCS_LINK_CACHE, "off")
+    assert default_link_state_cache() is None
+    monkeypatch.setenv(ENV_DOCS_LINK_CACHE, str(tmp_path / "custom.sqlite"))
+    cache = default_link_state_cache()
+    assert cache is not None and cache.db_path == tmp_path / "custom.sqlite"
+    monkeypatch.delenv(ENV_DOCS_LINK_CACHE)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    cache = default_link_state_cache()
+    assert cache is not None and cache.db_path == tmp_path / "xdg" / "template" / "doc-links.sqlite"
+
+
+def test_docs_lint_report_carries_link_cache_stats(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    repo = tmp_path / "repo"
+    _tree(repo / "docs")
+    monkeypatch.setenv(ENV_DOCS_LINK_CACHE, str(tmp_path / "links.sqlite"))
+
+    first = run_docs_lint(repo, links_only=True, quiet=True)
+    second = run_docs_lint(repo, links_only=True, quiet=True)
+
+    assert first.broken_links == second.broken_links
+    assert [link.target for link in second.broken_links or []] == ["later.md"]
+    assert first.link_cache == {"hits": 0, "misses": 3, "stores": 3, "evictions": 0}
+    assert second.link_cache == {"hits": 3, "misses": 0, "stores": 3, "evictions": 0}
+    assert json.loads(emit_json_report(second, repo))["link_cache"] == second.link_cache
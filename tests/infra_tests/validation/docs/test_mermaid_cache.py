@@ -0,0 +1,174 @@
+"""Tests for infrastructure.validation.docs.mermaid_cache and cached Mermaid lint runs.
+
+Zero-mocks: a real executable ``mmdc`` stand-in written to ``tmp_path`` logs
+every invocation, verdicts are stored in a real SQLite file, and the renderer
+fingerprint is read from a real ``node_modules`` layout.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from infrastructure.validation.docs.lint_runner import emit_json_report, run_docs_lint
+from infrastructure.validation.docs.mermaid_cache import (
+    ENV_MERMAID_LINT_CACHE,
+    MermaidVerdictCache,
+    block_cache_key,
+    default_mermaid_verdict_cache,
+    normalize_mermaid_source,
+    renderer_fingerprint,
+)
+from infrastructure.validation.docs.mermaid_lint import find_mermaid_blocks, validate_blocks
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="POSIX executable script semantics")
+
+# Renders anything without "BROKEN" and appends one line per invocation to
+# the log next to it, so tests can count browser launches.
+_FAKE_MMDC = """#!/usr/bin/env python3
+import pathlib, sys
+here = pathlib.Path(__file__).resolve().parent
+source = open(sys.argv[sys.argv.index('-i') + 1]).read()
+with open(here / 'invocations.log', 'a') as log:
+    log.write('x\\n')
+if 'BROKEN' in source:
+    sys.stderr.write('Parse error\\n')
+    sys.exit(1)
+open(sys.argv[sys.argv.index('-o') + 1], 'w').write('<svg/>')
+"""
+
+
+def _fake_mmdc(directory: Path) -> Path:
+    directory.mkdir(parents=True, exist_ok=True)
+    mmdc = directory / "mmdc"
+    mmdc.write_text(_FAKE_MMDC, encoding="utf-8")
+    mmdc.chmod(0o755)
+    return mmdc
+
+
+def _invocations(mmdc: Path) -> int:
+    log = mmdc.parent / "invocations.log"
+    return len(log.read_text().splitlines()) if log.exists() else 0
+
+
+def _write_docs(root: Path, *bodies: str) -> None:
+    root.mkdir(parents=True, exist_ok=True)
+    fences = "\n".join(f"```mermaid\n{body}\n```\n" for body in bodies)
+    (root / "page.md").write_text(f"# Page\n\n{fences}", encoding="utf-8")
+
+
+def _lint(docs: Path, mmdc: Path, cache: MermaidVerdictCache) -> list[str]:
+    failures = validate_blocks(find_mermaid_blocks([docs]), mmdc_path=str(mmdc), cache=cache)
+    return [failure.block.body for failure in failures]
+
+
+def test_warm_run_starts_no_renderer(tmp_path: Path) -> None:
+    docs, mmdc = tmp_path / "docs", _fake_mmdc(tmp_path / "bin")
+    _write_docs(docs, "flowchart TB\n  A --> B", "sequenceDiagram\n  A->>B: hi")
+    db = tmp_path / "verdicts.sqlite"
+
+    cold = MermaidVerdictCache(db)
+    assert _lint(docs, mmdc, cold) == []
+    assert (_invocations(mmdc), cold.stats.to_dict()) == (1, {"hits": 0, "misses": 2, "stores": 2, "evictions": 0})
+
+    warm = MermaidVerdictCache(db)
+    assert _lint(docs, mmdc, warm) == []
+    assert (_invocations(mmdc), warm.stats.to_dict()) == (1, {"hits": 2, "misses": 0, "stores": 0, "evictions": 0})
+
+
+def test_only_edited_blocks_are_rendered_and_whitespace_is_ignored(tmp_path: Path) -> None:
+    docs, mmdc = tmp_path / "docs", _fake_mmdc(tmp_path / "bin")
+    _write_docs(docs, "flowchart TB\n  A --> B", "flowchart LR\n  C --> D")
+    cache = MermaidVerdictCache(tmp_path / "verdicts.sqlite")
+    _lint(docs, mmdc, cache)
+
+    _write_docs(docs, "flowchart TB   \r\n  A --> B\r\n", "flowchart LR\n  C --> E")
+    rerun = MermaidVerdictCache(cache.db_path)
+    assert _lint(docs, mmdc, rerun) == []
+    assert rerun.stats.to_dict() == {"hits": 1, "misses": 1, "stores": 1, "evictions": 0}
+    assert _invocations(mmdc) == 2
+
+
+def test_reindented_fence_keeps_its_key() -> None:
+    body = "flowchart TB\n  A --> B"
+    indented = "    flowchart TB\n      A --> B\n"
+    assert normalize_mermaid_source(indented) == body
+    assert block_cache_key(indented, "r") == block_cache_key(body, "r")
+    assert block_cache_key("flowchart TB\nA --> B", "r") != block_cache_key(body, "r")
+
+
+def test_failures_are_never_cached(tmp_path: Path) -> None:
+    docs, mmdc = tmp_path / "docs", _fake_mmdc(tmp_path / "bin")
+    _write_docs(docs, "flowchart TB\n  A --> B", "flowchart TB\n  BROKEN")
+    cache = MermaidVerdictCache(tmp_path / "verdicts.sqlite")
+
+    assert _lint(docs, mmdc, cache) == ["flowchart TB\n  BROKEN"]
+    assert cache.stats.stores == 1  # the good block, rendered alone after the batch failed
+    rerun = MermaidVerdictCache(cache.db_path)
+    assert _lint(docs, mmdc, rerun) == ["flowchart TB\n  BROKEN"]
+    assert rerun.stats.to_dict() == {"hits": 1, "misses": 1, "stores": 0, "evictions": 0}
+
+
+def test_fingerprint_tracks_installed_versions_and_ignores_the_profile(tmp_path: Path) -> None:
+    modules = tmp_path / "node_modules"
+    cli = modules / "@mermaid-js" / "mermaid-cli"
+    (cli / "src").mkdir(parents=True)
+    (cli / "src" / "cli.js").write_text("// cli\n", encoding="utf-8")
+    (cli / "package.json").write_text('{"name": "@mermaid-js/mermaid-cli", "version": "11.16.0"}', encoding="utf-8")
+    mermaid_manifest = modules / "mermaid" / "package.json"
+    mermaid_manifest.parent.mkdir(parents=True)
+    mermaid_manifest.write_text('{"name": "mermaid", "version": "11.12.0"}', encoding="utf-8")
+    (modules / ".bin").mkdir()
+    (modules / ".bin" / "mmdc").symlink_to(cli / "src" / "cli.js")
+    mmdc = str(modules / ".bin" / "mmdc")
+
+    base = renderer_fingerprint(mmdc, {"args": ["--no-sandbox"], "userDataDir": "/tmp/a"})
+    assert renderer_fingerprint(mmdc, {"args": ["--no-sandbox"], "userDataDir": "/tmp/b"}) == base
+    assert renderer_fingerprint(mmdc, {"args": []}) != base
+
+    mermaid_manifest.write_text('{"name": "mermaid", "version": "11.13.0"}', encoding="utf-8")
+    bumped = renderer_fingerprint(mmdc, {"args": ["--no-sandbox"]})
+    assert bumped != base
+    assert block_cache_key("flowchart TB", bumped) != block_cache_key("flowchart TB", base)
+
+
+def test_store_keeps_the_most_recently_used_verdicts(tmp_path: Path) -> None:
+    cache = MermaidVerdictCache(tmp_path / "verdicts.sqlite", max_entries=2)
+    cache.record_passes(["a"])
+    cache.record_passes(["b"])
+    assert cache.passed(["a"]) == {"a"}  # refreshes "a"
+    cache.record_passes(["c"])
+
+    assert cache.passed(["a", "b", "c"]) == {"a", "c"}
+    assert cache.stats.evictions == 1
+
+
+def test_default_cache_location_follows_the_environment(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(ENV_MERMAID_LINT_CACHE, "off")
+    assert default_mermaid_verdict_cache() is None
+    monkeypatch.setenv(ENV_MERMAID_LINT_CACHE, str(tmp_path / "custom.sqlite"))
+    cache = default_mermaid_verdict_cache()
+    assert cache is not None and cache.db_path == tmp_path / "custom.sqlite"
+    monkeypatch.delenv(ENV_MERMAID_LINT_CACHE)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    cache = default_mermaid_verdict_cache()
+    assert cache is not None and cache.db_path == tmp_path / "xdg" / "template" / "mermaid-lint.sqlite"
+
+
+def test_docs_lint_report_carries_cache_stats(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    repo = tmp_path / "repo"
+    _write_docs(repo / "docs", "flowchart TB\n  A --> B")
+    mmdc = _fake_mmdc(repo / "node_modules" / ".bin")
+    monkeypatch.setenv(ENV_MERMAID_LINT_CACHE, str(tmp_path / "verdicts.sqlite"))
+
+    first = run_docs_lint(repo, mermaid_only=True, quiet=True)
+    second = run_docs_lint(repo, mermaid_only=True, quiet=True)
+
+    assert first.mermaid == [] and second.mermaid == []
+    assert first.mermaid_cache == {"hits": 0, "misses": 1, "stores": 1, "evictions": 0}
+    assert second.mermaid_cache == {"hits": 1, "misses": 0, "stores": 0, "evictions": 0}
+    assert _invocations(mmdc) == 1
+    assert json.loads(emit_json_report(second, repo))["mermaid_cache"] == second.mermaid_cache
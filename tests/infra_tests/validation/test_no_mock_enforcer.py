@@ -6,8 +6,10 @@ Follows No Mocks Policy - all tests use real data and real execution.
 
 from infrastructure.validation.output.no_mock_enforcer import (
     StandInCategory,
+    scan_hand_rolled_fakes,
     scan_lexical_mock_policy,
     scan_semantic_standins,
+    scan_semantic_standins_and_fakes,
     scan_test_roots,
     validate_no_mocks,
 )
@@ -297,3 +299,20 @@ def test_inventory(monkeypatch, tmp_path):
 
         assert lexical.errors
         assert inventory.errors
+
+    def test_single_pass_scan_matches_the_separate_inventories(self, tmp_path):
+        tests_dir = tmp_path / "tests"
+        tests_dir.mkdir()
+        (tests_dir / "test_mixed.py").write_text(
+            "class FakeClock:\n    pass\n\n\ndef test_env(monkeypatch):\n    monkeypatch.setenv('K', '1')\n",
+            encoding="utf-8",
+        )
+        (tests_dir / "test_invalid.py").write_text("def incomplete(:\n", encoding="utf-8")
+
+        standins, fakes = scan_semantic_standins_and_fakes(tests_dir, tmp_path)
+
+        assert standins == scan_semantic_standins(tests_dir, tmp_path)
+        assert fakes == scan_hand_rolled_fakes(tests_dir, tmp_path)
+        assert fakes.findings == ("tests/test_mixed.py:1: class FakeClock:",)
+        assert [use.method for use in standins.uses] == ["setenv"]
+        assert standins.errors == fakes.errors != ()
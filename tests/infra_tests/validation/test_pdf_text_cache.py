@@ -0,0 +1,123 @@
+"""Tests for the content-addressed PDF page-text cache.
+
+No mocks: real reportlab PDFs, real pypdf extraction and a real SQLite cache
+under ``tmp_path``.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from reportlab.pdfgen import canvas  # type: ignore[import-untyped]
+
+from infrastructure.validation.content.pdf_text_cache import (
+    ENV_PDF_TEXT_CACHE,
+    PdfTextCache,
+    default_pdf_text_cache,
+    extractor_version,
+)
+from infrastructure.validation.content.pdf_validator import (
+    _extract_with_pypdf,
+    extract_pdf_pages,
+    extract_text_from_pdf,
+    iter_pdf_pages,
+    pdf_text_prefix,
+)
+
+
+def _pdf(path: Path, pages: int, *, tag: str = "") -> Path:
+    c = canvas.Canvas(str(path), pagesize=(612, 792))
+    for number in range(1, pages + 1):
+        if number == 2:
+            c.setPageSize((400, 600))
+        for line in range(6):
+            c.drawString(72, 700 - 20 * line, f"{tag}Page {number} line {line} evidence words here")
+        c.showPage()
+        c.setPageSize((612, 792))
+    c.save()
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> PdfTextCache:
+    return PdfTextCache(tmp_path / "cache" / "pdf-text.sqlite")
+
+
+class TestExtractionCache:
+    def test_second_extraction_is_served_from_cache(self, tmp_path: Path, cache: PdfTextCache) -> None:
+        pdf = _pdf(tmp_path / "doc.pdf", 3)
+
+        first = extract_pdf_pages(pdf, cache=cache)
+        second = extract_pdf_pages(pdf, cache=cache)
+
+        assert second == first
+        assert first.text == _extract_with_pypdf(pdf)
+        assert (cache.stats.misses, cache.stats.hits, cache.stats.stores) == (1, 1, 1)
+        assert [(p.number, p.width, p.height) for p in second.pages] == [
+            (1, 612.0, 792.0),
+            (2, 400.0, 600.0),
+            (3, 612.0, 792.0),
+        ]
+
+    def test_cache_is_keyed_by_content_and_extractor(self, tmp_path: Path, cache: PdfTextCache) -> None:
+        pdf = _pdf(tmp_path / "doc.pdf", 2)
+        extraction = extract_pdf_pages(pdf, cache=cache)
+
+        _pdf(pdf, 2, tag="revised ")
+        assert "revised" in extract_pdf_pages(pdf, cache=cache).text
+        assert cache.get(extraction.sha256, extractor_version() + "-next") is None
+
+    def test_least_recently_used_documents_are_evicted(self, tmp_path: Path) -> None:
+        cache = PdfTextCache(tmp_path / "c.sqlite", max_documents=1)
+        extract_pdf_pages(_pdf(tmp_path / "a.pdf", 1, tag="a "), cache=cache)
+        extract_pdf_pages(_pdf(tmp_path / "b.pdf", 1, tag="b "), cache=cache)
+
+        assert len(cache) == 1
+        assert cache.stats.evictions == 1
+
+    def test_parallel_workers_match_serial_extraction(self, tmp_path: Path, cache: PdfTextCache) -> None:
+        pdf = _pdf(tmp_path / "long.pdf", 12)
+
+        parallel = extract_pdf_pages(pdf, cache=PdfTextCache(tmp_path / "p.sqlite"), workers=3)
+
+        assert parallel == extract_pdf_pages(pdf, cache=cache, workers=1)
+        assert [p.number for p in parallel.pages] == list(range(1, 13))
+
+    def test_unwritable_cache_location_still_extracts(self, tmp_path: Path) -> None:
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("x", encoding="utf-8")
+        pdf = _pdf(tmp_path / "doc.pdf", 1)
+
+        assert "Page 1" in extract_pdf_pages(pdf, cache=PdfTextCache(blocker / "cache.sqlite")).text
+
+    def test_cache_location_follows_environment(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv(ENV_PDF_TEXT_CACHE, "off")
+        assert default_pdf_text_cache() is None
+
+        monkeypatch.setenv(ENV_PDF_TEXT_CACHE, str(tmp_path / "env.sqlite"))
+        pdf = _pdf(tmp_path / "doc.pdf", 1)
+        extract_text_from_pdf(pdf)
+        assert len(PdfTextCache(tmp_path / "env.sqlite")) == 1
+
+
+class TestPageIterator:
+    def test_early_stop_extracts_and_stores_nothing_more(self, tmp_path: Path, cache: PdfTextCache) -> None:
+        pdf = _pdf(tmp_path / "doc.pdf", 4)
+
+        first = next(iter_pdf_pages(pdf, cache=cache))
+        assert first.number == 1
+        assert len(cache) == 0
+
+        assert [p.number for p in iter_pdf_pages(pdf, cache=cache)] == [1, 2, 3, 4]
+        assert len(cache) == 1
+        assert list(iter_pdf_pages(pdf, cache=cache)) == list(extract_pdf_pages(pdf, cache=cache).pages)
+
+    def test_prefix_matches_full_text(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv(ENV_PDF_TEXT_CACHE, "off")
+        pdf = _pdf(tmp_path / "doc.pdf", 5)
+        full = extract_text_from_pdf(pdf)
+
+        prefix = pdf_text_prefix(pdf, 100)
+        assert len(prefix) < len(full)
+        assert prefix.strip()[:100] == full.strip()[:100]